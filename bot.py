@@ -1,2136 +1,245 @@
+"""
+✅ 봇 실행 + 설정 + 프로세스 상태 (캐시 / 대기열 / 버튼 / 복제본 / 모델)
+
+명령어 / 리스너 / 백그라운드 작업은 cogs/, 확장들이 함께 쓰는 함수는 shared.py / views.py
+→ `!리로드`로 코드만 교체하고 이 모듈의 상태와 게이트웨이 연결은 그대로 유지
+"""
 import discord
 from discord.ext import commands
-import requests
-import json
-import random
 import asyncio
-import re
+import importlib
 import logging
-from datetime import datetime
+import sys
+import time
 
 import os
 from dotenv import load_dotenv
 
-with open("bot_pid.txt", "w") as f:
-    f.write(str(os.getpid()))
+import gas
+import tracing
+from cache import SnapshotCache, WriteOutbox
+from conversation import ConversationManager
+from hedging import Hedger
+from jobs import ChunkCursor, JobManager
+from sync import DeltaReplica
+
+from lineup_index import RecentLineupIndex
+from links import AccountLinks
+from matchmaking import Matchmaker
+from message_updates import MessageUpdater
+from name_index import PrefixIndex
+from predictor import WinPredictor
+from profiler import CommandProfiler, MemoryProfiler
+from ratelimit import FairQueue, RateLimiter, parse_limits
+from scheduler import GasScheduler
+from synergy import SynergyMatrix
+from view_store import ViewStore
 
 load_dotenv()  # .env 파일 로드
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 GAS_URL = os.getenv("GAS_URL")
+SYNERGY_PENALTY_WEIGHT = float(os.getenv("SYNERGY_PENALTY_WEIGHT", "0"))  # 0이면 팀 생성 시 시너지 페널티 미사용
+REMATCH_WINDOW = int(os.getenv("REMATCH_WINDOW", "5"))  # 같은 팀 반복을 확인할 최근 경기 수
+REMATCH_PENALTY_WEIGHT = float(os.getenv("REMATCH_PENALTY_WEIGHT", "1"))  # 0이면 반복 라인업 페널티 미사용
+TOP_K_LINEUPS = int(os.getenv("TOP_K_LINEUPS", "10"))  # `다음 후보` 버튼으로 보여줄 추천 라인업 수
+PREDICTOR_REFIT_EVERY = int(os.getenv("PREDICTOR_REFIT_EVERY", "10"))  # 새 경기 N개마다 승률 예측 모델 재학습
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")  # `!프로파일` / `!메모리` 결과 파일 저장 폴더
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")  # 명령어 / GAS / 디스코드 REST 스팬 저장 파일 (빈 값이면 저장 안 함)
+GAS_CACHE_FILE = os.getenv("GAS_CACHE_FILE", "gas_cache.json")  # GAS 장애 시 읽기 전용으로 보여줄 마지막 정상 응답
+GAS_CACHE_FLUSH_SECONDS = int(os.getenv("GAS_CACHE_FLUSH_SECONDS", "30"))  # 바뀐 캐시를 파일에 모아서 저장하는 간격 (초)
+RESULT_OUTBOX_FILE = os.getenv("RESULT_OUTBOX_FILE", "pending_results.json")  # GAS 장애 중 보관한 경기 결과
+GAS_RETRY_SECONDS = int(os.getenv("GAS_RETRY_SECONDS", "60"))  # 장애 중 쓰기 명령어 / 보류 결과 재시도 간격
+MMR_CHUNK_SIZE = int(os.getenv("MMR_CHUNK_SIZE", "25"))  # `!MMR갱신` 한 번의 GAS 요청에서 재계산할 유저 수 (0이면 한 번에 전체)
+MMR_CURSOR_FILE = os.getenv("MMR_CURSOR_FILE", "mmr_recompute.json")  # 중단된 MMR 갱신의 재개 위치
+GAS_HEDGE_QUANTILE = float(os.getenv("GAS_HEDGE_QUANTILE", "0.9"))  # 첫 요청이 이 백분위 지연을 넘기면 같은 읽기 요청을 한 번 더 전송
+GAS_HEDGE_RATIO = float(os.getenv("GAS_HEDGE_RATIO", "0.1"))  # 헤지 요청 상한 (전체 읽기 요청 대비 비율, 0이면 헤징 안 함)
+GAS_RATE_PER_SECOND = float(os.getenv("GAS_RATE_PER_SECOND", "2"))  # GAS 요청 토큰 버킷 속도 (0이면 제한 없음)
+GAS_BURST = int(os.getenv("GAS_BURST", "5"))
+GAS_DAILY_CALLS = int(os.getenv("GAS_DAILY_CALLS", "20000"))  # 최근 24시간 GAS 요청 수 예산
+GAS_DAILY_RUNTIME_MINUTES = float(os.getenv("GAS_DAILY_RUNTIME_MINUTES", "90"))  # 최근 24시간 GAS 응답 시간 합 예산
+# 명령어 / 버튼별 유저당 사용 제한 (이름=횟수/초, `*`는 나머지 전체 기본값)
+COMMAND_RATE_LIMITS = os.getenv(
+    "COMMAND_RATE_LIMITS",
+    "*=20/60,조회=6/60,결과조회=6/60,시너지=6/60,팀생성=4/60,팀생성일반=4/60,팀생성고급=4/60,"
+    "백업=1/300,백업정리=1/300,스냅샷=1/300,버튼 MIX=10/60,버튼 MIX(고급)=10/60,버튼 다음 후보=20/60"
+)
+CHANNEL_RATE_LIMIT = os.getenv("CHANNEL_RATE_LIMIT", "40/60")  # 채널 전체 명령어 사용 제한 (빈 값이면 제한 없음)
+FAIR_QUEUE_CONCURRENCY = int(os.getenv("FAIR_QUEUE_CONCURRENCY", "2"))  # 동시에 실행할 무거운 명령어 수
+LINKS_FILE = os.getenv("LINKS_FILE", "account_links.json")  # 디스코드 계정 ↔ 유저명 연결
+VIEW_STORE_FILE = os.getenv("VIEW_STORE_FILE", "views.json")  # 확인 / 팀 생성 버튼 상태 (재시작 후 복원)
+CONFIRM_VIEW_TTL = int(os.getenv("CONFIRM_VIEW_TTL", "600"))  # 확인 / 복구 버튼 유효 시간 (초)
+TEAM_VIEW_TTL = int(os.getenv("TEAM_VIEW_TTL", "21600"))  # 팀 생성 버튼 유효 시간 (초)
+MAX_LIVE_VIEWS = int(os.getenv("MAX_LIVE_VIEWS", "200"))  # 동시에 유지할 버튼 메시지 수 (넘으면 오래된 것부터 만료)
+VIEW_SWEEP_INTERVAL = int(os.getenv("VIEW_SWEEP_INTERVAL", "60"))  # 만료된 버튼 정리 간격 (초)
+VIEW_SWEEP_BATCH = int(os.getenv("VIEW_SWEEP_BATCH", "20"))  # 한 번에 정리할 최대 개수
+MATCH_QUEUE_FILE = os.getenv("MATCH_QUEUE_FILE", "match_queue.json")  # 채널별 매칭 대기열 (재시작 후에도 유지)
+LOBBY_STATUS_DELAY = float(os.getenv("LOBBY_STATUS_DELAY", "2"))  # 대기열 상태 메시지 수정 / 저장을 모아서 처리하는 간격 (초)
+SLASH_GUILD_ID = os.getenv("SLASH_GUILD_ID")  # 지정하면 슬래시 명령어를 해당 서버에만 즉시 등록 (없으면 전역 등록)
+ROSTER_SYNC_INTERVAL = int(os.getenv("ROSTER_SYNC_INTERVAL", "30"))  # 유저 / 별명 / 유저 정보 변경분 확인 최소 간격 (초)
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "0"))  # 시트 수정 알림 수신 포트 (0이면 사용 안 함)
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")  # Apps Script onEdit 트리거와 공유하는 HMAC 비밀키
+
+conversations = ConversationManager()  # ✅ 대화형 입력 ((채널, 유저) → 진행 중인 입력 대기)
+rate_limiter = RateLimiter(parse_limits(COMMAND_RATE_LIMITS), parse_limits(f"채널={CHANNEL_RATE_LIMIT}").get("채널"))
+fair_queue = FairQueue(FAIR_QUEUE_CONCURRENCY)
+# ✅ GAS 요청이 많거나 오래 걸려서 공정 대기열을 거치는 명령어
+FAIR_QUEUE_COMMANDS = {"조회", "결과조회", "시너지", "팀생성", "팀생성일반", "팀생성고급", "백업", "백업정리", "스냅샷", "롤백", "시즌목록"}
+# ✅ 유저 입력을 먼저 기다릴 수 있는 명령어 → 입력을 받은 뒤 acquire_fair_slot(ctx)로 직접 자리 확보
+PROMPT_FIRST_COMMANDS = {"팀생성일반", "팀생성고급"}
+
+account_links = AccountLinks(LINKS_FILE)  # ✅ 디스코드 유저 ID ↔ 유저명 (`!조회` 본인 조회 / @멘션 입력)
+result_outbox = WriteOutbox(RESULT_OUTBOX_FILE)
+view_store = ViewStore(VIEW_STORE_FILE, MAX_LIVE_VIEWS)
+live_views = {}  # ✅ 메시지 ID → 동작 중인 DurableView (최대 MAX_LIVE_VIEWS개)
+job_manager = JobManager()
+mmr_cursor = ChunkCursor(MMR_CURSOR_FILE)
+
+# ✅ MMR 전체 갱신과 겹치면 안 되는 경기 결과 쓰기 action
+RESULT_WRITE_ACTIONS = {"registerResult", "deleteMatch", "restoreLastBackup", "restoreFromFile"}
+gas_cache = SnapshotCache(GAS_CACHE_FILE)
+gas.configure(GAS_URL, gas_cache)
+gas.scheduler = GasScheduler(GAS_RATE_PER_SECOND, GAS_BURST, GAS_DAILY_CALLS, GAS_DAILY_RUNTIME_MINUTES * 60)
+gas.hedger = Hedger(quantile=GAS_HEDGE_QUANTILE, ratio=GAS_HEDGE_RATIO, burst=5 if GAS_HEDGE_RATIO > 0 else 0)
+
+# ✅ 유저 / 별명 / 유저 정보 로컬 복제본 (GAS 쓰기 성공 시 다음 조회에서 바로 변경분 동기화)
+replica = DeltaReplica(ROSTER_SYNC_INTERVAL)
+gas.write_listeners.append(lambda action: replica.mark_dirty())
+tracing.configure(TRACE_FILE)
 
 intents = discord.Intents.default()
 intents.message_content = True  # 메시지 내용을 읽을 수 있도록 설정
+intents.voice_states = True  # `!팀생성 보이스` (음성 채널 참가자 목록)
 
 bot = commands.Bot(command_prefix="!", intents=intents)
+tracing.instrument_discord(bot.http)
+message_updates = MessageUpdater()  # ✅ 메시지 수정 모아 보내기 (메시지별 마지막 값 + 채널별 수정 제한)
 
-class ConfirmView(discord.ui.View):
-    def __init__(self, ctx, payload, success_message, error_message, payload_type="generic", game_number=None, round_mode=4):
-        super().__init__(timeout=30)
-        self.ctx = ctx
-        self.payload = payload
-        self.success_message = success_message
-        self.error_message = error_message
-        self.payload_type = payload_type
-        self.game_number = game_number
-        self.round_mode = round_mode
-        self._has_been_clicked = False
-
-        self.is_best_of_three = round_mode == 3
-        self.is_best_of_four = round_mode == 4
-        self.is_best_of_five = round_mode == 5
-
-        logging.basicConfig(level=logging.DEBUG)
-        logging.info(f"📌 ConfirmView 생성됨 (Payload: {self.payload}, PayloadType: {self.payload_type})")
-
-        # ✅ payload_type이 "game_result"일 때만 선승 모드 토글 버튼 추가
-        if self.payload_type == "game_result":
-            self.add_item(self.ToggleRoundModeButton(self))  # ✅ (self) 넘겨줌
-
-    class ToggleRoundModeButton(discord.ui.Button):
-        def __init__(self, view):
-            round_mode = view.round_mode  # ✅ view로부터 현재 round_mode 받아옴
-
-            super().__init__(
-                label=f"🔁 선승 모드 (현재: {round_mode}선승)",
-                style={
-                    3: discord.ButtonStyle.blurple,
-                    4: discord.ButtonStyle.grey,
-                    5: discord.ButtonStyle.green
-                }.get(round_mode, discord.ButtonStyle.grey),
-                row=0
-            )
-
-        async def callback(self, interaction: discord.Interaction):
-            view = self.view
-            if not hasattr(view, "round_mode"):
-                view.round_mode = 4
-            else:
-                view.round_mode = {3: 4, 4: 5, 5: 3}[view.round_mode]
-
-            view.is_best_of_three = view.round_mode == 3
-            view.is_best_of_four = view.round_mode == 4
-            view.is_best_of_five = view.round_mode == 5
-
-            self.label = f"🔁 선승 모드 (현재: {view.round_mode}선승)"
-            self.style = {
-                3: discord.ButtonStyle.blurple,
-                4: discord.ButtonStyle.grey,
-                5: discord.ButtonStyle.green
-            }[view.round_mode]
-
-            await interaction.response.edit_message(view=view)
-
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        logging.debug(f"👤 [확인] {interaction.user} 가 버튼 클릭 (입력한 유저: {self.ctx.author})")
-        is_author = interaction.user == self.ctx.author
-        if not is_author:
-            await interaction.response.send_message("❌ 당신은 이 요청을 보낸 유저가 아닙니다.", ephemeral=True)
-            return False
-
-        # ✅ 확인 버튼이 눌릴 때만 _has_been_clicked 확인
-        if interaction.data["custom_id"] == self.confirm.custom_id:
-            if self._has_been_clicked:
-                await interaction.response.send_message("⚠️ 이미 처리 중입니다!", ephemeral=True)
-                return False
-
-        return True
-
-    async def send_followup(self, interaction: discord.Interaction, message: str):
-        """✅ 처리 중 메시지 전송"""
-        logging.debug(f"⏳ [처리 중] {message}")
-        return await interaction.followup.send(f"⌛ {message} 잠시만 기다려주세요!")
-
-    def extract_game_number(self, response_text: str) -> str:
-        """✅ GAS 응답에서 게임번호 추출 (JSON or 정규식)"""
-        logging.debug(f"📥 [응답 분석] 원본 응답: {response_text}")
-        try:
-            data = json.loads(response_text.strip().strip('"'))
-            return data.get("game_number", "알 수 없음")
-        except json.JSONDecodeError:
-            match = re.search(r"게임번호:\s*(\d+)", response_text)
-            return match.group(1) if match else "알 수 없음"
-
-    @discord.ui.button(label="✅ 확인", style=discord.ButtonStyle.green, custom_id="confirm_button")
-    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer()
-
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.disabled = True
-        await interaction.message.edit(view=self)
-
-        followup_message = await self.send_followup(interaction, "처리 중입니다.")
-
-        try:
-            # ✅ game_result 타입일 때만 선승모드 스코어 검사
-            if self.payload_type == "game_result":
-                win_score = self.payload.get("win_score", 0)
-                lose_score = self.payload.get("lose_score", 0)
-                total_score = win_score + lose_score
-                max_score = self.round_mode
-
-                # ✅ 콜드게임 예외 처리 (4선승 모드 + 3:0 or 0:3)
-                is_cold_game = (
-                        max_score == 4 and
-                        ((win_score == 3 and lose_score == 0) or (win_score == 0 and lose_score == 3))
-                )
-
-                if (win_score != max_score or lose_score >= max_score) and not is_cold_game:
-                    raise Exception(f"{max_score}선승 모드: 승리팀은 {max_score}점, 패배팀은 0~{max_score - 1}점이어야 합니다.")
-                if total_score > max_score + (max_score - 1) and not is_cold_game:
-                    raise Exception(
-                        f"{max_score}선승 모드: 양 팀 합계는 최대 {max_score}:{max_score - 1}로, 총 {max_score + (max_score - 1)}점을 초과할 수 없습니다.")
-
-            # ✅ 정상 요청 처리
-            logging.info(f"🚀 [요청 전송] Payload: {self.payload}")
-            response = await asyncio.to_thread(requests.post, GAS_URL, json=self.payload)
-
-            if response.status_code != 200:
-                raise requests.HTTPError(f"응답 코드 {response.status_code}")
-
-            response_text = response.text.strip().strip('"')
-            try:
-                data = json.loads(response_text)
-                if "error" in data:
-                    raise Exception(data["error"])
-            except json.JSONDecodeError:
-                data = {}
-
-            if self.payload_type == "game_result":
-                game_number = self.extract_game_number(response_text)
-                message = self.success_message(game_number) if callable(self.success_message) else self.success_message
-            else:
-                message = self.success_message
-
-            await followup_message.edit(content=message, view=None)
-
-        except (requests.RequestException, Exception) as e:
-            await followup_message.edit(content=f"🚨 {self.error_message}\n오류: {str(e)}", view=None)
 
-        self.stop()
+# ✅ 팀원 시너지 / 상대 전적 행렬 (첫 사용 시 전체 경기 기록으로 로드, 이후 결과 등록마다 증분 반영)
+synergy_matrix = SynergyMatrix()
+synergy_lock = asyncio.Lock()
 
-    @discord.ui.button(label="❌ 취소", style=discord.ButtonStyle.red)
-    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """❌ 취소 버튼을 눌렀을 때 실행"""
-        logging.info(f"🚫 [취소] {self.ctx.author} 님이 요청을 취소함")
 
-        # 🔒 버튼들 비활성화
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.disabled = True
-        await interaction.message.edit(view=self)
+# ✅ 최근 K경기 라인업 인덱스 (첫 사용 시 최근 경기로 초기화, 이후 결과 등록마다 갱신)
+lineup_index = RecentLineupIndex(REMATCH_WINDOW)
 
-        await interaction.response.send_message("🚫 작업이 취소되었습니다.", ephemeral=True)
-        self.stop()
 
+# ✅ 라인업 승률 예측 모델 (시작 시 백그라운드 학습, 이후 새 경기 N개마다 재학습)
+win_predictor = WinPredictor()
+predictor_refit_task = None
 
-class RollbackSelectView(discord.ui.View):
-    def __init__(self, ctx, options):
-        super().__init__(timeout=30)
-        self.ctx = ctx
-        self.add_item(RollbackSelectMenu(options, self))
-
-class RollbackSelectMenu(discord.ui.Select):
-    def __init__(self, options, parent_view):
-        super().__init__(placeholder="🔽 복구할 백업 파일을 선택하세요!", min_values=1, max_values=1, options=options)
-        self.parent_view = parent_view
-
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-
-        if interaction.user != self.parent_view.ctx.author:
-            await interaction.followup.send("❌ 당신은 이 작업을 요청한 유저가 아닙니다.", ephemeral=True)
-            return
-
-        file_id = self.values[0]
-        file_name = next((opt.label for opt in self.options if opt.value == file_id), "알 수 없음")
-
-        # ✅ 복구 확인 메시지
-        confirm_msg = f"⚠️ `{file_name}` 파일로 복구하시겠습니까?"
-
-        view = ConfirmRollbackView(self.parent_view.ctx, file_id, file_name)
-        await interaction.followup.send(confirm_msg, view=view)
-        self.parent_view.stop()
-
-
-class ConfirmRollbackView(discord.ui.View):
-    def __init__(self, ctx, file_id, file_name):
-        super().__init__(timeout=30)
-        self.ctx = ctx
-        self.file_id = file_id
-        self.file_name = file_name
-
-    @discord.ui.button(label="✅ 복구", style=discord.ButtonStyle.green)
-    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != self.ctx.author:
-            await interaction.response.send_message("❌ 당신은 이 작업을 요청한 유저가 아닙니다.", ephemeral=True)
-            return
-
-        # 🔄 로딩 메시지 출력 전 버튼 비활성화
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.disabled = True
-        await interaction.message.edit(view=self)
-
-        # 🔄 로딩 메시지
-        await interaction.response.defer()
-        loading_msg = await interaction.followup.send("🔄 복구 중입니다... 잠시만 기다려주세요!")
-
-        # 🛰️ 복구 요청
-        logging.info(f"📂 복구 확정됨 → file_id: {self.file_id}")
-        try:
-            response = await asyncio.to_thread(requests.post, GAS_URL, json={
-                "action": "restoreFromFile",
-                "file_id": self.file_id
-            })
-
-            if response.status_code == 200 and "success" in response.text:
-                await loading_msg.edit(content=f"✅ **복구 완료!** `{self.file_name}` 로 되돌렸습니다.")
-            else:
-                await loading_msg.edit(content=f"🚨 복구 실패! 서버 응답: {response.text}")
-
-        except Exception as e:
-            await loading_msg.edit(content=f"🚨 복구 중 예외 발생: {e}")
-
-        self.stop()
-
-    @discord.ui.button(label="❌ 취소", style=discord.ButtonStyle.red)
-    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_message("🚫 복구 작업이 취소되었습니다.", ephemeral=True)
-        self.stop()
-
-
-
-
-
-@bot.event
-async def on_ready():
-    print(f'✅ {bot.user}로 로그인 완료!')
-
-import requests
-import logging
-import re
-
-import logging
 
 # ✅ 허용할 특정 유저 ID 목록 (서버 주인 외 추가 관리자)
 ALLOWED_USER_IDS = {123456789012345678, 987654321098765432}  # 원하는 유저 ID 추가
 
-def is_allowed_user(ctx):
-    """✅ 명령어를 사용할 수 있는 유저인지 확인하는 함수"""
-    return ctx.author.id in ALLOWED_USER_IDS or ctx.author.id == ctx.guild.owner_id  # 서버 주인 포함
-
-@bot.command()
-async def 등록(ctx, username: str = None, classname: str = None, *, nickname: str = None):
-    """
-    ✅ 유저 등록 / 업데이트 명령어 (대화형 입력 추가)
-    """
-    logging.basicConfig(level=logging.INFO)
-
-    logging.info("🚀 [등록 명령어 호출] username: %s, classname: %s, nickname: %s", username, classname, nickname)
-
-    # ✅ 유저명이 없으면 입력받기
-    if username is None:
-        await ctx.send("🎮 **등록할 유저명을 입력하세요! (30초 내 입력)**")
-
-        try:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            username = msg.content.strip()
-            logging.info(f"✅ [입력 완료] 유저명: {username}")
-        except asyncio.TimeoutError:
-            await ctx.send("⏳ **시간 초과! 다시 `!등록` 명령어를 입력하세요.**")
-            return
-
-    def get_existing_users_and_aliases():
-        """GAS에서 모든 유저명과 별명을 가져오는 함수"""
-        try:
-            logging.info("🔍 GAS에서 기존 유저 및 별명 데이터를 가져오는 중...")
-            response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-            if response.status_code == 200:
-                data = response.json()
-                logging.info("✅ GAS 유저 및 별명 데이터 가져오기 성공!")
-                return data.get("users", []), data.get("aliases", {})  # 유저 리스트, 유저별 별명 딕셔너리 반환
-            else:
-                logging.warning(f"⚠ GAS 데이터 가져오기 실패! HTTP {response.status_code}")
-                return [], {}
-        except Exception as e:
-            logging.error(f"🚨 GAS 요청 중 오류 발생: {e}")
-            return [], {}
-
-    existing_users, existing_aliases = get_existing_users_and_aliases()
-    logging.info(f"📋 기존 등록된 유저명: {existing_users}")
-    logging.info(f"📋 기존 등록된 별명 목록: {existing_aliases}")
-
-    # ✅ 닉네임 목록 변환 (모든 유저의 닉네임을 하나의 리스트로 변환)
-    all_existing_nicknames = {alias for alias_list in existing_aliases.values() for alias in alias_list}
-
-    # ✅ 1️⃣ 유저명이 기존 닉네임과 중복인지 확인
-    if username and username in all_existing_nicknames:
-        logging.warning(f"⚠ [중복 확인] `{username}` 이(가) 기존 닉네임과 중복됨!")
-        await ctx.send(f"🚨 **유저명 `{username}`은(는) 다른 유저의 닉네임으로 사용 중입니다!** 다른 유저명을 입력하세요.")
-        return
-
-    # ✅ 2️⃣ 닉네임 중복 검사 (닉네임이 있을 경우)
-    if nickname:
-        if nickname in existing_users:
-            await ctx.send(f"🚨 **닉네임 `{nickname}`은(는) 다른 유저의 유저명으로 사용 중입니다!** 다른 닉네임을 입력하세요.")
-            return
-
-        if nickname in all_existing_nicknames:
-            await ctx.send(f"🚨 **닉네임 `{nickname}`은(는) 이미 사용 중입니다!** 다른 닉네임을 입력하세요.")
-            return
-
-    # ✅ 기존 유저 여부 확인
-    is_update = username in existing_users
-    logging.info(f"📝 기존 유저 여부 확인: {is_update}")
-
-    # ✅ 클래스명 정렬 및 포맷 변환 (드/어/넥/슴 → 드, 어, 넥, 슴)
-    valid_classes = ["드", "어", "넥", "슴"]
-    if classname:
-        classname = classname.replace("/", ",")  # ✅ 슬래시 → 콤마 변경
-        classname_list = classname.split(",")
-        classname_list = sorted(set(c.strip() for c in classname_list if c.strip() in valid_classes),
-                                key=lambda x: valid_classes.index(x))
-        classname = ",".join(classname_list)
-        logging.info(f"🛠 클래스 정리 완료: {classname}")
-
-    # ✅ GAS로 등록 요청 (기존 유저면 업데이트)
-    payload = {
-        "action": "register",
-        "username": username,
-        "classname": classname if classname else None,
-        "nickname": nickname if nickname else None
-    }
-
-    logging.info(f"🚀 [GAS 요청 전송] Payload: {payload}")
-
-    # ✅ 메시지 설정
-    if is_update:
-        confirm_msg = f"✅ `{username}` 님의 정보가 **업데이트**됩니다!\n"
-        if classname:
-            confirm_msg += f"- 클래스: `{classname}`\n"
-        if nickname:
-            confirm_msg += f"- 닉네임: `{nickname}`"
-        error_msg = "🚨 정보 업데이트에 실패했습니다."
-    else:
-        confirm_msg = f"✅ `{username}` 님이 **새로 등록**됩니다!"
-        error_msg = "🚨 등록 요청에 실패했습니다."
-
-    view = ConfirmView(ctx, payload, confirm_msg, error_msg)
-
-    logging.info("✅ 등록 요청 완료, 사용자 확인 대기 중...")
-    await ctx.send(f"📋 `{username}` 님을 등록(또는 업데이트)하시겠습니까?", view=view)
-
-@bot.command()
-async def 별명등록(ctx, username: str = None, *, aliases: str = None):
-    """유저의 별명을 등록하는 명령어 (서버 주인 + 특정 유저만 가능)"""
-    if not is_allowed_user(ctx):
-        await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다! 702702 01 240826 국민 조민형 입금 후 변경 문의")
-        return
-
-    logging.basicConfig(level=logging.INFO)
-    logging.info(f"🚀 [별명등록 명령어 실행] username: {username}, aliases: {aliases}")
-
-    def get_existing_users_and_aliases():
-        """GAS에서 모든 유저명과 별명을 가져오는 함수"""
-        try:
-            logging.info("🔍 GAS에서 기존 유저 및 별명 데이터를 가져오는 중...")
-            response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-            if response.status_code == 200:
-                data = response.json()
-                logging.info("✅ GAS 유저 및 별명 데이터 가져오기 성공!")
-                return data.get("users", []), data.get("aliases", {})  # 유저 리스트, 유저별 별명 딕셔너리 반환
-            else:
-                logging.warning(f"⚠ GAS 데이터 가져오기 실패! HTTP {response.status_code}")
-                return [], {}
-        except Exception as e:
-            logging.error(f"🚨 GAS 요청 중 오류 발생: {e}")
-            return [], {}
-
-    existing_users, existing_aliases = get_existing_users_and_aliases()
-    logging.info(f"📋 기존 등록된 유저명: {existing_users}")
-    logging.info(f"📋 기존 등록된 별명 목록: {existing_aliases}")
-
-    def check_duplicate(new_aliases, username):
-        """새로운 별명이 기존 유저명 또는 다른 유저의 별명과 중복되는지 확인"""
-        user_existing_aliases = existing_aliases.get(username, [])  # ✅ 해당 유저의 기존 별명
-        all_existing_aliases = {alias for user, alias_list in existing_aliases.items() if user != username for alias in alias_list}
-
-        duplicate_with_users = [alias for alias in new_aliases if alias in existing_users]  # ✅ 유저명과 중복 체크
-        duplicate_with_others = [alias for alias in new_aliases if alias in all_existing_aliases]
-        duplicate_with_self = [alias for alias in new_aliases if alias in user_existing_aliases]
-
-        logging.info(
-            f"🔍 입력한 별명: {new_aliases} | 중복된 별명(유저명): {duplicate_with_users} | "
-            f"중복된 별명(다른 유저): {duplicate_with_others} | 중복된 별명(본인): {duplicate_with_self}"
-        )
-
-        return duplicate_with_users, duplicate_with_others, duplicate_with_self
-
-    async def request_new_alias(ctx, username):
-        """사용자로부터 별명을 입력받는 함수 (중복되지 않는 별명을 받을 때까지 실행)"""
-        attempts = 2
-        while attempts > 0:
-            try:
-                await ctx.send(f"✏️ `{username}` 님의 별명을 입력하세요! (쉼표 또는 슬래시 구분, 남은 시도 {attempts}회)")
-                msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-                alias_list = [alias.strip() for alias in re.split(r"[,/]", msg.content)]
-
-                if not alias_list:
-                    await ctx.send("🚨 **별명을 입력해야 합니다!** 다시 입력해주세요.")
-                    logging.warning("⚠ 입력된 별명이 없음")
-                    attempts -= 1
-                    continue
-
-                duplicate_with_users, duplicate_with_others, duplicate_with_self = check_duplicate(alias_list, username)
-
-                if not duplicate_with_users and not duplicate_with_others and not duplicate_with_self:
-                    logging.info(f"✅ 새로운 별명 입력 완료: {alias_list}")
-                    return alias_list
-
-                error_messages = []
-                if duplicate_with_users:
-                    error_messages.append(f"❌ **유저명과 중복된 별명** `{', '.join(duplicate_with_users)}`")
-                if duplicate_with_others:
-                    error_messages.append(f"❌ **다른 유저가 이미 사용 중인 별명** `{', '.join(duplicate_with_others)}`")
-                if duplicate_with_self:
-                    error_messages.append(f"❌ **이미 `{username}` 님이 사용 중인 별명** `{', '.join(duplicate_with_self)}`")
-
-                await ctx.send("\n".join(error_messages))
-                logging.warning(f"⚠ 중복된 별명 입력됨: {error_messages}")
-                attempts -= 1
-
-            except asyncio.TimeoutError:
-                logging.error(f"⏳ `{username}` 님이 30초 내 입력하지 않음.")
-                await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!별명등록`을 입력하세요!")
-                return None
-
-        await ctx.send("🚨 너무 많은 시도 횟수 초과! 다시 `!별명등록`을 입력하세요.")
-        logging.warning("🚨 별명 입력 시도 횟수 초과!")
-        return None
-
-    # ✅ 유저명 입력 확인
-    if not username:
-        await ctx.send("🎮 별명을 등록할 유저명을 입력하세요! (30초 내 입력)")
-        try:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            username = msg.content.strip()
-            logging.info(f"📋 입력된 유저명: {username}")
-        except asyncio.TimeoutError:
-            await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!별명등록`을 입력하세요!")
-            logging.error("⏳ 유저명 입력 시간 초과!")
-            return
-
-    if not aliases:
-        alias_list = await request_new_alias(ctx, username)
-        if alias_list is None:
-            return
-    else:
-        alias_list = [alias.strip() for alias in re.split(r"[,/]", aliases)]
-        duplicate_with_users, duplicate_with_others, duplicate_with_self = check_duplicate(alias_list, username)
-
-        if duplicate_with_users or duplicate_with_others or duplicate_with_self:
-            error_messages = []
-            if duplicate_with_users:
-                error_messages.append(f"❌ **유저명과 중복된 별명** `{', '.join(duplicate_with_users)}`")
-            if duplicate_with_others:
-                error_messages.append(f"❌ **다른 유저가 이미 사용 중인 별명** `{', '.join(duplicate_with_others)}`")
-            if duplicate_with_self:
-                error_messages.append(f"❌ **이미 `{username}` 님이 사용 중인 별명** `{', '.join(duplicate_with_self)}`")
-
-            await ctx.send("\n".join(error_messages))
-            logging.warning(f"⚠ 중복된 별명 입력됨: {error_messages}")
-            alias_list = await request_new_alias(ctx, username)
-            if alias_list is None:
-                return
-
-    payload = {
-        "action": "registerAlias",
-        "username": username,
-        "aliases": alias_list
-    }
-    logging.info(f"🚀 GAS로 전송할 데이터: {payload}")
-
-    view = ConfirmView(ctx, payload, f"✅ `{username}` 님의 별명이 등록되었습니다: {', '.join(alias_list)}",
-                       "🚨 별명 등록 요청에 실패했습니다.")
-
-    logging.info(f"✅ `{username}` 님의 별명 등록 요청 완료! 별명: {alias_list}")
-    await ctx.send(f"📋 `{username}` 님의 별명을 `{', '.join(alias_list)}` (으)로 등록하시겠습니까?", view=view)
-
-@bot.command()
-async def 조회(ctx, username: str = None):
-    """
-    ✅ 새로운 Results 시트 구조 반영
-    """
-    logging.basicConfig(level=logging.INFO)
-
-    if not username:
-        await ctx.send("🔍 조회할 유저명을 입력하세요! 예시: `!조회 규석문`")
-        logging.warning("⚠ 조회 명령어 실행 - 유저명이 입력되지 않음!")
-        return
-
-    logging.info(f"🚀 [조회 명령어 실행] username: {username}")
-
-    payload = {"action": "getUserInfo", "username": username}
-    logging.info(f"📡 GAS로 데이터 요청: {payload}")
-
-    response = requests.post(GAS_URL, json=payload)
-    raw_response = response.text  # 🔍 원본 응답 저장 (디버깅 용도)
-
-    logging.info(f"🔍 GAS 응답 코드: {response.status_code}")
-    logging.info(f"🔍 GAS 응답 본문: {raw_response}")
-
-    try:
-        data = response.json()
-        logging.info(f"✅ GAS 응답 JSON 디코딩 성공! 데이터: {data}")
-    except requests.exceptions.JSONDecodeError:
-        logging.error(f"🚨 JSON 디코딩 오류 발생! 원본 응답: {raw_response}")
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{raw_response}`")
-        return
-
-    if "error" in data:
-        logging.warning(f"⚠ GAS 응답에서 오류 발생: {data['error']}")
-        await ctx.send(f"🚨 {data['error']}")
-        return
-
-    # ✅ 데이터 가공 후 출력
-    msg = (
-        f"📜 **`{data.get('username', '알 수 없음')}` 님의 정보**\n"
-        f"\n🛡 **플레이 가능 클래스:** {data.get('class', '[Data 없음]')}\n"
-        f"🎭 **별명:** {data.get('nickname', '[Data 없음]')}\n"
-        f"📅 **마지막 경기 일시:** {data.get('last_game', '[Data 없음]')}\n"
-        f"🏆 **이번 시즌 전체 승수:** {data.get('season_wins', 0)}승"
-    )
-
-    logging.info(f"✅ 최종 조회 결과 출력: \n{msg}")
-
-    await ctx.send(msg)
-
-@bot.command()
-async def 클래스(ctx, username: str = None, *, classes: str = None):
-    """
-    ✅ 유저의 클래스를 등록하는 명령어
-    """
-    logging.basicConfig(level=logging.INFO)
-
-    valid_classes = ["드", "어", "넥", "슴"]  # ✅ 고정된 클래스 순서
-
-    def format_classes(class_input):
-        class_list = [c.strip() for c in re.split(r"[,/]", class_input)]
-        valid_class_list = [c for c in class_list if c in valid_classes]
-        invalid_class_list = [c for c in class_list if c not in valid_classes]
-        valid_class_list = sorted(set(valid_class_list), key=lambda x: valid_classes.index(x))
-        return ", ".join(valid_class_list), invalid_class_list
-
-    # ✅ 직접 입력 방식 (username + classes 함께 입력됨)
-    if username and classes:
-        logging.info(f"🚀 [클래스 등록 요청] username: {username}, classes: {classes}")
-        formatted_classes, invalids = format_classes(classes)
+def is_admin(user, guild):
+    return user.id in ALLOWED_USER_IDS or (guild is not None and user.id == guild.owner_id)  # 서버 주인 포함
 
-        if not formatted_classes:
-            await ctx.send("🚫 유효한 클래스가 없습니다. `드, 어, 넥, 슴` 중에서 입력하세요.")
-            return
-        if invalids:
-            await ctx.send(f"⚠️ 유효하지 않은 클래스는 제외됩니다: {', '.join(invalids)}")
 
-        payload = {
-            "action": "registerClass",
-            "username": username,
-            "classes": formatted_classes
-        }
-        logging.info(f"📡 GAS로 전송할 데이터: {payload}")
-
-        view = ConfirmView(
-            ctx, payload,
-            f"✅ `{username}` 님의 클래스가 등록되었습니다: {formatted_classes}",
-            "🚨 클래스 등록 요청에 실패했습니다."
-        )
+def is_allowed_user(ctx):
+    """✅ 명령어를 사용할 수 있는 유저인지 확인하는 함수"""
+    return is_admin(ctx.author, ctx.guild)
 
-        await ctx.send(f"🛡 `{username}` 님의 클래스를 `{formatted_classes}` (으)로 등록하시겠습니까?", view=view)
-        return
 
-    # ✅ 대화형 모드
-    logging.info("🔍 [클래스 등록 - 대화형 입력 시작]")
-    await ctx.send("🎭 클래스를 등록할 유저명을 입력하세요! (30초 내 입력)")
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-    try:
-        msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-        username = msg.content.strip()
-        logging.info(f"📋 입력된 유저명: {username}")
 
-        await ctx.send(f"🛡 `{username}` 님의 클래스를 입력하세요! (쉼표 또는 슬래시 구분, 예시: 드,어/넥,슴) (30초 내 입력)")
+# ✅ 온디맨드 프로파일링 (관리자 전용)
+command_profiler = CommandProfiler(PROFILE_DIR)
+memory_profiler = MemoryProfiler(PROFILE_DIR)
+profile_channel = None  # ✅ 프로파일 결과를 보낼 채널 (`!프로파일`을 실행한 채널)
+profile_timer = None
+PROFILE_COMMANDS = {"프로파일", "프로파일중지", "메모리"}
 
-        while True:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            formatted_classes, invalids = format_classes(msg.content)
-            logging.info(f"📋 입력된 클래스: {formatted_classes}")
 
-            if not formatted_classes:
-                await ctx.send("🚫 유효한 클래스가 없습니다. `드, 어, 넥, 슴` 중에서 다시 입력해주세요.")
-                continue
+# ✅ 매칭 대기열 (참가 / 나가기는 메모리만 변경, 로비 구성 시에도 로컬 유저 정보 사용)
+matchmaker = Matchmaker(MATCH_QUEUE_FILE)
+player_records = {}  # ✅ 로컬 복제본을 쓸 수 없을 때 한 번 받은 참가자 유저 정보
+lobby_status_messages = {}  # 채널 ID → `!대기열` 상태 메시지
+lobby_refresh_tasks = {}  # 채널 ID → 상태 메시지 수정 / 저장 예약 작업
 
-            if invalids:
-                await ctx.send(f"⚠️ 유효하지 않은 클래스는 제외됩니다: {', '.join(invalids)}")
 
-            break  # ✅ 유효한 클래스가 들어오면 루프 탈출
+# ✅ 슬래시 명령어 (자동완성은 메모리 인덱스만 사용 → GAS 요청 없음)
+player_index = PrefixIndex()
+game_index = PrefixIndex(newest_first=True)
+slash_synced = False
+replica_warmup_task = None
+GAME_INDEX_REFRESH_SECONDS = 60
 
-        payload = {
-            "action": "registerClass",
-            "username": username,
-            "classes": formatted_classes
-        }
-        logging.info(f"📡 GAS로 전송할 데이터: {payload}")
 
-        view = ConfirmView(
-            ctx, payload,
-            f"✅ `{username}` 님의 클래스가 등록되었습니다: {formatted_classes}",
-            "🚨 클래스 등록 요청에 실패했습니다."
-        )
+# ✅ 명령어 확장 (cogs/): `!리로드`로 프로세스 / 게이트웨이 연결 / 캐시를 유지한 채 코드만 교체
+EXTENSIONS = ["cogs.core", "cogs.users", "cogs.results", "cogs.teams", "cogs.lobby", "cogs.maintenance", "cogs.diagnostics",
+              "cogs.info"]
+SHARED_MODULES = ["shared", "views"]  # ✅ 확장들이 함께 쓰는 모듈 (`!리로드 전체`에서 확장보다 먼저 이 순서로 다시 불러옴)
 
-        await ctx.send(f"🛡 `{username}` 님의 클래스를 `{formatted_classes}` (으)로 등록하시겠습니까?", view=view)
 
-    except asyncio.TimeoutError:
-        logging.warning("⏳ 시간이 초과되었습니다. 유저 입력 없음.")
-        await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!클래스`를 입력하세요!")
+async def load_extensions():
+    for name in EXTENSIONS:
+        await bot.load_extension(name)
+    logging.info(f"🧩 [확장] {len(EXTENSIONS)}개 로드: {EXTENSIONS}")
 
+bot.setup_hook = load_extensions
 
-import logging
 
 @bot.command()
-async def 결과등록(ctx, *, input_text: str = None):
-    """
-    ✅ !결과등록 명령어: 승리팀과 패배팀을 입력하면 경기 결과를 등록
-    """
-    logging.basicConfig(level=logging.INFO)
-
-    logging.info(f"📥 `!결과등록` 명령어 실행 → {ctx.author} ({ctx.author.id}) | 입력: {input_text}")
-
-    if input_text:
-        logging.info(f"🔍 입력된 경기 결과 파싱 시작: {input_text}")
-
-        # ✅ **스코어 총합 초과 검사 (9점 초과 시 오류)**
-        raw_scores = re.findall(r'\d+', input_text)
-        logging.info(f"🔢 추출된 점수: {raw_scores}")
-
-        if len(raw_scores) >= 2:
-            win_score, lose_score = map(int, raw_scores[:2])
-            total_score = win_score + lose_score
-
-            logging.info(f"🏆 승리팀 점수: {win_score}, ❌ 패배팀 점수: {lose_score}, 🔄 총합: {total_score}")
-
-        win_players, lose_players, win_score, lose_score, status = parse_match_input(input_text)
-
-        if status == "invalid_format":
-            await ctx.send("🚨 **잘못된 형식입니다!**\n`!결과등록 [아래5]유저1/... vs [위4]유저5/...`")
-            return
-        elif status == "invalid_player_count":
-            await ctx.send("🚨 **플레이어 수 오류입니다!** 양 팀 모두 4명씩 입력해야 합니다.")
-            return
-        elif status == "draw":
-            await ctx.send("🚨 **동점 경기는 등록할 수 없습니다!**")
-            return
-
-        logging.info(f"🏆 승리팀: {win_players}, ❌ 패배팀: {lose_players}, 🏅 스코어: {win_score}-{lose_score}")
-
-        if win_players is None or lose_players is None:
-            logging.warning(f"🚨 입력 형식 오류: {input_text}")
-            await ctx.send(
-                "🚨 **잘못된 형식입니다!**\n"
-                "`!결과등록 [아래5]유저1,유저2,유저3,유저4 vs [위4]유저5,유저6,유저7,유저8`\n"
-                "✅ **순서 주의:** 반드시 `드,어,넥,슴` 클래스 순서대로 입력해야 합니다."
-            )
-            return
-
-        await validate_and_register(ctx, win_players, lose_players, win_score, lose_score)
-        return
-
-    # ✅ 대화형 입력 모드
-    logging.info("📝 대화형 입력 모드 활성화")
-    await ctx.send(
-        "🏆 **경기 결과를 입력하세요!**\n"
-        "예시: `!결과등록 [아래5]유저1,유저2,유저3,유저4 vs [위4]유저5,유저6,유저7,유저8`\n"
-        "✅ **순서 주의:** 반드시 `드,어,넥,슴` 클래스 순서대로 입력해야 합니다."
-    )
-
-
-async def validate_and_register(ctx, win_players, lose_players, win_score, lose_score):
+async def 리로드(ctx, name: str = None):
     """
-    ✅ 유저 등록 여부 확인 후 경기 등록 진행 (action 기반 payload_type 자동 결정)
+    ✅ 명령어 확장 다시 불러오기 (관리자 전용)
+    - `!리로드 teams` → cogs/teams.py만, `!리로드 전체` → shared.py / views.py + 모든 확장 (동작 중인 버튼도 새 코드로 교체)
+    - 상태(캐시 / 대기열 / 버튼 / 복제본)는 bot 모듈에 있어서 그대로 유지, 실패하면 이전 코드가 계속 동작
+    - 슬래시 명령어의 이름 / 인자를 바꿨다면 재시작해야 디스코드에 다시 등록됨
     """
-    logging.info(f"✅ 유저 등록 여부 확인 중: {win_players + lose_players}")
-
-    # 명령어 실행한 유저 정보 추가
-    submitted_by = ctx.author.display_name
-    logging.info(f"📢 경기 결과 등록 요청자: {submitted_by}")
-
-    all_players = win_players + lose_players
-    response = requests.post(GAS_URL, json={"action": "getPlayersInfo", "players": all_players})
-
-    if response.status_code != 200:
-        logging.error(f"❌ 서버 응답 오류: {response.status_code}, 내용: {response.text}")
-        await ctx.send("🚨 서버 응답 오류로 인해 경기 등록을 진행할 수 없습니다. 다시 시도해주세요.")
-        return
-
-    data = response.json()
-    logging.info(f"📜 GAS 응답 데이터: {data}")
-
-    if "error" in data:
-        logging.warning(f"🚨 GAS 응답 오류: {data['error']}")
-        await ctx.send(f"🚨 {data['error']}")
-        return
-
-    registered_users = {player["username"] for player in data["players"]}
-    unregistered_users = [p for p in all_players if p not in registered_users]
-
-    if unregistered_users:
-        logging.warning(f"⛔ 등록되지 않은 유저 발견: {unregistered_users}")
-        await ctx.send(f"🚨 등록되지 않은 유저가 포함되어 있습니다: {', '.join(unregistered_users)}")
+    if not is_allowed_user(ctx):
+        await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
         return
 
-    # ✅ 경기번호 생성
-    game_number = datetime.now().strftime("%y%m%d%H%M%S")
-    logging.info(f"🎮 생성된 경기번호: {game_number}")
-
-    # ✅ payload 준비
-    payload = {
-        "action": "registerResult",
-        "game_number": game_number,
-        "winners": win_players,
-        "losers": lose_players,
-        "win_score": win_score,
-        "lose_score": lose_score,
-        "submitted_by": submitted_by
-    }
-    logging.info(f"🚀 경기 결과 등록 요청 데이터: {payload}")
-
-    # ✅ action 기반 payload_type 자동 결정
-    action = payload.get("action", "")
-    payload_type = "game_result" if action == "registerResult" else "generic"
-
-    # ✅ ConfirmView 생성
-    view = ConfirmView(
-        ctx=ctx,
-        payload=payload,
-        success_message=lambda x: f"✅ 경기 결과가 기록되었습니다! **[게임번호: {game_number}]**\n"
-                                  f"🏆 **승리 팀:** {format_team(win_players)} (스코어: {win_score})\n"
-                                  f"❌ **패배 팀:** {format_team(lose_players)} (스코어: {lose_score})\n"
-                                  f"👤 **등록자:** {submitted_by}",
-        error_message="🚨 경기 등록 요청에 실패했습니다.",
-        payload_type=payload_type,
-        game_number=game_number
-    )
-
-    # ✅ 최종 메시지 전송
-    await ctx.send(
-        f"📊 **승리 팀:** {format_team(win_players)} (스코어: {win_score})\n"
-        f"❌ **패배 팀:** {format_team(lose_players)} (스코어: {lose_score})\n"
-        f"👤 **등록자:** {submitted_by}\n\n"
-        f"경기 결과를 등록하시겠습니까?",
-        view=view
-    )
-
-def parse_match_input(input_text):
-    """
-    ✅ 경기 결과 텍스트에서 승리/패배 팀을 추출하는 함수
-    """
-    logging.info(f"📝 경기 결과 분석 중: {input_text}")
-
-    match = re.match(r"\[아래(\d+)]\s*(.+?)\s*vs\s*\[위(\d+)]\s*(.+)", input_text)
-
-    if not match:
-        logging.warning(f"🚨 입력 형식 오류: {input_text}")
-        return None, None, None, None, "invalid_format"
-
-    below_score = int(match.group(1))
-    above_score = int(match.group(3))
-    below_players = [p.strip() for p in match.group(2).split("/") if p.strip()]
-    above_players = [p.strip() for p in match.group(4).split("/") if p.strip()]
-
-    if len(below_players) != 4 or len(above_players) != 4:
-        logging.warning(f"🚨 플레이어 수 오류: {below_players} vs {above_players}")
-        return None, None, None, None, "invalid_player_count"
-
-    if below_score == above_score:
-        logging.warning(f"🚨 동점 경기 발생: {input_text}")
-        return None, None, None, None, "draw"
-
-    if below_score > above_score:
-        return below_players, above_players, below_score, above_score, "valid"
-    else:
-        return above_players, below_players, above_score, below_score, "valid"
-
-def format_team(team):
-    """
-    ✅ 유저명 + 클래스 포맷 적용
-    """
-    class_order = ["드", "어", "넥", "슴"]
-    return ", ".join(f"{player}({class_order[i]})" for i, player in enumerate(team))
-
-
-
-@bot.command()
-async def 결과조회(ctx, game_number: str = None):
-    """
-    ✅ 특정 경기 조회 or 최근 경기 조회
-    """
-    logging.basicConfig(level=logging.INFO)
-    logging.info(f"📥 `!결과조회` 명령어 입력됨. 입력된 game_number: {game_number}")
-
-    # ✅ 특정 경기 조회 or 최근 경기 조회 선택
-    if game_number:
-        payload = {"action": "getMatch", "game_number": int(game_number)}
-        logging.info(f"🔍 특정 경기 조회 요청: 게임번호 `{game_number}`")
-    else:
-        payload = {"action": "getRecentMatches"}
-        logging.info("🔍 최근 5경기 조회 요청")
-
-    logging.info(f"🚀 요청 URL: {GAS_URL}")
-    logging.info(f"📡 전송 데이터: {payload}")
-
-    try:
-        response = requests.post(GAS_URL, json=payload)
-        logging.info(f"📡 GAS 응답 상태 코드: {response.status_code}")
-        logging.info(f"📜 GAS 응답 원본: {response.text}")
-
-        data = response.json()
-        logging.info(f"🔍 변환된 GAS 응답 (JSON): {json.dumps(data, indent=2, ensure_ascii=False)}")
-
-    except requests.exceptions.JSONDecodeError:
-        logging.error(f"🚨 JSON 변환 오류 발생! 원본 응답: {response.text}")
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
+    if not name:
+        loaded = ", ".join(f"`{ext.split('.')[-1]}`" for ext in EXTENSIONS if ext in bot.extensions)
+        await ctx.send(f"🧩 사용법: `!리로드 <확장>` 또는 `!리로드 전체`\n로드된 확장: {loaded}")
         return
 
-    # ✅ 최근 5경기 조회
-    if "matches" in data and len(data["matches"]) > 0:
-        logging.info(f"✅ 최근 {len(data['matches'])}개 경기 데이터 감지됨!")
-        msg = "📊 **최근 5경기 결과:**\n"
-
-        for i, match in enumerate(data["matches"], start=1):
-            logging.info(f"🧐 디버깅: match 데이터 = {match}")  # ✅ match 데이터 확인
-
-            # ✅ 날짜 포맷 변경
-            timestamp = match.get("timestamp", "알 수 없음")
+    results = []
+    if name == "전체":
+        for module in SHARED_MODULES:
+            started = time.perf_counter()
             try:
-                formatted_date = datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M").strftime("%Y-%m-%d %H:%M")
-            except ValueError:
-                formatted_date = timestamp  # 변환 실패 시 원래 값 사용
-                logging.warning(f"⚠️ 날짜 변환 실패: `{timestamp}`")
-
-            msg += f"`[{i}]` 🎮 **게임번호:** `{match.get('game_number', '알 수 없음')}`\n"
-            msg += f"📅 **날짜:** {formatted_date}\n"
-            msg += f"🏆 **승리 팀:** {match.get('winners', '데이터 없음')}\n"
-            msg += f"❌ **패배 팀:** {match.get('losers', '데이터 없음')}\n\n"
-
-        await ctx.send(msg)
-
-    # ✅ 특정 경기 조회
-    elif "game_number" in data:
-        logging.info(f"✅ 개별 경기 데이터 감지됨: {data}")
-        msg = f"📜 **경기 정보**\n"
-        msg += f"🎮 **게임번호:** `{data.get('game_number', '알 수 없음')}`\n"
-        msg += f"📅 **날짜:** {data.get('timestamp', '알 수 없음')}\n"
-        msg += f"🏆 **승리 팀:** {data.get('winners', '데이터 없음')}\n"
-        msg += f"❌ **패배 팀:** {data.get('losers', '데이터 없음')}"
-
-        await ctx.send(msg)
-
-    else:
-        logging.warning("🚨 조회된 경기 기록이 없음!")
-        await ctx.send("🚨 해당 경기 기록이 없습니다.")
-
-@bot.command()
-async def 결과삭제(ctx, game_number: str = None):
-    """
-    ✅ 특정 경기 기록을 삭제하는 명령어
-    """
-    logging.basicConfig(level=logging.INFO)
-    logging.info(f"📥 `!결과삭제` 명령어 실행됨. 입력된 game_number: {game_number}")
-
-    if not game_number:
-        await ctx.send("🗑 삭제할 경기번호를 입력하세요! (30초 내 입력)")
-
-        def check(msg):
-            return msg.author == ctx.author and msg.channel == ctx.channel
-
-        try:
-            msg = await bot.wait_for("message", check=check, timeout=30.0)
-            game_number = msg.content.strip()  # 사용자가 입력한 게임번호
-            logging.info(f"✅ 입력된 게임번호: {game_number}")
-        except asyncio.TimeoutError:
-            logging.warning("⏳ 게임번호 입력 시간 초과됨.")
-            await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!결과삭제`를 입력하세요!")
-            return
-
-    # ✅ 해당 경기의 정보를 먼저 조회
-    payload = {"action": "getMatch", "game_number": game_number}
-    logging.info(f"🚀 GAS 요청 URL: {GAS_URL}")
-    logging.info(f"📡 전송 데이터: {payload}")
-
-    response = requests.post(GAS_URL, json=payload)
-    logging.info(f"📡 GAS 응답 상태 코드: {response.status_code}")
-    logging.info(f"📜 GAS 응답 원본: {response.text}")
-
-    try:
-        data = response.json()
-        logging.info(f"🔍 변환된 GAS 응답 (JSON): {json.dumps(data, indent=2, ensure_ascii=False)}")
-    except requests.exceptions.JSONDecodeError:
-        logging.error(f"🚨 JSON 변환 오류 발생! 원본 응답: {response.text}")
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    if "error" in data:
-        logging.warning(f"🚨 GAS에서 오류 반환: {data['error']}")
-        await ctx.send(f"🚨 {data['error']}")
-        return
-
-    # ✅ 승/패 팀 정보 가져오기 (리스트로 변환)
-    win_players = data.get("winners", "").split(", ") if isinstance(data.get("winners"), str) else data.get("winners", [])
-    lose_players = data.get("losers", "").split(", ") if isinstance(data.get("losers"), str) else data.get("losers", [])
-
-    # ✅ 팀 데이터가 정상적으로 로드되었는지 확인
-    logging.info(f"🏆 승리 팀: {win_players}")
-    logging.info(f"❌ 패배 팀: {lose_players}")
-
-    if not win_players or not lose_players:
-        logging.error("🚨 경기 데이터가 비어 있음! 경기번호가 올바른지 확인 필요.")
-        await ctx.send("🚨 경기 데이터를 가져올 수 없습니다. 경기번호를 확인하세요.")
-        return
-
-    def format_team(team):
-        """ ✅ 유저명 + 클래스 순서 적용 """
-        if not team or len(team) < 4:
-            logging.warning("🚨 팀 데이터가 4명 이하로 감지됨! 데이터 손상 가능성 있음.")
-            return "데이터 오류 (4명 부족)"
-
-        return ", ".join(f"{player.strip()}" for i, player in enumerate(team[:4]))  # ✅ 4명까지만 적용
-
-    win_team_info = format_team(win_players)
-    lose_team_info = format_team(lose_players)
-
-    # ✅ 삭제 확인 메시지
-    delete_message = (
-        f"⚠️ `{game_number}` 경기 기록을 삭제하시겠습니까?\n"
-        f" - 삭제 [승] {win_team_info}\n"
-        f" - 삭제 [패] {lose_team_info}"
-    )
-    logging.info(f"📋 삭제 전 최종 확인 메시지:\n{delete_message}")
-
-    # ✅ 삭제 요청 전 확인
-    delete_payload = {"action": "deleteMatch", "game_number": game_number}
-    logging.info(f"🚀 GAS에 삭제 요청 전송: {delete_payload}")
-
-    async def confirm_callback(interaction):
-        response = requests.post(GAS_URL, json=delete_payload)
-        logging.info(f"📡 GAS 응답 상태 코드 (삭제 요청): {response.status_code}")
-        logging.info(f"📜 GAS 응답 원본 (삭제 요청): {response.text}")
-
-        try:
-            data = response.json()
-            if "error" in data:
-                logging.warning(f"🚨 GAS에서 삭제 요청 실패: {data['error']}")
-                await ctx.send(f"🚨 오류: {data['error']}")
+                importlib.reload(sys.modules[module])
+            except Exception as e:
+                logging.error(f"🚨 [확장] `{module}` 리로드 실패: {e}", exc_info=e)
+                results.append(f"🚨 `{module}` 실패: {e}\n확장은 다시 불러오지 않았습니다.")
+                await ctx.send("\n".join(results))
                 return
+            results.append(f"✅ `{module}` ({(time.perf_counter() - started) * 1000:.0f}ms)")
 
-            # ✅ 삭제 완료 메시지 (경기 정보 포함)
-            result_message = (
-                f"✅ `{game_number}` 경기 기록이 삭제되었습니다!\n"
-                f" - 삭제 [승] {win_team_info}\n"
-                f" - 삭제 [패] {lose_team_info}"
-            )
-            logging.info("✅ 경기 삭제 완료!")
-            await ctx.send(result_message)
-
-        except Exception as e:
-            logging.error(f"🚨 경기 삭제 요청 중 예외 발생: {e}")
-            await ctx.send("🚨 경기 삭제 요청에 실패했습니다.")
-
-    result_message = (
-        f"✅ `{game_number}` 경기 기록이 삭제되었습니다!\n"
-        f" - 삭제 [승] {win_team_info}\n"
-        f" - 삭제 [패] {lose_team_info}"
-    )
-
-    view = ConfirmView(
-        ctx,
-        delete_payload,
-        result_message,
-        "🚨 경기 삭제 요청에 실패했습니다.",
-        game_number=game_number
-    )
-
-    await ctx.send(delete_message, view=view)
-import logging
-
-@bot.command(aliases=["도움", "헬프", "명령어"])
-async def 도움말(ctx):
-    """
-    ✅ 봇의 모든 명령어 목록을 출력하는 도움말 기능
-    """
-    logging.basicConfig(level=logging.INFO)
-    logging.info(f"📥 `!도움말` 명령어 실행됨. 요청한 사용자: {ctx.author.name}")
-
-    help_text = (
-        "**📘 사용 가능한 명령어 목록**\n\n"
-
-        "**🧑‍💼 유저 관리**\n"
-        "📥 `!등록` [유저명] [클래스] [별명] - 유저 등록 또는 수정\n"
-        "🧾 `!조회` [유저명] - 유저 정보 조회\n"
-        "🛡️ `!클래스` [유저명] [클래스] - 클래스 등록/변경\n"
-        "🏷️ `!별명등록` [유저명] [별명들] - 별명 등록 (👑 관리자 전용)\n"
-        "❌ `!별명삭제` [유저명] - 별명 전체 삭제 (👑 관리자 전용)\n\n"
-
-        "**📊 경기 기록**\n"
-        "📝 `!결과등록` [경기결과] - 경기 결과 등록\n"
-        "📄 `!결과조회` [게임번호] - 특정 경기 or 최근 5경기 조회\n"
-        "⏪ `!최근결과삭제` - 가장 최근 결과 복구 (30분 이내)\n\n"
-
-        "**🤝 팀 생성**\n"
-        "🔀 `!팀생성` [유저(클래스)] - MMR 기반 팀 생성 (클래스 포함)\n"
-        "🔐 `!팀생성고급` [유저1, ..., 유저8] - 고급 랜덤 팀 생성\n\n"
-
-        "**🛠️ 백업 / 시즌 (👑 관리자 전용)**\n"
-        "💾 `!백업` - 수동 백업 실행\n"
-        "🧹 `!백업정리` - 오래된 백업 정리\n"
-        "📦 `!롤백` - 백업 파일에서 롤백\n"
-        "📸 `!스냅샷` [시즌명] - 시즌별 스냅샷 생성\n"
-        "🗂️ `!시즌목록` - 시즌 목록과 기간 확인\n\n"
-
-        "**🌐 기타**\n"
-        "🖥️ `!홈페이지` - 리그 기록실 링크\n"
-        "🛠️ `!세팅` - 클래스별 세팅 가이드\n"
-        "📘 `!도움말` - 명령어 전체 보기\n"
-    )
-
-    logging.info("📜 도움말 메시지 내용 준비 완료.")
-
-    try:
-        await ctx.send(help_text)
-        logging.info("✅ 도움말 메시지 전송 성공!")
-    except Exception as e:
-        logging.error(f"🚨 도움말 메시지 전송 실패! 오류: {str(e)}")
-        await ctx.send("🚨 도움말 메시지를 전송하는 중 오류가 발생했습니다!")
-
-@bot.command()
-async def 팀생성일반(ctx, *, players: str = None):
-    """
-    ✅ MMR 순위를 기반으로 1~4등 중 2명, 5~8등 중 2명을 뽑아 팀을 나눔
-    ✅ 유저명뿐만 아니라 닉네임으로도 팀 생성 가능 (닉네임 → 유저명 변환)
-    ✅ 포지션을 랜덤하게 섞되, 해당 플레이어가 가진 클래스만 배치됨
-    """
-    import random
-
-    # ✅ 유저 입력 받기
-    if not players:
-        await ctx.send("🚨 **팀을 생성할 유저 목록을 입력하세요! (쉼표 또는 슬래시로 구분, 정확히 8명 입력 필수)**\n"
-                       "⏳ **30초 내로 유저명을 입력해주세요!**")
+    targets = EXTENSIONS if name == "전체" else [name if name.startswith("cogs.") else f"cogs.{name}"]
+    for extension in targets:
+        started = time.perf_counter()
         try:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            players = msg.content.strip()
-        except asyncio.TimeoutError:
-            await ctx.send("⏳ **시간 초과! 다시 `!팀생성` 명령어를 입력하세요.**")
-            return
+            if extension in bot.extensions:
+                await bot.reload_extension(extension)
+            else:
+                await bot.load_extension(extension)
+        except commands.ExtensionError as e:
+            logging.error(f"🚨 [확장] `{extension}` 리로드 실패: {e}", exc_info=e)
+            results.append(f"🚨 `{extension}` 실패: {e.__cause__ or e}")
+            continue
+        logging.info(f"🧩 [확장] `{extension}` 리로드 ({ctx.author})")
+        results.append(f"✅ `{extension}` ({(time.perf_counter() - started) * 1000:.0f}ms)")
 
-    player_list = list(set(re.split(r"[,/]", players.strip())))
-    logging.info(f"🎯 입력된 유저 리스트: {player_list}")
-
-    # ✅ GAS에서 유저명 & 닉네임 데이터 가져오기
-    response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-    try:
-        data = response.json()
-        if "error" in data:
-            await ctx.send(f"🚨 오류: {data['error']}")
-            return
-    except requests.exceptions.JSONDecodeError:
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    # ✅ 유저명 & 닉네임 매핑 정보
-    username_list = data.get("users", [])  # ✅ 유저명 리스트
-    alias_map = {alias: user for user, aliases in data.get("aliases", {}).items() for alias in aliases}  # 닉네임 → 유저명 매핑
-
-    # ✅ 입력한 값들을 유저명으로 변환
-    converted_players = []
-    unknown_players = []
-    for p in player_list:
-        if p in username_list:
-            converted_players.append(p)  # ✅ 원래 유저명 그대로 사용
-        elif p in alias_map:
-            converted_players.append(alias_map[p])  # ✅ 닉네임 → 유저명 변환
-            logging.info(f"🔄 닉네임 `{p}` → 유저명 `{alias_map[p]}` 변환 완료")
-        else:
-            unknown_players.append(p)  # ❌ 찾을 수 없는 유저
-
-    logging.info(f"🎯 **최종 변환된 유저 리스트:** {converted_players}")
-    logging.info(f"🚨 **등록되지 않은 유저:** {unknown_players}")
-
-    if len(converted_players) != 8:
-        await ctx.send(f"🚨 **팀 생성 불가! 정확히 8명의 유저를 입력해야 합니다!**\n"
-                       f"❌ **등록되지 않은 유저:** `{', '.join(unknown_players)}`")
-        return
-
-    # ✅ GAS에서 플레이어 정보 가져오기
-    payload = {"action": "getPlayersInfo", "players": converted_players}
-    response = requests.post(GAS_URL, json=payload)
-
-    try:
-        data = response.json()
-    except requests.exceptions.JSONDecodeError:
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    if "error" in data:
-        await ctx.send(f"🚨 {data['error']}")
-        return
-
-    players_data = data.get("players", [])
-    if not players_data:
-        await ctx.send(f"🚨 오류: 유저 정보를 가져오지 못했습니다.\n🔍 응답 내용: `{data}`")
-        return
-
-    registered_users = {p['username'] for p in players_data}
-    missing_users = [p for p in converted_players if p not in registered_users]
-
-    # ✅ **등록되지 않은 유저가 있으면 팀 생성 불가!**
-    if missing_users:
-        await ctx.send(f"🚨 **팀 생성 불가!** ❌\n"
-                       f"⛔ **등록되지 않은 유저**: `{', '.join(missing_users)}`\n"
-                       "📌 **해결 방법**: `!등록 [유저명]` 명령어로 유저를 등록한 후 다시 시도해주세요!")
-        return
-
-    # ✅ MMR 기준 정렬 (내림차순)
-    players_data.sort(key=lambda x: x['mmr'], reverse=True)
-    logging.info(f"📊 **MMR 순위 정렬된 유저 리스트:** {[(p['username'], p['mmr']) for p in players_data]}")
-
-    # ✅ 팀 생성 및 검증 로직
-    def create_balanced_teams():
-        top_half = random.sample(players_data[:4], 2)  # 상위 4명 중 2명 선택
-        bottom_half = random.sample(players_data[4:], 2)  # 하위 4명 중 2명 선택
-        team1 = top_half + bottom_half
-        team2 = [p for p in players_data if p not in team1]
-        return team1, team2
-
-    attempts = 0
-    valid_teams = False
-    while attempts < 10:
-        team1, team2 = create_balanced_teams()
-        logging.info(f"🎲 **랜덤 팀 배정 시도 {attempts+1}:** 팀1 - {team1}, 팀2 - {team2}")
-        valid_teams = True  # 검증 로직 간소화 (필요하면 check_valid_teams 추가)
-        if valid_teams:
-            break
-        attempts += 1
-
-    if not valid_teams:
-        await ctx.send("🚨 **팀 생성 실패! 유효한 조합을 찾을 수 없습니다.**")
-        return
-
-    # ✅ 팀 내 포지션 랜덤 배치
-    def shuffle_team_roles(team):
-        positions = ["드", "어", "넥", "슴"]
-        random.shuffle(positions)
-        shuffled_team = []
-        for position in positions:
-            available_players = [p for p in team if position in p["class"]]
-            if available_players:
-                selected_player = random.choice(available_players)
-                shuffled_team.append({"username": selected_player["username"], "class": position})
-                team.remove(selected_player)
-        return shuffled_team
-
-    team1 = shuffle_team_roles(team1)
-    team2 = shuffle_team_roles(team2)
-
-    logging.info(f"🔄 **팀1 최종 포지션:** {team1}")
-    logging.info(f"🔄 **팀2 최종 포지션:** {team2}")
-
-    # ✅ 최종 팀 배정 후 메시지 출력
-    team1_names = "/".join([p['username'] for p in team1])
-    team2_names = "/".join([p['username'] for p in team2])
-    msg = f"[아래] {team1_names} vs [위] {team2_names}"
-
-    await ctx.send(msg)
-
-@bot.command()
-async def 팀생성고급(ctx, *, players: str = None):
-    """
-    ✅ MMR 순위를 기반으로 2 to 1 (1/2, 3/4, 5/6, 7/8) 로 팀을 나눔 (고급 모드)
-    ✅ 닉네임 지원 및 포지션 무작위 섞기 적용
-    """
-    import random
-    logging.info("🚀 [팀생성고급] 명령어 실행됨")
-
-    # ✅ 유저 입력 받기
-    if not players:
-        await ctx.send(
-            "※ **해당 명령어는 관리자 전용 입니다.**\n"
-            "일반적인 팀생성은 `!팀생성` 명령어를 사용해주세요.\n"
-            "📌 **팀을 생성할 유저 목록을 입력하세요!** (쉼표 또는 슬래시 구분, 정확히 8명 입력 필수)"
-        )
-        try:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            players = msg.content.strip()
-        except asyncio.TimeoutError:
-            await ctx.send("⏳ **시간 초과! 다시 `!팀생성고급` 명령어를 입력하세요.**")
-            return
-
-    player_list = list(set(re.split(r"[,/]", players.strip())))
-    logging.info(f"🎯 입력된 유저 리스트: {player_list}")
-
-    # ✅ GAS에서 등록된 유저 및 별명 목록 가져오기
-    alias_response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-    try:
-        alias_data = alias_response.json()
-        existing_users = alias_data.get("users", [])
-        existing_aliases = alias_data.get("aliases", {})
-    except requests.exceptions.JSONDecodeError:
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{alias_response.text}`")
-        return
-
-    # ✅ 닉네임 → 실제 유저명 변환
-    resolved_players = []
-    unresolved_players = []
-
-    for player in player_list:
-        if player in existing_users:
-            resolved_players.append(player)  # ✅ 유저명이 존재하면 그대로 추가
-        else:
-            matched_user = None
-            for username, aliases in existing_aliases.items():
-                if player in aliases:
-                    matched_user = username
-                    break
-            if matched_user:
-                resolved_players.append(matched_user)  # ✅ 닉네임을 유저명으로 변환하여 추가
-                logging.info(f"🔄 닉네임 `{player}` → 유저명 `{matched_user}` 변환 완료")
-            else:
-                unresolved_players.append(player)  # ✅ 등록되지 않은 유저 저장
-
-    logging.info(f"✅ 최종 변환된 유저 리스트: {resolved_players}")
-    logging.info(f"🚨 등록되지 않은 유저: {unresolved_players}")
-
-    # ✅ 등록되지 않은 유저가 있으면 팀 생성 불가
-    if unresolved_players:
-        await ctx.send(
-            f"🚨 **팀 생성 불가!** ❌\n"
-            f"⛔ **등록되지 않은 유저/닉네임**: `{', '.join(unresolved_players)}`\n"
-            "📌 **해결 방법**: `!등록 [유저명]` 명령어로 유저를 등록한 후 다시 시도해주세요!"
-        )
-        return
-
-    # ✅ 유저 정보 요청 (GAS)
-    payload = {"action": "getPlayersInfo", "players": resolved_players}
-    response = requests.post(GAS_URL, json=payload)
-
-    try:
-        data = response.json()
-    except requests.exceptions.JSONDecodeError:
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    if "error" in data:
-        await ctx.send(f"🚨 {data['error']}")
-        return
-
-    players_data = data["players"]
-
-    # ✅ MMR 기준 정렬 (내림차순)
-    players_data.sort(key=lambda x: x['mmr'], reverse=True)
-    logging.info(f"📊 MMR 정렬된 유저 리스트: {[(p['username'], p['mmr']) for p in players_data]}")
-
-    # ✅ MMR 순위에 따른 고정 팀 배정 (2 to 1)
-    possible_combinations = [
-        ([0, 2, 4, 6], [1, 3, 5, 7]),
-        ([0, 3, 5, 6], [1, 2, 4, 7]),
-        ([0, 2, 5, 7], [1, 3, 4, 6]),
-        ([0, 3, 4, 7], [1, 2, 5, 6])
-    ]
-
-    # ✅ 랜덤하게 팀 조합을 선택 (최대 10번 시도)
-    attempts = 0
-    valid_teams = False
-    team1, team2 = [], []
-
-    while attempts < 10 and possible_combinations:
-        team1_idx, team2_idx = random.choice(possible_combinations)
-        team1 = [players_data[i] for i in team1_idx]
-        team2 = [players_data[i] for i in team2_idx]
-        logging.info(f"🎲 랜덤 팀 배정 시도 {attempts+1}: 팀1 - {team1}, 팀2 - {team2}")
-
-        valid_teams = True  # 필요하면 check_valid_teams 추가 가능
-        if valid_teams:
-            break
-        attempts += 1
-
-    if not valid_teams:
-        await ctx.send("🚨 **팀 생성 실패! 유효한 조합을 찾을 수 없습니다.**")
-        return
-
-    # ✅ 팀 내 포지션 랜덤 배치
-    def shuffle_team_roles(team):
-        positions = ["드", "어", "넥", "슴"]
-        random.shuffle(positions)
-        shuffled_team = []
-
-        for position in positions:
-            available_players = [p for p in team if position in p["class"]]
-            if available_players:
-                selected_player = random.choice(available_players)
-                shuffled_team.append({"username": selected_player["username"], "class": position})
-                team.remove(selected_player)
-
-        return shuffled_team
-
-    team1 = shuffle_team_roles(team1)
-    team2 = shuffle_team_roles(team2)
-
-    logging.info(f"🔄 팀1 최종 포지션: {team1}")
-    logging.info(f"🔄 팀2 최종 포지션: {team2}")
-
-    # ✅ 최종 팀 배정 후 메시지 출력
-    team1_names = "/".join([p['username'] for p in team1])
-    team2_names = "/".join([p['username'] for p in team2])
-    msg = f"[아래] {team1_names} vs [위] {team2_names}"
-
-    await ctx.send(msg)
-
-
-@bot.command()
-async def MMR갱신(ctx):
-    """
-    ✅ 모든 플레이어의 MMR을 현재 계수 정보로 다시 계산하는 명령어
-    ✅ 디버깅 로그 추가됨 (요청 시작, 응답 확인, 오류 처리)
-    """
-    import logging
-
-    logging.info("🚀 [MMR갱신] 명령어 실행됨")
-
-    await ctx.send("🔄 **모든 플레이어의 MMR을 최신 계수 값으로 갱신 중입니다... (잠시만 기다려주세요!)**")
-
-    payload = {"action": "updateAllMMR"}
-    logging.info(f"📤 [MMR갱신 요청] Payload: {payload}")
-
-    response = requests.post(GAS_URL, json=payload)
-
-    try:
-        data = response.json()
-        logging.info(f"📩 [서버 응답 수신] 응답 데이터: {data}")
-
-    except requests.exceptions.JSONDecodeError:
-        logging.error(f"🚨 [오류] GAS 응답이 JSON 형식이 아님! 응답 내용: {response.text}")
-        await ctx.send(f"🚨 **오류 발생:** GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    # ✅ 서버 응답 확인
-    if "error" in data:
-        logging.error(f"🚨 [오류] MMR 갱신 중 문제 발생: {data['error']}")
-        await ctx.send(f"🚨 **MMR 갱신 실패!**\n🔍 오류 내용: `{data['error']}`")
-        return
-
-    # ✅ 성공적으로 갱신된 경우
-    logging.info("✅ [MMR갱신 완료] 모든 플레이어의 MMR이 정상적으로 갱신됨")
-    await ctx.send(f"✅ **모든 플레이어의 MMR이 갱신되었습니다!**")
-
-@bot.command()
-async def 별명삭제(ctx, username: str = None):
-    """
-    ✅ 특정 유저의 모든 등록된 별명을 삭제하는 명령어
-    - `!별명삭제 유저명` → 해당 유저의 별명을 삭제
-    - `!별명삭제` → 유저명을 입력받아서 별명을 삭제
-    ✅ 디버깅 로그 추가됨
-    """
-
-    if not is_allowed_user(ctx):
-        await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다! 702702 01 240826 국민 조민형 입금 후 변경 문의")
-        return
-
-    import logging
-    logging.basicConfig(level=logging.INFO)
-
-    logging.info("🚀 [별명삭제] 명령어 실행됨")
-
-    # ✅ GAS에서 유저별 별명 가져오기
-    def get_existing_users_and_aliases():
-        try:
-            logging.info("🔍 GAS에서 기존 유저 및 별명 데이터를 가져오는 중...")
-            response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-
-            if response.status_code == 200:
-                data = response.json()
-                logging.info("✅ GAS 유저 및 별명 데이터 가져오기 성공!")
-                return data.get("users", []), data.get("aliases", {})
-
-            else:
-                logging.warning(f"⚠ GAS 데이터 가져오기 실패! HTTP {response.status_code}")
-                return [], {}
-
-        except Exception as e:
-            logging.error(f"🚨 [오류] GAS 요청 중 문제 발생: {e}")
-            return [], {}
-
-    # ✅ 유저 및 별명 데이터 가져오기
-    existing_users, existing_aliases = get_existing_users_and_aliases()
-    logging.info(f"📋 [유저 목록] 기존 등록된 유저명: {existing_users}")
-    logging.info(f"📋 [별명 목록] 기존 등록된 별명: {existing_aliases}")
-
-    # ✅ 대화형 모드: 유저명을 입력받기
-    if username is None:
-        await ctx.send("🎮 **별명을 삭제할 유저명을 입력하세요! (30초 내 입력)**")
-
-        try:
-            msg = await bot.wait_for("message", check=lambda m: m.author == ctx.author, timeout=30.0)
-            username = msg.content.strip()
-            logging.info(f"✅ [입력 받은 유저명] {username}")
-
-        except asyncio.TimeoutError:
-            logging.warning("⏳ [시간 초과] 별명 삭제 요청이 중단됨")
-            await ctx.send("⏳ **시간 초과! 다시 `!별명삭제` 명령어를 입력하세요.**")
-            return
-
-    # ✅ 유저 존재 여부 확인
-    if username not in existing_users:
-        logging.warning(f"🚨 [오류] `{username}` 유저가 등록되지 않음")
-        await ctx.send(f"🚨 **유저 `{username}` 를 찾을 수 없습니다!** 먼저 `!등록` 명령어로 등록하세요.")
-        return
-
-    # ✅ 해당 유저의 별명 확인
-    user_aliases = existing_aliases.get(username, [])
-    logging.info(f"📋 `{username}` 님의 현재 등록된 별명: {user_aliases}")
-
-    if not user_aliases:
-        logging.info(f"⚠️ `{username}` 님은 별명이 등록되어 있지 않음")
-        await ctx.send(f"⚠️ **`{username}` 님은 등록된 별명이 없습니다!**")
-        return
-
-    # ✅ 삭제 요청 확인 메시지
-    confirm_msg = (
-        f"⚠️ **`{username}` 님의 모든 별명을 삭제하시겠습니까?**\n"
-        f"📋 **현재 등록된 별명:** `{', '.join(user_aliases)}`"
-    )
-    error_msg = "🚨 별명 삭제 요청에 실패했습니다."
-
-    # ✅ GAS로 삭제 요청 준비
-    payload = {
-        "action": "deleteAlias",
-        "username": username
-    }
-    logging.info(f"📤 [별명 삭제 요청] Payload: {payload}")
-
-    # ✅ 삭제 요청을 확인하는 ConfirmView 생성
-    view = ConfirmView(ctx, payload, f"✅ `{username}` 님의 별명이 삭제되었습니다!", error_msg)
-    await ctx.send(confirm_msg, view=view)
-    logging.info(f"✅ [별명 삭제 요청 전송 완료] `{username}` 님의 별명 삭제 요청됨")
-
-@bot.command(aliases=["홈피", "웹페이지", "웹"])
-async def 홈페이지(ctx):
-    """내전 기록실 웹페이지로 이동하는 버튼 제공"""
-    view = discord.ui.View()
-    button = discord.ui.Button(label="📊 [내전 기록실 이동]", url="https://69dia.vercel.app/", style=discord.ButtonStyle.link)
-    view.add_item(button)
-
-    await ctx.send("🔗 **내전 기록실 웹페이지로 이동하려면 버튼을 클릭해주세요.**", view=view)
-
-
-@bot.command(aliases=["셋팅"])
-async def 세팅(ctx):
-    """캐릭터별 세팅을 볼 수 있는 블로그 링크 버튼 제공"""
-    view = discord.ui.View()
-    button = discord.ui.Button(label="🔧 [클래스별 세팅가이드]", url="https://blog.naver.com/lovlince/222991937440",
-                               style=discord.ButtonStyle.link)
-    view.add_item(button)
-
-    await ctx.send("🔗 **각 클래스별 세팅을 조회하시려면, 아래 버튼을 클릭해주세요.**", view=view)
-
-import aiohttp
-
-# 로깅 설정
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-
-
-def has_sufficient_classes(players_data):
-    class_counts = {"드": 0, "어": 0, "넥": 0, "슴": 0}
-    for player in players_data:
-        actual_classes = player.get("class", "").split(", ")
-        for cls in actual_classes:
-            if cls in class_counts:
-                class_counts[cls] += 1
-
-    logging.info(f"📊 [클래스 분포] {class_counts}")
-    insufficient = [cls for cls, count in class_counts.items() if count < 2]
-    return (len(insufficient) == 0), insufficient
-
-class TeamGenerationView(discord.ui.View):
-    def __init__(self, ctx, players, parsed_classes):
-        super().__init__()
-        self.ctx = ctx
-        self.players = players
-        self.parsed_players = parsed_classes
-        self.team1 = []
-        self.team2 = []
-        self.message = None  # ✅ 기존 메시지를 저장할 변수 추가
-        self.status_message = None  # ✅ "팀 생성 중..." 메시지 저장 변수
-
-    async def get_player_data(self):
-        """GAS에서 유저 정보 가져오기 (비동기 방식)"""
-        payload = {"action": "getPlayersInfo", "players": self.players}
-        logging.info(f"📡 [GAS 요청] 유저 정보 요청: {payload}")
-
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(GAS_URL, json=payload, timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logging.info(f"✅ [GAS 응답] 성공: {data}")
-                        return data
-                    else:
-                        logging.warning(f"⚠ [GAS 응답] 실패 (상태 코드: {response.status})")
-                        await self.ctx.send(f"🚨 GAS 응답 오류: 상태 코드 {response.status}")
-                        return None
-            except Exception as e:
-                logging.error(f"🚨 GAS 요청 실패: {e}")
-                await self.ctx.send(f"🚨 GAS 요청 중 오류 발생: {e}")
-                return None
-
-    def generate_teams(self, players_data):
-        """MMR 기반 팀 생성 (일반 방식)"""
-        sufficient, lacking = has_sufficient_classes(players_data)
-        if not sufficient:
-            error_msg = f"🚨 클래스별 2명 이상 필요: 부족한 클래스 → {', '.join(lacking)}"
-            asyncio.create_task(self.status_message.edit(content=error_msg))
-            logging.warning(f"❌ [클래스 부족] {error_msg}")
-            return
-
-
-        for p in players_data:
-            preferred = self.parsed_players.get(p["username"])  # 예: ["드", "넥"]
-            if preferred:
-                mmrs = []
-                for c in preferred:
-                    key = {
-                        "드": "mmrD",
-                        "어": "mmrA",
-                        "넥": "mmrN",
-                        "슴": "mmrS"
-                    }.get(c)
-                    if key and key in p:
-                        mmrs.append(p[key])
-                if mmrs:
-                    p["effective_mmr"] = sum(mmrs) / len(mmrs)
-                else:
-                    p["effective_mmr"] = p["mmr"]
-            else:
-                p["effective_mmr"] = p["mmr"]
-
-        players_data.sort(key=lambda x: x["effective_mmr"], reverse=True)  # MMR 정렬
-        logging.info(f"📊 [MMR 정렬] 유저 데이터: {[(p['username'], p['effective_mmr']) for p in players_data]}")
-
-        top_half = random.sample(players_data[:4], 2)
-        bottom_half = random.sample(players_data[4:], 2)
-        self.team1 = top_half + bottom_half
-        self.team2 = [p for p in players_data if p not in self.team1]
-
-        logging.info(f"🔴 [팀1] {self.team1}")
-        logging.info(f"🔵 [팀2] {self.team2}")
-
-    def generate_teams_advanced(self, players_data):
-        """MMR 기반 팀 생성 (고급 방식)"""
-
-        sufficient, lacking = has_sufficient_classes(players_data)
-        if not sufficient:
-            error_msg = f"🚨 클래스별 2명 이상 필요: 부족한 클래스 → {', '.join(lacking)}"
-            asyncio.create_task(self.status_message.edit(content=error_msg))
-            logging.warning(f"❌ [클래스 부족] {error_msg}")
-            return
-
-        for p in players_data:
-            preferred = self.parsed_players.get(p["username"])  # 예: ["드", "넥"]
-            if preferred:
-                mmrs = []
-                for c in preferred:
-                    key = {
-                        "드": "mmrD",
-                        "어": "mmrA",
-                        "넥": "mmrN",
-                        "슴": "mmrS"
-                    }.get(c)
-                    if key and key in p:
-                        mmrs.append(p[key])
-                if mmrs:
-                    p["effective_mmr"] = sum(mmrs) / len(mmrs)
-                else:
-                    p["effective_mmr"] = p["mmr"]
-            else:
-                p["effective_mmr"] = p["mmr"]
-
-        players_data.sort(key=lambda x: x["effective_mmr"], reverse=True)  # MMR 정렬
-
-        logging.info(f"📊 [고급 MMR 정렬] 유저 데이터: {[(p['username'], p['mmr']) for p in players_data]}")
-
-        possible_combinations = [
-            ([0, 2, 4, 6], [1, 3, 5, 7]),
-            ([0, 3, 5, 6], [1, 2, 4, 7]),
-            ([0, 2, 5, 7], [1, 3, 4, 6]),
-            ([0, 3, 4, 7], [1, 2, 5, 6])
-        ]
-
-        attempts = 0
-        while attempts < 10:
-            team1_idx, team2_idx = random.choice(possible_combinations)
-            self.team1 = [players_data[i] for i in team1_idx]
-            self.team2 = [players_data[i] for i in team2_idx]
-
-            logging.info(f"🎲 [고급 랜덤 배정 시도 {attempts + 1}] 팀1: {self.team1}, 팀2: {self.team2}")
-            return
-
-        logging.warning("🚨 [고급 팀 생성 실패] 유효한 조합을 찾지 못함")
-        self.ctx.send("🚨 **팀 생성 실패! 유효한 조합을 찾을 수 없습니다.**")
-
-    @discord.ui.button(label="MIX!", style=discord.ButtonStyle.green)
-    async def mix_teams(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """일반 MMR 기반 팀 생성"""
-        await interaction.response.defer()
-        self.disable_buttons()  # ✅ 버튼 비활성화
-        await self.update_status_message("⏳ **팀을 생성 중입니다...**")  # ✅ "팀 생성 중..." 메시지 표시
-
-        data = await self.get_player_data()
-        if not data or "players" not in data:
-            self.enable_buttons()  # ✅ 서버 응답 실패 시 버튼 다시 활성화
-            return
-
-        # ✅ 팀 내 포지션 랜덤 배치
-        def shuffle_team_roles(team):
-            positions = ["드", "어", "넥", "슴"]
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 1회차] {positions}")
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 2회차] {positions}")
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 3회차] {positions}")
-
-            shuffled_team = []
-            assigned_players = set()
-
-            logging.info("🔄 [클래스 배정 시작] 팀 구성원: %s", [p["username"] for p in team])
-            logging.info("🔀 [포지션 셔플 결과] %s", positions)
-
-            # 1. 단일 지정 클래스 우선 배정
-            for position in positions:
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    preferred = self.parsed_players.get(username)
-                    if preferred and len(preferred) == 1 and preferred[0] == position:
-                        shuffled_team.append({
-                            "username": username,
-                            "class": position
-                        })
-                        assigned_players.add(username)
-                        logging.info("🔒 [단일 지정 고정 배정] %s → %s", username, position)
-                        break
-
-            # 1. 유저 지정 클래스 우선 배정
-            for position in positions:
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    preferred = self.parsed_players.get(username)
-                    if preferred and position in preferred:
-                        shuffled_team.append({
-                            "username": username,
-                            "class": position
-                        })
-                        assigned_players.add(username)
-                        logging.info("✅ [지정 클래스 배정] %s → %s", username, position)
-                        break  # 해당 포지션에 한 명만 배정
-
-            # 2. 나머지 유저를 가능한 포지션에 랜덤 배정
-            for position in positions:
-                if any(member["class"] == position for member in shuffled_team):
-                    continue  # 이미 배정된 포지션이면 skip
-
-                available_players = []
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    actual_classes = p.get("class", "").split(", ")
-                    if position in actual_classes:
-                        available_players.append(p)
-
-                if available_players:
-                    selected = random.choice(available_players)
-                    shuffled_team.append({
-                        "username": selected["username"],
-                        "class": position
-                    })
-                    assigned_players.add(selected["username"])
-                    logging.info("🌀 [자동 배정] %s → %s", selected["username"], position)
-                else:
-                    logging.warning("⚠️ [포지션 미배정] %s 포지션에 적합한 유저 없음", position)
-                    return False
-
-            logging.info("🏁 [최종 클래스 배정 결과] %s", shuffled_team)
-
-            # ✅ 정렬 추가
-            position_order = {"드": 0, "어": 1, "넥": 2, "슴": 3}
-            shuffled_team.sort(key=lambda x: position_order.get(x["class"], 99))
-
-            logging.info("🏁 [최종 클래스 배정 결과(정렬)] %s", shuffled_team)
-
-            return shuffled_team
-
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            self.generate_teams(data["players"])
-
-            logging.info(f"🔄 팀1 최종 포지션(랜덤 배치 전): {self.team1}")
-            logging.info(f"🔄 팀2 최종 포지션(랜덤 배치 전): {self.team2}")
-
-            team1 = shuffle_team_roles(self.team1)
-            team2 = shuffle_team_roles(self.team2)
-
-            if team1 and team2:
-                break
-            elif attempt == max_attempts - 1:
-                await self.update_status_message("🚨 팀 생성 실패: 포지션 배정이 불가능한 조합입니다.")
-                self.enable_buttons()
-                return
-
-        logging.info(f"🔄 팀1 최종 포지션: {team1}")
-        logging.info(f"🔄 팀2 최종 포지션: {team2}")
-
-        result_text = f"[아래]{'/'.join([p['username'] for p in team1])} vs [위]{'/'.join([p['username'] for p in team2])}"
-
-        result_msg = f"""🏆 **MMR 기반 팀 생성 결과 (일반)** 🏆
-
-        🔴 **아랫팀:** {', '.join([p['username'] for p in team1])}
-        🔵 **윗팀:** {', '.join([p['username'] for p in team2])}
-
-        🎮 경기 준비 완료!
-        
-    {result_text}"""
-
-        await self.update_status_message(result_msg)  # ✅ 기존 메시지 업데이트
-
-        self.enable_buttons()  # ✅ 서버 응답 완료 후 버튼 다시 활성화
-
-    @discord.ui.button(label="MIX!(고급)", style=discord.ButtonStyle.blurple)
-    async def mix_teams_advanced(self, interaction: discord.Interaction, button: discord.ui.Button):
-        """고급 MMR 기반 팀 생성"""
-        await interaction.response.defer()
-        await self.update_status_message("⏳ **팀(고급)을 생성 중입니다...**")  # ✅ "팀 생성 중..." 메시지 표시
-        self.disable_buttons()  # ✅ 버튼 비활성화
-
-        data = await self.get_player_data()
-        if not data or "players" not in data:
-            self.enable_buttons()  # ✅ 서버 응답 실패 시 버튼 다시 활성화
-            return
-
-        def shuffle_team_roles(team):
-            positions = ["드", "어", "넥", "슴"]
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 1회차] {positions}")
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 2회차] {positions}")
-
-            random.shuffle(positions)
-            logging.info(f"🔀 [셔플 3회차] {positions}")
-
-            shuffled_team = []
-            assigned_players = set()
-
-            logging.info("🔄 [클래스 배정 시작] 팀 구성원: %s", [p["username"] for p in team])
-            logging.info("🔀 [포지션 셔플 결과] %s", positions)
-
-            # 1. 단일 지정 클래스 우선 배정
-            for position in positions:
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    preferred = self.parsed_players.get(username)
-                    if preferred and len(preferred) == 1 and preferred[0] == position:
-                        shuffled_team.append({
-                            "username": username,
-                            "class": position
-                        })
-                        assigned_players.add(username)
-                        logging.info("🔒 [단일 지정 고정 배정] %s → %s", username, position)
-                        break
-
-            # 1. 유저 지정 클래스 우선 배정
-            for position in positions:
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    preferred = self.parsed_players.get(username)
-                    if preferred and position in preferred:
-                        shuffled_team.append({
-                            "username": username,
-                            "class": position
-                        })
-                        assigned_players.add(username)
-                        logging.info("✅ [지정 클래스 배정] %s → %s", username, position)
-                        break  # 해당 포지션에 한 명만 배정
-
-            # 2. 나머지 유저를 가능한 포지션에 랜덤 배정
-            for position in positions:
-                if any(member["class"] == position for member in shuffled_team):
-                    continue  # 이미 배정된 포지션이면 skip
-
-                available_players = []
-                for p in team:
-                    username = p["username"]
-                    if username in assigned_players:
-                        continue
-
-                    actual_classes = p.get("class", "").split(", ")
-                    if position in actual_classes:
-                        available_players.append(p)
-
-                if available_players:
-                    selected = random.choice(available_players)
-                    shuffled_team.append({
-                        "username": selected["username"],
-                        "class": position
-                    })
-                    assigned_players.add(selected["username"])
-                    logging.info("🌀 [자동 배정] %s → %s", selected["username"], position)
-                else:
-                    logging.warning("⚠️ [포지션 미배정] %s 포지션에 적합한 유저 없음", position)
-                    return False
-
-            logging.info("🏁 [최종 클래스 배정 결과] %s", shuffled_team)
-
-            # ✅ 정렬 추가
-            position_order = {"드": 0, "어": 1, "넥": 2, "슴": 3}
-            shuffled_team.sort(key=lambda x: position_order.get(x["class"], 99))
-
-            logging.info("🏁 [최종 클래스 배정 결과(정렬)] %s", shuffled_team)
-
-            return shuffled_team
-
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            self.generate_teams_advanced(data["players"])
-
-            logging.info(f"🔄 팀1 최종 포지션(랜덤 배치 전): {self.team1}")
-            logging.info(f"🔄 팀2 최종 포지션(랜덤 배치 전): {self.team2}")
-
-            team1 = shuffle_team_roles(self.team1)
-            team2 = shuffle_team_roles(self.team2)
-
-            if team1 and team2:
-                break
-            elif attempt == max_attempts - 1:
-                await self.update_status_message("🚨 팀 생성 실패: 포지션 배정이 불가능한 조합입니다.")
-                self.enable_buttons()
-                return
-
-        result_text = f"[아래]{'/'.join([p['username'] for p in team1])} vs [위]{'/'.join([p['username'] for p in team2])}"
-
-        result_msg = f"""🏆 **MMR 기반 팀 생성 결과 (고급)** 🏆
-
-        🔴 **아랫팀:** {', '.join([p['username'] for p in team1])}
-        🔵 **윗팀:** {', '.join([p['username'] for p in team2])}
-    
-        🎮 경기 준비 완료!
-    
-    {result_text}"""
-
-        await self.update_status_message(result_msg)  # ✅ 기존 메시지 업데이트
-
-        self.enable_buttons()  # ✅ 서버 응답 완료 후 버튼 다시 활성화
-
-    def disable_buttons(self):
-        """버튼을 비활성화 (서버 응답 대기 중)"""
-        for child in self.children:
-            child.disabled = True
-        if self.message:
-            asyncio.create_task(self.message.edit(view=self))
-
-    def enable_buttons(self):
-        """버튼을 다시 활성화 (서버 응답 완료 후)"""
-        for child in self.children:
-            child.disabled = False
-        if self.message:
-            asyncio.create_task(self.message.edit(view=self))
-
-    async def update_status_message(self, content):
-        """상태 메시지 업데이트 (팀 생성 중 → 결과 표시)"""
-        if self.status_message:
-            await self.status_message.edit(content=content)
-        else:
-            self.status_message = await self.ctx.send(content)
-
-
-@bot.command()
-async def 팀생성(ctx, *, players: str = None):
-    """팀 생성 명령어"""
-    logging.info(f"🚀 [팀생성 명령어 실행] 입력된 플레이어: {players}")
-
-    if not players:
-        await ctx.send("🚨 **8명의 유저를 입력하세요! (쉼표 또는 슬래시로 구분)**")
-        return
-
-    player_list = list(set(re.split(r"[,/]", players.strip())))
-    player_list = re.findall(r"[^\s,()/]+(?:\([^\)]+\))?", players.strip())
-
-    logging.info(f"🎯 입력된 유저 리스트: {player_list}")
-
-    parsed_players = {}
-
-    for p in player_list:
-        p = p.strip()
-        match = re.match(r"^([^\(]+)\(([^)]+)\)$", p)
-        if match:
-            username, class_override = match.groups()
-            parsed_players[username.strip()] = [c.strip() for c in class_override.split(",")]
-            logging.info(f"🔍 클래스 지정됨: {username.strip()} → {parsed_players[username.strip()]}")
-        else:
-            parsed_players[p] = None
-            logging.info(f"ℹ️ 클래스 미지정: {p}")
-
-    logging.info(f"🔍 [유저 입력 파싱 완료] {parsed_players}")
-
-    player_list = list(parsed_players.keys())
-
-    if len(player_list) != 8:
-        await ctx.send("🚨 **정확히 8명의 유저를 입력해야 합니다!**")
-        return
-
-    # ✅ GAS에서 유저명 & 닉네임 데이터 가져오기
-    response = requests.get(f"{GAS_URL}?action=getUsersAndAliases")
-    try:
-        data = response.json()
-        if "error" in data:
-            await ctx.send(f"🚨 오류: {data['error']}")
-            return
-    except requests.exceptions.JSONDecodeError:
-        await ctx.send(f"🚨 오류: GAS 응답이 JSON 형식이 아닙니다.\n🔍 응답 내용: `{response.text}`")
-        return
-
-    # ✅ 유저명 & 닉네임 매핑 정보
-    username_list = data.get("users", [])  # ✅ 유저명 리스트
-    alias_map = {alias: user for user, aliases in data.get("aliases", {}).items() for alias in
-                 aliases}  # 닉네임 → 유저명 매핑
-
-    # ✅ 입력한 값들을 유저명으로 변환
-    converted_players = []
-    unknown_players = []
-    for p in player_list:
-        if p in username_list:
-            converted_players.append(p)  # ✅ 원래 유저명 그대로 사용
-        elif p in alias_map:
-            converted_players.append(alias_map[p])  # ✅ 닉네임 → 유저명 변환
-            logging.info(f"🔄 닉네임 `{p}` → 유저명 `{alias_map[p]}` 변환 완료")
-        else:
-            unknown_players.append(p)  # ❌ 찾을 수 없는 유저
-
-    logging.info(f"🎯 **최종 변환된 유저 리스트:** {converted_players}")
-    logging.info(f"🚨 **등록되지 않은 유저:** {unknown_players}")
-
-    if len(converted_players) != 8:
-        await ctx.send(f"🚨 **팀 생성 불가! 정확히 8명의 유저를 입력해야 합니다!**\n"
-                       f"❌ **등록되지 않은 유저:** `{', '.join(unknown_players)}`")
-        return
-
-    view = TeamGenerationView(ctx, converted_players, parsed_players)
-    message = await ctx.send("🔄 **팀을 생성할 방식을 선택하세요!**", view=view)
-    view.message = message  # ✅ 첫 번째 메시지를 저장하여 이후 MIX 버튼 클릭 시 업데이트 가능
-
-@bot.command()
-async def 백업(ctx):
-    """🛠 스프레드시트 수동 백업"""
-    await ctx.send("📦 백업을 시작합니다...")
-
-    response = requests.post(GAS_URL, json={"action": "triggerBackupFromDiscord"})
-
-    if response.status_code != 200:
-        await ctx.send("🚨 서버 오류로 백업에 실패했습니다.")
-        return
-
-    data = response.json()
-    if "error" in data:
-        await ctx.send(f"🚨 오류 발생: {data['error']}")
-    else:
-        await ctx.send(f"✅ {data['success']}")
-
-@bot.command()
-async def 백업정리(ctx):
-    """🧹 오래된 백업 정리"""
-    await ctx.send("🧹 오래된 백업을 정리하는 중입니다...")
-
-    response = requests.post(GAS_URL, json={"action": "cleanupBackups"})
-
-    if response.status_code != 200:
-        await ctx.send("🚨 서버 오류로 백업 정리에 실패했습니다.")
-        return
-
-    data = response.json()
-    if "error" in data:
-        await ctx.send(f"🚨 오류 발생: {data['error']}")
-    else:
-        await ctx.send(f"✅ {data['success']}")
-
-@bot.command()
-async def 스냅샷(ctx, *, season_name: str = None):
-    """📊 특정 시즌 기준으로 스냅샷 생성"""
-    if not season_name:
-        await ctx.send("❗ 시즌명을 입력해주세요!\n예: `!스냅샷 2024-04 시즌`")
-        return
-
-    await ctx.send(f"📊 `{season_name}` 기준으로 스냅샷을 생성 중입니다...")
-
-    response = requests.post(GAS_URL, json={
-        "action": "generateSeasonSnapshot",
-        "seasonName": season_name
-    })
-
-    if response.status_code != 200:
-        await ctx.send("🚨 서버 오류로 스냅샷 생성에 실패했습니다.")
-        return
-
-    data = response.json()
-    if "error" in data:
-        await ctx.send(f"🚨 오류 발생: {data['error']}")
-    else:
-        await ctx.send(f"✅ {data['success']}")
-
-@bot.command()
-async def 시즌목록(ctx):
-    """📋 시즌 시트 기준으로 시즌 목록 + 기간 출력"""
-    response = requests.post(GAS_URL, json={"action": "getSeasonList"})
-
-    if response.status_code != 200:
-        await ctx.send("🚨 서버 오류로 시즌 목록을 불러올 수 없습니다.")
-        return
-
-    data = response.json()
-    if "seasons" in data and data["seasons"]:
-        formatted = "\n".join(
-            f"• `{s['name']}` ({s['start']} ~ {s['end']})" for s in data["seasons"]
-        )
-        await ctx.send(f"📋 시즌 목록:\n{formatted}")
-    else:
-        await ctx.send("📂 시즌 시트에 등록된 시즌이 없습니다.")
-
-
-@bot.command()
-async def 최근결과삭제(ctx):
-    """
-    ⏪ 가장 최근 경기 결과를 복구하는 명령어
-    - 경기 등록 후 30분 이내만 가능
-    - Players / Results / History 시트를 복구
-    """
-    # ✅ 복구 요청 시 다시 한 번 확인
-    confirm_msg = (
-        "⚠️ **정말 마지막으로 등록된 경기 결과를 되돌리시겠습니까?**\n"
-        "📌 **30분이 경과한 백업은 자동으로 삭제되므로 복구할 수 없습니다.**"
-    )
-
-    view = ConfirmView(
-        ctx,
-        {"action": "restoreLastBackup"},
-        "✅ 마지막 경기 결과가 복구되었습니다!",
-        "🚨 복구에 실패했습니다."
-    )
-
-    await ctx.send(confirm_msg, view=view)
-
-@bot.command()
-async def 롤백(ctx):
-    """📦 백업 파일 중 하나를 선택하여 롤백"""
-    response = requests.post(GAS_URL, json={"action": "getBackupFileList"})
-    if response.status_code != 200:
-        await ctx.send("🚨 백업 목록 불러오기 실패!")
-        return
-
-    data = response.json()
-    backups = data.get("backups", [])
-    if not backups:
-        await ctx.send("📂 백업 파일이 존재하지 않습니다.")
-        return
+    if SLASH_GUILD_ID and slash_synced:
+        bot.tree.copy_global_to(guild=discord.Object(id=int(SLASH_GUILD_ID)))  # ✅ 서버 전용 사본도 새 슬래시 명령어로 교체
+    await ctx.send("\n".join(results))
 
-    # 최대 10개까지만
-    options = [
-        discord.SelectOption(label=b["name"], value=b["id"], description=b["created"].split("T")[0])
-        for b in backups[:5]
-    ]
 
-    view = RollbackSelectView(ctx, options)
-    await ctx.send("📁 복구할 백업 파일을 선택해주세요:", view=view)
+def main():
+    with open("bot_pid.txt", "w") as f:
+        f.write(str(os.getpid()))
+    bot.run(TOKEN)
+    gas_cache.save_if_dirty()  # ✅ 종료 직전까지 바뀐 캐시 저장
 
 
-bot.run(TOKEN)
+if __name__ == "__main__":
+    sys.modules.setdefault("bot", sys.modules[__name__])  # ✅ 확장의 `from bot import ...`가 실행 중인 이 모듈을 가리키도록
+    main()
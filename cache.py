@@ -0,0 +1,162 @@
+"""
+✅ GAS 장애 대비 마지막 정상 응답 캐시 + 보류 중인 경기 결과 보관함
+
+- SnapshotCache: 읽기 요청의 마지막 정상 응답을 파일에 저장해 두고, GAS가 응답하지 않을 때 (데이터, 저장 후 경과 초)로 반환
+  - getPlayersInfo: 유저별로 나눠 저장 → 요청한 유저가 모두 저장되어 있으면 조합해서 반환
+  - getUserInfo / getMatch: 유저명 / 게임번호별로 저장
+  - 그 외(getUsersAndAliases, getRecentMatches, getSeasonList, getAllMatches ...): action 단위로 저장
+- 시트 수정 알림(webhook.py)을 받으면 invalidate / patch_players로 해당 항목만 삭제하거나 갱신
+- 저장 / 삭제는 메모리만 바꾸고 dirty 표시 → save_if_dirty()로 모아서 파일에 저장 (읽기 요청마다 파일 전체를 쓰지 않도록)
+- WriteOutbox: GAS 장애로 등록하지 못한 경기 결과 payload를 파일에 보관 → GAS 복구 후 순서대로 재전송
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _load(path, default):
+    if not path or not os.path.exists(path):
+        return default
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"⚠️ [캐시] `{path}` 읽기 실패, 비어 있는 상태로 시작: {e}")
+        return default
+
+
+class SnapshotCache:
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = _load(path, {})  # 키 → {"saved_at": epoch 초, "data": 응답}
+        self.dirty = False
+        self._lock = threading.Lock()  # ✅ asyncio.to_thread 작업에서도 호출됨
+
+    @staticmethod
+    def _key(payload):
+        action = payload.get("action")
+        if action == "getUserInfo":
+            return f"user:{payload.get('username')}"
+        if action == "getMatch":
+            return f"match:{payload.get('game_number')}"
+        return action
+
+    def store(self, payload, data):
+        """✅ 정상 응답 저장 (GAS 오류 응답은 저장하지 않음)"""
+        if not isinstance(data, dict) or "error" in data:
+            return
+        now = time.time()
+        with self._lock:
+            if payload.get("action") == "getPlayersInfo":
+                for player in data.get("players", []):
+                    self.entries[f"player:{player.get('username')}"] = {"saved_at": now, "data": player}
+            else:
+                self.entries[self._key(payload)] = {"saved_at": now, "data": data}
+            self.dirty = True
+
+    def lookup(self, payload):
+        """✅ 저장된 응답 → (데이터, 저장 후 경과 초). 없으면 None"""
+        now = time.time()
+        with self._lock:
+            if payload.get("action") == "getPlayersInfo":
+                entries = [self.entries.get(f"player:{name}") for name in payload.get("players", [])]
+                if not entries or None in entries:
+                    return None
+                oldest = min(entry["saved_at"] for entry in entries)
+                return {"players": [entry["data"] for entry in entries]}, now - oldest
+
+            entry = self.entries.get(self._key(payload))
+            if entry is None:
+                return None
+            return entry["data"], now - entry["saved_at"]
+
+    def invalidate(self, keys=(), prefix=None):
+        """✅ 지정한 키(예: `player:유저명`, `getSeasonList`) 또는 prefix로 시작하는 항목 삭제 → 삭제한 개수"""
+        with self._lock:
+            targets = [key for key in keys if key in self.entries]
+            if prefix:
+                targets += [key for key in self.entries if key.startswith(prefix)]
+            for key in set(targets):
+                del self.entries[key]
+            if targets:
+                self.dirty = True
+            return len(set(targets))
+
+    def patch_players(self, rows):
+        """✅ 시트에서 수정된 유저 행(getPlayersInfo 형식)으로 유저별 항목 갱신"""
+        now = time.time()
+        with self._lock:
+            for row in rows:
+                self.entries[f"player:{row['username']}"] = {"saved_at": now, "data": row}
+            self.dirty = True
+
+    def save_if_dirty(self):
+        """✅ 바뀐 내용이 있으면 파일에 저장 (주기 작업에서 asyncio.to_thread로 호출, 쓰는 동안 잠금을 잡지 않음)"""
+        with self._lock:
+            if not self.dirty or not self.path:
+                return
+            entries = dict(self.entries)  # ✅ 항목 값은 교체만 되고 수정되지 않으므로 얕은 복사로 충분
+            self.dirty = False
+        try:
+            _atomic_write(self.path, entries)
+        except OSError as e:
+            logging.warning(f"⚠️ [캐시] 저장 실패: {e}")
+            with self._lock:
+                self.dirty = True
+
+
+class WriteOutbox:
+    def __init__(self, path=None):
+        self.path = path
+        self.pending = _load(path, [])  # 오래된 순 payload 리스트
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, payload):
+        with self._lock:
+            self.pending.append(payload)
+            self._save()
+        logging.info(f"📥 [보류 결과] 보관 ({len(self.pending)}건 대기): {payload}")
+
+    def peek(self):
+        with self._lock:
+            return self.pending[0] if self.pending else None
+
+    def pop(self):
+        with self._lock:
+            payload = self.pending.pop(0)
+            self._save()
+            return payload
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            _atomic_write(self.path, self.pending)
+        except OSError as e:
+            logging.warning(f"⚠️ [보류 결과] 저장 실패: {e}")
+
+
+def format_age(seconds):
+    """✅ 경과 초 → `3분` / `2시간 5분` / `1일 4시간`"""
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "1분 미만"
+    if minutes < 60:
+        return f"{minutes}분"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 24:
+        return f"{hours}시간 {minutes}분" if minutes else f"{hours}시간"
+    days, hours = divmod(hours, 24)
+    return f"{days}일 {hours}시간" if hours else f"{days}일"
@@ -0,0 +1 @@
+"""✅ 명령어 확장 (bot.py의 EXTENSIONS 순서로 로드, `!리로드 <이름>`으로 교체)"""
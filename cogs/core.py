@@ -0,0 +1,161 @@
+"""
+✅ 봇 공통 동작: 명령어 훅 / 전역 체크 / 이벤트 리스너 / 백그라운드 작업 (명령어 없음)
+
+- 사용 제한 + GAS 장애 중 쓰기 거절 (bot_check), 대화형 입력 전달 / 명령어 오류 / 로그인 (리스너)
+- 로드할 때: 명령어 훅 등록, 저장된 버튼 복원, 캐시 저장 / 버튼 정리 작업 + 시트 수정 알림 수신 서버 시작
+- `!리로드 core`로 교체하면 작업 / 수신 서버도 새 코드로 다시 시작 (언로드할 때 정리)
+"""
+import asyncio
+import logging
+import time
+
+import discord
+from discord.ext import commands
+
+import gas
+from cache import format_age
+from conversation import ConversationCancelled
+from webhook import InvalidationServer
+import bot as core  # ✅ 슬래시 명령어 등록 여부는 프로세스 상태 (리로드해도 다시 등록하지 않음)
+from bot import (FAIR_QUEUE_COMMANDS, GAS_CACHE_FLUSH_SECONDS, GAS_RETRY_SECONDS, SLASH_GUILD_ID, WEBHOOK_HOST, WEBHOOK_PORT,
+                 WEBHOOK_SECRET, conversations, fair_queue, gas_cache, is_allowed_user, rate_limiter, win_predictor)
+from shared import (end_command_span, invalidate_aliases, invalidate_players, invalidate_results, invalidate_seasons,
+                    schedule_predictor_refit, start_command_span)
+from views import restore_views, sweep_views
+
+
+# ✅ GAS 장애 중에는 거절하는 쓰기 명령어 (`결과등록`은 보관 후 복구 시 자동 등록)
+WRITE_COMMANDS = {"등록", "별명등록", "클래스", "결과삭제", "MMR갱신", "별명삭제", "백업", "백업정리", "스냅샷", "최근결과삭제", "롤백"}
+
+
+async def throttle_commands(ctx):
+    """✅ 유저 / 채널별 사용 제한 + 공정 대기열에 이미 많이 쌓인 유저 거절 (관리자는 제외)"""
+    if is_allowed_user(ctx):
+        return True
+
+    name = ctx.command.name
+    if name in FAIR_QUEUE_COMMANDS and fair_queue.is_full_for(ctx.author.id):
+        retry = 10.0
+        message = f"⏳ `{ctx.author.display_name}` 님의 요청이 이미 대기 중입니다. 끝난 뒤 다시 시도해주세요."
+    else:
+        retry, scope = rate_limiter.hit(name, ctx.author.id, ctx.channel.id)
+        if not retry:
+            return True
+        if scope == "channel":
+            message = f"⏳ 이 채널에 명령어 요청이 너무 많습니다. {retry:.0f}초 후 다시 시도해주세요."
+        else:
+            count, seconds = rate_limiter.rule(name)
+            message = (f"⏳ `{ctx.author.display_name}` 님, `!{name}` 명령어는 {seconds:.0f}초에 {count}번까지 사용할 수 있습니다. "
+                       f"{retry:.0f}초 후 다시 시도해주세요.")
+
+    if rate_limiter.should_notify(name, ctx.author.id, retry):
+        await ctx.send(message, delete_after=min(max(retry, 5), 30))
+    return False
+
+
+async def refuse_writes_while_degraded(ctx):
+    """✅ 최근 GAS_RETRY_SECONDS 안에 GAS가 실패했으면 쓰기 명령어를 바로 거절 (이후에는 한 번 시도해서 복구 확인)"""
+    if ctx.command.name not in WRITE_COMMANDS or not gas.is_degraded():
+        return True
+    if time.time() - gas.last_failure >= GAS_RETRY_SECONDS:
+        return True
+    await ctx.send(f"🚧 **GAS 서버 장애 중이라 `!{ctx.command.name}` 명령어를 실행할 수 없습니다.** "
+                   f"(장애 {format_age(time.time() - gas.degraded_since)}째, 조회 / 팀생성 / 결과등록은 계속 사용 가능)")
+    return False
+
+
+async def flush_gas_cache():
+    """✅ GAS_CACHE_FLUSH_SECONDS초마다 바뀐 캐시 저장 (파일 쓰기는 이벤트 루프 밖에서)"""
+    while True:
+        await asyncio.sleep(GAS_CACHE_FLUSH_SECONDS)
+        await asyncio.to_thread(gas_cache.save_if_dirty)
+
+
+async def sync_slash_commands(bot):
+    """✅ 슬래시 명령어 등록 (프로세스당 한 번, SLASH_GUILD_ID가 있으면 해당 서버에 즉시 반영)"""
+    if core.slash_synced:
+        return
+    try:
+        if SLASH_GUILD_ID:
+            guild = discord.Object(id=int(SLASH_GUILD_ID))
+            bot.tree.copy_global_to(guild=guild)
+            synced = await bot.tree.sync(guild=guild)
+        else:
+            synced = await bot.tree.sync()
+        core.slash_synced = True
+        logging.info(f"✅ [슬래시 명령어] {len(synced)}개 등록: {[command.name for command in synced]}")
+    except discord.HTTPException as e:
+        logging.error(f"🚨 [슬래시 명령어] 등록 실패: {e}")
+
+
+class Core(commands.Cog):
+    """✅ 모든 명령어에 적용되는 훅 / 체크 / 리스너 + 백그라운드 작업"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.tasks = []
+        self.invalidation_server = None
+
+    async def cog_load(self):
+        self.bot.before_invoke(start_command_span)
+        self.bot.after_invoke(end_command_span)
+        restore_views()
+        self.tasks = [asyncio.create_task(flush_gas_cache()), asyncio.create_task(sweep_views())]
+        await self.start_invalidation_server()
+
+    async def cog_unload(self):
+        for task in self.tasks:
+            task.cancel()
+        if self.invalidation_server is not None:
+            await self.invalidation_server.stop()
+            self.invalidation_server = None
+
+    async def bot_check(self, ctx):
+        return await throttle_commands(ctx) and await refuse_writes_while_degraded(ctx)
+
+    async def start_invalidation_server(self):
+        """✅ 시트 수정 알림 수신 서버 (핸들러는 shared 모듈의 invalidate_* → 리로드하면 새 핸들러로 다시 시작)"""
+        if not WEBHOOK_PORT:
+            return
+        if not WEBHOOK_SECRET:
+            logging.warning("⚠️ [캐시 무효화] WEBHOOK_SECRET이 없어 수신 서버를 시작하지 않습니다.")
+            return
+
+        server = InvalidationServer(WEBHOOK_SECRET, WEBHOOK_HOST, WEBHOOK_PORT)
+        server.on("Players", invalidate_players)
+        server.on("Aliases", invalidate_aliases)
+        server.on("Results", invalidate_results)
+        server.on("Seasons", invalidate_seasons)
+        try:
+            await server.start()
+        except OSError as e:
+            logging.error(f"🚨 [캐시 무효화] 수신 서버 시작 실패: {e}")
+            return
+        self.invalidation_server = server
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        """✅ 대화형 입력을 기다리는 (채널, 유저)의 메시지만 해당 명령어로 전달 (명령어 메시지는 제외)"""
+        if message.author.bot or message.content.startswith(self.bot.command_prefix):
+            return
+        conversations.dispatch(message)
+
+    @commands.Cog.listener()
+    async def on_command_error(self, ctx, error):
+        if isinstance(error, commands.CheckFailure):
+            return  # ✅ 거절 사유는 체크 함수에서 이미 안내함
+        if isinstance(getattr(error, "original", None), ConversationCancelled):
+            await ctx.send(f"❎ {error.original}")
+            return
+        logging.error(f"🚨 [명령어 오류] !{ctx.command}: {error}", exc_info=error)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        print(f'✅ {self.bot.user}로 로그인 완료!')
+        if not win_predictor.fitted:
+            schedule_predictor_refit()
+        await sync_slash_commands(self.bot)
+
+
+async def setup(bot):
+    await bot.add_cog(Core(bot))
@@ -0,0 +1,146 @@
+"""
+✅ 진단 명령어 (관리자 전용): CPU / 메모리 프로파일링, GAS 지연 / 일일 예산
+
+`!리로드 diagnostics`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨)
+"""
+import asyncio
+import re
+
+from discord.ext import commands
+
+import gas
+from profiler import ProfilerError
+from scheduler import PRIORITY_NAMES
+import bot as core  # ✅ 프로파일 결과 채널 / 타이머는 bot 모듈 상태 (finish_profiling이 사용)
+from bot import (GAS_DAILY_CALLS, GAS_DAILY_RUNTIME_MINUTES, GAS_HEDGE_QUANTILE, command_profiler, is_allowed_user,
+                 memory_profiler)
+from shared import finish_profiling, send_profile_result, stop_profiling_after
+
+
+class Diagnostics(commands.Cog):
+    """✅ 관리자 전용 진단 명령어 (프로파일 상태는 bot 모듈에 있어서 리로드 중에도 측정이 이어짐)"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command()
+    async def 프로파일(self, ctx, mode: str = "cpu", limit: str = "5회"):
+        """
+        ✅ CPU 프로파일링 시작 (관리자 전용)
+        - `!프로파일 cpu 5회` → 다음 명령어 5개 동안 cProfile (.pstats)
+        - `!프로파일 sample 30초` → 30초 동안 샘플링 프로파일러 (.collapsed, flamegraph 입력 형식)
+        """
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
+            return
+
+        match = re.fullmatch(r"(\d+)\s*(회|초|s)?", limit.strip())
+        if not match or int(match.group(1)) <= 0:
+            await ctx.send("🚨 범위는 `5회`(명령어 개수) 또는 `30초`(시간) 형식으로 입력해주세요.")
+            return
+        amount, unit = int(match.group(1)), match.group(2) or "회"
+        commands_limit, seconds = (None, amount) if unit in ("초", "s") else (amount, None)
+
+        try:
+            command_profiler.start(mode, commands=commands_limit, seconds=seconds)
+        except ProfilerError as e:
+            await ctx.send(f"🚨 {e}")
+            return
+
+        core.profile_channel = ctx.channel
+        if seconds:
+            core.profile_timer = asyncio.create_task(stop_profiling_after(seconds))
+        target = f"{seconds}초 동안" if seconds else f"다음 명령어 {commands_limit}개 동안"
+        await ctx.send(f"🔬 **`{mode}` 프로파일링 시작!** {target} 측정합니다. (`!프로파일중지`로 즉시 종료)")
+
+    @commands.command()
+    async def 프로파일중지(self, ctx):
+        """✅ 진행 중인 CPU 프로파일링 즉시 종료 + 결과 전송 (관리자 전용)"""
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
+            return
+        if not command_profiler.active:
+            await ctx.send("ℹ️ 진행 중인 프로파일링이 없습니다.")
+            return
+
+        core.profile_channel = ctx.channel
+        await finish_profiling("수동 종료")
+
+    @commands.command()
+    async def 메모리(self, ctx, action: str = "스냅샷"):
+        """
+        ✅ tracemalloc 메모리 추적 (관리자 전용)
+        - `!메모리 시작` → 추적 시작
+        - `!메모리 스냅샷` → 스냅샷 저장 + 직전 스냅샷 대비 증가량 상위 20개
+        - `!메모리 중지` → 추적 종료
+        """
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
+            return
+
+        try:
+            if action == "시작":
+                memory_profiler.start()
+                await ctx.send("🧠 **메모리 추적 시작!** `!메모리 스냅샷`으로 현재 상태를 확인하세요.")
+            elif action == "스냅샷":
+                path, summary = await asyncio.to_thread(memory_profiler.snapshot)
+                await send_profile_result(ctx.channel, f"🧠 **메모리 스냅샷** → `{path}`", path, summary)
+            elif action == "중지":
+                memory_profiler.stop()
+                await ctx.send("🧠 **메모리 추적 종료!**")
+            else:
+                await ctx.send("🚨 사용법: `!메모리 [시작|스냅샷|중지]`")
+        except ProfilerError as e:
+            await ctx.send(f"🚨 {e}")
+
+    @commands.command()
+    async def 지연(self, ctx):
+        """✅ GAS 읽기 요청 action별 지연 시간: 헤지 없이 기다렸을 시간(첫 요청) vs 헤지 적용 후 (관리자 전용)"""
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
+            return
+
+        rows = gas.hedger.report()
+        if not rows:
+            await ctx.send("⏱️ 아직 기록된 GAS 읽기 요청이 없습니다.")
+            return
+
+        def seconds(value):
+            return "-" if value is None else f"{value:.2f}s"
+
+        lines = [f"{'action':<20} {'요청':>4} {'헤지':>4} {'승':>3}  {'p50 전→후':>15}  {'p99 전→후':>15}"]
+        for action, requests_, hedges, wins, p50, p99, hedged_p50, hedged_p99 in rows:
+            lines.append(
+                f"{action:<20} {requests_:>4} {hedges:>4} {wins:>3}  "
+                f"{seconds(p50) + '→' + seconds(hedged_p50):>15}  {seconds(p99) + '→' + seconds(hedged_p99):>15}"
+            )
+        await ctx.send(
+            f"⏱️ **GAS 읽기 지연** (헤지 기준 p{GAS_HEDGE_QUANTILE * 100:.0f}, 남은 헤지 예산 {gas.hedger.budget.tokens:.1f})\n"
+            "```\n" + "\n".join(lines) + "\n```"
+        )
+
+    @commands.command()
+    async def 쿼터(self, ctx):
+        """✅ 최근 24시간 GAS 예산 사용량 + 우선순위별 요청 수 + 명령어별 비용 (관리자 전용)"""
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다!")
+            return
+
+        calls, seconds, fraction, by_priority, top = gas.scheduler.report()
+        priorities = " / ".join(f"{PRIORITY_NAMES[level]} {by_priority.get(level, 0)}회" for level in sorted(PRIORITY_NAMES))
+
+        lines = [f"{'명령어':<16} {'요청':>5} {'응답 합':>8} {'대기 합':>8} {'보류':>4}"]
+        for name, cost in top:
+            lines.append(f"{name:<16} {cost.calls:>5} {cost.seconds:>7.1f}s {cost.waited:>7.1f}s {cost.rejected:>4}")
+
+        await ctx.send(
+            f"📈 **GAS 일일 예산** {fraction * 100:.1f}% 사용\n"
+            f"- 요청 {calls} / {GAS_DAILY_CALLS}회, 응답 시간 {seconds / 60:.1f} / {GAS_DAILY_RUNTIME_MINUTES:.0f}분\n"
+            f"- 우선순위별: {priorities}\n"
+            f"- 대기 중: {sum(gas.scheduler.waiting)}건, 남은 토큰 {gas.scheduler.tokens:.1f}\n"
+            "```\n" + "\n".join(lines) + "\n```"
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(Diagnostics(bot))
@@ -0,0 +1,106 @@
+"""
+✅ 도움말 / 링크 명령어 (`!도움말`, `!홈페이지`, `!세팅`)
+
+`!리로드 info`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨)
+"""
+import logging
+
+import discord
+from discord.ext import commands
+
+
+class Info(commands.Cog):
+    """✅ 도움말 / 링크 명령어"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command(aliases=["도움", "헬프", "명령어"])
+    async def 도움말(self, ctx):
+        """
+        ✅ 봇의 모든 명령어 목록을 출력하는 도움말 기능
+        """
+        logging.basicConfig(level=logging.INFO)
+        logging.info(f"📥 `!도움말` 명령어 실행됨. 요청한 사용자: {ctx.author.name}")
+
+        help_text = (
+            "**📘 사용 가능한 명령어 목록**\n\n"
+
+            "**🧑‍💼 유저 관리**\n"
+            "📥 `!등록` [유저명] [클래스] [별명] - 유저 등록 또는 수정\n"
+            "🧾 `!조회` [유저명] - 유저 정보 조회 (생략하면 내 계정에 연결된 유저)\n"
+            "🔗 `!연결` [유저명] - 내 디스코드 계정을 유저명과 연결 (`!연결해제`로 해제)\n"
+            "🛡️ `!클래스` [유저명] [클래스] - 클래스 등록/변경\n"
+            "🏷️ `!별명등록` [유저명] [별명들] - 별명 등록 (👑 관리자 전용)\n"
+            "❌ `!별명삭제` [유저명] - 별명 전체 삭제 (👑 관리자 전용)\n"
+            "💡 유저명 대신 계정이 연결된 유저의 @멘션을 입력해도 됩니다 (조회 / 결과등록 / 팀생성 / 시너지 / 참가)\n\n"
+
+            "**🎮 매칭 대기열**\n"
+            "🙋 `!참가` [유저명] - 대기열 참가 (8명 + 클래스 구성이 맞으면 자동 팀 생성)\n"
+            "🚪 `!나가기` - 대기열에서 나가기\n"
+            "📋 `!대기열` - 현재 대기열 + 참가 / 나가기 버튼\n\n"
+
+            "**📊 경기 기록**\n"
+            "📝 `!결과등록` [경기결과] - 경기 결과 등록\n"
+            "📄 `!결과조회` [게임번호] - 특정 경기 or 최근 5경기 조회\n"
+            "⏪ `!최근결과삭제` - 가장 최근 결과 복구 (30분 이내)\n\n"
+
+            "**🤝 팀 생성**\n"
+            "🔀 `!팀생성` [유저(클래스)] - MMR 기반 팀 생성 (클래스 포함)\n"
+            "🧩 `!팀생성` ... 같은팀:유저1+유저2 다른팀:유저3+유저4 - 팀 제약 조건 지정\n"
+            "🎙️ `!팀생성 보이스` - 내가 있는 음성 채널 8명으로 팀 생성 (`!연결`된 계정만)\n"
+            "🔐 `!팀생성고급` [유저1, ..., 유저8] - 고급 랜덤 팀 생성\n"
+            "🤝 `!시너지` [유저명] [유저명] - 듀오 시너지 / 상대 전적 분석\n\n"
+
+            "**🛠️ 백업 / 시즌 / 진단 (👑 관리자 전용)**\n"
+            "💾 `!백업` - 수동 백업 실행\n"
+            "🧹 `!백업정리` - 오래된 백업 정리\n"
+            "📦 `!롤백` - 백업 파일에서 롤백\n"
+            "📸 `!스냅샷` [시즌명] - 시즌별 스냅샷 생성\n"
+            "🗂️ `!시즌목록` - 시즌 목록과 기간 확인\n"
+            "🔬 `!프로파일` [cpu|sample] [5회|30초] - CPU 프로파일링 (`!프로파일중지`로 종료)\n"
+            "🧠 `!메모리` [시작|스냅샷|중지] - 메모리 할당 추적\n"
+            "⏱️ `!지연` - GAS 읽기 요청 지연 (헤지 전 / 후 p50 · p99)\n"
+            "📈 `!쿼터` - GAS 일일 예산 사용량 / 명령어별 비용\n"
+            "🧩 `!리로드` [확장|전체] - 명령어 코드 다시 불러오기 (전체: 공용 모듈 / 버튼 포함, 재시작 없음)\n\n"
+
+            "**⚡ 슬래시 명령어** (유저명 / 게임번호 자동완성)\n"
+            "`/조회` · `/결과조회` · `/결과등록` · `/팀생성`\n\n"
+
+            "**🌐 기타**\n"
+            "🖥️ `!홈페이지` - 리그 기록실 링크\n"
+            "🛠️ `!세팅` - 클래스별 세팅 가이드\n"
+            "📘 `!도움말` - 명령어 전체 보기\n"
+        )
+
+        logging.info("📜 도움말 메시지 내용 준비 완료.")
+
+        try:
+            await ctx.send(help_text)
+            logging.info("✅ 도움말 메시지 전송 성공!")
+        except Exception as e:
+            logging.error(f"🚨 도움말 메시지 전송 실패! 오류: {str(e)}")
+            await ctx.send("🚨 도움말 메시지를 전송하는 중 오류가 발생했습니다!")
+
+    @commands.command(aliases=["홈피", "웹페이지", "웹"])
+    async def 홈페이지(self, ctx):
+        """내전 기록실 웹페이지로 이동하는 버튼 제공"""
+        view = discord.ui.View()
+        button = discord.ui.Button(label="📊 [내전 기록실 이동]", url="https://69dia.vercel.app/", style=discord.ButtonStyle.link)
+        view.add_item(button)
+
+        await ctx.send("🔗 **내전 기록실 웹페이지로 이동하려면 버튼을 클릭해주세요.**", view=view)
+
+    @commands.command(aliases=["셋팅"])
+    async def 세팅(self, ctx):
+        """캐릭터별 세팅을 볼 수 있는 블로그 링크 버튼 제공"""
+        view = discord.ui.View()
+        button = discord.ui.Button(label="🔧 [클래스별 세팅가이드]", url="https://blog.naver.com/lovlince/222991937440",
+                                   style=discord.ButtonStyle.link)
+        view.add_item(button)
+
+        await ctx.send("🔗 **각 클래스별 세팅을 조회하시려면, 아래 버튼을 클릭해주세요.**", view=view)
+
+
+async def setup(bot):
+    await bot.add_cog(Info(bot))
@@ -0,0 +1,240 @@
+"""
+✅ 매칭 대기열 명령어: `!참가`, `!나가기`, `!대기열` + 대기열 버튼 / 자동 로비 구성
+
+`!리로드 lobby`로 프로세스 재시작 없이 다시 불러올 수 있음 (대기열 / 상태 메시지는 bot 모듈에 있어서 유지됨)
+"""
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+import gas
+from records import CLASS_ORDER
+from bot import (LOBBY_STATUS_DELAY, account_links, is_allowed_user, lobby_refresh_tasks, lobby_status_messages, matchmaker,
+                 message_updates, player_records, replica)
+from shared import (GAS_UNAVAILABLE_MESSAGE, expand_mentions, find_indexed_name, get_players, get_roster,
+                    has_sufficient_classes, refresh_player_index, traced_interaction)
+from views import TeamGenerationView, send_view
+
+NOT_LINKED_MESSAGE = ("🔗 연결된 유저명이 없습니다. `!등록`으로 직접 등록하면 자동으로 연결되고, "
+                      "이미 등록된 유저명은 관리자에게 `!연결`을 요청해주세요.")
+OTHER_PLAYER_MESSAGE = "🚫 다른 유저를 대기열에 넣거나 빼는 것은 관리자만 할 수 있습니다."
+
+
+async def resolve_username(name):
+    """✅ 유저명 / 별명 → 유저명 (로컬 유저 인덱스 우선, 거기에 없을 때만 GAS 조회), 등록되지 않은 유저면 None"""
+    refresh_player_index()
+    username = find_indexed_name(name)
+    if username is None:
+        roster, _ = await get_roster()
+        username = roster.resolve(name)
+    return username
+
+
+async def lookup_player_record(name):
+    """✅ 유저명 / 별명 → Player (로컬 복제본 우선, 없으면 처음 한 번만 GAS 조회), 등록되지 않은 유저면 None"""
+    username = await resolve_username(name)
+    if username is None:
+        return None
+    if not replica.supported and username in player_records:
+        return player_records[username]
+
+    players, _ = await get_players([username])
+    if not players:
+        return None
+    player_records[username] = players[0]
+    return players[0]
+
+
+def format_lobby_status(channel_id):
+    queue = matchmaker.queue(channel_id)
+    counts = " · ".join(f"{cls} {count}" for cls, count in zip(CLASS_ORDER, queue.class_counts))
+    names = ", ".join(f"`{name}`" for name in queue.entries) or "(비어 있음)"
+    return (f"🎮 **매칭 대기열** ({len(queue)}/{matchmaker.lobby_size})\n"
+            f"👥 {names}\n"
+            f"🛡 클래스 가능 인원: {counts} (클래스별 2명 이상이면 자동으로 팀 생성)")
+
+
+def schedule_lobby_refresh(channel, queue_changed=True):
+    """
+    ✅ 상태 메시지 수정 / 파일 저장은 LOBBY_STATUS_DELAY초마다 한 번으로 모음
+    - queue_changed: 참가 / 나가기로 대기열이 바뀌었으면 로비 구성 가능할 때 바로 팀 생성
+      (로비 구성 후 / 실패 후에는 False → 다음 참가 / 나가기까지 다시 시도하지 않음)
+    """
+    if queue_changed and matchmaker.queue(channel.id).may_be_ready(matchmaker.lobby_size):
+        asyncio.create_task(form_lobbies(channel))
+
+    task = lobby_refresh_tasks.get(channel.id)
+    if task is None or task.done():
+        lobby_refresh_tasks[channel.id] = asyncio.create_task(refresh_lobby_status(channel))
+
+
+async def refresh_lobby_status(channel):
+    await asyncio.sleep(LOBBY_STATUS_DELAY)
+    matchmaker.save_if_dirty()
+    message = lobby_status_messages.get(channel.id)
+    if message is None:
+        return
+    try:
+        await message_updates.edit(message, content=format_lobby_status(channel.id))
+    except discord.HTTPException as e:
+        logging.warning(f"⚠️ [매칭 대기열] 상태 메시지 수정 실패: {e}")
+        lobby_status_messages.pop(channel.id, None)
+
+
+async def form_lobbies(channel):
+    """✅ 대기열에서 8명을 뽑아 팀 생성 결과를 바로 전송 (다시 8명이 모여 있으면 반복, 실패하면 대기열에 되돌리고 중단)"""
+    while (members := matchmaker.form_lobby(channel.id)) is not None:
+        names = [name for name, _, _ in members]
+        logging.info(f"🎮 [매칭] 로비 구성: {names}")
+        try:
+            players, age = await get_players(names)
+        except (gas.GasUnavailable, gas.GasError) as e:
+            logging.warning(f"⚠️ [매칭] 유저 정보 조회 실패: {e}")
+            players, age = [], None
+
+        sufficient, insufficient = has_sufficient_classes(players)
+        if len(players) != len(names) or not sufficient:
+            matchmaker.requeue(channel.id, members)
+            await channel.send("🚨 **매칭 대기열:** 유저 정보를 불러오지 못해 팀을 만들지 못했습니다. 다음 참가 / 나가기 때 다시 시도합니다."
+                               if len(players) != len(names) else
+                               f"🚨 **매칭 대기열:** 최신 클래스 정보로는 {', '.join(insufficient)} 인원이 부족합니다.")
+            break
+
+        view = TeamGenerationView(channel, names, dict.fromkeys(names), players_data=players, stale_age=age)
+        lineup = await view.build_lineup()
+        if lineup is None:
+            matchmaker.requeue(channel.id, members)
+            break
+
+        mentions = " ".join(f"<@{user_id}>" for _, user_id, _ in members)
+        message = await send_view(
+            channel, f"🎮 **매칭 완료!** {mentions}\n" + view.format_result("매칭 대기열 자동 팀 생성 결과", *lineup), view
+        )
+        view.message = view.status_message = message
+        view.save_state()
+
+    schedule_lobby_refresh(channel, queue_changed=False)
+
+
+async def join_matchmaking(channel, user, name):
+    """✅ 대기열 참가 → 안내 문구"""
+    try:
+        player = await lookup_player_record(name)
+    except (gas.GasUnavailable, gas.GasError):
+        return GAS_UNAVAILABLE_MESSAGE
+    if player is None:
+        return f"🚨 `{name}` 은(는) 등록되지 않은 유저입니다. `!등록` 후 참가해주세요."
+    if not player.classes:
+        return f"🚨 `{player.username}` 님은 등록된 클래스가 없습니다. `!클래스`로 먼저 등록해주세요."
+
+    joined, other_channel = matchmaker.join(channel.id, player.username, user.id, player.classes)
+    if other_channel is not None:
+        return f"🚨 `{player.username}` 님은 이미 <#{other_channel}> 대기열에 있습니다."
+    if not joined:
+        return f"ℹ️ `{player.username}` 님은 이미 대기열에 있습니다."
+
+    schedule_lobby_refresh(channel)
+    return f"✅ `{player.username}` 님 참가! ({len(matchmaker.queue(channel.id))}/{matchmaker.lobby_size})"
+
+
+async def leave_matchmaking(name):
+    """✅ 대기열 나가기 → 안내 문구 (대기 중인 유저명이면 이름 조회 없음)"""
+    username = name
+    if name not in matchmaker.channel_of:
+        try:
+            username = await resolve_username(name) or name
+        except (gas.GasUnavailable, gas.GasError):
+            pass
+    channel_id = matchmaker.leave(username)
+    if channel_id is None:
+        return f"ℹ️ `{username}` 님은 대기열에 없습니다.", None
+    return f"👋 `{username}` 님이 대기열에서 나갔습니다. ({len(matchmaker.queue(channel_id))}/{matchmaker.lobby_size})", channel_id
+
+
+async def command_target(ctx, name):
+    """
+    ✅ `!참가` / `!나가기` 대상 유저명 → 유저명 (안내 후 None)
+    - 생략하면 연결된 유저명, 다른 유저는 👑 관리자만 지정 가능
+    """
+    linked = account_links.username_for(ctx.author.id)
+    if not name:
+        if linked is None:
+            await ctx.send(NOT_LINKED_MESSAGE)
+        return linked
+
+    name = await expand_mentions(ctx, name)
+    if name is None or is_allowed_user(ctx) or name == linked:
+        return name
+    try:
+        if linked is not None and await resolve_username(name) == linked:
+            return name
+    except (gas.GasUnavailable, gas.GasError):
+        await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+        return None
+    await ctx.send(OTHER_PLAYER_MESSAGE)
+    return None
+
+
+class LobbyView(discord.ui.View):
+    """✅ `!대기열` 메시지의 참가 / 나가기 버튼 (상태 없음 → cog_load에서 한 번 등록하면 모든 대기열 메시지에서 동작)"""
+
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @discord.ui.button(label="참가", style=discord.ButtonStyle.green, custom_id="lobby_join")
+    @traced_interaction("버튼 참가")
+    async def join(self, interaction: discord.Interaction, button: discord.ui.Button):
+        name = account_links.username_for(interaction.user.id)
+        message = await join_matchmaking(interaction.channel, interaction.user, name) if name else NOT_LINKED_MESSAGE
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @discord.ui.button(label="나가기", style=discord.ButtonStyle.grey, custom_id="lobby_leave")
+    @traced_interaction("버튼 나가기")
+    async def leave(self, interaction: discord.Interaction, button: discord.ui.Button):
+        name = account_links.username_for(interaction.user.id)
+        message, channel_id = await leave_matchmaking(name) if name else (NOT_LINKED_MESSAGE, None)
+        if channel_id is not None:
+            schedule_lobby_refresh(interaction.client.get_channel(channel_id) or interaction.channel)
+        await interaction.response.send_message(message, ephemeral=True)
+
+
+class Lobby(commands.Cog):
+    """✅ 매칭 대기열 명령어 (로드할 때 대기열 버튼 등록)"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        """✅ 대기열 버튼을 이 모듈의 LobbyView로 등록 (리로드 후에도 현재 상태 메시지의 버튼이 새 코드로 동작)"""
+        self.bot.add_view(LobbyView())
+        for message in lobby_status_messages.values():
+            self.bot.add_view(LobbyView(), message_id=message.id)
+
+    @commands.command()
+    async def 참가(self, ctx, *, name: str = None):
+        """✅ 매칭 대기열 참가 (유저명을 생략하면 연결된 유저명, 다른 유저는 관리자만)"""
+        name = await command_target(ctx, name)
+        if name is not None:
+            await ctx.send(await join_matchmaking(ctx.channel, ctx.author, name))
+
+    @commands.command()
+    async def 나가기(self, ctx, *, name: str = None):
+        """✅ 매칭 대기열에서 나가기 (유저명을 생략하면 연결된 유저명, 다른 유저는 관리자만)"""
+        name = await command_target(ctx, name)
+        if name is None:
+            return
+        message, channel_id = await leave_matchmaking(name)
+        if channel_id is not None:
+            schedule_lobby_refresh(self.bot.get_channel(channel_id) or ctx.channel)
+        await ctx.send(message)
+
+    @commands.command()
+    async def 대기열(self, ctx):
+        """✅ 이 채널의 매칭 대기열 + 참가 / 나가기 버튼 (이후 변경 사항은 이 메시지에 반영)"""
+        lobby_status_messages[ctx.channel.id] = await ctx.send(format_lobby_status(ctx.channel.id), view=LobbyView())
+
+
+async def setup(bot):
+    await bot.add_cog(Lobby(bot))
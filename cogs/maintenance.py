@@ -0,0 +1,241 @@
+"""
+✅ 관리 명령어: MMR 전체 갱신, 백업 / 백업정리 / 롤백, 시즌 스냅샷 / 목록
+
+`!리로드 maintenance`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨)
+"""
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+import gas
+from jobs import progress_bar
+from records import decode_json
+from bot import MMR_CHUNK_SIZE, job_manager, mmr_cursor
+from shared import schedule_predictor_refit, stale_notice
+from views import ConfirmView, RollbackSelectView, send_view
+
+
+async def recompute_mmr_once():
+    """✅ 기존 방식: GAS 요청 한 번으로 전체 재계산"""
+    response = await asyncio.to_thread(gas.post, {"action": "updateAllMMR"})
+    data = decode_json(response.content)
+    if "error" in data:
+        raise RuntimeError(data["error"])
+    return data
+
+
+async def recompute_mmr_chunks(job):
+    """
+    ✅ MMR_CHUNK_SIZE명씩 `updateMMRChunk` 요청 (Apps Script 실행 시간 제한 회피)
+    - GAS 응답: {"processed": 누적 처리 수, "total": 전체 수, "next_cursor": 다음 시작 위치, "done": bool}
+    - 청크가 끝날 때마다 다음 시작 위치를 저장 → 실패 후 다시 실행하면 이어서 진행 (청크 재실행은 결과가 같음)
+    """
+    saved_cursor = mmr_cursor.load()
+    cursor = saved_cursor or 0
+    if saved_cursor is not None:
+        logging.info(f"⏯️ [MMR갱신] 중단된 위치 {saved_cursor}부터 재개")
+
+    while True:
+        response = await asyncio.to_thread(gas.post, {"action": "updateMMRChunk", "cursor": cursor, "limit": MMR_CHUNK_SIZE})
+        data = decode_json(response.content)
+        if "error" in data:
+            if saved_cursor is None and cursor == 0:
+                # ✅ 청크 action이 없는 GAS 배포본이면 기존 전체 갱신으로 대체
+                logging.warning(f"⚠️ [MMR갱신] 청크 갱신 불가 ({data['error']}) → 전체 갱신으로 대체")
+                return await recompute_mmr_once()
+            raise RuntimeError(data["error"])
+
+        if data.get("done"):
+            mmr_cursor.clear()
+            return data
+
+        cursor = data["next_cursor"]
+        mmr_cursor.save(cursor)
+        await job.report(f"🔄 **MMR 갱신 중...** {progress_bar(data.get('processed', 0), data.get('total', 0))}")
+
+
+async def recompute_all_mmr(job):
+    """✅ 결과 등록 / 삭제와 겹치지 않도록 쓰기 잠금 안에서 MMR 전체 재계산"""
+    if job_manager.write_lock.locked():
+        await job.report("⏳ **처리 중인 경기 결과가 끝나면 MMR 갱신을 시작합니다...**", force=True)
+
+    async with job_manager.write_lock:
+        await job.report("🔄 **모든 플레이어의 MMR을 최신 계수 값으로 갱신 중입니다... (잠시만 기다려주세요!)**", force=True)
+        try:
+            data = await (recompute_mmr_chunks(job) if MMR_CHUNK_SIZE > 0 else recompute_mmr_once())
+        except Exception as e:
+            logging.error(f"🚨 [오류] MMR 갱신 중 문제 발생: {e}")
+            resume_note = "\n♻️ 다시 `!MMR갱신`을 실행하면 중단된 지점부터 이어서 진행합니다." if mmr_cursor.load() is not None else ""
+            await job.report(f"🚨 **MMR 갱신 실패!**\n🔍 오류 내용: `{e}`{resume_note}", force=True)
+            return
+
+    logging.info(f"✅ [MMR갱신 완료] 모든 플레이어의 MMR이 정상적으로 갱신됨: {data}")
+    await job.report(f"✅ **모든 플레이어의 MMR이 갱신되었습니다!** ({job.elapsed:.0f}초)", force=True)
+    schedule_predictor_refit()  # ✅ 클래스별 MMR이 바뀌었으므로 승률 예측 모델도 다시 학습
+
+
+class Maintenance(commands.Cog):
+    """✅ 관리 명령어 (MMR 갱신 / 백업 / 시즌)"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command()
+    async def MMR갱신(self, ctx):
+        """
+        ✅ 모든 플레이어의 MMR을 현재 계수 정보로 다시 계산하는 명령어
+        - 이미 진행 중이면 새로 실행하지 않고 진행 중인 작업의 상태 메시지를 안내
+        - 진행 상황은 상태 메시지 하나를 수정해서 표시
+        """
+        logging.info("🚀 [MMR갱신] 명령어 실행됨")
+
+        job, started = job_manager.start("MMR갱신", recompute_all_mmr)
+        if not started:
+            link = job.status_message.jump_url if job.status_message else ""
+            await ctx.send(f"⏳ **이미 MMR 갱신이 진행 중입니다!** 진행 상황은 기존 메시지에서 확인해주세요. {link}")
+            return
+
+        job.status_message = await ctx.send("🔄 **MMR 갱신을 준비 중입니다...**")
+        await job.report(job.text or "🔄 **MMR 갱신을 준비 중입니다...**", force=True)
+
+    @commands.command()
+    async def 백업(self, ctx):
+        """🛠 스프레드시트 수동 백업"""
+        await ctx.send("📦 백업을 시작합니다...")
+
+        try:
+            response = await asyncio.to_thread(gas.post, {"action": "triggerBackupFromDiscord"})
+        except gas.QuotaExceeded as e:
+            await ctx.send(f"⏳ {e}")
+            return
+
+        if response.status_code != 200:
+            await ctx.send("🚨 서버 오류로 백업에 실패했습니다.")
+            return
+
+        data = decode_json(response.content)
+        if "error" in data:
+            await ctx.send(f"🚨 오류 발생: {data['error']}")
+        else:
+            await ctx.send(f"✅ {data['success']}")
+
+    @commands.command()
+    async def 백업정리(self, ctx):
+        """🧹 오래된 백업 정리"""
+        await ctx.send("🧹 오래된 백업을 정리하는 중입니다...")
+
+        try:
+            response = await asyncio.to_thread(gas.post, {"action": "cleanupBackups"})
+        except gas.QuotaExceeded as e:
+            await ctx.send(f"⏳ {e}")
+            return
+
+        if response.status_code != 200:
+            await ctx.send("🚨 서버 오류로 백업 정리에 실패했습니다.")
+            return
+
+        data = decode_json(response.content)
+        if "error" in data:
+            await ctx.send(f"🚨 오류 발생: {data['error']}")
+        else:
+            await ctx.send(f"✅ {data['success']}")
+
+    @commands.command()
+    async def 스냅샷(self, ctx, *, season_name: str = None):
+        """📊 특정 시즌 기준으로 스냅샷 생성"""
+        if not season_name:
+            await ctx.send("❗ 시즌명을 입력해주세요!\n예: `!스냅샷 2024-04 시즌`")
+            return
+
+        await ctx.send(f"📊 `{season_name}` 기준으로 스냅샷을 생성 중입니다...")
+
+        try:
+            response = await asyncio.to_thread(gas.post, {
+                "action": "generateSeasonSnapshot",
+                "seasonName": season_name
+            })
+        except gas.QuotaExceeded as e:
+            await ctx.send(f"⏳ {e}")
+            return
+
+        if response.status_code != 200:
+            await ctx.send("🚨 서버 오류로 스냅샷 생성에 실패했습니다.")
+            return
+
+        data = decode_json(response.content)
+        if "error" in data:
+            await ctx.send(f"🚨 오류 발생: {data['error']}")
+        else:
+            await ctx.send(f"✅ {data['success']}")
+
+    @commands.command()
+    async def 시즌목록(self, ctx):
+        """📋 시즌 시트 기준으로 시즌 목록 + 기간 출력"""
+        try:
+            data, age = await asyncio.to_thread(gas.fetch, {"action": "getSeasonList"})
+        except gas.GasUnavailable:
+            await ctx.send("🚨 서버 오류로 시즌 목록을 불러올 수 없습니다.")
+            return
+
+        if "seasons" in data and data["seasons"]:
+            formatted = "\n".join(
+                f"• `{s['name']}` ({s['start']} ~ {s['end']})" for s in data["seasons"]
+            )
+            await ctx.send(f"{stale_notice(age)}📋 시즌 목록:\n{formatted}")
+        else:
+            await ctx.send("📂 시즌 시트에 등록된 시즌이 없습니다.")
+
+    @commands.command()
+    async def 최근결과삭제(self, ctx):
+        """
+        ⏪ 가장 최근 경기 결과를 복구하는 명령어
+        - 경기 등록 후 30분 이내만 가능
+        - Players / Results / History 시트를 복구
+        """
+        # ✅ 복구 요청 시 다시 한 번 확인
+        confirm_msg = (
+            "⚠️ **정말 마지막으로 등록된 경기 결과를 되돌리시겠습니까?**\n"
+            "📌 **30분이 경과한 백업은 자동으로 삭제되므로 복구할 수 없습니다.**"
+        )
+
+        view = ConfirmView(
+            ctx,
+            {"action": "restoreLastBackup"},
+            "✅ 마지막 경기 결과가 복구되었습니다!",
+            "🚨 복구에 실패했습니다."
+        )
+
+        await send_view(ctx, confirm_msg, view)
+
+    @commands.command()
+    async def 롤백(self, ctx):
+        """📦 백업 파일 중 하나를 선택하여 롤백"""
+        try:
+            data, age = await asyncio.to_thread(gas.fetch, {"action": "getBackupFileList"})
+        except gas.GasUnavailable:
+            await ctx.send("🚨 백업 목록 불러오기 실패!")
+            return
+
+        if "error" in data:
+            await ctx.send(f"🚨 오류 발생: {data['error']}")
+            return
+
+        backups = data.get("backups", [])
+        if not backups:
+            await ctx.send("📂 백업 파일이 존재하지 않습니다.")
+            return
+
+        # 최대 10개까지만
+        options = [
+            discord.SelectOption(label=b["name"], value=b["id"], description=b["created"].split("T")[0])
+            for b in backups[:5]
+        ]
+
+        view = RollbackSelectView(ctx, options)
+        await send_view(ctx, f"{stale_notice(age)}📁 복구할 백업 파일을 선택해주세요:", view)
+
+
+async def setup(bot):
+    await bot.add_cog(Maintenance(bot))
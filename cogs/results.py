@@ -0,0 +1,444 @@
+"""
+✅ 경기 기록 명령어: 결과등록 / 결과조회 / 결과삭제 + `/결과등록`, `/결과조회`, GAS 장애 중 보관한 결과 재전송
+
+`!리로드 results`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨, 재전송 작업은 새 코드로 다시 시작)
+"""
+import asyncio
+import json
+import logging
+import re
+from datetime import datetime
+
+import discord
+import requests
+from discord import app_commands
+from discord.ext import commands
+
+import gas
+from cache import format_age
+from predictor import role_diffs
+from records import Match, decode_json, decode_matches
+from bot import GAS_RETRY_SECONDS, GAS_URL, conversations, result_outbox, win_predictor
+from shared import (GAS_UNAVAILABLE_MESSAGE, autocomplete_game_number, autocomplete_player, expand_mentions,
+                    format_linked_accounts, format_team, get_players, on_result_registered, on_results_rewritten,
+                    parse_match_input, post_result_write, refresh_player_index, resolve_typed_name,
+                    result_already_recorded, run_slash, stale_notice)
+from views import ConfirmView, send_view
+
+
+async def validate_and_register(ctx, win_players, lose_players, win_score, lose_score):
+    """
+    ✅ 유저 등록 여부 확인 후 경기 등록 진행 (action 기반 payload_type 자동 결정)
+    """
+    logging.info(f"✅ 유저 등록 여부 확인 중: {win_players + lose_players}")
+
+    # 명령어 실행한 유저 정보 추가
+    submitted_by = ctx.author.display_name
+    logging.info(f"📢 경기 결과 등록 요청자: {submitted_by}")
+
+    all_players = win_players + lose_players
+    try:
+        players, age = await get_players(all_players)
+    except gas.GasUnavailable as e:
+        logging.error(f"❌ 서버 응답 오류: {e}")
+        await ctx.send("🚨 서버 응답 오류로 인해 경기 등록을 진행할 수 없습니다. 다시 시도해주세요.")
+        return
+    except gas.GasError as e:
+        logging.warning(f"🚨 GAS 응답 오류: {e}")
+        await ctx.send(f"🚨 {e}")
+        return
+
+    if age is not None:
+        logging.warning(f"📦 캐시된 유저 정보로 등록 진행 ({format_age(age)} 전 저장)")
+    logging.info(f"📜 유저 정보: {players}")
+
+    registered_users = {player.username for player in players}
+    unregistered_users = [p for p in all_players if p not in registered_users]
+
+    if unregistered_users:
+        logging.warning(f"⛔ 등록되지 않은 유저 발견: {unregistered_users}")
+        await ctx.send(f"🚨 등록되지 않은 유저가 포함되어 있습니다: {', '.join(unregistered_users)}")
+        return
+
+    # ✅ 등록 전 기준 예상 승률 (클래스별 MMR 차이 기반)
+    players_by_name = {player.username: player for player in players}
+    win_probability = win_predictor.predict_diff(role_diffs(win_players, lose_players, players_by_name))
+    logging.info(f"🎲 승리 팀 예상 승률: {win_probability:.3f}")
+
+    # ✅ 경기번호 생성
+    game_number = datetime.now().strftime("%y%m%d%H%M%S")
+    logging.info(f"🎮 생성된 경기번호: {game_number}")
+
+    # ✅ payload 준비
+    payload = {
+        "action": "registerResult",
+        "game_number": game_number,
+        "winners": win_players,
+        "losers": lose_players,
+        "win_score": win_score,
+        "lose_score": lose_score,
+        "submitted_by": submitted_by
+    }
+    logging.info(f"🚀 경기 결과 등록 요청 데이터: {payload}")
+
+    # ✅ action 기반 payload_type 자동 결정
+    action = payload.get("action", "")
+    payload_type = "game_result" if action == "registerResult" else "generic"
+
+    # ✅ ConfirmView 생성
+    view = ConfirmView(
+        ctx=ctx,
+        payload=payload,
+        success_message=lambda x: f"✅ 경기 결과가 기록되었습니다! **[게임번호: {game_number}]**\n"
+                                  f"🏆 **승리 팀:** {format_team(win_players)} (스코어: {win_score})\n"
+                                  f"❌ **패배 팀:** {format_team(lose_players)} (스코어: {lose_score})\n"
+                                  f"👤 **등록자:** {submitted_by}",
+        error_message="🚨 경기 등록 요청에 실패했습니다.",
+        payload_type=payload_type,
+        game_number=game_number
+    )
+
+    # ✅ 최종 메시지 전송
+    await send_view(
+        ctx,
+        f"📊 **승리 팀:** {format_team(win_players)} (스코어: {win_score})\n"
+        f"❌ **패배 팀:** {format_team(lose_players)} (스코어: {lose_score})\n"
+        f"👤 **등록자:** {submitted_by}\n"
+        f"{format_linked_accounts(all_players)}"
+        f"🎲 **경기 전 예상 승률:** 승리 팀 {win_probability * 100:.0f}%\n\n"
+        f"경기 결과를 등록하시겠습니까?",
+        view,
+        allowed_mentions=discord.AllowedMentions.none()
+    )
+
+
+async def flush_result_outbox():
+    """✅ GAS 장애 중 보관한 경기 결과를 순서대로 재전송 (이미 기록된 경기는 건너뜀, 실패하면 GAS_RETRY_SECONDS 후 다시 시도)"""
+    while True:
+        payload = result_outbox.peek()
+        if payload is None:
+            await asyncio.sleep(GAS_RETRY_SECONDS)
+            continue
+
+        recorded = await result_already_recorded(payload)
+        if recorded is None:
+            await asyncio.sleep(GAS_RETRY_SECONDS)
+            continue
+
+        if not recorded:
+            try:
+                response = await post_result_write(payload)
+                delivered = response.status_code == 200
+            except gas.QuotaExceeded as e:
+                logging.warning(f"⚠️ [보류 결과] GAS 예산 초과로 재전송 대기: {e}")
+                await asyncio.sleep(GAS_RETRY_SECONDS)
+                continue
+            except requests.RequestException as e:
+                logging.warning(f"⚠️ [보류 결과] 재전송 실패: {e}")
+                delivered = False
+
+            if not delivered:
+                gas.mark_failed("보류 결과 재전송 실패")
+                await asyncio.sleep(GAS_RETRY_SECONDS)
+                continue
+
+        gas.mark_healthy()
+        result_outbox.pop()
+        on_result_registered(payload)
+        status = "이미 등록되어 있어 재전송 생략" if recorded else "등록 완료"
+        logging.info(f"✅ [보류 결과] 게임번호 {payload.get('game_number')} {status} (남은 {len(result_outbox)}건)")
+
+
+class Results(commands.Cog):
+    """✅ 경기 기록 명령어 + `/결과조회`, `/결과등록` + 보류 결과 재전송 작업"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.outbox_task = None
+
+    async def cog_load(self):
+        self.outbox_task = asyncio.create_task(flush_result_outbox())
+
+    async def cog_unload(self):
+        """✅ 재전송 중에 취소돼도 다음 재전송 전에 이미 등록됐는지 확인하므로 중복 등록 없음"""
+        self.outbox_task.cancel()
+
+    @commands.command()
+    async def 결과등록(self, ctx, *, input_text: str = None):
+        """
+        ✅ !결과등록 명령어: 승리팀과 패배팀을 입력하면 경기 결과를 등록
+        """
+        logging.basicConfig(level=logging.INFO)
+
+        logging.info(f"📥 `!결과등록` 명령어 실행 → {ctx.author} ({ctx.author.id}) | 입력: {input_text}")
+
+        if input_text:
+            input_text = await expand_mentions(ctx, input_text)
+            if input_text is None:
+                return
+            logging.info(f"🔍 입력된 경기 결과 파싱 시작: {input_text}")
+
+            # ✅ **스코어 총합 초과 검사 (9점 초과 시 오류)**
+            raw_scores = re.findall(r'\d+', input_text)
+            logging.info(f"🔢 추출된 점수: {raw_scores}")
+
+            if len(raw_scores) >= 2:
+                win_score, lose_score = map(int, raw_scores[:2])
+                total_score = win_score + lose_score
+
+                logging.info(f"🏆 승리팀 점수: {win_score}, ❌ 패배팀 점수: {lose_score}, 🔄 총합: {total_score}")
+
+            win_players, lose_players, win_score, lose_score, status = parse_match_input(input_text)
+
+            if status == "invalid_format":
+                await ctx.send("🚨 **잘못된 형식입니다!**\n`!결과등록 [아래5]유저1/... vs [위4]유저5/...`")
+                return
+            elif status == "invalid_player_count":
+                await ctx.send("🚨 **플레이어 수 오류입니다!** 양 팀 모두 4명씩 입력해야 합니다.")
+                return
+            elif status == "draw":
+                await ctx.send("🚨 **동점 경기는 등록할 수 없습니다!**")
+                return
+
+            logging.info(f"🏆 승리팀: {win_players}, ❌ 패배팀: {lose_players}, 🏅 스코어: {win_score}-{lose_score}")
+
+            if win_players is None or lose_players is None:
+                logging.warning(f"🚨 입력 형식 오류: {input_text}")
+                await ctx.send(
+                    "🚨 **잘못된 형식입니다!**\n"
+                    "`!결과등록 [아래5]유저1,유저2,유저3,유저4 vs [위4]유저5,유저6,유저7,유저8`\n"
+                    "✅ **순서 주의:** 반드시 `드,어,넥,슴` 클래스 순서대로 입력해야 합니다."
+                )
+                return
+
+            await validate_and_register(ctx, win_players, lose_players, win_score, lose_score)
+            return
+
+        # ✅ 대화형 입력 모드
+        logging.info("📝 대화형 입력 모드 활성화")
+        await ctx.send(
+            "🏆 **경기 결과를 입력하세요!**\n"
+            "예시: `!결과등록 [아래5]유저1,유저2,유저3,유저4 vs [위4]유저5,유저6,유저7,유저8`\n"
+            "✅ **순서 주의:** 반드시 `드,어,넥,슴` 클래스 순서대로 입력해야 합니다."
+        )
+
+    @commands.command()
+    async def 결과조회(self, ctx, game_number: str = None):
+        """
+        ✅ 특정 경기 조회 or 최근 경기 조회
+        """
+        logging.basicConfig(level=logging.INFO)
+        logging.info(f"📥 `!결과조회` 명령어 입력됨. 입력된 game_number: {game_number}")
+
+        # ✅ 특정 경기 조회 or 최근 경기 조회 선택
+        if game_number:
+            payload = {"action": "getMatch", "game_number": int(game_number)}
+            logging.info(f"🔍 특정 경기 조회 요청: 게임번호 `{game_number}`")
+        else:
+            payload = {"action": "getRecentMatches"}
+            logging.info("🔍 최근 5경기 조회 요청")
+
+        logging.info(f"🚀 요청 URL: {GAS_URL}")
+        logging.info(f"📡 전송 데이터: {payload}")
+
+        try:
+            data, age = await asyncio.to_thread(gas.fetch, payload)
+            logging.info(f"🔍 변환된 GAS 응답 (JSON): {json.dumps(data, indent=2, ensure_ascii=False)}")
+
+        except gas.GasUnavailable as e:
+            logging.error(f"🚨 GAS 응답 실패 (캐시 없음): {e}")
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+
+        # ✅ 최근 5경기 조회
+        matches = decode_matches(data)
+        if matches:
+            logging.info(f"✅ 최근 {len(matches)}개 경기 데이터 감지됨!")
+            msg = stale_notice(age) + "📊 **최근 5경기 결과:**\n"
+
+            for i, match in enumerate(matches, start=1):
+                logging.info(f"🧐 디버깅: match 데이터 = {match}")  # ✅ match 데이터 확인
+
+                # ✅ 날짜 포맷 변경
+                timestamp = match.timestamp or "알 수 없음"
+                try:
+                    formatted_date = datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M").strftime("%Y-%m-%d %H:%M")
+                except ValueError:
+                    formatted_date = timestamp  # 변환 실패 시 원래 값 사용
+                    logging.warning(f"⚠️ 날짜 변환 실패: `{timestamp}`")
+
+                msg += f"`[{i}]` 🎮 **게임번호:** `{match.game_number or '알 수 없음'}`\n"
+                msg += f"📅 **날짜:** {formatted_date}\n"
+                msg += f"🏆 **승리 팀:** {', '.join(match.winners) or '데이터 없음'}\n"
+                msg += f"❌ **패배 팀:** {', '.join(match.losers) or '데이터 없음'}\n\n"
+
+            await ctx.send(msg)
+
+        # ✅ 특정 경기 조회
+        elif "game_number" in data:
+            logging.info(f"✅ 개별 경기 데이터 감지됨: {data}")
+            match = Match.from_dict(data)
+            msg = stale_notice(age) + "📜 **경기 정보**\n"
+            msg += f"🎮 **게임번호:** `{match.game_number or '알 수 없음'}`\n"
+            msg += f"📅 **날짜:** {match.timestamp or '알 수 없음'}\n"
+            msg += f"🏆 **승리 팀:** {', '.join(match.winners) or '데이터 없음'}\n"
+            msg += f"❌ **패배 팀:** {', '.join(match.losers) or '데이터 없음'}"
+
+            await ctx.send(msg)
+
+        else:
+            logging.warning("🚨 조회된 경기 기록이 없음!")
+            await ctx.send("🚨 해당 경기 기록이 없습니다.")
+
+    @commands.command()
+    async def 결과삭제(self, ctx, game_number: str = None):
+        """
+        ✅ 특정 경기 기록을 삭제하는 명령어
+        """
+        logging.basicConfig(level=logging.INFO)
+        logging.info(f"📥 `!결과삭제` 명령어 실행됨. 입력된 game_number: {game_number}")
+
+        if not game_number:
+            await ctx.send("🗑 삭제할 경기번호를 입력하세요! (30초 내 입력)")
+
+            try:
+                msg = await conversations.ask(ctx, "게임번호")
+                game_number = msg.content.strip()  # 사용자가 입력한 게임번호
+                logging.info(f"✅ 입력된 게임번호: {game_number}")
+            except asyncio.TimeoutError:
+                logging.warning("⏳ 게임번호 입력 시간 초과됨.")
+                await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!결과삭제`를 입력하세요!")
+                return
+
+        # ✅ 해당 경기의 정보를 먼저 조회
+        payload = {"action": "getMatch", "game_number": game_number}
+        logging.info(f"🚀 GAS 요청 URL: {GAS_URL}")
+        logging.info(f"📡 전송 데이터: {payload}")
+
+        # ✅ 삭제는 확인 버튼을 누른 뒤에만 요청하므로 명령어 실행 시 GAS 왕복은 조회 한 번
+        try:
+            data, _ = await asyncio.to_thread(gas.fetch, payload)
+            logging.info(f"🔍 변환된 GAS 응답 (JSON): {json.dumps(data, indent=2, ensure_ascii=False)}")
+        except gas.GasUnavailable as e:
+            logging.error(f"🚨 GAS 응답 실패 (캐시 없음): {e}")
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+
+        if "error" in data:
+            logging.warning(f"🚨 GAS에서 오류 반환: {data['error']}")
+            await ctx.send(f"🚨 {data['error']}")
+            return
+
+        # ✅ 승/패 팀 정보 가져오기 (리스트로 변환)
+        match = Match.from_dict(data)
+        win_players, lose_players = list(match.winners), list(match.losers)
+
+        # ✅ 팀 데이터가 정상적으로 로드되었는지 확인
+        logging.info(f"🏆 승리 팀: {win_players}")
+        logging.info(f"❌ 패배 팀: {lose_players}")
+
+        if not win_players or not lose_players:
+            logging.error("🚨 경기 데이터가 비어 있음! 경기번호가 올바른지 확인 필요.")
+            await ctx.send("🚨 경기 데이터를 가져올 수 없습니다. 경기번호를 확인하세요.")
+            return
+
+        def format_team(team):
+            """ ✅ 유저명 + 클래스 순서 적용 """
+            if not team or len(team) < 4:
+                logging.warning("🚨 팀 데이터가 4명 이하로 감지됨! 데이터 손상 가능성 있음.")
+                return "데이터 오류 (4명 부족)"
+
+            return ", ".join(f"{player.strip()}" for i, player in enumerate(team[:4]))  # ✅ 4명까지만 적용
+
+        win_team_info = format_team(win_players)
+        lose_team_info = format_team(lose_players)
+
+        # ✅ 삭제 확인 메시지
+        delete_message = (
+            f"⚠️ `{game_number}` 경기 기록을 삭제하시겠습니까?\n"
+            f" - 삭제 [승] {win_team_info}\n"
+            f" - 삭제 [패] {lose_team_info}"
+        )
+        logging.info(f"📋 삭제 전 최종 확인 메시지:\n{delete_message}")
+
+        # ✅ 삭제 요청 전 확인
+        delete_payload = {"action": "deleteMatch", "game_number": game_number}
+        logging.info(f"🚀 GAS에 삭제 요청 전송: {delete_payload}")
+
+        async def confirm_callback(interaction):
+            response = await post_result_write(delete_payload)
+            logging.info(f"📡 GAS 응답 상태 코드 (삭제 요청): {response.status_code}")
+            logging.info(f"📜 GAS 응답 원본 (삭제 요청): {response.text}")
+
+            try:
+                data = decode_json(response.content)
+                if "error" in data:
+                    logging.warning(f"🚨 GAS에서 삭제 요청 실패: {data['error']}")
+                    await ctx.send(f"🚨 오류: {data['error']}")
+                    return
+
+                # ✅ 삭제 완료 메시지 (경기 정보 포함)
+                result_message = (
+                    f"✅ `{game_number}` 경기 기록이 삭제되었습니다!\n"
+                    f" - 삭제 [승] {win_team_info}\n"
+                    f" - 삭제 [패] {lose_team_info}"
+                )
+                logging.info("✅ 경기 삭제 완료!")
+                on_results_rewritten([game_number])
+                await ctx.send(result_message)
+
+            except Exception as e:
+                logging.error(f"🚨 경기 삭제 요청 중 예외 발생: {e}")
+                await ctx.send("🚨 경기 삭제 요청에 실패했습니다.")
+
+        result_message = (
+            f"✅ `{game_number}` 경기 기록이 삭제되었습니다!\n"
+            f" - 삭제 [승] {win_team_info}\n"
+            f" - 삭제 [패] {lose_team_info}"
+        )
+
+        view = ConfirmView(
+            ctx,
+            delete_payload,
+            result_message,
+            "🚨 경기 삭제 요청에 실패했습니다.",
+            game_number=game_number
+        )
+
+        await send_view(ctx, delete_message, view)
+
+    @app_commands.command(name="결과조회", description="특정 경기 또는 최근 5경기 결과 조회")
+    @app_commands.describe(게임번호="비워 두면 최근 5경기")
+    @app_commands.autocomplete(게임번호=autocomplete_game_number)
+    async def slash_결과조회(self, interaction: discord.Interaction, 게임번호: str = None):
+        await run_slash(interaction, self.결과조회, 게임번호)
+
+    @app_commands.command(name="결과등록", description="경기 결과 등록 (팀별 드 / 어 / 넥 / 슴 순서)")
+    @app_commands.describe(아래점수="아래 팀 점수", 위점수="위 팀 점수")
+    @app_commands.autocomplete(아래_드=autocomplete_player, 아래_어=autocomplete_player, 아래_넥=autocomplete_player,
+                               아래_슴=autocomplete_player, 위_드=autocomplete_player, 위_어=autocomplete_player,
+                               위_넥=autocomplete_player, 위_슴=autocomplete_player)
+    async def slash_결과등록(self, interaction: discord.Interaction,
+                         아래_드: str, 아래_어: str, 아래_넥: str, 아래_슴: str, 아래점수: app_commands.Range[int, 0, 9],
+                         위_드: str, 위_어: str, 위_넥: str, 위_슴: str, 위점수: app_commands.Range[int, 0, 9]):
+        refresh_player_index()
+        below = [resolve_typed_name(name) for name in (아래_드, 아래_어, 아래_넥, 아래_슴)]
+        above = [resolve_typed_name(name) for name in (위_드, 위_어, 위_넥, 위_슴)]
+
+        async def register(ctx):
+            if len(set(below + above)) != 8:
+                await ctx.send("🚨 **같은 유저가 두 번 입력되었습니다!** 8명 모두 다른 유저여야 합니다.")
+                return
+            if 아래점수 == 위점수:
+                await ctx.send("🚨 **동점 경기는 등록할 수 없습니다!**")
+                return
+            if 아래점수 > 위점수:
+                await validate_and_register(ctx, below, above, 아래점수, 위점수)
+            else:
+                await validate_and_register(ctx, above, below, 위점수, 아래점수)
+
+        await run_slash(interaction, register)
+
+
+async def setup(bot):
+    await bot.add_cog(Results(bot))
@@ -0,0 +1,551 @@
+"""
+✅ 팀 생성 명령어: `!팀생성` (보이스 포함), `!팀생성일반`, `!팀생성고급`, `!시너지` + `/팀생성`
+
+`!리로드 teams`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨)
+"""
+import asyncio
+import logging
+import re
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import gas
+from records import CLASS_ORDER
+from team_solver import ConstraintError, parse_constraints
+from bot import account_links, conversations, synergy_matrix
+from shared import (GAS_UNAVAILABLE_MESSAGE, acquire_fair_slot, autocomplete_player, complete_players,
+                    ensure_synergy_loaded, expand_mentions, get_roster_and_players, run_slash, stale_notice)
+from views import TeamGenerationView, send_view
+
+
+async def start_team_generation(ctx, player_list, parsed_players, together, apart):
+    """✅ 입력 8명(유저명 / 별명) → 유저명 변환 + 조건 확인 후 팀 생성 버튼 전송 (`!팀생성`, `/팀생성` 공용)"""
+    # ✅ 유저명 & 닉네임 매핑 정보 + 유저 정보 (로컬 복제본 또는 GAS 왕복 한 번)
+    try:
+        roster, players_by_name, age = await get_roster_and_players(player_list)
+    except gas.GasUnavailable:
+        await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+        return
+    except gas.GasError as e:
+        await ctx.send(f"🚨 오류: {e}")
+        return
+
+    # ✅ 입력한 값들을 유저명으로 변환
+    converted_players = []
+    unknown_players = []
+    for p in player_list:
+        username = roster.resolve(p)
+        if username is None:
+            unknown_players.append(p)  # ❌ 찾을 수 없는 유저
+            continue
+        if username != p:
+            logging.info(f"🔄 닉네임 `{p}` → 유저명 `{username}` 변환 완료")
+        converted_players.append(username)
+
+    logging.info(f"🎯 **최종 변환된 유저 리스트:** {converted_players}")
+    logging.info(f"🚨 **등록되지 않은 유저:** {unknown_players}")
+
+    if len(converted_players) != 8:
+        await ctx.send(f"🚨 **팀 생성 불가! 정확히 8명의 유저를 입력해야 합니다!**\n"
+                       f"❌ **등록되지 않은 유저:** `{', '.join(unknown_players)}`")
+        return
+
+    # ✅ 닉네임으로 입력한 클래스 지정 / 제약 조건도 유저명 기준으로 변환
+    def resolve(name):
+        return roster.resolve(name) or name
+
+    parsed_players = {resolve(p): classes for p, classes in parsed_players.items()}
+    together = [[resolve(name) for name in group] for group in together]
+    apart = [(resolve(a), resolve(b)) for a, b in apart]
+
+    outside = sorted({name for group in together for name in group} | {name for pair in apart for name in pair}
+                     - set(converted_players))
+    if outside:
+        await ctx.send(f"🚨 **팀 생성 불가!** 조건에 쓰인 유저가 참가자 목록에 없습니다: `{', '.join(outside)}`")
+        return
+
+    # ✅ 미리 받은 유저 정보에 빠진 유저가 있으면 버튼 클릭 시 다시 조회
+    players_data = None
+    if all(name in players_by_name for name in converted_players):
+        players_data = [players_by_name[name] for name in converted_players]
+
+    view = TeamGenerationView(ctx, converted_players, parsed_players, together, apart, players_data, age)
+    message = await send_view(ctx, "🔄 **팀을 생성할 방식을 선택하세요!**", view)
+    view.message = message  # ✅ 첫 번째 메시지를 저장하여 이후 MIX 버튼 클릭 시 업데이트 가능
+    view.start_prefetch()  # ✅ 버튼 클릭 전에 유저 정보 / 추천 조합 미리 계산
+
+
+VOICE_KEYWORD = "보이스"
+
+
+async def voice_roster(ctx):
+    """
+    ✅ 명령어를 실행한 유저의 음성 채널 참가자 → 연결된 유저명 리스트 (디스코드 음성 상태 캐시 + 계정 연결만 사용, GAS 조회 없음)
+    - 음성 채널에 없거나 연결되지 않은 참가자가 있거나 8명이 아니면 안내 후 None
+    """
+    voice = getattr(ctx.author, "voice", None)
+    if voice is None or voice.channel is None:
+        await ctx.send("🚨 **음성 채널에 먼저 들어간 뒤 `!팀생성 보이스`를 입력하세요!**")
+        return None
+
+    channel = voice.channel
+    usernames, unlinked = [], []
+    for user_id in channel.voice_states:
+        member = ctx.guild.get_member(user_id)
+        if member is not None and member.bot:
+            continue
+        username = account_links.username_for(user_id)
+        if username is None:
+            unlinked.append(member.display_name if member is not None else f"<@{user_id}>")
+        else:
+            usernames.append(username)
+    logging.info(f"🎙️ [보이스 팀생성] {channel.name}: 연결됨 {usernames}, 연결 안 됨 {unlinked}")
+
+    if unlinked:
+        await ctx.send(f"🚨 **`{channel.name}` 채널에 유저명이 연결되지 않은 참가자가 있습니다:** `{', '.join(unlinked)}`\n"
+                       f"`!등록`으로 직접 등록하거나 관리자에게 `!연결`을 요청한 뒤 다시 시도해주세요.",
+                       allowed_mentions=discord.AllowedMentions.none())
+        return None
+    if len(usernames) != 8:
+        await ctx.send(f"🚨 **`{channel.name}` 채널 인원이 {len(usernames)}명입니다. 정확히 8명이어야 합니다!**")
+        return None
+    return usernames
+
+
+class Teams(commands.Cog):
+    """✅ 팀 생성 / 시너지 명령어 + `/팀생성`"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command()
+    async def 팀생성일반(self, ctx, *, players: str = None):
+        """
+        ✅ MMR 순위를 기반으로 1~4등 중 2명, 5~8등 중 2명을 뽑아 팀을 나눔
+        ✅ 유저명뿐만 아니라 닉네임으로도 팀 생성 가능 (닉네임 → 유저명 변환)
+        ✅ 포지션을 랜덤하게 섞되, 해당 플레이어가 가진 클래스만 배치됨
+        """
+        import random
+
+        # ✅ 유저 입력 받기
+        if not players:
+            await ctx.send("🚨 **팀을 생성할 유저 목록을 입력하세요! (쉼표 또는 슬래시로 구분, 정확히 8명 입력 필수)**\n"
+                           "⏳ **30초 내로 유저명을 입력해주세요!**")
+            try:
+                msg = await conversations.ask(ctx, "유저 목록")
+                players = msg.content.strip()
+            except asyncio.TimeoutError:
+                await ctx.send("⏳ **시간 초과! 다시 `!팀생성` 명령어를 입력하세요.**")
+                return
+
+        players = await expand_mentions(ctx, players)
+        if players is None:
+            return
+
+        player_list = list(set(re.split(r"[,/]", players.strip())))
+        logging.info(f"🎯 입력된 유저 리스트: {player_list}")
+
+        await acquire_fair_slot(ctx)  # ✅ 입력을 기다리는 동안에는 공정 대기열 자리를 잡지 않음
+
+        # ✅ 유저명 & 닉네임 매핑 + 유저 정보 (로컬 복제본 또는 GAS 왕복 한 번, 장애 시 캐시)
+        try:
+            roster, players_by_name, age = await get_roster_and_players(player_list)
+        except gas.GasUnavailable:
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+        except gas.GasError as e:
+            await ctx.send(f"🚨 오류: {e}")
+            return
+
+        # ✅ 입력한 값들을 유저명으로 변환
+        converted_players = []
+        unknown_players = []
+        for p in player_list:
+            username = roster.resolve(p)
+            if username is None:
+                unknown_players.append(p)  # ❌ 찾을 수 없는 유저
+                continue
+            if username != p:
+                logging.info(f"🔄 닉네임 `{p}` → 유저명 `{username}` 변환 완료")
+            converted_players.append(username)
+
+        logging.info(f"🎯 **최종 변환된 유저 리스트:** {converted_players}")
+        logging.info(f"🚨 **등록되지 않은 유저:** {unknown_players}")
+
+        if len(converted_players) != 8:
+            await ctx.send(f"🚨 **팀 생성 불가! 정확히 8명의 유저를 입력해야 합니다!**\n"
+                           f"❌ **등록되지 않은 유저:** `{', '.join(unknown_players)}`")
+            return
+
+        # ✅ 함께 받은 플레이어 정보 사용 (빠진 유저만 추가 조회)
+        try:
+            players_data, age = await complete_players(converted_players, players_by_name, age)
+        except gas.GasUnavailable:
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+        except gas.GasError as e:
+            await ctx.send(f"🚨 {e}")
+            return
+
+        if not players_data:
+            await ctx.send("🚨 오류: 유저 정보를 가져오지 못했습니다.")
+            return
+
+        registered_users = {p.username for p in players_data}
+        missing_users = [p for p in converted_players if p not in registered_users]
+
+        # ✅ **등록되지 않은 유저가 있으면 팀 생성 불가!**
+        if missing_users:
+            await ctx.send(f"🚨 **팀 생성 불가!** ❌\n"
+                           f"⛔ **등록되지 않은 유저**: `{', '.join(missing_users)}`\n"
+                           "📌 **해결 방법**: `!등록 [유저명]` 명령어로 유저를 등록한 후 다시 시도해주세요!")
+            return
+
+        # ✅ MMR 기준 정렬 (내림차순)
+        players_data.sort(key=lambda x: x.mmr, reverse=True)
+        logging.info(f"📊 **MMR 순위 정렬된 유저 리스트:** {[(p.username, p.mmr) for p in players_data]}")
+
+        # ✅ 팀 생성 및 검증 로직
+        def create_balanced_teams():
+            top_half = random.sample(players_data[:4], 2)  # 상위 4명 중 2명 선택
+            bottom_half = random.sample(players_data[4:], 2)  # 하위 4명 중 2명 선택
+            team1 = top_half + bottom_half
+            team2 = [p for p in players_data if p not in team1]
+            return team1, team2
+
+        attempts = 0
+        valid_teams = False
+        while attempts < 10:
+            team1, team2 = create_balanced_teams()
+            logging.info(f"🎲 **랜덤 팀 배정 시도 {attempts+1}:** 팀1 - {team1}, 팀2 - {team2}")
+            valid_teams = True  # 검증 로직 간소화 (필요하면 check_valid_teams 추가)
+            if valid_teams:
+                break
+            attempts += 1
+
+        if not valid_teams:
+            await ctx.send("🚨 **팀 생성 실패! 유효한 조합을 찾을 수 없습니다.**")
+            return
+
+        # ✅ 팀 내 포지션 랜덤 배치
+        def shuffle_team_roles(team):
+            positions = ["드", "어", "넥", "슴"]
+            random.shuffle(positions)
+            shuffled_team = []
+            for position in positions:
+                available_players = [p for p in team if p.can_play(CLASS_ORDER.index(position))]
+                if available_players:
+                    selected_player = random.choice(available_players)
+                    shuffled_team.append({"username": selected_player.username, "class": position})
+                    team.remove(selected_player)
+            return shuffled_team
+
+        team1 = shuffle_team_roles(team1)
+        team2 = shuffle_team_roles(team2)
+
+        logging.info(f"🔄 **팀1 최종 포지션:** {team1}")
+        logging.info(f"🔄 **팀2 최종 포지션:** {team2}")
+
+        # ✅ 최종 팀 배정 후 메시지 출력
+        team1_names = "/".join([p['username'] for p in team1])
+        team2_names = "/".join([p['username'] for p in team2])
+        msg = f"[아래] {team1_names} vs [위] {team2_names}"
+
+        await ctx.send(stale_notice(age) + msg)
+
+    @commands.command()
+    async def 팀생성고급(self, ctx, *, players: str = None):
+        """
+        ✅ MMR 순위를 기반으로 2 to 1 (1/2, 3/4, 5/6, 7/8) 로 팀을 나눔 (고급 모드)
+        ✅ 닉네임 지원 및 포지션 무작위 섞기 적용
+        """
+        import random
+        logging.info("🚀 [팀생성고급] 명령어 실행됨")
+
+        # ✅ 유저 입력 받기
+        if not players:
+            await ctx.send(
+                "※ **해당 명령어는 관리자 전용 입니다.**\n"
+                "일반적인 팀생성은 `!팀생성` 명령어를 사용해주세요.\n"
+                "📌 **팀을 생성할 유저 목록을 입력하세요!** (쉼표 또는 슬래시 구분, 정확히 8명 입력 필수)"
+            )
+            try:
+                msg = await conversations.ask(ctx, "유저 목록")
+                players = msg.content.strip()
+            except asyncio.TimeoutError:
+                await ctx.send("⏳ **시간 초과! 다시 `!팀생성고급` 명령어를 입력하세요.**")
+                return
+
+        players = await expand_mentions(ctx, players)
+        if players is None:
+            return
+
+        player_list = list(set(re.split(r"[,/]", players.strip())))
+        logging.info(f"🎯 입력된 유저 리스트: {player_list}")
+
+        await acquire_fair_slot(ctx)  # ✅ 입력을 기다리는 동안에는 공정 대기열 자리를 잡지 않음
+
+        # ✅ 등록된 유저 및 별명 목록 + 유저 정보 (로컬 복제본 또는 GAS 왕복 한 번, 장애 시 캐시)
+        try:
+            roster, players_by_name, age = await get_roster_and_players(player_list)
+        except gas.GasUnavailable:
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+        except gas.GasError as e:
+            await ctx.send(f"🚨 오류: {e}")
+            return
+
+        # ✅ 닉네임 → 실제 유저명 변환
+        resolved_players = []
+        unresolved_players = []
+
+        for player in player_list:
+            if player in roster.users:
+                resolved_players.append(player)  # ✅ 유저명이 존재하면 그대로 추가
+            else:
+                matched_user = roster.alias_map.get(player)
+                if matched_user:
+                    resolved_players.append(matched_user)  # ✅ 닉네임을 유저명으로 변환하여 추가
+                    logging.info(f"🔄 닉네임 `{player}` → 유저명 `{matched_user}` 변환 완료")
+                else:
+                    unresolved_players.append(player)  # ✅ 등록되지 않은 유저 저장
+
+        logging.info(f"✅ 최종 변환된 유저 리스트: {resolved_players}")
+        logging.info(f"🚨 등록되지 않은 유저: {unresolved_players}")
+
+        # ✅ 등록되지 않은 유저가 있으면 팀 생성 불가
+        if unresolved_players:
+            await ctx.send(
+                f"🚨 **팀 생성 불가!** ❌\n"
+                f"⛔ **등록되지 않은 유저/닉네임**: `{', '.join(unresolved_players)}`\n"
+                "📌 **해결 방법**: `!등록 [유저명]` 명령어로 유저를 등록한 후 다시 시도해주세요!"
+            )
+            return
+
+        # ✅ 함께 받은 유저 정보 사용 (빠진 유저만 추가 조회)
+        try:
+            players_data, age = await complete_players(resolved_players, players_by_name, age)
+        except gas.GasUnavailable:
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+        except gas.GasError as e:
+            await ctx.send(f"🚨 {e}")
+            return
+
+        # ✅ MMR 기준 정렬 (내림차순)
+        players_data.sort(key=lambda x: x.mmr, reverse=True)
+        logging.info(f"📊 MMR 정렬된 유저 리스트: {[(p.username, p.mmr) for p in players_data]}")
+
+        # ✅ MMR 순위에 따른 고정 팀 배정 (2 to 1)
+        possible_combinations = [
+            ([0, 2, 4, 6], [1, 3, 5, 7]),
+            ([0, 3, 5, 6], [1, 2, 4, 7]),
+            ([0, 2, 5, 7], [1, 3, 4, 6]),
+            ([0, 3, 4, 7], [1, 2, 5, 6])
+        ]
+
+        # ✅ 랜덤하게 팀 조합을 선택 (최대 10번 시도)
+        attempts = 0
+        valid_teams = False
+        team1, team2 = [], []
+
+        while attempts < 10 and possible_combinations:
+            team1_idx, team2_idx = random.choice(possible_combinations)
+            team1 = [players_data[i] for i in team1_idx]
+            team2 = [players_data[i] for i in team2_idx]
+            logging.info(f"🎲 랜덤 팀 배정 시도 {attempts+1}: 팀1 - {team1}, 팀2 - {team2}")
+
+            valid_teams = True  # 필요하면 check_valid_teams 추가 가능
+            if valid_teams:
+                break
+            attempts += 1
+
+        if not valid_teams:
+            await ctx.send("🚨 **팀 생성 실패! 유효한 조합을 찾을 수 없습니다.**")
+            return
+
+        # ✅ 팀 내 포지션 랜덤 배치
+        def shuffle_team_roles(team):
+            positions = ["드", "어", "넥", "슴"]
+            random.shuffle(positions)
+            shuffled_team = []
+
+            for position in positions:
+                available_players = [p for p in team if p.can_play(CLASS_ORDER.index(position))]
+                if available_players:
+                    selected_player = random.choice(available_players)
+                    shuffled_team.append({"username": selected_player.username, "class": position})
+                    team.remove(selected_player)
+
+            return shuffled_team
+
+        team1 = shuffle_team_roles(team1)
+        team2 = shuffle_team_roles(team2)
+
+        logging.info(f"🔄 팀1 최종 포지션: {team1}")
+        logging.info(f"🔄 팀2 최종 포지션: {team2}")
+
+        # ✅ 최종 팀 배정 후 메시지 출력
+        team1_names = "/".join([p['username'] for p in team1])
+        team2_names = "/".join([p['username'] for p in team2])
+        msg = f"[아래] {team1_names} vs [위] {team2_names}"
+
+        await ctx.send(stale_notice(age) + msg)
+
+    @commands.command()
+    async def 시너지(self, ctx, username: str = None, partner: str = None):
+        """
+        ✅ 팀원 시너지 / 상대 전적 분석
+        - `!시너지` → 전체 듀오 시너지 상위/하위
+        - `!시너지 유저명` → 해당 유저의 베스트/워스트 듀오 + 상대 전적
+        - `!시너지 유저명 유저명` → 두 유저의 동반 전적 + 클래스 조합별 승률
+        """
+        logging.info(f"📥 `!시너지` 명령어 실행됨. username: {username}, partner: {partner}")
+
+        if username:
+            username = await expand_mentions(ctx, username)
+            if username is None:
+                return
+        if partner:
+            partner = await expand_mentions(ctx, partner)
+            if partner is None:
+                return
+
+        if not await ensure_synergy_loaded():
+            await ctx.send("🚨 경기 기록을 불러오지 못했습니다. 잠시 후 다시 시도해주세요.")
+            return
+
+        def format_pairs(pairs):
+            return "\n".join(
+                f"• `{a}` + `{b}` — {games}경기 {rate * 100:.0f}% (시너지 {score * 100:+.1f}%p)"
+                for a, b, games, rate, score in pairs
+            ) or "• 데이터 부족"
+
+        if username and partner:
+            for name in (username, partner):
+                if name not in synergy_matrix.index:
+                    await ctx.send(f"🚨 `{name}` 님의 경기 기록이 없습니다.")
+                    return
+
+            i, j = synergy_matrix.index[username], synergy_matrix.index[partner]
+            together = int(synergy_matrix.together_games[i, j])
+            together_wins = int(synergy_matrix.together_wins[i, j])
+            versus = int(synergy_matrix.versus_games[i, j])
+            versus_wins = int(synergy_matrix.versus_wins[i, j])
+            score = synergy_matrix.synergy()[i, j]
+
+            msg = (
+                f"🤝 **`{username}` + `{partner}` 시너지**\n"
+                f"👥 **같은 팀:** {together}경기 {together_wins}승 (시너지 {score * 100:+.1f}%p)\n"
+                f"⚔️ **맞대결:** {versus}경기 `{username}` {versus_wins}승 / `{partner}` {versus - versus_wins}승\n"
+            )
+            class_pairs = synergy_matrix.class_pairs(username, partner)
+            if class_pairs:
+                msg += "\n🛡 **클래스 조합별 전적**\n" + "\n".join(
+                    f"• {a}+{b} — {games}경기 {rate * 100:.0f}%" for a, b, games, rate in class_pairs
+                )
+            await ctx.send(msg)
+            return
+
+        if username:
+            if username not in synergy_matrix.index:
+                await ctx.send(f"🚨 `{username}` 님의 경기 기록이 없습니다.")
+                return
+
+            rivals = synergy_matrix.rivals(username, limit=3)
+            rival_text = "\n".join(
+                f"• vs `{name}` — {games}경기 {rate * 100:.0f}%" for name, games, rate in rivals
+            ) or "• 데이터 부족"
+
+            msg = (
+                f"🤝 **`{username}` 님의 시너지 분석**\n\n"
+                f"📈 **베스트 듀오**\n{format_pairs(synergy_matrix.top_pairs(username, limit=3))}\n\n"
+                f"📉 **워스트 듀오**\n{format_pairs(synergy_matrix.top_pairs(username, limit=3, reverse=True))}\n\n"
+                f"⚔️ **상대 전적 (승률 순)**\n{rival_text}"
+            )
+            await ctx.send(msg)
+            return
+
+        msg = (
+            f"🤝 **전체 듀오 시너지** (누적 {synergy_matrix.matches_seen}경기)\n\n"
+            f"📈 **상위 5**\n{format_pairs(synergy_matrix.top_pairs(limit=5))}\n\n"
+            f"📉 **하위 5**\n{format_pairs(synergy_matrix.top_pairs(limit=5, reverse=True))}"
+        )
+        await ctx.send(msg)
+
+    @commands.command()
+    async def 팀생성(self, ctx, *, players: str = None):
+        """팀 생성 명령어"""
+        logging.info(f"🚀 [팀생성 명령어 실행] 입력된 플레이어: {players}")
+
+        if not players:
+            await ctx.send("🚨 **8명의 유저를 입력하세요! (쉼표 또는 슬래시로 구분)**")
+            return
+
+        players = await expand_mentions(ctx, players)
+        if players is None:
+            return
+
+        # ✅ 같은팀:A+B / 다른팀:A+B 조건 분리
+        try:
+            players, together, apart = parse_constraints(players)
+        except ConstraintError as e:
+            await ctx.send(f"🚨 **팀 생성 불가!** {e}")
+            return
+        logging.info(f"🧩 [팀 제약 조건] 같은팀: {together}, 다른팀: {apart}")
+
+        if players.strip() == VOICE_KEYWORD:
+            player_list = await voice_roster(ctx)
+            if player_list is not None:
+                await start_team_generation(ctx, player_list, dict.fromkeys(player_list), together, apart)
+            return
+
+        player_list = list(set(re.split(r"[,/]", players.strip())))
+        player_list = re.findall(r"[^\s,()/]+(?:\([^\)]+\))?", players.strip())
+
+        logging.info(f"🎯 입력된 유저 리스트: {player_list}")
+
+        parsed_players = {}
+
+        for p in player_list:
+            p = p.strip()
+            match = re.match(r"^([^\(]+)\(([^)]+)\)$", p)
+            if match:
+                username, class_override = match.groups()
+                parsed_players[username.strip()] = [c.strip() for c in class_override.split(",")]
+                logging.info(f"🔍 클래스 지정됨: {username.strip()} → {parsed_players[username.strip()]}")
+            else:
+                parsed_players[p] = None
+                logging.info(f"ℹ️ 클래스 미지정: {p}")
+
+        logging.info(f"🔍 [유저 입력 파싱 완료] {parsed_players}")
+
+        player_list = list(parsed_players.keys())
+
+        if len(player_list) != 8:
+            await ctx.send("🚨 **정확히 8명의 유저를 입력해야 합니다!**")
+            return
+
+        await start_team_generation(ctx, player_list, parsed_players, together, apart)
+
+    @app_commands.command(name="팀생성", description="8명으로 밸런스 팀 생성")
+    @app_commands.autocomplete(유저1=autocomplete_player, 유저2=autocomplete_player, 유저3=autocomplete_player,
+                               유저4=autocomplete_player, 유저5=autocomplete_player, 유저6=autocomplete_player,
+                               유저7=autocomplete_player, 유저8=autocomplete_player)
+    async def slash_팀생성(self, interaction: discord.Interaction, 유저1: str, 유저2: str, 유저3: str, 유저4: str,
+                        유저5: str, 유저6: str, 유저7: str, 유저8: str):
+        player_list = list(dict.fromkeys([유저1, 유저2, 유저3, 유저4, 유저5, 유저6, 유저7, 유저8]))
+
+        async def generate(ctx):
+            if len(player_list) != 8:
+                await ctx.send("🚨 **정확히 8명의 서로 다른 유저를 입력해야 합니다!**")
+                return
+            await start_team_generation(ctx, player_list, dict.fromkeys(player_list), [], [])
+
+        await run_slash(interaction, generate)
+
+
+async def setup(bot):
+    await bot.add_cog(Teams(bot))
@@ -0,0 +1,499 @@
+"""
+✅ 유저 관리 명령어: 등록 / 조회 / 클래스 / 별명, 디스코드 계정 연결 + `/조회`
+
+`!리로드 users`로 프로세스 재시작 없이 다시 불러올 수 있음 (상태는 bot 모듈에 있어서 유지됨)
+"""
+import asyncio
+import logging
+import re
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import gas
+from links import MENTION_PATTERN
+from bot import account_links, conversations, is_allowed_user
+from shared import (GAS_UNAVAILABLE_MESSAGE, autocomplete_player, expand_mentions, fetch_roster, format_linked_accounts,
+                    get_roster, refresh_player_index, resolve_typed_name, run_slash, stale_notice)
+from views import ConfirmView, send_view
+
+
+class Users(commands.Cog):
+    """✅ 유저 관리 명령어 + `/조회`"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.command()
+    async def 등록(self, ctx, username: str = None, classname: str = None, *, nickname: str = None):
+        """
+        ✅ 유저 등록 / 업데이트 명령어 (대화형 입력 추가)
+        """
+        logging.basicConfig(level=logging.INFO)
+
+        logging.info("🚀 [등록 명령어 호출] username: %s, classname: %s, nickname: %s", username, classname, nickname)
+
+        # ✅ 유저명이 없으면 입력받기
+        if username is None:
+            await ctx.send("🎮 **등록할 유저명을 입력하세요! (30초 내 입력)**")
+
+            try:
+                msg = await conversations.ask(ctx, "유저명")
+                username = msg.content.strip()
+                logging.info(f"✅ [입력 완료] 유저명: {username}")
+            except asyncio.TimeoutError:
+                await ctx.send("⏳ **시간 초과! 다시 `!등록` 명령어를 입력하세요.**")
+                return
+
+
+        roster = await fetch_roster()
+        existing_users, existing_aliases = roster.users, roster.aliases
+        logging.info(f"📋 기존 등록된 유저명: {existing_users}")
+        logging.info(f"📋 기존 등록된 별명 목록: {existing_aliases}")
+
+        # ✅ 닉네임 목록 변환 (모든 유저의 닉네임을 하나의 리스트로 변환)
+        all_existing_nicknames = {alias for alias_list in existing_aliases.values() for alias in alias_list}
+
+        # ✅ 1️⃣ 유저명이 기존 닉네임과 중복인지 확인
+        if username and username in all_existing_nicknames:
+            logging.warning(f"⚠ [중복 확인] `{username}` 이(가) 기존 닉네임과 중복됨!")
+            await ctx.send(f"🚨 **유저명 `{username}`은(는) 다른 유저의 닉네임으로 사용 중입니다!** 다른 유저명을 입력하세요.")
+            return
+
+        # ✅ 2️⃣ 닉네임 중복 검사 (닉네임이 있을 경우)
+        if nickname:
+            if nickname in existing_users:
+                await ctx.send(f"🚨 **닉네임 `{nickname}`은(는) 다른 유저의 유저명으로 사용 중입니다!** 다른 닉네임을 입력하세요.")
+                return
+
+            if nickname in all_existing_nicknames:
+                await ctx.send(f"🚨 **닉네임 `{nickname}`은(는) 이미 사용 중입니다!** 다른 닉네임을 입력하세요.")
+                return
+
+        # ✅ 기존 유저 여부 확인
+        is_update = username in existing_users
+        logging.info(f"📝 기존 유저 여부 확인: {is_update}")
+
+        # ✅ 클래스명 정렬 및 포맷 변환 (드/어/넥/슴 → 드, 어, 넥, 슴)
+        valid_classes = ["드", "어", "넥", "슴"]
+        if classname:
+            classname = classname.replace("/", ",")  # ✅ 슬래시 → 콤마 변경
+            classname_list = classname.split(",")
+            classname_list = sorted(set(c.strip() for c in classname_list if c.strip() in valid_classes),
+                                    key=lambda x: valid_classes.index(x))
+            classname = ",".join(classname_list)
+            logging.info(f"🛠 클래스 정리 완료: {classname}")
+
+        # ✅ GAS로 등록 요청 (기존 유저면 업데이트)
+        payload = {
+            "action": "register",
+            "username": username,
+            "classname": classname if classname else None,
+            "nickname": nickname if nickname else None
+        }
+
+        logging.info(f"🚀 [GAS 요청 전송] Payload: {payload}")
+
+        # ✅ 메시지 설정
+        if is_update:
+            confirm_msg = f"✅ `{username}` 님의 정보가 **업데이트**됩니다!\n"
+            if classname:
+                confirm_msg += f"- 클래스: `{classname}`\n"
+            if nickname:
+                confirm_msg += f"- 닉네임: `{nickname}`"
+            error_msg = "🚨 정보 업데이트에 실패했습니다."
+        else:
+            confirm_msg = f"✅ `{username}` 님이 **새로 등록**됩니다!"
+            error_msg = "🚨 등록 요청에 실패했습니다."
+
+        # ✅ 새 유저를 본인이 등록하면 확인 후 디스코드 계정과 자동 연결 (업데이트는 연결하지 않음)
+        view = ConfirmView(ctx, payload, confirm_msg, error_msg, link_user_id=None if is_update else ctx.author.id)
+
+        logging.info("✅ 등록 요청 완료, 사용자 확인 대기 중...")
+        await send_view(ctx, f"📋 `{username}` 님을 등록(또는 업데이트)하시겠습니까?", view)
+
+    @commands.command()
+    async def 별명등록(self, ctx, username: str = None, *, aliases: str = None):
+        """유저의 별명을 등록하는 명령어 (서버 주인 + 특정 유저만 가능)"""
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다! 702702 01 240826 국민 조민형 입금 후 변경 문의")
+            return
+
+        logging.basicConfig(level=logging.INFO)
+        logging.info(f"🚀 [별명등록 명령어 실행] username: {username}, aliases: {aliases}")
+
+
+        roster = await fetch_roster()
+        existing_users, existing_aliases = roster.users, roster.aliases
+        logging.info(f"📋 기존 등록된 유저명: {existing_users}")
+        logging.info(f"📋 기존 등록된 별명 목록: {existing_aliases}")
+
+        def check_duplicate(new_aliases, username):
+            """새로운 별명이 기존 유저명 또는 다른 유저의 별명과 중복되는지 확인"""
+            user_existing_aliases = existing_aliases.get(username, [])  # ✅ 해당 유저의 기존 별명
+            all_existing_aliases = {alias for user, alias_list in existing_aliases.items() if user != username for alias in alias_list}
+
+            duplicate_with_users = [alias for alias in new_aliases if alias in existing_users]  # ✅ 유저명과 중복 체크
+            duplicate_with_others = [alias for alias in new_aliases if alias in all_existing_aliases]
+            duplicate_with_self = [alias for alias in new_aliases if alias in user_existing_aliases]
+
+            logging.info(
+                f"🔍 입력한 별명: {new_aliases} | 중복된 별명(유저명): {duplicate_with_users} | "
+                f"중복된 별명(다른 유저): {duplicate_with_others} | 중복된 별명(본인): {duplicate_with_self}"
+            )
+
+            return duplicate_with_users, duplicate_with_others, duplicate_with_self
+
+        async def request_new_alias(ctx, username):
+            """사용자로부터 별명을 입력받는 함수 (중복되지 않는 별명을 받을 때까지 실행)"""
+            attempts = 2
+            while attempts > 0:
+                try:
+                    await ctx.send(f"✏️ `{username}` 님의 별명을 입력하세요! (쉼표 또는 슬래시 구분, 남은 시도 {attempts}회)")
+                    msg = await conversations.ask(ctx, "별명")
+                    alias_list = [alias.strip() for alias in re.split(r"[,/]", msg.content)]
+
+                    if not alias_list:
+                        await ctx.send("🚨 **별명을 입력해야 합니다!** 다시 입력해주세요.")
+                        logging.warning("⚠ 입력된 별명이 없음")
+                        attempts -= 1
+                        continue
+
+                    duplicate_with_users, duplicate_with_others, duplicate_with_self = check_duplicate(alias_list, username)
+
+                    if not duplicate_with_users and not duplicate_with_others and not duplicate_with_self:
+                        logging.info(f"✅ 새로운 별명 입력 완료: {alias_list}")
+                        return alias_list
+
+                    error_messages = []
+                    if duplicate_with_users:
+                        error_messages.append(f"❌ **유저명과 중복된 별명** `{', '.join(duplicate_with_users)}`")
+                    if duplicate_with_others:
+                        error_messages.append(f"❌ **다른 유저가 이미 사용 중인 별명** `{', '.join(duplicate_with_others)}`")
+                    if duplicate_with_self:
+                        error_messages.append(f"❌ **이미 `{username}` 님이 사용 중인 별명** `{', '.join(duplicate_with_self)}`")
+
+                    await ctx.send("\n".join(error_messages))
+                    logging.warning(f"⚠ 중복된 별명 입력됨: {error_messages}")
+                    attempts -= 1
+
+                except asyncio.TimeoutError:
+                    logging.error(f"⏳ `{username}` 님이 30초 내 입력하지 않음.")
+                    await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!별명등록`을 입력하세요!")
+                    return None
+
+            await ctx.send("🚨 너무 많은 시도 횟수 초과! 다시 `!별명등록`을 입력하세요.")
+            logging.warning("🚨 별명 입력 시도 횟수 초과!")
+            return None
+
+        # ✅ 유저명 입력 확인
+        if not username:
+            await ctx.send("🎮 별명을 등록할 유저명을 입력하세요! (30초 내 입력)")
+            try:
+                msg = await conversations.ask(ctx, "유저명")
+                username = msg.content.strip()
+                logging.info(f"📋 입력된 유저명: {username}")
+            except asyncio.TimeoutError:
+                await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!별명등록`을 입력하세요!")
+                logging.error("⏳ 유저명 입력 시간 초과!")
+                return
+
+        if not aliases:
+            alias_list = await request_new_alias(ctx, username)
+            if alias_list is None:
+                return
+        else:
+            alias_list = [alias.strip() for alias in re.split(r"[,/]", aliases)]
+            duplicate_with_users, duplicate_with_others, duplicate_with_self = check_duplicate(alias_list, username)
+
+            if duplicate_with_users or duplicate_with_others or duplicate_with_self:
+                error_messages = []
+                if duplicate_with_users:
+                    error_messages.append(f"❌ **유저명과 중복된 별명** `{', '.join(duplicate_with_users)}`")
+                if duplicate_with_others:
+                    error_messages.append(f"❌ **다른 유저가 이미 사용 중인 별명** `{', '.join(duplicate_with_others)}`")
+                if duplicate_with_self:
+                    error_messages.append(f"❌ **이미 `{username}` 님이 사용 중인 별명** `{', '.join(duplicate_with_self)}`")
+
+                await ctx.send("\n".join(error_messages))
+                logging.warning(f"⚠ 중복된 별명 입력됨: {error_messages}")
+                alias_list = await request_new_alias(ctx, username)
+                if alias_list is None:
+                    return
+
+        payload = {
+            "action": "registerAlias",
+            "username": username,
+            "aliases": alias_list
+        }
+        logging.info(f"🚀 GAS로 전송할 데이터: {payload}")
+
+        view = ConfirmView(ctx, payload, f"✅ `{username}` 님의 별명이 등록되었습니다: {', '.join(alias_list)}",
+                           "🚨 별명 등록 요청에 실패했습니다.")
+
+        logging.info(f"✅ `{username}` 님의 별명 등록 요청 완료! 별명: {alias_list}")
+        await send_view(ctx, f"📋 `{username}` 님의 별명을 `{', '.join(alias_list)}` (으)로 등록하시겠습니까?", view)
+
+    @commands.command()
+    async def 조회(self, ctx, username: str = None):
+        """
+        ✅ 새로운 Results 시트 구조 반영
+        """
+        logging.basicConfig(level=logging.INFO)
+
+        if not username:
+            username = account_links.username_for(ctx.author.id)
+        else:
+            username = await expand_mentions(ctx, username)
+            if username is None:
+                return
+        if not username:
+            await ctx.send("🔍 조회할 유저명을 입력하세요! 예시: `!조회 규석문` (계정이 연결되어 있으면 `!조회`만 입력해도 됩니다)")
+            logging.warning("⚠ 조회 명령어 실행 - 유저명이 입력되지 않음!")
+            return
+
+        logging.info(f"🚀 [조회 명령어 실행] username: {username}")
+
+        payload = {"action": "getUserInfo", "username": username}
+        logging.info(f"📡 GAS로 데이터 요청: {payload}")
+
+        try:
+            data, age = await asyncio.to_thread(gas.fetch, payload)
+            logging.info(f"✅ GAS 응답 JSON 디코딩 성공! 데이터: {data}")
+        except gas.GasUnavailable as e:
+            logging.error(f"🚨 GAS 응답 실패 (캐시 없음): {e}")
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+
+        if "error" in data:
+            logging.warning(f"⚠ GAS 응답에서 오류 발생: {data['error']}")
+            await ctx.send(f"🚨 {data['error']}")
+            return
+
+        # ✅ 데이터 가공 후 출력
+        msg = stale_notice(age) + (
+            f"📜 **`{data.get('username', '알 수 없음')}` 님의 정보**\n"
+            f"\n🛡 **플레이 가능 클래스:** {data.get('class', '[Data 없음]')}\n"
+            f"🎭 **별명:** {data.get('nickname', '[Data 없음]')}\n"
+            f"{format_linked_accounts([data.get('username')])}"
+            f"📅 **마지막 경기 일시:** {data.get('last_game', '[Data 없음]')}\n"
+            f"🏆 **이번 시즌 전체 승수:** {data.get('season_wins', 0)}승"
+        )
+
+        logging.info(f"✅ 최종 조회 결과 출력: \n{msg}")
+
+        await ctx.send(msg)
+
+    @commands.command()
+    async def 클래스(self, ctx, username: str = None, *, classes: str = None):
+        """
+        ✅ 유저의 클래스를 등록하는 명령어
+        """
+        logging.basicConfig(level=logging.INFO)
+
+        valid_classes = ["드", "어", "넥", "슴"]  # ✅ 고정된 클래스 순서
+
+        def format_classes(class_input):
+            class_list = [c.strip() for c in re.split(r"[,/]", class_input)]
+            valid_class_list = [c for c in class_list if c in valid_classes]
+            invalid_class_list = [c for c in class_list if c not in valid_classes]
+            valid_class_list = sorted(set(valid_class_list), key=lambda x: valid_classes.index(x))
+            return ", ".join(valid_class_list), invalid_class_list
+
+        # ✅ 직접 입력 방식 (username + classes 함께 입력됨)
+        if username and classes:
+            logging.info(f"🚀 [클래스 등록 요청] username: {username}, classes: {classes}")
+            formatted_classes, invalids = format_classes(classes)
+
+            if not formatted_classes:
+                await ctx.send("🚫 유효한 클래스가 없습니다. `드, 어, 넥, 슴` 중에서 입력하세요.")
+                return
+            if invalids:
+                await ctx.send(f"⚠️ 유효하지 않은 클래스는 제외됩니다: {', '.join(invalids)}")
+
+            payload = {
+                "action": "registerClass",
+                "username": username,
+                "classes": formatted_classes
+            }
+            logging.info(f"📡 GAS로 전송할 데이터: {payload}")
+
+            view = ConfirmView(
+                ctx, payload,
+                f"✅ `{username}` 님의 클래스가 등록되었습니다: {formatted_classes}",
+                "🚨 클래스 등록 요청에 실패했습니다."
+            )
+
+            await send_view(ctx, f"🛡 `{username}` 님의 클래스를 `{formatted_classes}` (으)로 등록하시겠습니까?", view)
+            return
+
+        # ✅ 대화형 모드
+        logging.info("🔍 [클래스 등록 - 대화형 입력 시작]")
+        await ctx.send("🎭 클래스를 등록할 유저명을 입력하세요! (30초 내 입력)")
+
+        try:
+            msg = await conversations.ask(ctx, "유저명")
+            username = msg.content.strip()
+            logging.info(f"📋 입력된 유저명: {username}")
+
+            await ctx.send(f"🛡 `{username}` 님의 클래스를 입력하세요! (쉼표 또는 슬래시 구분, 예시: 드,어/넥,슴) (30초 내 입력)")
+
+            while True:
+                msg = await conversations.ask(ctx, "클래스")
+                formatted_classes, invalids = format_classes(msg.content)
+                logging.info(f"📋 입력된 클래스: {formatted_classes}")
+
+                if not formatted_classes:
+                    await ctx.send("🚫 유효한 클래스가 없습니다. `드, 어, 넥, 슴` 중에서 다시 입력해주세요.")
+                    continue
+
+                if invalids:
+                    await ctx.send(f"⚠️ 유효하지 않은 클래스는 제외됩니다: {', '.join(invalids)}")
+
+                break  # ✅ 유효한 클래스가 들어오면 루프 탈출
+
+            payload = {
+                "action": "registerClass",
+                "username": username,
+                "classes": formatted_classes
+            }
+            logging.info(f"📡 GAS로 전송할 데이터: {payload}")
+
+            view = ConfirmView(
+                ctx, payload,
+                f"✅ `{username}` 님의 클래스가 등록되었습니다: {formatted_classes}",
+                "🚨 클래스 등록 요청에 실패했습니다."
+            )
+
+            await send_view(ctx, f"🛡 `{username}` 님의 클래스를 `{formatted_classes}` (으)로 등록하시겠습니까?", view)
+
+        except asyncio.TimeoutError:
+            logging.warning("⏳ 시간이 초과되었습니다. 유저 입력 없음.")
+            await ctx.send("⏳ 시간이 초과되었습니다. 다시 `!클래스`를 입력하세요!")
+
+    @commands.command()
+    async def 별명삭제(self, ctx, username: str = None):
+        """
+        ✅ 특정 유저의 모든 등록된 별명을 삭제하는 명령어
+        - `!별명삭제 유저명` → 해당 유저의 별명을 삭제
+        - `!별명삭제` → 유저명을 입력받아서 별명을 삭제
+        ✅ 디버깅 로그 추가됨
+        """
+
+        if not is_allowed_user(ctx):
+            await ctx.send(f"🚫 `{ctx.author.display_name}` 님은 이 명령어를 사용할 수 없습니다! 702702 01 240826 국민 조민형 입금 후 변경 문의")
+            return
+
+        import logging
+        logging.basicConfig(level=logging.INFO)
+
+        logging.info("🚀 [별명삭제] 명령어 실행됨")
+
+
+        # ✅ 유저 및 별명 데이터 가져오기
+        roster = await fetch_roster()
+        existing_users, existing_aliases = roster.users, roster.aliases
+        logging.info(f"📋 [유저 목록] 기존 등록된 유저명: {existing_users}")
+        logging.info(f"📋 [별명 목록] 기존 등록된 별명: {existing_aliases}")
+
+        # ✅ 대화형 모드: 유저명을 입력받기
+        if username is None:
+            await ctx.send("🎮 **별명을 삭제할 유저명을 입력하세요! (30초 내 입력)**")
+
+            try:
+                msg = await conversations.ask(ctx, "유저명")
+                username = msg.content.strip()
+                logging.info(f"✅ [입력 받은 유저명] {username}")
+
+            except asyncio.TimeoutError:
+                logging.warning("⏳ [시간 초과] 별명 삭제 요청이 중단됨")
+                await ctx.send("⏳ **시간 초과! 다시 `!별명삭제` 명령어를 입력하세요.**")
+                return
+
+        # ✅ 유저 존재 여부 확인
+        if username not in existing_users:
+            logging.warning(f"🚨 [오류] `{username}` 유저가 등록되지 않음")
+            await ctx.send(f"🚨 **유저 `{username}` 를 찾을 수 없습니다!** 먼저 `!등록` 명령어로 등록하세요.")
+            return
+
+        # ✅ 해당 유저의 별명 확인
+        user_aliases = existing_aliases.get(username, [])
+        logging.info(f"📋 `{username}` 님의 현재 등록된 별명: {user_aliases}")
+
+        if not user_aliases:
+            logging.info(f"⚠️ `{username}` 님은 별명이 등록되어 있지 않음")
+            await ctx.send(f"⚠️ **`{username}` 님은 등록된 별명이 없습니다!**")
+            return
+
+        # ✅ 삭제 요청 확인 메시지
+        confirm_msg = (
+            f"⚠️ **`{username}` 님의 모든 별명을 삭제하시겠습니까?**\n"
+            f"📋 **현재 등록된 별명:** `{', '.join(user_aliases)}`"
+        )
+        error_msg = "🚨 별명 삭제 요청에 실패했습니다."
+
+        # ✅ GAS로 삭제 요청 준비
+        payload = {
+            "action": "deleteAlias",
+            "username": username
+        }
+        logging.info(f"📤 [별명 삭제 요청] Payload: {payload}")
+
+        # ✅ 삭제 요청을 확인하는 ConfirmView 생성
+        view = ConfirmView(ctx, payload, f"✅ `{username}` 님의 별명이 삭제되었습니다!", error_msg)
+        await send_view(ctx, confirm_msg, view)
+        logging.info(f"✅ [별명 삭제 요청 전송 완료] `{username}` 님의 별명 삭제 요청됨")
+
+    @commands.command()
+    async def 연결(self, ctx, *, args: str = None):
+        """
+        ✅ `!연결` → 내 계정에 연결된 유저명 확인
+        ✅ `!연결 유저명` / `!연결 @멘션 유저명` → 계정과 유저명 연결 (👑 관리자 전용, 이미 다른 계정에 연결된 유저명도 변경 가능)
+        - 일반 유저는 `!등록`으로 직접 새로 등록한 유저명만 자동으로 연결됨 (다른 유저명을 가져가지 못하도록)
+        """
+        if not args:
+            current = account_links.username_for(ctx.author.id)
+            await ctx.send(f"🔗 현재 연결된 유저명: `{current}`" if current else
+                           "🔗 연결된 유저명이 없습니다. `!등록`으로 직접 등록하거나 관리자에게 `!연결`을 요청해주세요.")
+            return
+
+        if not is_allowed_user(ctx):
+            await ctx.send("🚫 계정 연결은 관리자만 할 수 있습니다. `!등록`으로 직접 새로 등록한 유저명은 자동으로 연결됩니다.")
+            return
+
+        target = ctx.author
+        if ctx.message.mentions:
+            target = ctx.message.mentions[0]
+            args = MENTION_PATTERN.sub("", args).strip()
+
+        try:
+            roster, _ = await get_roster()
+        except (gas.GasUnavailable, gas.GasError):
+            await ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return
+        username = roster.resolve(args)
+        if username is None:
+            await ctx.send(f"🚨 `{args}` 은(는) 등록되지 않은 유저입니다. `!등록` 후 연결해주세요.")
+            return
+
+        account_links.link(target.id, username)
+        logging.info(f"🔗 [계정 연결] {target} ({target.id}) → {username} (요청: {ctx.author})")
+        await ctx.send(f"🔗 {target.mention} ↔ `{username}` 연결 완료!", allowed_mentions=discord.AllowedMentions.none())
+
+    @commands.command()
+    async def 연결해제(self, ctx):
+        """✅ 내 계정의 유저명 연결 해제"""
+        username = account_links.unlink(ctx.author.id)
+        await ctx.send(f"🔗 `{username}` 연결을 해제했습니다." if username else "ℹ️ 연결된 유저명이 없습니다.")
+
+    @app_commands.command(name="조회", description="유저 정보 조회")
+    @app_commands.describe(유저="유저명 또는 별명")
+    @app_commands.autocomplete(유저=autocomplete_player)
+    async def slash_조회(self, interaction: discord.Interaction, 유저: str):
+        refresh_player_index()
+        await run_slash(interaction, self.조회, resolve_typed_name(유저))
+
+
+async def setup(bot):
+    await bot.add_cog(Users(bot))
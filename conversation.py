@@ -0,0 +1,148 @@
+"""
+✅ 대화형 입력 관리 (명령어마다 bot.wait_for 리스너를 추가하던 방식 대체)
+
+- (채널 ID, 유저 ID) → 진행 중인 대화 하나. 새 메시지는 dict 조회 한 번으로 해당 대화에만 전달 (O(1))
+  대기 중인 입력이 많아도 메시지마다 모든 check 함수를 실행하지 않음
+- ask(ctx, step): 명령어를 실행한 채널 / 유저의 다음 메시지를 기다림, step은 현재 입력 단계 이름 (로그용)
+- 같은 채널에서 같은 유저가 새 명령어로 입력을 요청하면 이전 대화는 ConversationCancelled로 종료
+- `취소` 입력 시 ConversationCancelled, 시간 초과 시 ConversationTimeout (asyncio.TimeoutError 하위 클래스 → 기존 처리 그대로)
+- 시간 제한은 TimerWheel 하나로 관리 (대기 중인 입력 수와 관계없이 타이머 작업 1개)
+"""
+import asyncio
+import collections
+import logging
+import math
+import time
+
+CANCEL_WORDS = {"취소", "cancel"}
+
+
+class ConversationTimeout(asyncio.TimeoutError):
+    pass
+
+
+class ConversationCancelled(Exception):
+    def __init__(self, command, reason):
+        super().__init__(f"`!{command}` 입력이 취소되었습니다 ({reason})")
+        self.command = command
+        self.reason = reason
+
+
+class Timer:
+    __slots__ = ("callback", "rounds", "cancelled")
+
+    def __init__(self, callback, rounds):
+        self.callback = callback
+        self.rounds = rounds
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """✅ 해시 타이머 휠: tick초마다 슬롯 하나를 확인 (등록 / 취소 O(1), 정밀도는 tick초)"""
+
+    def __init__(self, tick=0.5, slots=128):
+        self.tick = tick
+        self.slots = [[] for _ in range(slots)]
+        self.cursor = 0
+        self.count = 0
+        self._task = None
+
+    def schedule(self, delay, callback):
+        ticks = max(1, math.ceil(delay / self.tick))
+        timer = Timer(callback, (ticks - 1) // len(self.slots))
+        self.slots[(self.cursor + ticks) % len(self.slots)].append(timer)
+        self.count += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return timer
+
+    async def _run(self):
+        while self.count:
+            await asyncio.sleep(self.tick)
+            self.cursor = (self.cursor + 1) % len(self.slots)
+            remaining = []
+            for timer in self.slots[self.cursor]:
+                if timer.cancelled:
+                    self.count -= 1
+                elif timer.rounds:
+                    timer.rounds -= 1
+                    remaining.append(timer)
+                else:
+                    self.count -= 1
+                    try:
+                        timer.callback()
+                    except Exception as e:
+                        logging.error(f"🚨 [타이머] 콜백 오류: {e}", exc_info=e)
+            self.slots[self.cursor] = remaining
+
+
+class Conversation:
+    def __init__(self, key, owner, command):
+        self.key = key
+        self.owner = owner  # 대화를 시작한 명령어의 Context
+        self.command = command
+        self.step = None
+        self.future = None
+        self.started_at = time.monotonic()
+
+
+class ConversationManager:
+    def __init__(self, tick=0.5):
+        self.conversations = {}  # (채널 ID, 유저 ID) → Conversation
+        self.wheel = TimerWheel(tick)
+        self.stats = collections.Counter()
+
+    async def ask(self, ctx, step, timeout=30.0):
+        """✅ ctx의 채널 / 유저가 보내는 다음 메시지 반환 (시간 초과: ConversationTimeout, 취소: ConversationCancelled)"""
+        key = (ctx.channel.id, ctx.author.id)
+        conversation = self.conversations.get(key)
+        if conversation is None or conversation.owner is not ctx:
+            if conversation is not None:
+                self._cancel(conversation, "새 명령어 실행")
+            conversation = Conversation(key, ctx, ctx.command.qualified_name if ctx.command else "?")
+            self.conversations[key] = conversation
+
+        future = asyncio.get_running_loop().create_future()
+        conversation.step = step
+        conversation.future = future
+        timer = self.wheel.schedule(timeout, lambda: self._expire(future))
+        try:
+            return await future
+        finally:
+            timer.cancel()
+            if conversation.future is future:
+                conversation.future = None
+
+    def _expire(self, future):
+        if not future.done():
+            self.stats["timeout"] += 1
+            future.set_exception(ConversationTimeout())
+
+    def _cancel(self, conversation, reason):
+        if self.conversations.get(conversation.key) is conversation:
+            del self.conversations[conversation.key]
+        if conversation.future is not None and not conversation.future.done():
+            self.stats["cancelled"] += 1
+            conversation.future.set_exception(ConversationCancelled(conversation.command, reason))
+
+    def dispatch(self, message):
+        """✅ 대화 중인 유저의 메시지면 해당 대화로 전달하고 True"""
+        conversation = self.conversations.get((message.channel.id, message.author.id))
+        if conversation is None or conversation.future is None or conversation.future.done():
+            return False
+
+        if message.content.strip().lower() in CANCEL_WORDS:
+            self._cancel(conversation, "사용자 취소")
+        else:
+            self.stats["answered"] += 1
+            conversation.future.set_result(message)
+        return True
+
+    def close(self, ctx):
+        """✅ 명령어가 끝나면 해당 명령어가 연 대화 정리"""
+        conversation = self.conversations.get((ctx.channel.id, ctx.author.id))
+        if conversation is not None and conversation.owner is ctx:
+            del self.conversations[conversation.key]
@@ -0,0 +1,262 @@
+"""
+✅ GAS(Google Apps Script) 공용 클라이언트
+
+모든 GAS 요청이 이 모듈을 거치도록 해서 요청마다 CLIENT 스팬(`GAS <action>`)을 남긴다.
+- post(payload): 동기 POST (명령어에서는 asyncio.to_thread로 호출 권장)
+- get(action, **params): 동기 GET (`?action=...`)
+- post_async(payload): aiohttp 비동기 POST → (HTTP 상태 코드, 응답 본문 bytes)
+- fetch(payload) / fetch_async(payload): 읽기 전용 요청 → (데이터, 캐시 경과 초 또는 None)
+  GAS가 응답하지 않으면(연결 실패 / HTTP 오류 / JSON이 아닌 응답) 마지막 정상 응답을 캐시에서 반환
+  읽기 시간 초과(READ_TIMEOUT)도 캐시로 응답하지만 장애로 표시하지는 않음 (느린 콜드 스타트가 쓰기 명령어를 막지 않도록)
+- fetch_async / batch_async는 hedger로 헤징 (첫 요청이 관측 p90 안에 응답하지 않으면 한 번 더 요청)
+- batch(payloads): 여러 읽기 action을 POST 한 번(`getBatch`)으로 → [(데이터, 캐시 경과 초 또는 None), ...]
+- 모든 요청은 scheduler(우선순위 + 토큰 버킷 + 일일 예산)를 통과해야 전송됨, 예산 초과 시 QuotaExceeded
+- write_listeners: `get`으로 시작하지 않는 action이 성공하면 listener(action) 호출
+"""
+import asyncio
+import contextlib
+import logging
+import time
+
+import aiohttp
+import requests
+
+import tracing
+from hedging import Hedger
+from records import JSONDecodeError, decode_json
+from scheduler import BudgetExceeded, GasScheduler
+
+GAS_URL = None
+READ_TIMEOUT = 30  # 읽기 요청이 이 시간(초) 안에 끝나지 않으면 캐시 사용 (장애로 표시하지는 않음)
+cache = None  # cache.SnapshotCache (None이면 장애 시 바로 GasUnavailable)
+
+degraded_since = None  # ✅ 마지막 정상 응답 이후 처음 실패한 시각 (정상이면 None)
+last_failure = None
+batch_supported = True  # ✅ GAS 배포본이 getBatch를 모르면 False → action별 개별 요청
+hedger = Hedger()  # ✅ 읽기 요청 헤징 (action별 지연 통계 포함)
+scheduler = GasScheduler()  # ✅ 우선순위 / 요청 속도 / 일일 예산 (명령어별 비용 집계 포함)
+GET_ONLY_ACTIONS = {"getUsersAndAliases"}
+write_listeners = []  # ✅ 쓰기 action 성공 후 호출할 콜백 listener(action) (로컬 복제본 재동기화 등)
+
+
+class GasUnavailable(Exception):
+    pass
+
+
+class GasError(Exception):
+    """GAS가 {"error": ...}로 돌려준 오류 응답"""
+
+
+class QuotaExceeded(GasError):
+    """일일 예산 초과로 전송하지 않은 요청 (GAS 장애가 아니므로 장애 모드로 바꾸지 않음, 읽기는 캐시로 대체)"""
+
+
+def configure(url, snapshot_cache=None):
+    global GAS_URL, cache
+    GAS_URL = url
+    cache = snapshot_cache
+
+
+def _span(method, action, **attributes):
+    return tracing.span(f"GAS {action}", kind="CLIENT",
+                        attributes={"http.method": method, "gas.action": str(action), **attributes})
+
+
+def _record_response(span, status, body):
+    span.set_attribute("http.status_code", status)
+    span.set_attribute("http.response_content_length", len(body))
+    if status != 200:
+        span.set_error(f"HTTP {status}")
+
+
+@contextlib.contextmanager
+def _scheduled(action):
+    try:
+        level, waited = scheduler.acquire(action)
+    except BudgetExceeded as e:
+        raise QuotaExceeded(str(e))
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        scheduler.record(level, time.monotonic() - started, waited)
+
+
+@contextlib.asynccontextmanager
+async def _scheduled_async(action):
+    try:
+        level, waited = scheduler.try_acquire(action) or await asyncio.to_thread(scheduler.acquire, action)
+    except BudgetExceeded as e:
+        raise QuotaExceeded(str(e))
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        scheduler.record(level, time.monotonic() - started, waited)
+
+
+def post(payload, **kwargs):
+    action = payload.get("action")
+    with _scheduled(action), _span("POST", action) as span:
+        response = requests.post(GAS_URL, json=payload, **kwargs)
+        _record_response(span, response.status_code, response.content)
+
+    _notify_write(action, response.status_code)
+    return response
+
+
+def _notify_write(action, status):
+    if status == 200 and not str(action).startswith("get"):
+        for listener in write_listeners:
+            listener(action)
+
+
+def get(action, timeout=None, **params):
+    with _scheduled(action), _span("GET", action) as span:
+        response = requests.get(GAS_URL, params={"action": action, **params}, timeout=timeout)
+        _record_response(span, response.status_code, response.content)
+        return response
+
+
+async def post_async(payload, timeout=READ_TIMEOUT):
+    async with _scheduled_async(payload.get("action")):
+        return await _post_async(payload, timeout)
+
+
+async def _post_async(payload, timeout):
+    with _span("POST", payload.get("action")) as span:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(GAS_URL, json=payload, timeout=timeout) as response:
+                body = await response.read()
+                _record_response(span, response.status, body)
+    _notify_write(payload.get("action"), response.status)
+    return response.status, body
+
+
+def is_degraded():
+    return degraded_since is not None
+
+
+def mark_healthy():
+    global degraded_since, last_failure
+    if degraded_since is not None:
+        logging.info(f"✅ [GAS] 응답 복구 (장애 {time.time() - degraded_since:.0f}초)")
+    degraded_since = None
+    last_failure = None
+
+
+def mark_failed(reason):
+    global degraded_since, last_failure
+    if degraded_since is None:
+        degraded_since = time.time()
+        logging.warning(f"🚧 [GAS] 응답 실패 → 캐시 읽기 전용 모드: {reason}")
+    last_failure = time.time()
+
+
+def _decode(status, body):
+    """✅ 정상 응답이면 데이터, GAS 장애로 볼 수 있는 응답이면 GasUnavailable"""
+    if status != 200:
+        raise GasUnavailable(f"HTTP {status}")
+    try:
+        return decode_json(body)
+    except JSONDecodeError:
+        raise GasUnavailable("JSON이 아닌 응답 (할당량 초과 / 스크립트 오류 페이지)")
+
+
+def _fallback(payload, error):
+    reason = str(error) or type(error).__name__
+    if not isinstance(error, (QuotaExceeded, asyncio.TimeoutError, requests.Timeout)):
+        mark_failed(reason)
+    cached = cache.lookup(payload) if cache else None
+    if cached is None:
+        raise GasUnavailable(reason)
+    logging.warning(f"📦 [GAS 캐시] `{payload.get('action')}` 캐시 응답 사용 ({cached[1]:.0f}초 전 저장)")
+    return cached
+
+
+def _remember(payload, data):
+    mark_healthy()
+    if cache:
+        cache.store(payload, data)
+    return data, None
+
+
+def fetch(payload, method="POST"):
+    """
+    ✅ 동기 읽기 요청 → (데이터, None) 또는 GAS 장애 시 (캐시 데이터, 저장 후 경과 초)
+    - method="GET"이면 payload를 쿼리 파라미터로 전송 (`getUsersAndAliases`처럼 GET으로만 제공되는 action)
+    """
+    try:
+        if method == "GET":
+            params = {key: value for key, value in payload.items() if key != "action"}
+            response = get(payload["action"], timeout=READ_TIMEOUT, **params)
+        else:
+            response = post(payload, timeout=READ_TIMEOUT)
+        return _remember(payload, _decode(response.status_code, response.content))
+    except (requests.RequestException, GasUnavailable, QuotaExceeded) as e:
+        return _fallback(payload, e)
+
+
+async def _hedged_read(payload, timeout):
+    async def attempt():
+        status, body = await post_async(payload, timeout=timeout)
+        return _decode(status, body)
+
+    return await hedger.run(payload.get("action"), attempt, timeout)
+
+
+async def fetch_async(payload, timeout=READ_TIMEOUT):
+    """✅ fetch의 aiohttp 버전 (헤징 적용)"""
+    try:
+        return _remember(payload, await _hedged_read(payload, timeout))
+    except (aiohttp.ClientError, asyncio.TimeoutError, GasUnavailable, QuotaExceeded) as e:
+        return _fallback(payload, e)
+
+
+def batch(payloads):
+    """
+    ✅ 여러 읽기 요청을 GAS 왕복 한 번으로 → payloads 순서대로 [(데이터, 캐시 경과 초 또는 None), ...]
+    - 요청: {"action": "getBatch", "requests": [payload, ...]} → 응답: {"results": [각 action의 응답, ...]}
+    - 개별 action 오류는 해당 결과에 {"error": ...}로 들어옴 (호출하는 쪽에서 확인)
+    - GAS 장애 시 각 요청을 캐시에서 반환 (하나라도 없으면 GasUnavailable)
+    """
+    if not batch_supported:
+        return [fetch(payload, "GET" if payload["action"] in GET_ONLY_ACTIONS else "POST") for payload in payloads]
+
+    try:
+        response = post({"action": "getBatch", "requests": payloads}, timeout=READ_TIMEOUT)
+        data = _decode(response.status_code, response.content)
+    except (requests.RequestException, GasUnavailable, QuotaExceeded) as e:
+        return [_fallback(payload, e) for payload in payloads]
+
+    results = _batch_results(payloads, data)
+    if results is None:
+        return batch(payloads)
+    return [_remember(payload, result) for payload, result in zip(payloads, results)]
+
+
+async def batch_async(payloads, timeout=READ_TIMEOUT):
+    """✅ batch의 aiohttp 버전 (헤징 적용)"""
+    if not batch_supported:
+        return await asyncio.to_thread(batch, payloads)
+
+    try:
+        data = await _hedged_read({"action": "getBatch", "requests": payloads}, timeout)
+    except (aiohttp.ClientError, asyncio.TimeoutError, GasUnavailable, QuotaExceeded) as e:
+        return [_fallback(payload, e) for payload in payloads]
+
+    results = _batch_results(payloads, data)
+    if results is None:
+        return await asyncio.to_thread(batch, payloads)
+    return [_remember(payload, result) for payload, result in zip(payloads, results)]
+
+
+def _batch_results(payloads, data):
+    """✅ getBatch 응답의 results (GAS 배포본이 getBatch를 모르면 batch_supported=False로 바꾸고 None)"""
+    global batch_supported
+    results = data.get("results") if isinstance(data, dict) else None
+    if isinstance(results, list) and len(results) == len(payloads):
+        return results
+    logging.warning(f"⚠️ [GAS] getBatch 미지원 ({data.get('error') if isinstance(data, dict) else data}) → 개별 요청 사용")
+    batch_supported = False
+    return None
@@ -0,0 +1,143 @@
+"""
+✅ 읽기 요청 헤징 (Apps Script 콜드 스타트 등 꼬리 지연 줄이기)
+
+- 첫 요청이 action별 관측 p90(quantile) 안에 응답하지 않으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용
+- 같은 결과를 돌려주는 읽기 요청(getPlayersInfo, getBatch ...)에만 사용할 것 (쓰기 요청은 중복 실행됨)
+- HedgeBudget: 요청마다 ratio만큼 적립, 헤지 1번에 1 소모 → 헤지 요청은 전체의 ratio 비율 이하 (GAS 할당량 보호)
+- 첫 요청의 지연(primary)은 요청마다 한 번 기록 → 헤지 적용 지연(effective)과 비교
+  헤지가 먼저 응답하거나 시간 초과로 첫 요청을 취소하면 취소 시점까지의 경과 시간을 기록 (중도 절단 표본)
+  → 느린 첫 요청이 표본에서 빠져서 p90이 낮게 잡히는 일이 없도록
+"""
+import asyncio
+import collections
+import math
+import time
+
+
+class LatencyWindow:
+    """✅ 최근 size개 지연 시간(초) 표본"""
+
+    def __init__(self, size=200):
+        self.samples = collections.deque(maxlen=size)
+
+    def __len__(self):
+        return len(self.samples)
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def percentile(self, q):
+        """✅ nearest-rank 백분위수 (q: 0~1). 표본이 없으면 None"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class HedgeBudget:
+    def __init__(self, ratio=0.1, burst=5):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst
+
+    def on_request(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def try_spend(self):
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class HedgeStats:
+    def __init__(self):
+        self.primary = LatencyWindow()  # 첫 요청 자체의 지연 (취소했으면 취소 시점까지, 헤지하지 않았다면 기다렸을 시간의 하한)
+        self.effective = LatencyWindow()  # 헤지를 적용해 실제로 응답을 받은 시간
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class Hedger:
+    def __init__(self, quantile=0.9, min_samples=20, min_delay=0.3, ratio=0.1, burst=5):
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.budget = HedgeBudget(ratio, burst)
+        self.stats = collections.defaultdict(HedgeStats)
+
+    def delay_for(self, action):
+        """✅ 헤지 요청을 보낼 시점(초). 표본이 min_samples개 미만이면 None (헤지하지 않음)"""
+        primary = self.stats[action].primary
+        if len(primary) < self.min_samples:
+            return None
+        return max(self.min_delay, primary.percentile(self.quantile))
+
+    async def run(self, action, attempt, timeout):
+        """
+        ✅ attempt()(코루틴 함수)를 실행하고, 필요하면 한 번 더 실행해서 먼저 성공한 결과 반환
+        - timeout초 안에 아무 응답도 없으면 asyncio.TimeoutError
+        - 모든 요청이 실패하면 마지막 예외를 그대로 전달
+        - 결과를 돌려주거나 시간 초과되면 남은 요청은 취소
+        """
+        stats = self.stats[action]
+        stats.requests += 1
+        self.budget.on_request()
+
+        started = time.monotonic()
+        deadline = started + timeout
+        delay = self.delay_for(action)
+        hedge_at = started + delay if delay is not None and delay < timeout else None
+
+        primary = asyncio.create_task(attempt())
+        pending = {primary}
+        error = None
+
+        while pending:
+            wake = deadline if hedge_at is None else min(deadline, hedge_at)
+            done, pending = await asyncio.wait(pending, timeout=max(0.0, wake - time.monotonic()),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            if primary in done:
+                stats.primary.add(time.monotonic() - started)
+            for task in done:
+                if task.exception() is None:
+                    elapsed = time.monotonic() - started
+                    stats.effective.add(elapsed)
+                    if task is not primary:
+                        stats.hedge_wins += 1
+                    self._cancel(pending, stats, primary, elapsed)
+                    return task.result()
+                error = task.exception()
+
+            now = time.monotonic()
+            if hedge_at is not None and now >= hedge_at and pending:
+                hedge_at = None
+                if self.budget.try_spend():
+                    stats.hedges += 1
+                    pending.add(asyncio.create_task(attempt()))
+            elif now >= deadline and pending:
+                self._cancel(pending, stats, primary, now - started)
+                raise asyncio.TimeoutError()
+
+        raise error
+
+    @staticmethod
+    def _cancel(tasks, stats, primary, elapsed):
+        """✅ 남은 요청 취소, 첫 요청이 그중에 있으면 취소 시점까지의 경과 시간(elapsed)을 primary 표본으로 기록"""
+        for task in tasks:
+            if task is primary:
+                stats.primary.add(elapsed)
+            task.cancel()
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    def report(self):
+        """✅ action별 [(action, 요청 수, 헤지 수, 헤지 승, primary p50, primary p99, effective p50, effective p99)]"""
+        rows = []
+        for action, stats in sorted(self.stats.items()):
+            rows.append((
+                action, stats.requests, stats.hedges, stats.hedge_wins,
+                stats.primary.percentile(0.5), stats.primary.percentile(0.99),
+                stats.effective.percentile(0.5), stats.effective.percentile(0.99),
+            ))
+        return rows
@@ -0,0 +1,100 @@
+"""
+✅ 오래 걸리는 GAS 작업 관리
+
+- JobManager.start(name, ...): 같은 이름의 작업이 진행 중이면 새로 시작하지 않고 진행 중인 작업을 반환 (single-flight)
+- JobManager.write_lock: 전체 재계산과 경기 결과 쓰기(registerResult / deleteMatch)가 서로 끼어들지 않도록 직렬화
+- Job.report(text): 상태 메시지 하나를 수정해서 진행 상황 표시 (min_interval초 간격으로 제한, 마지막 보고는 항상 반영)
+- ChunkCursor: 청크 단위 작업의 다음 시작 위치를 파일에 저장 → 중간에 실패하거나 봇이 재시작돼도 이어서 실행
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+
+
+class Job:
+    def __init__(self, name, status_message=None, min_interval=2.0):
+        self.name = name
+        self.status_message = status_message
+        self.min_interval = min_interval
+        self.started_at = time.monotonic()
+        self.task = None
+        self.text = ""
+        self._last_edit = 0.0
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    async def report(self, text, force=False):
+        """✅ 진행 상황 갱신 (디스코드 수정 요청은 min_interval초에 한 번만)"""
+        self.text = text
+        now = time.monotonic()
+        if self.status_message is None or (not force and now - self._last_edit < self.min_interval):
+            return
+        self._last_edit = now
+        try:
+            await self.status_message.edit(content=text)
+        except Exception as e:  # 진행 상황 표시 실패로 작업을 멈추지 않음
+            logging.warning(f"⚠️ [작업 {self.name}] 상태 메시지 수정 실패: {e}")
+
+
+class JobManager:
+    def __init__(self):
+        self.write_lock = asyncio.Lock()
+        self.jobs = {}
+
+    def running(self, name):
+        job = self.jobs.get(name)
+        return job if job and job.task and not job.task.done() else None
+
+    def start(self, name, run, status_message=None):
+        """
+        ✅ run(job) 코루틴을 백그라운드 작업으로 시작 → (job, 새로 시작했는지 여부)
+        - 같은 이름의 작업이 진행 중이면 그 작업을 그대로 반환 (요청 합치기)
+        """
+        job = self.running(name)
+        if job:
+            return job, False
+
+        job = Job(name, status_message)
+        job.task = asyncio.create_task(run(job))
+        self.jobs[name] = job
+        logging.info(f"🧰 [작업 {name}] 시작")
+        return job, True
+
+
+class ChunkCursor:
+    """✅ 청크 작업의 다음 시작 위치 저장 파일 ({"cursor": ..., "updated_at": ...})"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f).get("cursor")
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ [청크 작업] 재개 위치 읽기 실패, 처음부터 실행: {e}")
+            return None
+
+    def save(self, cursor):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"cursor": cursor, "updated_at": time.time()}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def progress_bar(done, total, width=20):
+    """✅ `▓▓▓▓░░░░ 12/40` 형태 진행 막대"""
+    if not total:
+        return f"{done}개 처리"
+    filled = min(width, int(width * done / total))
+    return f"{'▓' * filled}{'░' * (width - filled)} {done}/{total}"
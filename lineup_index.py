@@ -0,0 +1,87 @@
+"""
+✅ 최근 라인업 인덱스 (재대결 / 같은 조합 반복 방지)
+
+최근 K경기의 팀 구성을 보관하면서
+- pair_counts[(A, B)]   : 최근 K경기 중 A와 B가 같은 팀이었던 횟수
+- lineup_counts[라인업] : 최근 K경기 중 완전히 같은 팀 구성이 나온 횟수
+를 유지한다. 후보 팀 분할 하나의 페널티는 팀당 6쌍 조회로 끝나므로 O(1).
+"""
+import logging
+from collections import deque
+from itertools import combinations
+
+from records import split_team
+
+EXACT_REPEAT_PENALTY = 6  # 완전히 같은 라인업이면 같은 팀 쌍 6개가 더 겹친 것으로 취급
+
+
+def lineup_key(team1, team2):
+    """✅ 좌우(아래/위) 구분 없는 라인업 키"""
+    return frozenset((frozenset(team1), frozenset(team2)))
+
+
+class RecentLineupIndex:
+    def __init__(self, window=5):
+        self.window = window
+        self.lineups = deque()  # (팀1 유저명 튜플, 팀2 유저명 튜플), 오래된 순
+        self.pair_counts = {}
+        self.lineup_counts = {}
+        self.loaded = False
+
+    @staticmethod
+    def _pairs(team):
+        return combinations(sorted(team), 2)
+
+    def _add(self, team1, team2, delta):
+        for team in (team1, team2):
+            for pair in self._pairs(team):
+                count = self.pair_counts.get(pair, 0) + delta
+                if count:
+                    self.pair_counts[pair] = count
+                else:
+                    self.pair_counts.pop(pair, None)
+
+        key = lineup_key(team1, team2)
+        count = self.lineup_counts.get(key, 0) + delta
+        if count:
+            self.lineup_counts[key] = count
+        else:
+            self.lineup_counts.pop(key, None)
+
+    def record(self, team1, team2):
+        """✅ 경기 1건 추가 (window를 넘으면 가장 오래된 경기 제거)"""
+        team1, team2 = tuple(split_team(team1)), tuple(split_team(team2))
+        self.lineups.append((team1, team2))
+        self._add(team1, team2, 1)
+        while len(self.lineups) > self.window:
+            old1, old2 = self.lineups.popleft()
+            self._add(old1, old2, -1)
+
+    def load_matches(self, matches):
+        """✅ Match 리스트(game_number 오름차순 정렬 후 최근 window개)로 인덱스 초기화"""
+        self.lineups.clear()
+        self.pair_counts.clear()
+        self.lineup_counts.clear()
+
+        ordered = sorted(matches, key=lambda m: m.game_number)
+        for match in ordered[-self.window:]:
+            self.record(match.winners, match.losers)
+
+        self.loaded = True
+        logging.info(f"✅ [최근 라인업] {len(self.lineups)}경기 로드 (window={self.window})")
+
+    def resize(self, window):
+        """✅ 최근 경기 범위 변경 (줄이면 오래된 경기부터 제거)"""
+        self.window = max(1, window)
+        while len(self.lineups) > self.window:
+            old1, old2 = self.lineups.popleft()
+            self._add(old1, old2, -1)
+
+    def penalty(self, team1, team2):
+        """✅ 후보 분할의 반복 페널티 = 최근 같은 팀이었던 쌍 수 + 완전 반복 라인업 가중치"""
+        total = 0
+        for team in (team1, team2):
+            for pair in self._pairs(team):
+                total += self.pair_counts.get(pair, 0)
+        total += EXACT_REPEAT_PENALTY * self.lineup_counts.get(lineup_key(team1, team2), 0)
+        return total
@@ -0,0 +1,95 @@
+"""
+✅ 디스코드 계정 ↔ 등록 유저명 연결 (GAS 조회 없이 `!조회`만으로 본인 조회, @멘션으로 유저 입력)
+
+- AccountLinks: 디스코드 유저 ID → 유저명 dict + 유저명 → 유저 ID 역색인 (양방향 조회 O(1))
+- 한 유저명은 디스코드 계정 하나에만 연결 (다른 계정이 가져가려면 관리자 `!연결`)
+- 연결 / 해제는 드물어서 바뀔 때마다 바로 파일에 저장 (임시 파일 → 교체)
+- replace_mentions(text): `<@123>` / `<@!123>` → 연결된 유저명, 연결되지 않은 멘션은 따로 반환
+"""
+import json
+import logging
+import os
+import re
+
+MENTION_PATTERN = re.compile(r"<@!?(\d+)>")
+
+
+class AccountLinks:
+    def __init__(self, path=None):
+        self.path = path
+        self.usernames = {}  # 디스코드 유저 ID → 유저명
+        self.user_ids = {}  # 유저명 → 디스코드 유저 ID
+        self._load()
+
+    def __len__(self):
+        return len(self.usernames)
+
+    def username_for(self, user_id):
+        return self.usernames.get(user_id)
+
+    def user_id_for(self, username):
+        return self.user_ids.get(username)
+
+    def link(self, user_id, username):
+        """✅ 연결 (같은 계정의 이전 연결 / 같은 유저명의 이전 계정 연결은 해제) → 연결이 바뀌었으면 True"""
+        if self.usernames.get(user_id) == username:
+            return False
+        self._unlink(user_id)
+        previous = self.user_ids.get(username)
+        if previous is not None:
+            self._unlink(previous)
+        self.usernames[user_id] = username
+        self.user_ids[username] = user_id
+        self._save()
+        return True
+
+    def unlink(self, user_id):
+        username = self._unlink(user_id)
+        if username is not None:
+            self._save()
+        return username
+
+    def _unlink(self, user_id):
+        username = self.usernames.pop(user_id, None)
+        if username is not None and self.user_ids.get(username) == user_id:
+            del self.user_ids[username]
+        return username
+
+    def replace_mentions(self, text):
+        """✅ 멘션 → 유저명으로 바꾼 텍스트, 연결되지 않은 멘션의 유저 ID 리스트"""
+        unlinked = []
+
+        def replace(match):
+            user_id = int(match.group(1))
+            username = self.usernames.get(user_id)
+            if username is None:
+                unlinked.append(user_id)
+                return match.group(0)
+            return username
+
+        return MENTION_PATTERN.sub(replace, text), unlinked
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({str(user_id): username for user_id, username in self.usernames.items()}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"⚠️ [계정 연결] 저장 실패: {e}")
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ [계정 연결] `{self.path}` 읽기 실패, 연결 없이 시작: {e}")
+            return
+        for user_id, username in data.items():
+            self.usernames[int(user_id)] = username
+            self.user_ids[username] = int(user_id)
+        logging.info(f"🔗 [계정 연결] {len(self.usernames)}명 불러옴")
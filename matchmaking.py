@@ -0,0 +1,165 @@
+"""
+✅ 채널별 매칭 대기열 (`!참가` / `!나가기` / 버튼) → 인원과 클래스 구성이 맞으면 바로 로비 구성
+
+- LobbyQueue: OrderedDict 하나로 참가 / 나가기 / 포함 확인 O(1), 참가 순서 유지
+  클래스별 가능 인원(class_counts)을 참가 / 나가기 때마다 갱신 → 로비 가능 여부를 O(1)로 먼저 판단
+- pick(): 먼저 참가한 순서대로 size명을 뽑되, 클래스별 2명 이상(팀생성 `has_sufficient_classes` 기준)이 안 되면
+  앞쪽 window명 안에서 참가 순서가 가장 빠른 조합을 찾음
+- Matchmaker: 채널 ID → LobbyQueue + 유저 → 채널 색인 (한 유저는 한 채널 대기열에만), 파일에 저장해서 재시작 후에도 유지
+  참가 / 나가기는 메모리만 바꾸고 dirty 표시 → save_if_dirty()로 모아서 저장 (이벤트마다 파일 쓰기 없음)
+"""
+import collections
+import itertools
+import json
+import logging
+import os
+
+from records import CLASS_ORDER
+
+MIN_PER_CLASS = 2
+
+
+def covers_classes(masks, minimum=MIN_PER_CLASS):
+    """✅ 클래스 비트마스크 목록이 모든 클래스를 minimum명 이상 커버하는지"""
+    counts = [0] * len(CLASS_ORDER)
+    for mask in masks:
+        for i in range(len(CLASS_ORDER)):
+            if mask >> i & 1:
+                counts[i] += 1
+    return all(count >= minimum for count in counts)
+
+
+class LobbyQueue:
+    def __init__(self):
+        self.entries = collections.OrderedDict()  # 유저명 → (디스코드 유저 ID, 클래스 비트마스크)
+        self.class_counts = [0] * len(CLASS_ORDER)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, username):
+        return username in self.entries
+
+    def _count(self, mask, delta):
+        for i in range(len(CLASS_ORDER)):
+            if mask >> i & 1:
+                self.class_counts[i] += delta
+
+    def join(self, username, user_id, mask):
+        if username in self.entries:
+            return False
+        self.entries[username] = (user_id, mask)
+        self._count(mask, 1)
+        return True
+
+    def leave(self, username):
+        entry = self.entries.pop(username, None)
+        if entry is None:
+            return False
+        self._count(entry[1], -1)
+        return True
+
+    def may_be_ready(self, size):
+        """✅ O(1) 사전 확인: 인원이 size명 이상이고 대기열 전체로는 클래스 구성이 가능한지"""
+        return len(self.entries) >= size and all(count >= MIN_PER_CLASS for count in self.class_counts)
+
+    def pick(self, size=8, window=16):
+        """✅ 로비에 들어갈 유저명 size명 (참가 순서 우선), 구성할 수 없으면 None"""
+        if not self.may_be_ready(size):
+            return None
+
+        head = list(itertools.islice(self.entries.items(), window))
+        first = head[:size]
+        if covers_classes(mask for _, (_, mask) in first):
+            return [name for name, _ in first]
+
+        # ✅ combinations는 인덱스 사전순 → 먼저 참가한 유저가 많이 포함된 조합부터 확인
+        for combo in itertools.combinations(head, size):
+            if covers_classes(mask for _, (_, mask) in combo):
+                return [name for name, _ in combo]
+        return None
+
+    def to_list(self):
+        return [[name, user_id, mask] for name, (user_id, mask) in self.entries.items()]
+
+
+class Matchmaker:
+    def __init__(self, path=None, lobby_size=8):
+        self.path = path
+        self.lobby_size = lobby_size
+        self.queues = {}  # 채널 ID → LobbyQueue
+        self.channel_of = {}  # 유저명 → 대기 중인 채널 ID
+        self.dirty = False
+        self._load()
+
+    def queue(self, channel_id):
+        return self.queues.setdefault(channel_id, LobbyQueue())
+
+    def join(self, channel_id, username, user_id, mask):
+        """✅ 참가 → (참가 여부, 이미 대기 중인 다른 채널 ID 또는 None)"""
+        current = self.channel_of.get(username)
+        if current is not None and current != channel_id:
+            return False, current
+        if not self.queue(channel_id).join(username, user_id, mask):
+            return False, None
+        self.channel_of[username] = channel_id
+        self.dirty = True
+        return True, None
+
+    def leave(self, username):
+        """✅ 나가기 → 나간 채널 ID (대기 중이 아니면 None)"""
+        channel_id = self.channel_of.pop(username, None)
+        if channel_id is None:
+            return None
+        self.queues[channel_id].leave(username)
+        self.dirty = True
+        return channel_id
+
+    def form_lobby(self, channel_id):
+        """✅ 로비를 만들 수 있으면 해당 유저들을 대기열에서 빼고 [(유저명, 디스코드 유저 ID, 클래스 비트마스크), ...] 반환"""
+        queue = self.queue(channel_id)
+        names = queue.pick(self.lobby_size)
+        if names is None:
+            return None
+        members = [(name, *queue.entries[name]) for name in names]
+        for name in names:
+            queue.leave(name)
+            self.channel_of.pop(name, None)
+        self.dirty = True
+        return members
+
+    def requeue(self, channel_id, members):
+        """✅ 로비 구성에 실패하면 form_lobby가 돌려준 유저들을 원래 순서대로 대기열 맨 앞으로 되돌림"""
+        queue = self.queue(channel_id)
+        for name, user_id, mask in reversed(members):
+            if name not in self.channel_of and queue.join(name, user_id, mask):
+                queue.entries.move_to_end(name, last=False)
+                self.channel_of[name] = channel_id
+        self.dirty = True
+
+    def save_if_dirty(self):
+        if not self.dirty or not self.path:
+            return
+        data = {str(channel_id): queue.to_list() for channel_id, queue in self.queues.items() if len(queue)}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logging.warning(f"⚠️ [매칭 대기열] 저장 실패: {e}")
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ [매칭 대기열] `{self.path}` 읽기 실패, 빈 대기열로 시작: {e}")
+            return
+        for channel_id, entries in data.items():
+            for name, user_id, mask in entries:
+                self.join(int(channel_id), name, user_id, mask)
+        self.dirty = False
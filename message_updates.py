@@ -0,0 +1,84 @@
+"""
+✅ 디스코드 메시지 수정 모아 보내기 (버튼 비활성화 / 상태 문구 / 결과 표시가 각각 REST 요청이 되지 않도록)
+
+- 메시지마다 보낼 수정 내용(content / view / allowed_mentions ...)을 하나로 합침 (같은 항목은 마지막 값만)
+- 메시지마다 작업 1개가 채널별 버킷(기본 5회/5초, 디스코드 메시지 수정 제한)에 맞춰 보냄
+  → 버킷을 기다리는 동안 들어온 수정은 다음 요청 하나에 합쳐짐
+- view는 보낼 때의 버튼 상태가 그대로 나가므로 비활성화 → 활성화가 연달아 오면 요청 한 번으로 끝남
+- edit(): 합쳐진 요청이 끝날 때까지 대기 (실패하면 예외), schedule(): 기다리지 않음 (실패는 로그만)
+"""
+import asyncio
+import logging
+
+from ratelimit import TokenBucket
+
+
+class PendingEdit:
+    __slots__ = ("message", "fields", "waiters")
+
+    def __init__(self, message):
+        self.message = message
+        self.fields = {}
+        self.waiters = []
+
+
+class MessageUpdater:
+    def __init__(self, count=5, seconds=5.0):
+        self.rule = (count, seconds)
+        self.pending = {}  # 메시지 ID → PendingEdit (아직 보내지 않은 수정)
+        self.tasks = {}  # 메시지 ID → 보내는 작업
+        self.buckets = {}  # 채널 ID → TokenBucket
+
+    def _queue(self, message, fields):
+        entry = self.pending.get(message.id)
+        if entry is None:
+            entry = self.pending[message.id] = PendingEdit(message)
+        entry.message = message  # ✅ 같은 메시지를 가리키는 최신 객체 사용
+        entry.fields.update(fields)
+
+        task = self.tasks.get(message.id)
+        if task is None or task.done():
+            self.tasks[message.id] = asyncio.create_task(self._flush(message.id))
+        return entry
+
+    def schedule(self, message, **fields):
+        """✅ 수정 예약 (결과를 기다리지 않음)"""
+        self._queue(message, fields)
+
+    async def edit(self, message, **fields):
+        """✅ 수정 예약 후 해당 수정이 포함된 요청이 끝날 때까지 대기"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue(message, fields).waiters.append(future)
+        await future
+
+    def _bucket(self, message):
+        channel = getattr(message, "channel", None)
+        key = channel.id if channel is not None else message.id
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(*self.rule)
+        return bucket
+
+    async def _flush(self, message_id):
+        try:
+            while message_id in self.pending:
+                bucket = self._bucket(self.pending[message_id].message)
+                while retry := bucket.take():
+                    await asyncio.sleep(retry)
+
+                entry = self.pending.pop(message_id)
+                try:
+                    await entry.message.edit(**entry.fields)
+                except Exception as e:
+                    if not entry.waiters:
+                        logging.warning(f"⚠️ [메시지 수정] 실패 (메시지 {message_id}): {e}")
+                    for future in entry.waiters:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for future in entry.waiters:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            if self.tasks.get(message_id) is asyncio.current_task():
+                del self.tasks[message_id]
@@ -0,0 +1,69 @@
+"""
+✅ 슬래시 명령어 자동완성용 메모리 이름 인덱스
+
+디스코드 자동완성은 3초 안에 응답해야 하므로 GAS를 부르지 않고 메모리에서만 찾는다.
+- PrefixIndex: 정렬된 키 리스트 + bisect로 접두어 검색 (O(log n + k)), 부족하면 중간 일치로 채움
+- build_player_index(roster): 유저명 + 별명 (`별명 → 유저명` 항목은 선택하면 유저명이 입력됨)
+- build_game_index(game_numbers): 게임번호 (yymmddHHMMSS라서 문자열 역순 = 최신순)
+"""
+import bisect
+
+
+def _normalize(text):
+    return str(text).strip().casefold()
+
+
+class PrefixIndex:
+    def __init__(self, newest_first=False):
+        self.newest_first = newest_first
+        self.keys = []  # 정규화한 검색 키 (정렬)
+        self.entries = []  # keys와 같은 순서의 (표시 이름, 입력 값)
+        self.version = None  # 인덱스를 만든 원본 데이터 버전 (다시 만들지 판단용)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def build(self, items, version=None):
+        """✅ items: [(표시 이름, 입력 값), ...]"""
+        pairs = sorted({(_normalize(label), label, value) for label, value in items})
+        self.keys = [key for key, _, _ in pairs]
+        self.entries = [(label, value) for _, label, value in pairs]
+        self.version = version
+
+    def add(self, label, value):
+        key = _normalize(label)
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key and self.entries[position] == (label, value):
+            return
+        self.keys.insert(position, key)
+        self.entries.insert(position, (label, value))
+
+    def search(self, text, limit=25):
+        """✅ 접두어 일치 우선, limit개가 안 되면 중간 일치로 채움 → [(표시 이름, 입력 값), ...]"""
+        query = _normalize(text)
+        start = bisect.bisect_left(self.keys, query)
+        end = bisect.bisect_right(self.keys, query + "\U0010ffff")
+        positions = range(end - 1, start - 1, -1) if self.newest_first else range(start, end)
+        results = [self.entries[i] for i in positions][:limit]
+
+        if query and len(results) < limit:
+            seen = set(range(start, end))
+            order = range(len(self.keys) - 1, -1, -1) if self.newest_first else range(len(self.keys))
+            for i in order:
+                if i not in seen and query in self.keys[i]:
+                    results.append(self.entries[i])
+                    if len(results) >= limit:
+                        break
+        return results
+
+
+def build_player_index(index, roster, version=None):
+    items = [(user, user) for user in roster.users]
+    items += [(f"{alias} → {user}", user) for user, aliases in roster.aliases.items() for alias in aliases]
+    index.build(items, version)
+    return index
+
+
+def build_game_index(index, game_numbers, version=None):
+    index.build(((str(number), str(number)) for number in game_numbers if number), version)
+    return index
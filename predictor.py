@@ -0,0 +1,97 @@
+"""
+✅ 라인업 승률 예측 모델
+
+클래스별 MMR 차이(아랫팀 - 윗팀, `드,어,넥,슴` 순서)를 입력으로 하는 로지스틱 회귀.
+- 학습: 저장된 경기 기록 전체를 NumPy로 한 번에 Newton(IRLS) 반복 (좌우 대칭 샘플 추가, 절편 없음)
+- 규제: Elo 공식(팀 평균 MMR 차이 400 → 약 91%)을 사전값으로 두고 그쪽으로 당기는 L2
+- 예측: 가중치 4개와의 내적 + 시그모이드만 계산하므로 후보 하나당 수 마이크로초
+"""
+import logging
+import math
+
+import numpy as np
+
+from team_solver import ROLE_ORDER, role_mmr
+
+MMR_SCALE = 400.0
+ELO_PRIOR_WEIGHT = math.log(10) / len(ROLE_ORDER)  # 모든 클래스 차이를 평균낸 Elo와 같은 기울기
+
+
+def role_diffs(team1, team2, players_by_name):
+    """✅ 두 팀(`드,어,넥,슴` 순서 유저명)의 클래스별 MMR 차이 리스트"""
+    return [
+        role_mmr(players_by_name[a], role) - role_mmr(players_by_name[b], role)
+        for role, a, b in zip(ROLE_ORDER, team1, team2)
+    ]
+
+
+class WinPredictor:
+    def __init__(self, l2=2.0, iterations=25):
+        self.l2 = l2
+        self.iterations = iterations
+        self.prior = np.full(len(ROLE_ORDER), ELO_PRIOR_WEIGHT)
+        self.weights = self.prior.copy()
+        self._fast_weights = tuple(float(w) / MMR_SCALE for w in self.weights)
+        self.fitted = False
+        self.samples = 0
+        self.games_since_fit = 0
+
+    def fit(self, matches, players):
+        """
+        ✅ 경기 기록(Match 리스트) + 현재 유저 정보(Player 리스트)로 가중치 재학습
+        - 경기 당시가 아닌 현재 클래스별 MMR을 사용 (시트에 경기 시점 MMR이 없기 때문)
+        - 유저 정보가 없는 경기는 제외
+        """
+        players_by_name = {p.username: p for p in players}
+        rows = []
+        for match in matches:
+            if not match.is_full:
+                continue
+            if not all(name in players_by_name for name in match.winners + match.losers):
+                continue
+            rows.append(role_diffs(match.winners, match.losers, players_by_name))
+
+        if not rows:
+            logging.warning("⚠️ [승률 예측] 학습할 경기가 없어 Elo 기본값 유지")
+            return False
+
+        diffs = np.asarray(rows, dtype=float) / MMR_SCALE
+        x = np.vstack([diffs, -diffs])  # ✅ 좌우 대칭 (승리팀 기준 1, 패배팀 기준 0)
+        y = np.concatenate([np.ones(len(diffs)), np.zeros(len(diffs))])
+
+        w = self.prior.copy()
+        identity = np.eye(len(w))
+        for _ in range(self.iterations):
+            p = 1.0 / (1.0 + np.exp(-(x @ w)))
+            gradient = x.T @ (p - y) + self.l2 * (w - self.prior)
+            hessian = (x * (p * (1 - p))[:, None]).T @ x + self.l2 * identity
+            step = np.linalg.solve(hessian, gradient)
+            w -= step
+            if np.abs(step).max() < 1e-6:
+                break
+
+        self.weights = w
+        self._fast_weights = tuple(float(v) / MMR_SCALE for v in w)
+        self.fitted = True
+        self.samples = len(rows)
+        self.games_since_fit = 0
+        logging.info(f"✅ [승률 예측] {self.samples}경기로 학습 완료 → 가중치 {np.round(w, 3).tolist()}")
+        return True
+
+    def predict_diff(self, diffs):
+        """✅ 클래스별 MMR 차이 4개 → 첫 번째 팀 승률 (NumPy 없이 계산하는 빠른 경로)"""
+        z = 0.0
+        for w, d in zip(self._fast_weights, diffs):
+            z += w * d
+        if z < -30:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def predict_batch(self, diffs):
+        """✅ (M, 4) 클래스별 MMR 차이 배열 → 첫 번째 팀 승률 배열"""
+        z = (np.asarray(diffs, dtype=float) / MMR_SCALE) @ self.weights
+        return 1.0 / (1.0 + np.exp(-z))
+
+    def balance_objective(self, diffs):
+        """✅ 팀 탐색용 목적 함수: 50:50에서 벗어난 정도 (작을수록 균형)"""
+        return abs(self.predict_diff(diffs) - 0.5)
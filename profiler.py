@@ -0,0 +1,231 @@
+"""
+✅ 운영 중 온디맨드 프로파일링 (관리자 명령어용)
+
+- CPU: cProfile(이벤트 루프 스레드에서 실행되는 코드 전체) 또는 샘플링 프로파일러
+  (별도 스레드가 일정 간격으로 이벤트 루프 스레드의 스택을 기록, 오버헤드가 작아 운영 중 사용 가능)
+- 종료 조건: 다음 N개 명령어 실행 후 또는 T초 후
+- 결과: 출력 폴더에 `.pstats`(cProfile) / `.collapsed`(flamegraph.pl, speedscope 호환) 파일 + 상위 20개 요약
+- 메모리: tracemalloc 시작 → 스냅샷마다 `.tracemalloc` 파일 저장 + 직전 스냅샷 대비 증가량 상위 20개
+
+※ `asyncio.to_thread`로 넘긴 작업(동기 GAS 요청 등)은 다른 스레드에서 실행되므로 CPU 프로파일에는
+  해당 작업을 기다리는 시간만 잡힌다.
+"""
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+TOP_N = 20
+MODES = ("cpu", "sample")
+
+
+class ProfilerError(Exception):
+    pass
+
+
+def _output_path(output_dir, prefix, extension):
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, f"{prefix}_{datetime.now().strftime('%y%m%d_%H%M%S')}.{extension}")
+
+
+def _frame_label(code):
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StackSampler:
+    """✅ 대상 스레드의 콜스택을 interval초마다 기록하는 샘플링 프로파일러"""
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()  # "루트;...;말단" → 샘플 수
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    @property
+    def samples(self):
+        return sum(self.stacks.values())
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def summary(self, limit=TOP_N):
+        """✅ 함수별 자체(self) / 누적(total) 샘플 비율 상위 목록"""
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for label in set(frames):
+                total[label] += count
+
+        samples = self.samples or 1
+        lines = [f"{'self':>6} {'total':>6}  함수"]
+        for label, count in own.most_common(limit):
+            lines.append(f"{count / samples:>6.1%} {total[label] / samples:>6.1%}  {label}")
+        return "\n".join(lines)
+
+
+def pstats_summary(profile, limit=TOP_N):
+    """✅ cProfile 결과 → 누적 시간 기준 상위 함수 표 (디스코드 메시지용 짧은 형식)"""
+    stats = pstats.Stats(profile)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    lines = [f"{'누적ms':>9} {'자체ms':>9} {'호출':>7}  함수"]
+    for (filename, line, func), (_, calls, own_time, cumulative, _) in rows:
+        lines.append(
+            f"{cumulative * 1000:>9.1f} {own_time * 1000:>9.1f} {calls:>7}  {os.path.basename(filename)}:{line}({func})"
+        )
+    return "\n".join(lines)
+
+
+class CommandProfiler:
+    """✅ 다음 N개 명령어 / T초 동안만 켜지는 CPU 프로파일러"""
+
+    def __init__(self, output_dir="profiles"):
+        self.output_dir = output_dir
+        self.mode = None
+        self.remaining_commands = None
+        self.deadline = None
+        self.started_at = None
+        self._profile = None
+        self._sampler = None
+
+    @property
+    def active(self):
+        return self.mode is not None
+
+    def start(self, mode="cpu", commands=None, seconds=None):
+        if self.active:
+            raise ProfilerError(f"이미 `{self.mode}` 프로파일링이 진행 중입니다.")
+        if mode not in MODES:
+            raise ProfilerError(f"알 수 없는 모드 `{mode}` (사용 가능: {', '.join(MODES)})")
+
+        if mode == "cpu":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident())
+            self._sampler.start()
+
+        self.mode = mode
+        self.remaining_commands = commands
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.started_at = time.monotonic()
+        logging.info(f"🔬 [프로파일] {mode} 시작 (명령어 {commands}개 / {seconds}초)")
+
+    def command_finished(self):
+        """✅ 명령어 1개 종료 시 호출 → 목표 개수에 도달하면 True"""
+        if not self.active or self.remaining_commands is None:
+            return False
+        self.remaining_commands -= 1
+        return self.remaining_commands <= 0
+
+    def stop(self):
+        """✅ 프로파일링 종료 → (저장한 파일 경로, 요약 텍스트)"""
+        if not self.active:
+            raise ProfilerError("진행 중인 프로파일링이 없습니다.")
+
+        elapsed = time.monotonic() - self.started_at
+        if self.mode == "cpu":
+            self._profile.disable()
+            path = _output_path(self.output_dir, "cpu", "pstats")
+            self._profile.dump_stats(path)
+            summary = f"⏱ {elapsed:.1f}초 동안 측정\n" + pstats_summary(self._profile)
+        else:
+            self._sampler.stop()
+            path = _output_path(self.output_dir, "sample", "collapsed")
+            self._sampler.write_collapsed(path)
+            summary = f"⏱ {elapsed:.1f}초 동안 샘플 {self._sampler.samples}개\n" + self._sampler.summary()
+
+        logging.info(f"🔬 [프로파일] {self.mode} 종료 → {path}")
+        self.mode = None
+        self.remaining_commands = None
+        self.deadline = None
+        self._profile = None
+        self._sampler = None
+        return path, summary
+
+
+class MemoryProfiler:
+    """✅ tracemalloc 스냅샷 / 직전 스냅샷 대비 증가량"""
+
+    IGNORED = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(self, output_dir="profiles"):
+        self.output_dir = output_dir
+        self.previous = None
+
+    @property
+    def active(self):
+        return tracemalloc.is_tracing()
+
+    def start(self, frames=10):
+        if self.active:
+            raise ProfilerError("이미 메모리 추적이 진행 중입니다.")
+        tracemalloc.start(frames)
+        self.previous = None
+        logging.info(f"🧠 [메모리] tracemalloc 시작 (frames={frames})")
+
+    def snapshot(self, limit=TOP_N):
+        """✅ 스냅샷 저장 → (파일 경로, 요약 텍스트). 첫 스냅샷은 전체 상위, 이후는 직전 대비 증가량 상위"""
+        if not self.active:
+            raise ProfilerError("메모리 추적이 시작되지 않았습니다.")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.IGNORED)
+        path = _output_path(self.output_dir, "memory", "tracemalloc")
+        snapshot.dump(path)
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"📦 현재 {current / 1024 / 1024:.1f}MB / 최대 {peak / 1024 / 1024:.1f}MB"]
+        if self.previous is None:
+            lines.append("🔝 할당 위치 상위")
+            for stat in snapshot.statistics("lineno")[:limit]:
+                frame = stat.traceback[0]
+                lines.append(f"{stat.size / 1024:>9.1f}KB {stat.count:>7}개  {os.path.basename(frame.filename)}:{frame.lineno}")
+        else:
+            lines.append("📈 직전 스냅샷 대비 증가량 상위")
+            for stat in snapshot.compare_to(self.previous, "lineno")[:limit]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"{stat.size_diff / 1024:>+9.1f}KB {stat.count_diff:>+7}개  {os.path.basename(frame.filename)}:{frame.lineno}"
+                )
+
+        self.previous = snapshot
+        return path, "\n".join(lines)
+
+    def stop(self):
+        if not self.active:
+            raise ProfilerError("메모리 추적이 시작되지 않았습니다.")
+        tracemalloc.stop()
+        self.previous = None
+        logging.info("🧠 [메모리] tracemalloc 종료")
@@ -0,0 +1,134 @@
+"""
+✅ 유저 / 채널별 명령어 사용 제한 + 무거운 명령어 공정 대기열
+
+- RateLimiter: 명령어(또는 버튼)별 `횟수/초` 토큰 버킷을 유저마다, 채널 전체에는 공통 버킷 하나
+  설정 문자열 예: "조회=6/60,팀생성=4/60,버튼 MIX=10/60" (없는 이름은 `*` 기본값, `*`도 없으면 제한 없음)
+- 제한에 걸리면 다시 시도할 수 있을 때까지 남은 초와 걸린 범위(유저 / 채널)를 반환 → 호출하는 쪽에서 안내 (같은 유저 / 명령어에는 한 번만)
+- FairQueue: 동시에 실행할 수 있는 무거운 명령어 수를 제한하고, 빈 자리는 유저별로 돌아가며 배정
+  (한 유저가 여러 번 요청해도 다른 유저 요청 사이사이에 하나씩만 실행)
+"""
+import asyncio
+import collections
+import logging
+import time
+
+
+def parse_limits(spec):
+    """✅ "조회=6/60,팀생성=4/60" → {"조회": (6, 60.0), "팀생성": (4, 60.0)}"""
+    limits = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        try:
+            name, rule = item.rsplit("=", 1)
+            count, seconds = rule.split("/")
+            limits[name.strip()] = (int(count), float(seconds))
+        except ValueError:
+            logging.warning(f"⚠️ [사용 제한] 잘못된 설정 무시: `{item}` (형식: 이름=횟수/초)")
+    return limits
+
+
+class TokenBucket:
+    def __init__(self, count, seconds):
+        self.capacity = count
+        self.rate = count / seconds
+        self.tokens = float(count)
+        self.updated_at = time.monotonic()
+
+    def take(self):
+        """✅ 토큰 하나 사용 → 0 (통과) 또는 다음 토큰까지 남은 초"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    def __init__(self, limits, channel_limit=None):
+        self.limits = limits
+        self.channel_limit = channel_limit  # (횟수, 초) 채널 전체 공통
+        self.user_buckets = {}
+        self.channel_buckets = {}
+        self._notified_until = {}
+
+    def rule(self, name):
+        return self.limits.get(name, self.limits.get("*"))
+
+    def hit(self, name, user_id, channel_id):
+        """✅ 사용 기록 → (0, None) 통과 또는 (다시 시도할 수 있을 때까지 남은 초, "user" / "channel")"""
+        rule = self.rule(name)
+        if rule:
+            bucket = self.user_buckets.setdefault((name, user_id), TokenBucket(*rule))
+            retry = bucket.take()
+            if retry:
+                return retry, "user"
+        if self.channel_limit and channel_id is not None:
+            bucket = self.channel_buckets.setdefault(channel_id, TokenBucket(*self.channel_limit))
+            retry = bucket.take()
+            if retry:
+                return retry, "channel"
+        return 0.0, None
+
+    def should_notify(self, name, user_id, retry):
+        """✅ 같은 유저 / 명령어에 대한 안내는 제한이 풀릴 때까지 한 번만 (안내 메시지로 채널이 도배되지 않도록)"""
+        now = time.monotonic()
+        key = (name, user_id)
+        if self._notified_until.get(key, 0) > now:
+            return False
+        self._notified_until[key] = now + retry
+        return True
+
+
+class FairQueue:
+    def __init__(self, concurrency=2, max_pending_per_user=2):
+        self.concurrency = concurrency
+        self.max_pending_per_user = max_pending_per_user
+        self.active = 0
+        self.waiters = collections.OrderedDict()  # 유저 ID → deque[Future] (먼저 기다린 유저 순)
+
+    @property
+    def pending(self):
+        return sum(len(queue) for queue in self.waiters.values())
+
+    def is_full_for(self, user_id):
+        return len(self.waiters.get(user_id, ())) >= self.max_pending_per_user
+
+    def must_wait(self):
+        return self.active >= self.concurrency or bool(self.waiters)
+
+    async def acquire(self, user_id):
+        if not self.must_wait():
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.setdefault(user_id, collections.deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # 자리를 받은 직후 취소됨 → 다음 대기자에게 넘김
+            else:
+                queue = self.waiters.get(user_id)
+                if queue and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del self.waiters[user_id]
+            raise
+
+    def release(self):
+        """✅ 자리를 다음 유저에게 넘김 (유저 순서를 돌아가며 각 유저의 가장 오래된 요청 하나씩)"""
+        while self.waiters:
+            user_id, queue = next(iter(self.waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self.waiters.move_to_end(user_id)
+            else:
+                del self.waiters[user_id]
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
@@ -0,0 +1,136 @@
+"""
+✅ GAS 응답 레코드 (응답을 한 번만 디코딩해서 모든 명령어가 같은 객체를 사용)
+
+- decode_json: orjson이 설치되어 있으면 orjson, 없으면 표준 json으로 디코딩
+- Player: 클래스 비트마스크 + 클래스별 MMR 배열 (`드,어,넥,슴` 순서)
+- Match: 게임번호 / 날짜 / 승패 팀 (유저명 튜플) / 스코어
+- Roster: 유저명 목록 + 별명 → 유저명 매핑
+"""
+import json
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError / requests JSONDecodeError 모두 이 예외의 하위 클래스
+
+CLASS_ORDER = ["드", "어", "넥", "슴"]
+CLASS_MMR_KEYS = ("mmrD", "mmrA", "mmrN", "mmrS")
+
+
+def decode_json(raw):
+    """✅ GAS 응답 본문(bytes 또는 str) → 파이썬 객체"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def class_mask(classes):
+    """✅ "드, 어" / "드,어" / ["드", "어"] → 클래스 비트마스크 (드=1, 어=2, 넥=4, 슴=8)"""
+    if isinstance(classes, str):
+        classes = classes.replace("/", ",").split(",")
+    mask = 0
+    for c in classes or []:
+        c = c.strip()
+        if c in CLASS_ORDER:
+            mask |= 1 << CLASS_ORDER.index(c)
+    return mask
+
+
+def mask_to_classes(mask):
+    """✅ 클래스 비트마스크 → `드,어,넥,슴` 순서의 클래스 리스트"""
+    return [c for i, c in enumerate(CLASS_ORDER) if mask >> i & 1]
+
+
+def split_team(team):
+    """✅ GAS 경기 데이터의 팀 표기("a, b, c, d" 또는 리스트)를 유저명 리스트로 변환"""
+    if isinstance(team, str):
+        return [p.strip() for p in team.split(",") if p.strip()]
+    return [str(p).strip() for p in (team or []) if str(p).strip()]
+
+
+@dataclass(slots=True)
+class Player:
+    username: str
+    classes: int = 0  # 클래스 비트마스크
+    mmr: float = 0.0
+    class_mmr: tuple = (0.0, 0.0, 0.0, 0.0)  # `드,어,넥,슴` 순서 클래스별 MMR
+    effective_mmr: float = 0.0  # 팀 생성 시 클래스 지정을 반영한 정렬용 MMR
+
+    @classmethod
+    def from_dict(cls, data):
+        mmr = float(data.get("mmr") or 0)
+        class_mmr = tuple(
+            float(data[key]) if data.get(key) not in (None, "") else mmr
+            for key in CLASS_MMR_KEYS
+        )
+        return cls(str(data["username"]), class_mask(data.get("class", "")), mmr, class_mmr, mmr)
+
+    def can_play(self, role):
+        """✅ role: 클래스 인덱스(0~3)"""
+        return bool(self.classes >> role & 1)
+
+    @property
+    def class_names(self):
+        return mask_to_classes(self.classes)
+
+
+@dataclass(slots=True)
+class Match:
+    game_number: str
+    timestamp: str = ""
+    winners: tuple = ()  # `드,어,넥,슴` 순서 유저명
+    losers: tuple = ()
+    win_score: int = None
+    lose_score: int = None
+
+    @classmethod
+    def from_dict(cls, data):
+        def score(key):
+            value = data.get(key)
+            return int(value) if value not in (None, "") else None
+
+        return cls(
+            str(data.get("game_number", "")),
+            str(data.get("timestamp", "")),
+            tuple(split_team(data.get("winners"))),
+            tuple(split_team(data.get("losers"))),
+            score("win_score"),
+            score("lose_score"),
+        )
+
+    @property
+    def is_full(self):
+        """✅ 4:4 경기 여부"""
+        return len(self.winners) == len(CLASS_ORDER) and len(self.losers) == len(CLASS_ORDER)
+
+
+@dataclass(slots=True)
+class Roster:
+    users: frozenset = frozenset()
+    aliases: dict = field(default_factory=dict)  # 유저명 → [별명, ...]
+    alias_map: dict = field(default_factory=dict)  # 별명 → 유저명
+
+    @classmethod
+    def from_dict(cls, data):
+        aliases = {user: list(alias_list) for user, alias_list in data.get("aliases", {}).items()}
+        alias_map = {alias: user for user, alias_list in aliases.items() for alias in alias_list}
+        return cls(frozenset(data.get("users", [])), aliases, alias_map)
+
+    def resolve(self, name):
+        """✅ 유저명 또는 별명 → 유저명 (없으면 None)"""
+        if name in self.users:
+            return name
+        return self.alias_map.get(name)
+
+
+def decode_players(data):
+    """✅ `getPlayersInfo` 응답 → Player 리스트"""
+    return [Player.from_dict(p) for p in data.get("players", [])]
+
+
+def decode_matches(data):
+    """✅ `getAllMatches` / `getRecentMatches` 응답 → Match 리스트"""
+    return [Match.from_dict(m) for m in data.get("matches", [])]
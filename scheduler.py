@@ -0,0 +1,179 @@
+"""
+✅ GAS 요청 우선순위 스케줄러 + 일일 할당량 예산
+
+Apps Script는 하루 실행 횟수 / 실행 시간 할당량이 있어서, 폭주한 `!MMR갱신`이나 백업이 급한 경기 결과 등록과 같은 줄에 서면 안 된다.
+- 우선순위: WRITE(사용자 쓰기) > READ(사용자 조회) > BACKGROUND(백그라운드 동기화 / 백업 / 스냅샷 / MMR 재계산)
+  - action 이름으로 자동 분류, 백그라운드 작업 안에서는 `with priority(BACKGROUND):`로 지정
+- 토큰 버킷: 초당 rate개, 최대 burst개. 토큰이 부족하면 높은 우선순위 대기자부터 통과
+- 최근 24시간 사용량(요청 수 / GAS 응답 시간 합)이 예산의 RESERVE 비율을 넘으면 해당 우선순위 요청은 BudgetExceeded
+  (백그라운드 80%, 조회 95%까지만 → 남은 예산은 경기 결과 등록용)
+- 명령어별 비용(요청 수 / 응답 시간 / 대기 시간)을 누적 → 관리자 `!쿼터`
+"""
+import collections
+import contextlib
+import contextvars
+import threading
+import time
+
+WRITE, READ, BACKGROUND = 0, 1, 2
+PRIORITY_NAMES = {WRITE: "쓰기", READ: "조회", BACKGROUND: "백그라운드"}
+RESERVE = {WRITE: 1.0, READ: 0.95, BACKGROUND: 0.8}
+
+# ✅ 사용자 명령어에서 호출하더라도 유지보수 성격인 action
+BACKGROUND_ACTIONS = {
+    "triggerBackupFromDiscord", "cleanupBackups", "generateSeasonSnapshot", "updateAllMMR", "updateMMRChunk",
+}
+
+_priority = contextvars.ContextVar("gas_priority", default=None)
+_command = contextvars.ContextVar("gas_command", default="(백그라운드)")
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+def classify(action):
+    override = _priority.get()
+    if override is not None:
+        return override
+    if action in BACKGROUND_ACTIONS:
+        return BACKGROUND
+    return READ if str(action).startswith("get") else WRITE
+
+
+@contextlib.contextmanager
+def priority(level):
+    """✅ 블록 안의 GAS 요청 우선순위 지정 (asyncio.to_thread / create_task에도 전달됨)"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def set_command(name):
+    """✅ 이후 GAS 요청 비용을 name(명령어 / 버튼)으로 집계 → reset_command(token)으로 복원"""
+    return _command.set(name)
+
+
+def reset_command(token):
+    try:
+        _command.reset(token)
+    except ValueError:  # 다른 컨텍스트에서 만든 토큰
+        pass
+
+
+class RollingBudget:
+    """✅ 최근 window초 동안의 요청 수 / 응답 시간 합"""
+
+    def __init__(self, max_calls, max_seconds, window=86400):
+        self.max_calls = max_calls
+        self.max_seconds = max_seconds
+        self.window = window
+        self.events = collections.deque()  # (time.time(), 응답 시간)
+        self.seconds = 0.0
+
+    def _prune(self):
+        cutoff = time.time() - self.window
+        while self.events and self.events[0][0] < cutoff:
+            self.seconds -= self.events.popleft()[1]
+
+    def add(self, seconds):
+        self.events.append((time.time(), seconds))
+        self.seconds += seconds
+
+    def usage(self):
+        """✅ (요청 수, 응답 시간 합, 예산 대비 사용 비율 중 큰 값)"""
+        self._prune()
+        calls = len(self.events)
+        fraction = max(calls / self.max_calls if self.max_calls else 0.0,
+                       self.seconds / self.max_seconds if self.max_seconds else 0.0)
+        return calls, self.seconds, fraction
+
+
+class CommandCost:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0  # GAS 응답 시간 합
+        self.waited = 0.0  # 스케줄러 대기 시간 합
+        self.rejected = 0
+
+
+class GasScheduler:
+    def __init__(self, rate=2.0, burst=5, max_calls=20000, max_seconds=90 * 60):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.budget = RollingBudget(max_calls, max_seconds)
+        self.waiting = [0, 0, 0]  # 우선순위별 대기 중인 요청 수
+        self.costs = collections.defaultdict(CommandCost)
+        self.priority_calls = collections.Counter()
+        self._refilled_at = time.monotonic()
+        self._cond = threading.Condition()  # ✅ asyncio.to_thread 작업과 이벤트 루프 양쪽에서 호출됨
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.rate <= 0:
+            self.tokens = float(self.burst)
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _can_go(self, level):
+        return self.tokens >= 1 and not any(self.waiting[:level])
+
+    def _check_budget(self, level):
+        calls, _, fraction = self.budget.usage()
+        if fraction >= RESERVE[level]:
+            self.costs[_command.get()].rejected += 1
+            raise BudgetExceeded(
+                f"GAS 일일 예산 {fraction * 100:.0f}% 사용 ({calls}회) → {PRIORITY_NAMES[level]} 요청 보류"
+            )
+
+    def try_acquire(self, action):
+        """✅ 기다리지 않고 통과할 수 있으면 (우선순위, 0.0), 기다려야 하면 None"""
+        level = classify(action)
+        with self._cond:
+            self._check_budget(level)
+            self._refill()
+            if not self._can_go(level):
+                return None
+            self.tokens -= 1
+            return level, 0.0
+
+    def acquire(self, action):
+        """✅ 토큰이 생길 때까지 대기 (높은 우선순위 대기자가 먼저) → (우선순위, 대기 시간)"""
+        level = classify(action)
+        started = time.monotonic()
+        with self._cond:
+            self._check_budget(level)
+            self.waiting[level] += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._can_go(level):
+                        self.tokens -= 1
+                        break
+                    shortfall = (1 - self.tokens) / self.rate if self.tokens < 1 and self.rate > 0 else 0.05
+                    self._cond.wait(timeout=max(0.01, shortfall))
+            finally:
+                self.waiting[level] -= 1
+                self._cond.notify_all()
+        return level, time.monotonic() - started
+
+    def record(self, level, seconds, waited):
+        """✅ 요청 하나가 끝난 뒤 예산 / 명령어별 비용 반영"""
+        with self._cond:
+            self.budget.add(seconds)
+            self.priority_calls[level] += 1
+            cost = self.costs[_command.get()]
+            cost.calls += 1
+            cost.seconds += seconds
+            cost.waited += waited
+
+    def report(self, limit=15):
+        """✅ (요청 수, 응답 시간 합, 예산 사용 비율, 우선순위별 요청 수, 비용 큰 순 [(명령어, CommandCost)])"""
+        with self._cond:
+            calls, seconds, fraction = self.budget.usage()
+            top = sorted(self.costs.items(), key=lambda item: item[1].seconds, reverse=True)[:limit]
+            return calls, seconds, fraction, dict(self.priority_calls), top
@@ -0,0 +1,546 @@
+"""
+✅ 명령어 확장(cogs/)이 함께 쓰는 함수: 명령어 훅, GAS 읽기, 분석 데이터 갱신, 캐시 무효화, 프로파일링, 슬래시 명령어 공용 처리
+
+상태(캐시 / 대기열 / 복제본 / 모델)는 bot 모듈에 두고 여기에는 함수만 둠 → `!리로드 전체`로 코드를 교체해도 상태는 유지됨
+"""
+import asyncio
+import functools
+import logging
+import re
+import time
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import gas
+import tracing
+from cache import format_age
+from name_index import build_game_index, build_player_index
+from records import Roster, decode_matches, decode_players
+from scheduler import BACKGROUND, priority, reset_command, set_command
+import bot as core  # ✅ 다시 대입하는 상태(백그라운드 작업 / 프로파일 채널)는 bot 모듈 속성으로
+from bot import (FAIR_QUEUE_COMMANDS, GAME_INDEX_REFRESH_SECONDS, PREDICTOR_REFIT_EVERY, PROFILE_COMMANDS, PROMPT_FIRST_COMMANDS,
+                 account_links, command_profiler, conversations, fair_queue, game_index, gas_cache, is_admin, job_manager,
+                 lineup_index, player_index, rate_limiter, replica, synergy_lock, synergy_matrix, win_predictor)
+
+
+async def start_command_span(ctx):
+    """✅ 명령어 하나 = 트레이스 하나 (안에서 호출하는 GAS / 디스코드 요청이 자식 스팬으로 연결됨)"""
+    ctx.trace_span, ctx.trace_token = tracing.start_span(
+        f"!{ctx.command.qualified_name}", kind="SERVER",
+        attributes={"discord.user_id": ctx.author.id, "discord.channel_id": ctx.channel.id}
+    )
+    ctx.cost_token = set_command(f"!{ctx.command.qualified_name}")  # ✅ GAS 요청 비용 집계 (`!쿼터`)
+
+    if ctx.command.name in FAIR_QUEUE_COMMANDS and ctx.command.name not in PROMPT_FIRST_COMMANDS:
+        await acquire_fair_slot(ctx)
+
+
+async def acquire_fair_slot(ctx):
+    """✅ 무거운 명령어의 공정 대기열 자리 확보 (명령어가 끝나면 end_command_span에서 반납)"""
+    if getattr(ctx, "fair_slot", False):
+        return
+    if fair_queue.must_wait():
+        await ctx.send(f"⏳ 요청이 많아 대기열 {fair_queue.pending + 1}번째로 곧 실행됩니다.", delete_after=15)
+    await fair_queue.acquire(ctx.author.id)
+    ctx.fair_slot = True
+
+
+async def end_command_span(ctx):
+    await count_profiled_command(ctx)
+    if hasattr(ctx, "trace_span"):
+        tracing.end_span(ctx.trace_span, ctx.trace_token, "명령어 오류" if ctx.command_failed else None)
+    if hasattr(ctx, "cost_token"):
+        reset_command(ctx.cost_token)
+    if getattr(ctx, "fair_slot", False):
+        fair_queue.release()
+    conversations.close(ctx)
+
+
+def traced_interaction(name):
+    """✅ 버튼 콜백을 스팬으로 기록 (View를 만든 명령어의 트레이스에 연결)"""
+    def decorator(callback):
+        @functools.wraps(callback)
+        async def wrapper(self, interaction, item):
+            retry, _ = rate_limiter.hit(name, interaction.user.id, interaction.channel_id)
+            if retry:
+                if rate_limiter.should_notify(name, interaction.user.id, retry):
+                    await interaction.response.send_message(
+                        f"⏳ 버튼을 너무 자주 눌렀습니다. {retry:.0f}초 후 다시 눌러주세요.", ephemeral=True
+                    )
+                else:
+                    await interaction.response.defer()
+                return
+
+            parent = getattr(self, "trace_parent", None)
+            cost_token = set_command(name)
+            try:
+                with tracing.span(name, kind="SERVER", parent=parent, attributes={"discord.user_id": interaction.user.id}):
+                    return await callback(self, interaction, item)
+            finally:
+                reset_command(cost_token)
+        return wrapper
+    return decorator
+
+
+async def ensure_synergy_loaded():
+    """✅ 시너지 행렬이 비어 있으면 GAS에서 전체 경기 기록을 받아 한 번만 로드"""
+    if synergy_matrix.loaded:
+        return True
+
+    async with synergy_lock:
+        if synergy_matrix.loaded:
+            return True
+
+        matches = await fetch_all_matches()
+        if matches is None:
+            return False
+
+        await asyncio.to_thread(synergy_matrix.load_matches, matches)
+        return True
+
+
+async def fetch_all_matches():
+    """✅ GAS에서 전체 경기 기록을 Match 리스트로 가져옴 (실패 시 None)"""
+    logging.info("📡 [경기 기록] 전체 경기 기록 요청 중...")
+    try:
+        data, _ = await asyncio.to_thread(gas.fetch, {"action": "getAllMatches"})
+    except Exception as e:
+        logging.error(f"🚨 [경기 기록] 전체 경기 기록 요청 실패: {e}")
+        return None
+
+    if "error" in data:
+        logging.warning(f"⚠️ [경기 기록] GAS 오류: {data['error']}")
+        return None
+
+    return decode_matches(data)
+
+
+async def ensure_lineup_index_loaded():
+    """✅ 최근 라인업 인덱스가 비어 있으면 GAS 최근 경기 기록으로 초기화"""
+    if lineup_index.loaded:
+        return True
+
+    try:
+        data, _ = await asyncio.to_thread(gas.fetch, {"action": "getRecentMatches"})
+    except Exception as e:
+        logging.error(f"🚨 [최근 라인업] 최근 경기 요청 실패: {e}")
+        return False
+
+    if "error" in data:
+        logging.warning(f"⚠️ [최근 라인업] GAS 오류: {data['error']}")
+        return False
+
+    lineup_index.load_matches(decode_matches(data))
+    return True
+
+
+async def refit_predictor():
+    """
+    ✅ 전체 경기 기록 + 해당 유저들의 클래스별 MMR로 승률 예측 모델 재학습 (GAS 요청은 백그라운드 우선순위)
+    - 실패해도 새 경기 카운터를 0으로 → 다음 재학습은 다시 PREDICTOR_REFIT_EVERY경기 뒤 (경기마다 전체 재학습 반복 방지)
+    """
+    with priority(BACKGROUND):
+        try:
+            fitted = await _refit_predictor()
+        except Exception as e:
+            logging.error(f"🚨 [승률 예측] 재학습 실패: {e}", exc_info=e)
+            fitted = False
+
+    if not fitted:
+        win_predictor.games_since_fit = 0
+    return fitted
+
+
+async def _refit_predictor():
+    matches = await fetch_all_matches()
+    if matches is None:
+        return False
+
+    names = sorted({name for m in matches for name in m.winners + m.losers})
+    if not names:
+        return False
+
+    try:
+        data, _ = await asyncio.to_thread(gas.fetch, {"action": "getPlayersInfo", "players": names})
+    except Exception as e:
+        logging.error(f"🚨 [승률 예측] 유저 정보 요청 실패: {e}")
+        return False
+
+    if "error" in data:
+        logging.warning(f"⚠️ [승률 예측] GAS 오류: {data['error']}")
+        return False
+
+    return await asyncio.to_thread(win_predictor.fit, matches, decode_players(data))
+
+
+def schedule_predictor_refit():
+    """✅ 재학습이 진행 중이 아니면 백그라운드 재학습 시작"""
+    if core.predictor_refit_task is None or core.predictor_refit_task.done():
+        core.predictor_refit_task = asyncio.create_task(refit_predictor())
+
+
+def on_result_registered(payload):
+    """✅ 경기 결과 등록 성공 후 로컬 분석 데이터(시너지 / 최근 라인업 / 승률 예측) 갱신"""
+    if synergy_matrix.loaded:
+        synergy_matrix.record_match(payload["winners"], payload["losers"])
+    if lineup_index.loaded:
+        lineup_index.record(payload["winners"], payload["losers"])
+    if payload.get("game_number"):
+        game_index.add(str(payload["game_number"]), str(payload["game_number"]))
+
+    win_predictor.games_since_fit += 1
+    if win_predictor.games_since_fit >= PREDICTOR_REFIT_EVERY:
+        logging.info(f"🔁 [승률 예측] 새 경기 {win_predictor.games_since_fit}개 → 백그라운드 재학습")
+        schedule_predictor_refit()
+
+
+def on_results_rewritten(deleted=()):
+    """
+    ✅ 경기 삭제 / 백업 복구로 봇이 Results 시트를 고쳐 쓴 뒤 로컬 분석 데이터 초기화
+    - 경기 목록 캐시 / 시너지 / 최근 라인업: invalidate_results → 다음 사용 시 다시 로드
+    - 게임번호 인덱스: 삭제한 게임번호만 빼고, 복구면 비운 뒤 다음 자동완성 때 캐시로 다시 구성
+    - 승률 예측: 백그라운드 재학습
+    """
+    removed = {str(number) for number in deleted}
+    invalidate_results(sorted(removed), [])
+    build_game_index(game_index, [number for _, number in game_index.entries if number not in removed] if removed else [])
+    schedule_predictor_refit()
+
+
+def format_win_probability(probability):
+    """✅ 아랫팀(첫 번째 팀) 승률 → `아랫팀 55% : 45% 윗팀` 형태"""
+    return f"아랫팀 {probability * 100:.0f}% : {(1 - probability) * 100:.0f}% 윗팀"
+
+
+def stale_notice(age):
+    """✅ GAS 장애로 캐시 데이터를 보여줄 때 메시지 앞에 붙이는 안내 (정상 응답이면 빈 문자열)"""
+    if age is None:
+        return ""
+    return f"⚠️ **GAS 응답 없음 — {format_age(age)} 전 저장된 데이터입니다. (읽기 전용)**\n\n"
+
+
+async def expand_mentions(ctx, text):
+    """✅ 입력 속 @멘션 → 연결된 유저명 (GAS 조회 없음), 연결되지 않은 멘션이 있으면 안내 후 None"""
+    if not text:
+        return text
+    text, unlinked = account_links.replace_mentions(text)
+    if unlinked:
+        await ctx.send(f"🚨 {', '.join(f'<@{user_id}>' for user_id in unlinked)} 님은 연결된 유저명이 없습니다. "
+                       f"`!등록`으로 직접 등록하거나 관리자에게 `!연결`을 요청해주세요.", allowed_mentions=discord.AllowedMentions.none())
+        return None
+    return text
+
+
+def format_linked_accounts(usernames):
+    """✅ 유저명 중 디스코드 계정과 연결된 유저 → `유저명 = @계정` 목록 (없으면 빈 문자열)"""
+    linked = [f"`{name}` = <@{account_links.user_id_for(name)}>"
+              for name in usernames if account_links.user_id_for(name) is not None]
+    return f"🔗 **디스코드 계정:** {', '.join(linked)}\n" if linked else ""
+
+
+def link_registered_user(user, guild, username):
+    """
+    ✅ `!등록`으로 새 유저 등록 성공 후, 등록한 본인 계정을 유저명과 연결 → 안내 문구 (연결하지 않으면 빈 문자열)
+    - ConfirmView가 새 유저 등록 + 등록한 본인이 확인했을 때만 호출 (기존 유저 업데이트는 연결하지 않음)
+    - 아직 연결되지 않은 계정 + 다른 계정에 연결되지 않은 유저명일 때만 (관리자는 다른 유저를 대신 등록하므로 `!연결` 사용)
+    """
+    if is_admin(user, guild) or account_links.username_for(user.id) is not None:
+        return ""
+    if account_links.user_id_for(username) is not None:
+        return ""
+    account_links.link(user.id, username)
+    logging.info(f"🔗 [계정 연결] {user} ({user.id}) → {username}")
+    return f"\n🔗 `{user.display_name}` 님의 디스코드 계정이 `{username}` 과(와) 연결되었습니다. 이제 `!조회`만 입력해도 됩니다."
+
+
+GAS_UNAVAILABLE_MESSAGE = "🚧 GAS 서버가 응답하지 않고, 저장된 데이터도 없습니다. 잠시 후 다시 시도해주세요."
+
+
+# ✅ 시트 수정 알림 → 해당 캐시 항목만 무효화 / 갱신 (폴링 없음, 수신 서버는 cogs/core.py)
+def invalidate_players(keys, rows):
+    """Players 시트: 수정된 행이 오면 유저별 캐시 갱신, 키만 오면 해당 유저 캐시 삭제"""
+    replica.mark_dirty()
+    if rows:
+        gas_cache.patch_players(rows)
+    patched = {row["username"] for row in rows}
+    if keys:
+        gas_cache.invalidate([f"player:{k}" for k in keys if k not in patched] + [f"user:{k}" for k in keys])
+    elif not rows:
+        gas_cache.invalidate(prefix="player:")
+        gas_cache.invalidate(prefix="user:")
+    schedule_predictor_refit()  # ✅ 클래스별 MMR이 바뀌었을 수 있음
+
+
+def invalidate_aliases(keys, rows):
+    """Aliases 시트: 유저 / 별명 목록 + 해당 유저 조회 캐시 삭제"""
+    replica.mark_dirty()
+    gas_cache.invalidate(["getUsersAndAliases"] + [f"user:{k}" for k in keys])
+
+
+def invalidate_results(keys, rows):
+    """Results 시트: 경기 목록 캐시 삭제 + 시너지 / 최근 라인업은 다음 사용 시 다시 로드"""
+    gas_cache.invalidate(["getRecentMatches", "getAllMatches"] + [f"match:{k}" for k in keys],
+                         prefix=None if keys else "match:")
+    synergy_matrix.loaded = False
+    lineup_index.loaded = False
+
+
+def invalidate_seasons(keys, rows):
+    gas_cache.invalidate(["getSeasonList"])
+
+
+async def post_result_write(payload, on_wait=None):
+    """✅ 경기 결과 쓰기 요청 (진행 중인 MMR 전체 갱신이 끝난 뒤 전송, 기다려야 하면 on_wait() 호출)"""
+    if job_manager.write_lock.locked() and on_wait:
+        await on_wait()
+    async with job_manager.write_lock:
+        return await asyncio.to_thread(gas.post, payload)
+
+
+async def result_already_recorded(payload):
+    """
+    ✅ 보류 결과의 게임번호가 이미 시트에 있는지 → True / False, GAS가 응답하지 않아 확인할 수 없으면 None
+    - 첫 전송이 시트에 기록된 뒤 응답만 실패(5xx / 연결 끊김)했을 수 있으므로 재전송 전에 확인 (같은 경기 중복 등록 방지)
+    """
+    game_number = str(payload.get("game_number"))
+    try:
+        data, age = await asyncio.to_thread(gas.fetch, {"action": "getMatch", "game_number": int(game_number)})
+    except gas.GasUnavailable:
+        return None
+    if age is not None:
+        return None  # ✅ 캐시 응답 = GAS 장애 중
+    return "error" not in data and str(data.get("game_number")) == game_number
+
+
+async def get_roster():
+    """✅ 유저명 / 별명 → (Roster, 캐시 경과 초 또는 None). 로컬 복제본 우선, 변경분 동기화 미지원이면 전체 조회"""
+    if await replica.sync():
+        return replica.roster, replica.stale_age
+
+    data, age = await asyncio.to_thread(gas.fetch, {"action": "getUsersAndAliases"}, "GET")
+    if "error" in data:
+        raise gas.GasError(data["error"])
+    return Roster.from_dict(data), age
+
+
+async def get_players(names):
+    """✅ 유저 정보 → (등록된 유저의 Player 리스트, 캐시 경과 초 또는 None). 로컬 복제본 우선"""
+    if await replica.sync():
+        return replica.players_for(names), replica.stale_age
+
+    data, age = await gas.fetch_async({"action": "getPlayersInfo", "players": names}, timeout=gas.READ_TIMEOUT)
+    if "error" in data:
+        raise gas.GasError(data["error"])
+    return decode_players(data), age
+
+
+async def get_roster_and_players(names):
+    """
+    ✅ Roster + 입력한 이름(유저명 / 별명)의 유저 정보를 GAS 왕복 한 번으로 → (Roster, {유저명: Player}, 캐시 경과 초 또는 None)
+    - 로컬 복제본을 쓸 수 있으면 GAS 요청 없음
+    - 아니면 getUsersAndAliases + getPlayersInfo를 getBatch 하나로 요청 (별명은 마지막으로 저장된 Roster로 미리 유저명 변환)
+    - 그 사이 별명이 바뀌어 빠진 유저는 결과에 없음 → 호출하는 쪽에서 추가 조회
+    """
+    if await replica.sync():
+        roster = replica.roster
+        players = replica.players_for([roster.resolve(name) or name for name in names])
+        return roster, {player.username: player for player in players}, replica.stale_age
+
+    cached = gas_cache.lookup({"action": "getUsersAndAliases"})
+    hint = Roster.from_dict(cached[0]) if cached else Roster()
+    lookup = sorted({hint.resolve(name) or name for name in names})
+
+    (roster_data, roster_age), (players_data, players_age) = await gas.batch_async([
+        {"action": "getUsersAndAliases"},
+        {"action": "getPlayersInfo", "players": lookup},
+    ])
+    if "error" in roster_data:
+        raise gas.GasError(roster_data["error"])
+
+    players = {} if "error" in players_data else {player.username: player for player in decode_players(players_data)}
+    ages = [age for age in (roster_age, players_age) if age is not None]
+    return Roster.from_dict(roster_data), players, max(ages) if ages else None
+
+
+async def complete_players(names, players_by_name, age):
+    """
+    ✅ get_roster_and_players로 받은 유저 정보 → names 순서의 (Player 리스트, 캐시 경과 초 또는 None)
+    - 빠진 유저(그 사이 별명이 바뀐 경우 등)만 get_players로 추가 조회, 등록되지 않은 유저는 결과에 없음
+    """
+    missing = [name for name in names if name not in players_by_name]
+    if missing:
+        extra, extra_age = await get_players(missing)
+        players_by_name = {**players_by_name, **{player.username: player for player in extra}}
+        ages = [value for value in (age, extra_age) if value is not None]
+        age = max(ages) if ages else None
+    return [players_by_name[name] for name in names if name in players_by_name], age
+
+
+async def fetch_roster():
+    """✅ GAS에서 모든 유저명과 별명을 Roster로 가져오는 함수 (실패 시 빈 Roster)"""
+    try:
+        logging.info("🔍 GAS에서 기존 유저 및 별명 데이터를 가져오는 중...")
+        roster, _ = await get_roster()
+        logging.info("✅ GAS 유저 및 별명 데이터 가져오기 성공!")
+        return roster
+    except Exception as e:
+        logging.error(f"🚨 GAS 요청 중 오류 발생: {e}")
+    return Roster()
+
+
+def parse_match_input(input_text):
+    """
+    ✅ 경기 결과 텍스트에서 승리/패배 팀을 추출하는 함수
+    """
+    logging.info(f"📝 경기 결과 분석 중: {input_text}")
+
+    match = re.match(r"\[아래(\d+)]\s*(.+?)\s*vs\s*\[위(\d+)]\s*(.+)", input_text)
+
+    if not match:
+        logging.warning(f"🚨 입력 형식 오류: {input_text}")
+        return None, None, None, None, "invalid_format"
+
+    below_score = int(match.group(1))
+    above_score = int(match.group(3))
+    below_players = [p.strip() for p in match.group(2).split("/") if p.strip()]
+    above_players = [p.strip() for p in match.group(4).split("/") if p.strip()]
+
+    if len(below_players) != 4 or len(above_players) != 4:
+        logging.warning(f"🚨 플레이어 수 오류: {below_players} vs {above_players}")
+        return None, None, None, None, "invalid_player_count"
+
+    if below_score == above_score:
+        logging.warning(f"🚨 동점 경기 발생: {input_text}")
+        return None, None, None, None, "draw"
+
+    if below_score > above_score:
+        return below_players, above_players, below_score, above_score, "valid"
+    else:
+        return above_players, below_players, above_score, below_score, "valid"
+
+
+def format_team(team):
+    """
+    ✅ 유저명 + 클래스 포맷 적용
+    """
+    class_order = ["드", "어", "넥", "슴"]
+    return ", ".join(f"{player}({class_order[i]})" for i, player in enumerate(team))
+
+
+def has_sufficient_classes(players_data):
+    class_counts = {"드": 0, "어": 0, "넥": 0, "슴": 0}
+    for player in players_data:
+        for cls in player.class_names:
+            class_counts[cls] += 1
+
+    logging.info(f"📊 [클래스 분포] {class_counts}")
+    insufficient = [cls for cls, count in class_counts.items() if count < 2]
+    return (len(insufficient) == 0), insufficient
+
+
+# ✅ 온디맨드 프로파일링 (관리자 전용, 명령어는 cogs/diagnostics.py)
+async def send_profile_result(channel, title, path, summary):
+    """✅ 상위 20개 요약은 메시지로, 전체 결과는 파일로 전송"""
+    body = summary if len(summary) <= 1800 else summary[:1800] + "\n..."
+    await channel.send(f"{title}\n```\n{body}\n```", file=discord.File(path))
+
+
+async def finish_profiling(reason):
+    if core.profile_timer and core.profile_timer is not asyncio.current_task():
+        core.profile_timer.cancel()
+    core.profile_timer = None
+
+    path, summary = command_profiler.stop()
+    if core.profile_channel:
+        await send_profile_result(core.profile_channel, f"🔬 **프로파일 종료** ({reason}) → `{path}`", path, summary)
+
+
+async def stop_profiling_after(seconds):
+    await asyncio.sleep(seconds)
+    if command_profiler.active:
+        await finish_profiling(f"{seconds}초 경과")
+
+
+async def count_profiled_command(ctx):
+    """✅ `!프로파일 cpu 5회` → 프로파일 명령어를 제외한 명령어 5개가 끝나면 자동 종료"""
+    if ctx.command and ctx.command.name in PROFILE_COMMANDS:
+        return
+    if command_profiler.command_finished():
+        await finish_profiling("명령어 횟수 도달")
+
+
+# ✅ 슬래시 명령어 (자동완성은 메모리 인덱스만 사용 → GAS 요청 없음)
+def refresh_player_index():
+    """✅ 로컬 복제본(버전이 바뀌었을 때) 또는 마지막으로 저장된 getUsersAndAliases로 유저 인덱스 갱신"""
+    if replica.synced_at is not None:
+        if player_index.version != ("replica", replica.version):
+            build_player_index(player_index, replica.roster, ("replica", replica.version))
+        return
+
+    cached = gas_cache.lookup({"action": "getUsersAndAliases"})
+    if cached and player_index.version != ("cache", int(time.time() - cached[1])):
+        build_player_index(player_index, Roster.from_dict(cached[0]), ("cache", int(time.time() - cached[1])))
+    if replica.supported and (core.replica_warmup_task is None or core.replica_warmup_task.done()):
+        core.replica_warmup_task = asyncio.create_task(replica.sync())  # ✅ 다음 자동완성부터 복제본 사용 (이번 응답은 기다리지 않음)
+
+
+def refresh_game_index():
+    """✅ 캐시된 최근 / 전체 경기 기록으로 게임번호 인덱스 갱신 (GAME_INDEX_REFRESH_SECONDS마다, 새 등록은 바로 추가)"""
+    if game_index.version and time.monotonic() - game_index.version < GAME_INDEX_REFRESH_SECONDS:
+        return
+    numbers = [number for _, number in game_index.entries]
+    for action in ("getAllMatches", "getRecentMatches"):
+        cached = gas_cache.lookup({"action": action})
+        if cached:
+            numbers += [match.game_number for match in decode_matches(cached[0])]
+    build_game_index(game_index, numbers, time.monotonic())
+
+
+def find_indexed_name(name):
+    """✅ 유저명 / 별명 → 유저명 (유저 인덱스에서 정확히 일치하는 항목만, GAS 요청 없음), 없으면 None"""
+    for label, value in player_index.search(name, limit=50):
+        if label == name or label.startswith(f"{name} → "):
+            return value
+    return None
+
+
+def resolve_typed_name(name):
+    """✅ 자동완성 목록에서 고르지 않고 직접 입력한 별명 → 유저명 (인덱스에 없으면 그대로)"""
+    return find_indexed_name(name) or name
+
+
+async def autocomplete_player(interaction: discord.Interaction, current: str):
+    refresh_player_index()
+    return [app_commands.Choice(name=label[:100], value=value) for label, value in player_index.search(current)]
+
+
+async def autocomplete_game_number(interaction: discord.Interaction, current: str):
+    refresh_game_index()
+    return [app_commands.Choice(name=label, value=value) for label, value in game_index.search(current)]
+
+
+async def run_slash(interaction, callback, *args):
+    """
+    ✅ 슬래시 명령어를 기존 명령어 본문으로 실행 (사용 제한 / 트레이스 / 비용 집계 훅 동일 적용)
+    - callback: 같은 Cog의 명령어(`self.조회`, 호출하면 Cog가 자동으로 넘어감) 또는 `callback(ctx, *args)` 함수
+    """
+    name = interaction.command.name
+    retry, _ = rate_limiter.hit(name, interaction.user.id, interaction.channel_id)
+    if retry:
+        await interaction.response.send_message(f"⏳ `/{name}` 명령어를 너무 자주 사용했습니다. {retry:.0f}초 후 다시 시도해주세요.",
+                                                ephemeral=True)
+        return
+
+    await interaction.response.defer(thinking=True)  # ✅ GAS 응답이 3초를 넘어도 상호작용이 만료되지 않도록
+    ctx = await commands.Context.from_interaction(interaction)
+    await start_command_span(ctx)
+    try:
+        await callback(ctx, *args)
+    except Exception as e:
+        ctx.command_failed = True
+        logging.error(f"🚨 [슬래시 명령어 오류] /{name}: {e}", exc_info=e)
+        await ctx.send("🚨 명령어 처리 중 오류가 발생했습니다.")
+    finally:
+        await end_command_span(ctx)
@@ -0,0 +1,184 @@
+"""
+✅ 팀 밸런싱 전략 몬테카를로 시뮬레이터 (오프라인 도구)
+
+숨겨진 실제 실력을 가진 가상 유저 풀을 만들고, 팀 생성 전략별로 수천 번의 내전을 시뮬레이션한다.
+- 참가자 8명을 뽑아 현재 레이팅으로 정렬 → 전략으로 팀 분할 → 실제 실력으로 승패 결정 → Elo 방식 레이팅 갱신
+- 리그 여러 개를 NumPy 배열로 한 번에 진행하고, (전략, 시드) 단위 작업은 프로세스 풀로 병렬 실행
+- 리포트: 경기별 예상 승률 격차(|실제 실력 기준 승률 - 50%|) 분포, 레이팅 수렴 속도(실제 실력과의 상관계수)
+
+사용 예: python simulator.py --leagues 200 --nights 2000 --players 20 --seeds 4
+"""
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+from team_solver import ADVANCED_PATTERNS, GENERAL_PATTERNS
+
+TEAM_SIZE = 4
+LOBBY_SIZE = 2 * TEAM_SIZE
+
+
+def _pattern_masks(patterns):
+    """✅ 순위 인덱스 패턴 리스트 → (패턴 수, 8) bool 마스크 (True = 팀1)"""
+    masks = np.zeros((len(patterns), LOBBY_SIZE), dtype=bool)
+    for row, pattern in enumerate(patterns):
+        masks[row, list(pattern)] = True
+    return masks
+
+
+GENERAL_MASKS = _pattern_masks(GENERAL_PATTERNS)
+ADVANCED_MASKS = _pattern_masks(ADVANCED_PATTERNS)
+ALL_SPLIT_MASKS = _pattern_masks([c for c in combinations(range(LOBBY_SIZE), TEAM_SIZE) if 0 in c])  # 좌우 대칭 제외 35개
+
+
+def strategy_general(sorted_ratings, rng):
+    """`팀생성일반`: 상위 4명 중 2명 + 하위 4명 중 2명을 균등 랜덤"""
+    return GENERAL_MASKS[rng.integers(len(GENERAL_MASKS), size=len(sorted_ratings))]
+
+
+def strategy_advanced(sorted_ratings, rng):
+    """`팀생성고급`: 2 to 1 템플릿 4개 중 균등 랜덤"""
+    return ADVANCED_MASKS[rng.integers(len(ADVANCED_MASKS), size=len(sorted_ratings))]
+
+
+def strategy_min_gap(sorted_ratings, rng):
+    """`다음 후보` 1순위: 35개 분할 중 레이팅 합 차이가 가장 작은 분할"""
+    team1_sums = sorted_ratings @ ALL_SPLIT_MASKS.T
+    gaps = np.abs(2 * team1_sums - sorted_ratings.sum(axis=1, keepdims=True))
+    return ALL_SPLIT_MASKS[gaps.argmin(axis=1)]
+
+
+def strategy_random(sorted_ratings, rng):
+    """기준선: 35개 분할 중 완전 랜덤"""
+    return ALL_SPLIT_MASKS[rng.integers(len(ALL_SPLIT_MASKS), size=len(sorted_ratings))]
+
+
+STRATEGIES = {
+    "일반": strategy_general,
+    "고급": strategy_advanced,
+    "최소차이": strategy_min_gap,
+    "랜덤": strategy_random,
+}
+
+
+def elo_probability(diff):
+    """✅ 팀 평균 레이팅(또는 실력) 차이 → 승률"""
+    return 1.0 / (1.0 + 10.0 ** (-diff / 400.0))
+
+
+def simulate(strategy, seed, leagues=100, players=20, nights=1000, k_factor=24.0, skill_sd=200.0, checkpoint=50):
+    """
+    ✅ 한 전략 / 한 시드의 리그 여러 개를 동시에 시뮬레이션
+    - 반환: {"strategy", "margins": (nights * leagues,) 예상 승률 격차, "correlations": 체크포인트별 평균 상관계수}
+    """
+    rng = np.random.default_rng(seed)
+    choose = STRATEGIES[strategy]
+    rows = np.arange(leagues)[:, None]
+
+    skill = rng.normal(1000.0, skill_sd, size=(leagues, players))  # 숨겨진 실제 실력
+    rating = np.full((leagues, players), 1000.0)  # 모든 유저가 같은 레이팅에서 시작
+    margins = np.empty((nights, leagues), dtype=np.float32)
+    correlations = []
+
+    for night in range(nights):
+        picks = np.argsort(rng.random((leagues, players)), axis=1)[:, :LOBBY_SIZE]
+        order = np.argsort(-rating[rows, picks], axis=1)
+        picks = np.take_along_axis(picks, order, axis=1)  # 레이팅 내림차순 참가자
+
+        sorted_ratings = rating[rows, picks]
+        sign = np.where(choose(sorted_ratings, rng), 1.0, -1.0)  # 팀1 +1, 팀2 -1
+
+        true_probability = elo_probability((skill[rows, picks] * sign).sum(axis=1) / TEAM_SIZE)
+        margins[night] = np.abs(true_probability - 0.5)
+        team1_won = rng.random(leagues) < true_probability
+
+        expected = elo_probability((sorted_ratings * sign).sum(axis=1) / TEAM_SIZE)
+        delta = k_factor * (team1_won - expected)
+        rating[rows, picks] += delta[:, None] * sign
+
+        if (night + 1) % checkpoint == 0:
+            centered_rating = rating - rating.mean(axis=1, keepdims=True)
+            centered_skill = skill - skill.mean(axis=1, keepdims=True)
+            corr = (centered_rating * centered_skill).sum(axis=1) / (
+                np.sqrt((centered_rating ** 2).sum(axis=1) * (centered_skill ** 2).sum(axis=1)) + 1e-12
+            )
+            correlations.append(float(corr.mean()))
+
+    return {"strategy": strategy, "margins": margins.ravel(), "correlations": correlations}
+
+
+def _simulate_task(args):
+    strategy, seed, options = args
+    return simulate(strategy, seed, **options)
+
+
+def run(strategies, seeds, workers=None, **options):
+    """✅ (전략 × 시드) 작업을 프로세스 풀로 실행 후 전략별로 합산"""
+    tasks = [(strategy, seed, options) for strategy in strategies for seed in range(seeds)]
+    logging.info(f"🎲 [시뮬레이션] 작업 {len(tasks)}개 실행 (전략 {len(strategies)}개 × 시드 {seeds}개)")
+
+    merged = {strategy: {"margins": [], "correlations": []} for strategy in strategies}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_simulate_task, tasks):
+            merged[result["strategy"]]["margins"].append(result["margins"])
+            merged[result["strategy"]]["correlations"].append(result["correlations"])
+
+    return {
+        strategy: {
+            "margins": np.concatenate(data["margins"]),
+            "correlations": np.mean(np.asarray(data["correlations"]), axis=0),
+        }
+        for strategy, data in merged.items()
+    }
+
+
+def format_report(results, checkpoint, target_correlation=0.9):
+    """✅ 전략별 예상 승률 격차 분포 + 수렴 속도 표"""
+    lines = [
+        "📊 팀 밸런싱 전략 시뮬레이션 결과",
+        "",
+        f"{'전략':<8}{'격차 평균':>10}{'p50':>8}{'p90':>8}{'p99':>8}{'45~55% 비율':>14}{'최종 상관':>10}{f'상관 {target_correlation} 도달':>14}",
+    ]
+    for strategy, data in results.items():
+        margins = data["margins"]
+        correlations = data["correlations"]
+        p50, p90, p99 = np.percentile(margins, [50, 90, 99])
+        reached = np.nonzero(correlations >= target_correlation)[0]
+        reached_text = f"{(reached[0] + 1) * checkpoint}경기" if reached.size else "미도달"
+        lines.append(
+            f"{strategy:<8}{margins.mean() * 100:>9.1f}%{p50 * 100:>7.1f}%{p90 * 100:>7.1f}%{p99 * 100:>7.1f}%"
+            f"{(margins <= 0.05).mean() * 100:>13.1f}%{correlations[-1]:>10.3f}{reached_text:>14}"
+        )
+    lines.append("")
+    lines.append("※ 격차 = |실제 실력 기준 팀1 승률 - 50%| (작을수록 공정), 상관 = 레이팅과 실제 실력의 상관계수")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="팀 밸런싱 전략 몬테카를로 시뮬레이터")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    parser.add_argument("--seeds", type=int, default=4, help="전략별 독립 시드 수 (프로세스 풀 작업 단위)")
+    parser.add_argument("--leagues", type=int, default=100, help="시드당 동시에 시뮬레이션할 리그 수")
+    parser.add_argument("--players", type=int, default=20, help="리그당 유저 풀 크기")
+    parser.add_argument("--nights", type=int, default=1000, help="리그당 경기 수")
+    parser.add_argument("--k-factor", type=float, default=24.0)
+    parser.add_argument("--skill-sd", type=float, default=200.0, help="실제 실력 표준편차")
+    parser.add_argument("--checkpoint", type=int, default=50, help="상관계수 측정 간격 (경기 수)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    results = run(
+        args.strategies, args.seeds, workers=args.workers,
+        leagues=args.leagues, players=args.players, nights=args.nights,
+        k_factor=args.k_factor, skill_sd=args.skill_sd, checkpoint=args.checkpoint,
+    )
+    print(format_report(results, args.checkpoint))
+
+
+if __name__ == "__main__":
+    main()
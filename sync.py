@@ -0,0 +1,156 @@
+"""
+✅ 유저 / 별명 / 유저 정보 로컬 복제본 (버전 기반 변경분 동기화)
+
+GAS `getChangesSince` action에 마지막으로 받은 데이터 버전을 보내면 그 이후 변경분만 돌려받아 로컬 인덱스에 바로 반영한다.
+- 요청: {"action": "getChangesSince", "since": 버전}  (since=0 또는 GAS가 변경 기록을 잃은 경우 전체 데이터)
+- 응답: {
+    "version": 새 버전 (단조 증가),
+    "full": 전체 데이터 여부 (true면 로컬 인덱스를 비우고 다시 채움),
+    "users":   {"added": [유저명, ...], "removed": [유저명, ...]},
+    "aliases": {"changed": {유저명: [별명, ...]}, "removed": [유저명, ...]},
+    "players": {"changed": [getPlayersInfo 형식 행, ...], "removed": [유저명, ...]}
+  }
+- 변경이 없으면 버전만 돌아오므로 평소 동기화 비용은 수십 바이트
+- min_interval초 안에는 다시 묻지 않음 (시트 수정 알림을 받으면 mark_dirty()로 즉시 재동기화)
+- GAS 배포본에 action이 없으면(첫 요청부터 오류) supported=False → 호출하는 쪽이 기존 전체 조회로 대체
+"""
+import asyncio
+import dataclasses
+import logging
+import time
+
+import requests
+
+import gas
+from records import JSONDecodeError, Player, Roster, decode_json
+
+
+class DeltaReplica:
+    def __init__(self, min_interval=30):
+        self.min_interval = min_interval
+        self.version = 0
+        self.users = set()
+        self.aliases = {}  # 유저명 → [별명, ...]
+        self.alias_map = {}  # 별명 → 유저명
+        self.players = {}  # 유저명 → Player
+        self.supported = True
+        self.synced_at = None  # 마지막으로 동기화에 성공한 시각 (time.time())
+        self.last_attempt_ok = False
+        self._checked_at = 0.0
+        self._dirty = True
+        self._lock = asyncio.Lock()
+
+    # ---------- 변경분 반영 ----------
+
+    def _set_aliases(self, user, alias_list):
+        for alias in self.aliases.pop(user, []):
+            if self.alias_map.get(alias) == user:
+                del self.alias_map[alias]
+        if alias_list:
+            self.aliases[user] = list(alias_list)
+            for alias in alias_list:
+                self.alias_map[alias] = user
+
+    def apply(self, delta):
+        """✅ 변경분(또는 전체 데이터)을 로컬 인덱스에 반영"""
+        if delta.get("full"):
+            self.users.clear()
+            self.aliases.clear()
+            self.alias_map.clear()
+            self.players.clear()
+
+        users = delta.get("users") or {}
+        self.users.update(users.get("added", []))
+        for user in users.get("removed", []):
+            self.users.discard(user)
+            self._set_aliases(user, None)
+            self.players.pop(user, None)
+
+        aliases = delta.get("aliases") or {}
+        for user, alias_list in (aliases.get("changed") or {}).items():
+            self._set_aliases(user, alias_list)
+        for user in aliases.get("removed", []):
+            self._set_aliases(user, None)
+
+        players = delta.get("players") or {}
+        for row in players.get("changed", []):
+            player = Player.from_dict(row)
+            self.players[player.username] = player
+        for user in players.get("removed", []):
+            self.players.pop(user, None)
+
+        self.version = delta.get("version", self.version)
+
+    # ---------- 조회 ----------
+
+    @property
+    def roster(self):
+        """✅ 로컬 인덱스를 그대로 참조하는 Roster (복사 없음)"""
+        return Roster(self.users, self.aliases, self.alias_map)
+
+    def players_for(self, names):
+        """✅ 등록된 유저만 Player 복사본으로 반환 (팀 생성 중 effective_mmr 수정이 다른 요청과 공유되지 않도록)"""
+        return [dataclasses.replace(self.players[name]) for name in names if name in self.players]
+
+    @property
+    def stale_age(self):
+        """✅ 마지막 동기화 시도가 실패했으면 마지막 성공 이후 경과 초, 아니면 None"""
+        if self.last_attempt_ok or self.synced_at is None:
+            return None
+        return time.time() - self.synced_at
+
+    # ---------- 동기화 ----------
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def _needs_sync(self):
+        return self._dirty or time.monotonic() - self._checked_at >= self.min_interval
+
+    async def sync(self):
+        """✅ 필요하면 변경분 동기화 → 로컬 인덱스를 쓸 수 있으면 True (GAS 실패 시에도 이전 데이터가 있으면 True)"""
+        if not self.supported:
+            return False
+        if not self._needs_sync():
+            return True
+
+        async with self._lock:
+            if not self._needs_sync():
+                return True
+            self._checked_at = time.monotonic()
+
+            try:
+                response = await asyncio.to_thread(
+                    gas.post, {"action": "getChangesSince", "since": self.version}, timeout=gas.READ_TIMEOUT
+                )
+                data = decode_json(response.content)
+            except gas.QuotaExceeded as e:
+                logging.warning(f"⚠️ [동기화] GAS 예산 초과로 이번 동기화 생략: {e}")
+                self.last_attempt_ok = False
+                return self.synced_at is not None
+            except (requests.RequestException, JSONDecodeError) as e:
+                gas.mark_failed(str(e))
+                self.last_attempt_ok = False
+                return self.synced_at is not None
+
+            if "error" in data:
+                if self.synced_at is None:
+                    logging.warning(f"⚠️ [동기화] 변경분 동기화 미지원 ({data['error']}) → 전체 조회 사용")
+                    self.supported = False
+                    return False
+                logging.warning(f"⚠️ [동기화] GAS 오류: {data['error']}")
+                self.last_attempt_ok = False
+                return True
+
+            gas.mark_healthy()
+            before = self.version
+            self.apply(data)
+            self._dirty = False
+            self.synced_at = time.time()
+            self.last_attempt_ok = True
+            if self.version != before:
+                logging.info(
+                    f"🔄 [동기화] v{before} → v{self.version} ({'전체' if data.get('full') else '변경분'}, "
+                    f"{len(response.content)}바이트, 유저 {len(self.users)}명)"
+                )
+            return True
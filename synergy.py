@@ -0,0 +1,232 @@
+"""
+✅ 팀원 시너지 / 상대 전적 분석 모듈
+
+경기 기록(승리팀/패배팀, `드,어,넥,슴` 순서)을 NumPy 행렬로 누적한다.
+- together_games[i, j] / together_wins[i, j] : i와 j가 같은 팀으로 뛴 경기 수 / 승리 수 (대각선 = 개인 전적)
+- versus_games[i, j] / versus_wins[i, j]     : i가 j를 상대로 만난 경기 수 / i가 이긴 수
+- class_games[a, b, i, j] / class_wins[...]  : i가 a클래스, j가 b클래스로 같은 팀이었을 때의 경기 수 / 승리 수
+"""
+import logging
+
+import numpy as np
+
+from records import CLASS_ORDER, split_team
+
+
+class SynergyMatrix:
+    def __init__(self, capacity=32, prior_games=4):
+        self.index = {}  # 유저명 → 행렬 인덱스
+        self.names = []
+        self.prior_games = prior_games  # 베이지안 보정용 가상 경기 수
+        self.matches_seen = 0
+        self.loaded = False
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.together_games = np.zeros((capacity, capacity), dtype=np.int32)
+        self.together_wins = np.zeros((capacity, capacity), dtype=np.int32)
+        self.versus_games = np.zeros((capacity, capacity), dtype=np.int32)
+        self.versus_wins = np.zeros((capacity, capacity), dtype=np.int32)
+        self.class_games = np.zeros((4, 4, capacity, capacity), dtype=np.int32)
+        self.class_wins = np.zeros((4, 4, capacity, capacity), dtype=np.int32)
+
+    def _grow(self, needed):
+        """행렬 크기를 두 배씩 늘려서 유저 추가 비용을 상각"""
+        if needed <= self.capacity:
+            return
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        pad = new_capacity - self.capacity
+        for name in ("together_games", "together_wins", "versus_games", "versus_wins"):
+            setattr(self, name, np.pad(getattr(self, name), ((0, pad), (0, pad))))
+        for name in ("class_games", "class_wins"):
+            setattr(self, name, np.pad(getattr(self, name), ((0, 0), (0, 0), (0, pad), (0, pad))))
+        self.capacity = new_capacity
+        logging.info(f"📐 [시너지] 행렬 크기 확장 → {new_capacity}")
+
+    def _rows(self, names):
+        rows = []
+        for name in names:
+            if name not in self.index:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+            rows.append(self.index[name])
+        self._grow(len(self.names))
+        return np.asarray(rows, dtype=np.intp)
+
+    def _accumulate(self, win_rows, lose_rows):
+        """
+        ✅ (M, 4) 형태의 승리팀/패배팀 인덱스 배열을 한 번에 누적
+        - 같은 인덱스가 여러 번 나와도 안전하도록 np.add.at 사용
+        """
+        positions = np.broadcast_to(np.arange(4), win_rows.shape)
+
+        for rows, won in ((win_rows, True), (lose_rows, False)):
+            i = np.broadcast_to(rows[:, :, None], rows.shape + (4,)).ravel()
+            j = np.broadcast_to(rows[:, None, :], rows.shape[:1] + (4, 4)).ravel()
+            a = np.broadcast_to(positions[:, :, None], rows.shape + (4,)).ravel()
+            b = np.broadcast_to(positions[:, None, :], rows.shape[:1] + (4, 4)).ravel()
+            np.add.at(self.together_games, (i, j), 1)
+            np.add.at(self.class_games, (a, b, i, j), 1)
+            if won:
+                np.add.at(self.together_wins, (i, j), 1)
+                np.add.at(self.class_wins, (a, b, i, j), 1)
+
+        i = np.broadcast_to(win_rows[:, :, None], win_rows.shape + (4,)).ravel()
+        j = np.broadcast_to(lose_rows[:, None, :], lose_rows.shape[:1] + (4, 4)).ravel()
+        np.add.at(self.versus_games, (i, j), 1)
+        np.add.at(self.versus_games, (j, i), 1)
+        np.add.at(self.versus_wins, (i, j), 1)
+
+        self.matches_seen += win_rows.shape[0]
+
+    def load_matches(self, matches):
+        """✅ 전체 경기 기록(Match 리스트)으로 행렬을 처음부터 다시 계산"""
+        self.index = {}
+        self.names = []
+        self.matches_seen = 0
+        self._allocate(self.capacity)
+
+        win_rows, lose_rows = [], []
+        for match in matches:
+            if not match.is_full:
+                logging.warning(f"⚠️ [시너지] 4:4가 아닌 경기 제외: {match.game_number}")
+                continue
+            win_rows.append(self._rows(match.winners))
+            lose_rows.append(self._rows(match.losers))
+
+        if win_rows:
+            self._accumulate(np.vstack(win_rows), np.vstack(lose_rows))
+
+        self.loaded = True
+        logging.info(f"✅ [시너지] {self.matches_seen}경기 / {len(self.names)}명 로드 완료")
+
+    def record_match(self, winners, losers):
+        """✅ 결과 등록 1건을 증분 반영"""
+        winners, losers = split_team(winners), split_team(losers)
+        if len(winners) != 4 or len(losers) != 4:
+            return
+        self._accumulate(self._rows(winners)[None, :], self._rows(losers)[None, :])
+        logging.info(f"➕ [시너지] 경기 반영 (누적 {self.matches_seen}경기)")
+
+    def _player_rates(self):
+        n = len(self.names)
+        games = np.diagonal(self.together_games)[:n].astype(float)
+        wins = np.diagonal(self.together_wins)[:n].astype(float)
+        k = self.prior_games
+        return (wins + 0.5 * k) / (games + k)
+
+    def synergy(self):
+        """
+        ✅ 팀원 시너지 행렬 (N×N)
+        - 동반 승률을 개인 승률 평균 쪽으로 보정한 뒤, 개인 승률 평균과의 차이를 반환
+        - 함께 뛴 경기가 적을수록 0에 가까워짐
+        """
+        n = len(self.names)
+        k = self.prior_games
+        rates = self._player_rates()
+        expected = (rates[:, None] + rates[None, :]) / 2
+        games = self.together_games[:n, :n]
+        wins = self.together_wins[:n, :n]
+        smoothed = (wins + k * expected) / (games + k)
+        result = smoothed - expected
+        np.fill_diagonal(result, 0.0)
+        return result
+
+    def head_to_head(self):
+        """✅ 상대 전적 승률 행렬 (N×N, 경기가 없으면 0.5)"""
+        n = len(self.names)
+        k = self.prior_games
+        return (self.versus_wins[:n, :n] + 0.5 * k) / (self.versus_games[:n, :n] + k)
+
+    def class_pairs(self, username_a, username_b, min_games=1):
+        """
+        ✅ 두 유저가 같은 팀일 때 클래스 조합별 전적
+        - 반환: [(A 클래스, B 클래스, 경기 수, 승률), ...] (경기 수 많은 순)
+        """
+        if username_a not in self.index or username_b not in self.index:
+            return []
+        i, j = self.index[username_a], self.index[username_b]
+        games = self.class_games[:, :, i, j]
+        wins = self.class_wins[:, :, i, j]
+        a_idx, b_idx = np.nonzero(games >= min_games)
+        order = np.argsort(-games[a_idx, b_idx])
+        return [
+            (CLASS_ORDER[a_idx[o]], CLASS_ORDER[b_idx[o]], int(games[a_idx[o], b_idx[o]]),
+             float(wins[a_idx[o], b_idx[o]] / games[a_idx[o], b_idx[o]]))
+            for o in order
+        ]
+
+    def team_synergy(self, team, matrix=None):
+        """✅ 팀 내 모든 2인 조합의 시너지 합계 (모르는 유저는 무시)"""
+        rows = [self.index[name] for name in team if name in self.index]
+        if len(rows) < 2:
+            return 0.0
+        matrix = self.synergy() if matrix is None else matrix
+        rows = np.asarray(rows)
+        return float(np.triu(matrix[np.ix_(rows, rows)], k=1).sum())
+
+    def balance_penalty(self, team1, team2, matrix=None):
+        """✅ 양 팀 시너지 합계 차이 (팀 생성 시 불균형 페널티로 사용)"""
+        if not self.loaded:
+            return 0.0
+        matrix = self.synergy() if matrix is None else matrix
+        return abs(self.team_synergy(team1, matrix) - self.team_synergy(team2, matrix))
+
+    def top_pairs(self, username=None, limit=5, min_games=3, reverse=False):
+        """
+        ✅ 시너지 상위(또는 하위) 듀오 목록
+        - 반환: [(유저A, 유저B, 동반 경기 수, 동반 승률, 시너지), ...]
+        """
+        n = len(self.names)
+        if n < 2:
+            return []
+        matrix = self.synergy()
+        games = self.together_games[:n, :n]
+
+        mask = np.triu(games >= min_games, k=1)
+        if username is not None:
+            if username not in self.index:
+                return []
+            row = self.index[username]
+            mask = np.zeros_like(games, dtype=bool)
+            mask[row] = games[row] >= min_games
+            mask[row, row] = False
+
+        i_idx, j_idx = np.nonzero(mask)
+        if i_idx.size == 0:
+            return []
+        scores = matrix[i_idx, j_idx]
+        order = np.argsort(scores if reverse else -scores)[:limit]
+
+        return [
+            (
+                self.names[i_idx[o]],
+                self.names[j_idx[o]],
+                int(games[i_idx[o], j_idx[o]]),
+                float(self.together_wins[i_idx[o], j_idx[o]] / games[i_idx[o], j_idx[o]]),
+                float(scores[o]),
+            )
+            for o in order
+        ]
+
+    def rivals(self, username, limit=5, min_games=3):
+        """
+        ✅ 특정 유저의 상대 전적 (승률 높은 순)
+        - 반환: [(상대 유저, 맞대결 경기 수, 승률), ...]
+        """
+        if username not in self.index:
+            return []
+        n = len(self.names)
+        row = self.index[username]
+        games = self.versus_games[row, :n]
+        wins = self.versus_wins[row, :n]
+        cols = np.nonzero(games >= min_games)[0]
+        if cols.size == 0:
+            return []
+        rates = wins[cols] / games[cols]
+        order = np.argsort(-rates)[:limit]
+        return [(self.names[cols[o]], int(games[cols[o]]), float(rates[o])) for o in order]
@@ -0,0 +1,318 @@
+"""
+✅ 제약 조건 기반 팀 구성 솔버
+
+`팀생성` 입력에서 받을 수 있는 제약 조건
+- `유저(드,넥)` → 해당 유저는 드/넥 중에서만 배정 (한 개만 쓰면 클래스 고정)
+- `같은팀:A+B(+C...)` → 지정한 유저들을 같은 팀에 배정
+- `다른팀:A+B` → 지정한 유저들을 서로 다른 팀에 배정
+
+점수 계산(MMR, 시너지 등) 전에 제약 전파로 가능한 팀 분할/클래스 배정만 남겨두고,
+불가능한 경우 이유를 담은 ConstraintError를 발생시킨다.
+"""
+import bisect
+import logging
+import math
+import random
+import re
+from collections import deque
+from itertools import combinations, permutations, product
+
+from records import CLASS_ORDER, class_mask
+
+ROLE_ORDER = CLASS_ORDER
+
+# ✅ MMR 내림차순 순위 기준 팀1 인덱스 패턴 (나머지 4명이 팀2)
+GENERAL_PATTERNS = [top + bottom for top in combinations(range(4), 2) for bottom in combinations(range(4, 8), 2)]  # 상위 4명 중 2명 + 하위 4명 중 2명
+ADVANCED_PATTERNS = [(0, 2, 4, 6), (0, 3, 5, 6), (0, 2, 5, 7), (0, 3, 4, 7)]  # 2 to 1 (1/2, 3/4, 5/6, 7/8)
+CONSTRAINT_PATTERN = re.compile(r"(같은팀|다른팀)\s*:\s*([^\s,/()]+)")
+
+
+class ConstraintError(Exception):
+    """✅ 제약 조건을 만족하는 팀 구성이 없을 때 발생 (메시지는 그대로 유저에게 표시)"""
+
+
+def parse_constraints(text):
+    """
+    ✅ `팀생성` 입력에서 같은팀/다른팀 조건을 분리
+    - 반환: (조건을 제거한 입력, 같은팀 그룹 리스트, 다른팀 쌍 리스트)
+    """
+    together, apart = [], []
+    for kind, names in CONSTRAINT_PATTERN.findall(text):
+        group = list(dict.fromkeys(n.strip() for n in names.split("+") if n.strip()))
+        if len(group) < 2:
+            raise ConstraintError(f"`{kind}:` 조건에는 `+`로 구분한 2명 이상의 유저가 필요합니다. (예: `{kind}:유저1+유저2`)")
+        if kind == "같은팀":
+            together.append(group)
+        else:
+            apart.extend(combinations(group, 2))
+
+    return CONSTRAINT_PATTERN.sub(" ", text), together, apart
+
+
+def pick_by_penalty(candidates, penalties):
+    """
+    ✅ 페널티가 작은 후보일수록 높은 확률로 뽑는 가중 랜덤 선택
+    - 가중치 = exp(-(페널티 - 최소 페널티)), 페널티가 모두 같으면 균등 랜덤
+    """
+    best = min(penalties)
+    weights = [math.exp(-(penalty - best)) for penalty in penalties]
+    return random.choices(candidates, weights=weights, k=1)[0]
+
+
+def split_by_pattern(players, pattern):
+    """✅ MMR 정렬된 유저 리스트 → (패턴 순위의 팀1, 나머지 팀2)"""
+    team1 = [players[i] for i in pattern]
+    team2 = [p for i, p in enumerate(players) if i not in pattern]
+    return team1, team2
+
+
+def role_mmr(player, role):
+    """✅ Player의 클래스별 MMR (role: 클래스명)"""
+    return player.class_mmr[ROLE_ORDER.index(role)]
+
+
+class TeamSolver:
+    def __init__(self, players, roles=None, together=(), apart=()):
+        """
+        - players: Player 리스트
+        - roles: {유저명: [클래스, ...]} (`유저(드,넥)` 입력, 없으면 등록된 클래스 사용)
+        - together: [[유저명, ...], ...] / apart: [(유저명, 유저명), ...]
+        """
+        self.players = list(players)
+        self.names = [p.username for p in self.players]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.team_size = len(self.players) // 2
+        self.together = [list(group) for group in together]
+        self.apart = [tuple(pair) for pair in apart]
+
+        roles = roles or {}
+        self.domains = [  # 유저별 배정 가능한 클래스 비트마스크
+            class_mask(roles[p.username]) if roles.get(p.username) else p.classes
+            for p in self.players
+        ]
+
+        self.splits = set()  # 가능한 팀1 비트마스크
+        self.assignments = {}  # 팀 비트마스크 → 가능한 클래스 배정 리스트
+
+    def _describe(self, rows):
+        return ", ".join(f"`{self.names[i]}`" for i in rows)
+
+    def propagate(self):
+        """
+        ✅ 제약 전파 후 가능한 팀 분할과 클래스 배정을 계산
+        1. 클래스별 가능 인원 확인 (2명뿐이면 두 사람은 반드시 다른 팀)
+        2. 같은팀 조건을 하나의 묶음으로 합침
+        3. 다른팀 조건을 묶음 간 2-색칠로 검사 → 묶음 뒤집기 조합만 열거
+        4. 각 분할마다 양 팀 클래스 배정 가능 여부 확인
+        """
+        n = len(self.players)
+        if self.team_size != len(ROLE_ORDER) or n != 2 * self.team_size:
+            raise ConstraintError(f"팀 생성에는 정확히 {2 * len(ROLE_ORDER)}명이 필요합니다. (현재 {n}명)")
+
+        for name in {x for group in self.together for x in group} | {x for pair in self.apart for x in pair}:
+            if name not in self.index:
+                raise ConstraintError(f"조건에 쓰인 `{name}` 님이 참가자 목록에 없습니다.")
+
+        for i, mask in enumerate(self.domains):
+            if not mask:
+                raise ConstraintError(f"`{self.names[i]}` 님이 맡을 수 있는 클래스가 없습니다.")
+
+        edges = [(self.index[a], self.index[b], "다른팀 조건 때문에") for a, b in self.apart]
+        for r, role in enumerate(ROLE_ORDER):
+            able = [i for i in range(n) if self.domains[i] >> r & 1]
+            fixed = [i for i in able if self.domains[i] == 1 << r]
+            if len(able) < 2:
+                raise ConstraintError(f"`{role}` 클래스를 맡을 수 있는 인원이 {len(able)}명뿐입니다. (최소 2명)")
+            if len(fixed) > 2:
+                raise ConstraintError(f"`{role}` 클래스로 고정된 인원이 {len(fixed)}명입니다: {self._describe(fixed)} (최대 2명)")
+            if len(able) == 2:
+                edges.append((able[0], able[1], f"`{role}` 가능 인원이 2명뿐이라"))
+            elif len(fixed) == 2:
+                edges.append((fixed[0], fixed[1], f"둘 다 `{role}` 고정이라"))
+
+        # ✅ 같은팀 묶음 (union-find)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for group in self.together:
+            rows = [self.index[name] for name in group]
+            for row in rows[1:]:
+                parent[find(row)] = find(rows[0])
+
+        blocks = {}
+        for i in range(n):
+            blocks.setdefault(find(i), []).append(i)
+        for members in blocks.values():
+            if len(members) > self.team_size:
+                raise ConstraintError(f"같은팀 조건으로 묶인 인원이 {len(members)}명입니다: {self._describe(members)} (최대 {self.team_size}명)")
+
+        # ✅ 다른팀 조건 → 묶음 간 2-색칠
+        neighbors = {root: [] for root in blocks}
+        for i, j, reason in edges:
+            a, b = find(i), find(j)
+            if a == b:
+                raise ConstraintError(f"{self._describe([i, j])} 님은 같은팀 조건으로 묶였지만, {reason} 다른 팀이어야 합니다.")
+            neighbors[a].append((b, i, j, reason))
+            neighbors[b].append((a, j, i, reason))
+
+        color = {}
+        pieces = []  # (한쪽 면 비트마스크, 반대쪽 면 비트마스크)
+        for start in blocks:
+            if start in color:
+                continue
+            color[start] = 0
+            sides = [0, 0]
+            queue = deque([start])
+            while queue:
+                root = queue.popleft()
+                for member in blocks[root]:
+                    sides[color[root]] |= 1 << member
+                for other, i, j, reason in neighbors[root]:
+                    if other not in color:
+                        color[other] = 1 - color[root]
+                        queue.append(other)
+                    elif color[other] == color[root]:
+                        raise ConstraintError(f"다른팀 조건이 서로 충돌합니다. ({self._describe([i, j])}: {reason} 다른 팀이어야 함)")
+            pieces.append(tuple(sides))
+
+        full = (1 << n) - 1
+        candidates = set()
+        for orientation in product((0, 1), repeat=len(pieces)):
+            mask = 0
+            for (side0, side1), flip in zip(pieces, orientation):
+                mask |= side1 if flip else side0
+            if bin(mask).count("1") == self.team_size:
+                candidates.add(mask)
+
+        if not candidates:
+            raise ConstraintError(f"같은팀/다른팀 조건으로는 {self.team_size}:{self.team_size} 인원을 맞출 수 없습니다.")
+
+        self.splits = set()
+        self.assignments = {}
+        for mask in candidates:
+            first = self._role_assignments(mask)
+            second = self._role_assignments(full ^ mask)
+            if first and second:
+                self.splits.add(mask)
+                self.assignments[mask] = first
+                self.assignments[full ^ mask] = second
+
+        if not self.splits:
+            raise ConstraintError("조건을 만족하면서 양 팀 모두 `드, 어, 넥, 슴`을 채울 수 있는 조합이 없습니다.")
+
+        logging.info(f"🧩 [팀 솔버] 팀 분할 후보 {len(candidates)}개 → 클래스 배정 가능 {len(self.splits)}개")
+        return self
+
+    def _role_assignments(self, mask):
+        """✅ 팀 비트마스크에 대해 가능한 클래스 배정을 모두 반환 (각 배정 = 드/어/넥/슴 순서의 유저 인덱스)"""
+        if mask in self.assignments:
+            return self.assignments[mask]
+        members = [i for i in range(len(self.players)) if mask >> i & 1]
+        results = []
+        for perm in permutations(range(len(ROLE_ORDER))):
+            if all(self.domains[members[k]] >> perm[k] & 1 for k in range(len(members))):
+                ordered = [0] * len(ROLE_ORDER)
+                for k, r in enumerate(perm):
+                    ordered[r] = members[k]
+                results.append(tuple(ordered))
+        return results
+
+    def team_mask(self, team):
+        """✅ Player 리스트 → 비트마스크"""
+        mask = 0
+        for p in team:
+            mask |= 1 << self.index[p.username]
+        return mask
+
+    def is_feasible(self, team1):
+        return self.team_mask(team1) in self.splits
+
+    def feasible_splits(self):
+        """✅ 가능한 모든 (팀1, 팀2) Player 리스트 (좌우 대칭 중복 제거)"""
+        full = (1 << len(self.players)) - 1
+        result = []
+        for mask in sorted(self.splits):
+            if mask > full ^ mask:
+                continue
+            team1 = [self.players[i] for i in range(len(self.players)) if mask >> i & 1]
+            team2 = [self.players[i] for i in range(len(self.players)) if not mask >> i & 1]
+            result.append((team1, team2))
+        return result
+
+    def assign_roles(self, team):
+        """✅ 가능한 클래스 배정 중 하나를 랜덤 선택 → `드,어,넥,슴` 순서의 [{"username", "class"}]"""
+        options = self.assignments.get(self.team_mask(team))
+        if not options:
+            return None
+        chosen = random.choice(options)
+        return [{"username": self.names[i], "class": ROLE_ORDER[r]} for r, i in enumerate(chosen)]
+
+    def lineup_gap(self, team1, team2):
+        """✅ 클래스 배정이 끝난 두 팀의 MMR 차이 (각 유저의 배정 클래스 MMR 합 기준)"""
+        return abs(sum(self.role_diffs(team1, team2)))
+
+    def role_diffs(self, team1, team2):
+        """✅ 클래스 배정이 끝난 두 팀(`드,어,넥,슴` 순서)의 클래스별 MMR 차이"""
+        return [
+            role_mmr(self.players[self.index[a["username"]]], a["class"])
+            - role_mmr(self.players[self.index[b["username"]]], b["class"])
+            for a, b in zip(team1, team2)
+        ]
+
+    def top_lineups(self, k, tiebreak=None, objective=None):
+        """
+        ✅ 균형이 좋은 순으로 서로 다른 팀 분할 상위 k개
+        - objective가 없으면 MMR 차이 기준: 양 팀 클래스 배정 합계를 정렬 후 이분 탐색으로 최소 차이 배정 선택
+        - objective(클래스별 MMR 차이 4개)가 있으면 모든 배정 조합 중 objective가 가장 작은 배정 선택 (예: 승률 예측)
+        - tiebreak(팀1 유저명, 팀2 유저명): 점수가 같을 때 비교할 보조 점수 (예: 반복 라인업 페널티)
+        - 반환: [(MMR 차이, 팀1, 팀2), ...] (팀 = `드,어,넥,슴` 순서의 [{"username", "class"}])
+        """
+        n = len(self.players)
+        full = (1 << n) - 1
+        roles = range(len(ROLE_ORDER))
+        mmr = [[role_mmr(p, role) for role in ROLE_ORDER] for p in self.players]
+
+        def totals(mask):
+            return sorted(
+                (sum(mmr[i][r] for r, i in enumerate(assignment)), assignment)
+                for assignment in self.assignments[mask]
+            )
+
+        ranked = []
+        for mask in self.splits:
+            if mask > full ^ mask:
+                continue
+
+            best = None
+            if objective is None:
+                first, second = totals(mask), totals(full ^ mask)
+                second_sums = [total for total, _ in second]
+                for total, assignment in first:
+                    pos = bisect.bisect_left(second_sums, total)
+                    for j in (pos - 1, pos):
+                        if 0 <= j < len(second):
+                            gap = abs(total - second_sums[j])
+                            if best is None or gap < best[0]:
+                                best = (round(gap, 1), gap, assignment, second[j][1])
+            else:
+                for assignment1 in self.assignments[mask]:
+                    for assignment2 in self.assignments[full ^ mask]:
+                        diffs = [mmr[assignment1[r]][r] - mmr[assignment2[r]][r] for r in roles]
+                        score = objective(diffs)
+                        if best is None or score < best[0]:
+                            best = (score, abs(sum(diffs)), assignment1, assignment2)
+
+            score, gap, assignment1, assignment2 = best
+            team1 = [{"username": self.names[i], "class": ROLE_ORDER[r]} for r, i in enumerate(assignment1)]
+            team2 = [{"username": self.names[i], "class": ROLE_ORDER[r]} for r, i in enumerate(assignment2)]
+            extra = tiebreak([p["username"] for p in team1], [p["username"] for p in team2]) if tiebreak else 0
+            ranked.append((score, extra, gap, team1, team2))
+
+        ranked.sort(key=lambda item: (item[0], item[1]))
+        logging.info(f"🏅 [상위 라인업] {len(ranked)}개 분할 중 상위 {min(k, len(ranked))}개 선택")
+        return [(gap, team1, team2) for _, _, gap, team1, team2 in ranked[:k]]
@@ -0,0 +1,55 @@
+import time
+import types
+
+import pytest
+
+
+class FakeChannel:
+    """✅ 보낸 메시지 내용을 모아두는 채널"""
+
+    def __init__(self, channel_id=1):
+        self.id = channel_id
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+        return types.SimpleNamespace(id=len(self.sent), channel=self, content=content)
+
+
+class FakeContext:
+    """✅ ctx.send 내용을 모아두는 명령어 컨텍스트 (DM 취급 → guild 없음)"""
+
+    def __init__(self, user_id, channel_id=1):
+        self.author = types.SimpleNamespace(id=user_id, display_name=f"유저{user_id}", mention=f"<@{user_id}>")
+        self.guild = None
+        self.channel = FakeChannel(channel_id)
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """✅ time.time()을 고정 — now[0]을 늘려서 시간을 진행"""
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def core(monkeypatch, tmp_path):
+    """✅ 상태 파일이 tmp_path에 생기도록 작업 디렉터리를 옮긴 뒤 bot 모듈을 불러옴"""
+    monkeypatch.chdir(tmp_path)
+    import bot
+    return bot
+
+
+@pytest.fixture
+def make_context():
+    return FakeContext
+
+
+@pytest.fixture
+def make_channel():
+    return FakeChannel
@@ -0,0 +1,87 @@
+import pytest
+
+from cache import SnapshotCache, WriteOutbox, format_age
+
+
+def test_store_and_lookup_by_action_and_key(clock):
+    cache = SnapshotCache()
+    cache.store({"action": "getSeasonList"}, {"seasons": ["s1"]})
+    cache.store({"action": "getUserInfo", "username": "a"}, {"username": "a"})
+    cache.store({"action": "getMatch", "game_number": 7}, {"game_number": 7})
+
+    clock[0] += 30
+    assert cache.lookup({"action": "getSeasonList"}) == ({"seasons": ["s1"]}, 30)
+    assert cache.lookup({"action": "getUserInfo", "username": "a"}) == ({"username": "a"}, 30)
+    assert cache.lookup({"action": "getUserInfo", "username": "b"}) is None
+    assert cache.lookup({"action": "getMatch", "game_number": 7})[0] == {"game_number": 7}
+
+
+def test_error_responses_are_not_stored():
+    cache = SnapshotCache()
+    cache.store({"action": "getSeasonList"}, {"error": "스크립트 오류"})
+    cache.store({"action": "getRecentMatches"}, ["not", "a", "dict"])
+    assert cache.entries == {} and not cache.dirty
+
+
+def test_players_are_stored_per_user_and_reassembled(clock):
+    cache = SnapshotCache()
+    cache.store({"action": "getPlayersInfo", "players": ["a", "b"]},
+                {"players": [{"username": "a", "mmr": 1}, {"username": "b", "mmr": 2}]})
+    clock[0] += 10
+    cache.store({"action": "getPlayersInfo", "players": ["c"]}, {"players": [{"username": "c", "mmr": 3}]})
+    clock[0] += 5
+
+    data, age = cache.lookup({"action": "getPlayersInfo", "players": ["c", "a"]})
+    assert [p["username"] for p in data["players"]] == ["c", "a"]
+    assert age == 15  # ✅ 가장 오래된 유저 기준
+    assert cache.lookup({"action": "getPlayersInfo", "players": ["a", "missing"]}) is None
+    assert cache.lookup({"action": "getPlayersInfo", "players": []}) is None
+
+
+def test_invalidate_and_patch_players():
+    cache = SnapshotCache()
+    cache.store({"action": "getPlayersInfo"}, {"players": [{"username": "a"}, {"username": "b"}]})
+    cache.store({"action": "getUserInfo", "username": "a"}, {"username": "a"})
+
+    assert cache.invalidate(["player:a", "nothing"]) == 1
+    assert cache.invalidate(prefix="user:") == 1
+    assert set(cache.entries) == {"player:b"}
+
+    cache.patch_players([{"username": "b", "mmr": 99}])
+    assert cache.lookup({"action": "getPlayersInfo", "players": ["b"]})[0] == {"players": [{"username": "b", "mmr": 99}]}
+
+
+def test_changes_are_written_only_by_save_if_dirty(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = SnapshotCache(str(path))
+    cache.store({"action": "getSeasonList"}, {"seasons": []})
+    assert cache.dirty and not path.exists()
+
+    cache.save_if_dirty()
+    assert not cache.dirty and path.exists()
+    assert SnapshotCache(str(path)).lookup({"action": "getSeasonList"})[0] == {"seasons": []}
+
+
+def test_failed_save_stays_dirty(tmp_path):
+    cache = SnapshotCache(str(tmp_path / "missing" / "cache.json"))
+    cache.store({"action": "getSeasonList"}, {"seasons": []})
+    cache.save_if_dirty()
+    assert cache.dirty
+
+
+def test_outbox_keeps_order_across_restart(tmp_path):
+    path = str(tmp_path / "outbox.json")
+    outbox = WriteOutbox(path)
+    outbox.add({"game_number": "1"})
+    outbox.add({"game_number": "2"})
+    assert outbox.pop() == {"game_number": "1"}
+
+    reloaded = WriteOutbox(path)
+    assert len(reloaded) == 1 and reloaded.peek() == {"game_number": "2"}
+
+
+@pytest.mark.parametrize("seconds, text", [
+    (30, "1분 미만"), (180, "3분"), (3600, "1시간"), (7500, "2시간 5분"), (86400 + 4 * 3600, "1일 4시간"),
+])
+def test_format_age(seconds, text):
+    assert format_age(seconds) == text
@@ -0,0 +1,33 @@
+import pytest
+
+import gas
+from cache import SnapshotCache
+from scheduler import BudgetExceeded
+
+
+@pytest.fixture
+def over_budget(monkeypatch):
+    def acquire(action):
+        raise BudgetExceeded("오늘 GAS 예산을 모두 사용했습니다.")
+
+    monkeypatch.setattr(gas.scheduler, "acquire", acquire)
+    monkeypatch.setattr(gas, "cache", SnapshotCache())
+    monkeypatch.setattr(gas, "degraded_since", None)
+
+
+def test_quota_exceeded_read_uses_cache_without_degrading(over_budget):
+    gas.cache.store({"action": "getSeasonList"}, {"seasons": ["s1"]})
+    data, age = gas.fetch({"action": "getSeasonList"})
+    assert data == {"seasons": ["s1"]} and age is not None
+    assert not gas.is_degraded()
+
+    with pytest.raises(gas.GasUnavailable):
+        gas.fetch({"action": "getRecentMatches"})  # ✅ 캐시도 없으면 읽기 실패로 안내
+    assert not gas.is_degraded()
+
+
+def test_quota_exceeded_write_is_not_a_connection_failure(over_budget):
+    with pytest.raises(gas.QuotaExceeded) as info:
+        gas.post({"action": "registerResult"})
+    assert isinstance(info.value, gas.GasError)
+    assert not isinstance(info.value, (gas.GasUnavailable, gas.requests.RequestException))
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from hedging import Hedger
+
+
+def warmed_hedger(seconds=0.02):
+    hedger = Hedger(min_samples=3, min_delay=0.01)
+    for _ in range(3):
+        hedger.stats["getBatch"].primary.add(seconds)
+    return hedger
+
+
+def test_hedge_win_records_censored_primary_latency():
+    hedger = warmed_hedger()
+    calls = []
+
+    async def attempt():
+        calls.append(len(calls))
+        await asyncio.sleep(10 if len(calls) == 1 else 0.01)  # ✅ 첫 요청만 콜드 스타트
+        return len(calls)
+
+    result = asyncio.run(hedger.run("getBatch", attempt, timeout=5))
+    stats = hedger.stats["getBatch"]
+    assert result == 2 and stats.hedge_wins == 1
+    assert len(stats.primary) == 4  # ✅ 진 첫 요청도 취소 시점까지의 지연으로 기록
+    assert stats.primary.samples[-1] == pytest.approx(stats.effective.samples[-1])
+    assert stats.primary.samples[-1] > 0.02
+
+
+def test_timeout_and_failure_still_record_primary_latency():
+    hedger = Hedger(min_samples=100)
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def failing():
+        raise RuntimeError("HTTP 500")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(hedger.run("getPlayersInfo", slow, timeout=0.05))
+    with pytest.raises(RuntimeError):
+        asyncio.run(hedger.run("getPlayersInfo", failing, timeout=1))
+    samples = list(hedger.stats["getPlayersInfo"].primary.samples)
+    assert len(samples) == 2 and samples[0] >= 0.05
@@ -0,0 +1,71 @@
+import asyncio
+import importlib
+
+import pytest
+
+import gas
+from records import Roster
+
+CHANNEL_ID = 4242
+ALL_CLASSES = 0b1111
+
+
+@pytest.fixture
+def lobby(core):
+    module = importlib.import_module("cogs.lobby")
+    yield module
+    for name in list(core.matchmaker.queue(CHANNEL_ID).entries):
+        core.matchmaker.leave(name)
+    core.account_links.unlink(1)
+    core.account_links.unlink(2)
+
+
+def test_failed_lobby_is_not_retried_until_queue_changes(core, lobby, monkeypatch, make_channel):
+    calls = []
+
+    async def get_players(names):
+        calls.append(names)
+        raise gas.GasUnavailable("GAS 응답 없음")
+
+    monkeypatch.setattr(lobby, "get_players", get_players)
+    channel = make_channel(CHANNEL_ID)
+
+    async def scenario():
+        for i in range(8):
+            core.matchmaker.join(CHANNEL_ID, f"p{i}", i, ALL_CLASSES)
+        lobby.schedule_lobby_refresh(channel)
+        await asyncio.sleep(0.05)
+        assert len(calls) == 1 and len(channel.sent) == 1  # ✅ 실패 후 같은 대기열로 다시 구성하지 않음
+        assert len(core.matchmaker.queue(CHANNEL_ID)) == 8
+
+        core.matchmaker.join(CHANNEL_ID, "p8", 8, ALL_CLASSES)
+        lobby.schedule_lobby_refresh(channel)  # ✅ 참가로 대기열이 바뀌면 한 번 더 시도
+        await asyncio.sleep(0.05)
+        assert len(calls) == 2 and len(channel.sent) == 2
+        core.lobby_refresh_tasks.pop(CHANNEL_ID).cancel()
+
+    asyncio.run(scenario())
+
+
+def test_players_act_only_on_their_linked_name(core, lobby, monkeypatch, make_context):
+    async def get_roster():
+        return Roster(frozenset({"본인", "남"}), {"본인": ["별명"]}, {"별명": "본인"}), None
+
+    monkeypatch.setattr(lobby, "get_roster", get_roster)
+    core.account_links.link(1, "본인")
+
+    async def scenario():
+        ctx = make_context(1)
+        assert await lobby.command_target(ctx, None) == "본인"
+        assert await lobby.command_target(ctx, "별명") == "별명"
+        assert await lobby.command_target(ctx, "남") is None
+        assert ctx.sent == [lobby.OTHER_PLAYER_MESSAGE]
+
+        unlinked = make_context(2)
+        assert await lobby.command_target(unlinked, None) is None
+        assert unlinked.sent == [lobby.NOT_LINKED_MESSAGE]
+
+        admin = make_context(next(iter(core.ALLOWED_USER_IDS)))
+        assert await lobby.command_target(admin, "남") == "남"
+
+    asyncio.run(scenario())
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from message_updates import MessageUpdater
+
+
+class FakeMessage:
+    def __init__(self, message_id, channel_id=1, fail=False):
+        self.id = message_id
+        self.channel = SimpleNamespace(id=channel_id)
+        self.fail = fail
+        self.edits = []
+
+    async def edit(self, **fields):
+        await asyncio.sleep(0)
+        self.edits.append(fields)
+        if self.fail:
+            raise RuntimeError("HTTP 500")
+
+
+def test_schedules_before_flush_coalesce_into_one_edit():
+    async def scenario():
+        updater = MessageUpdater()
+        message = FakeMessage(1)
+        updater.schedule(message, view="disabled")
+        updater.schedule(message, content="⏳ 생성 중")
+        await updater.edit(message, view="enabled")
+        return message.edits
+
+    assert asyncio.run(scenario()) == [{"view": "enabled", "content": "⏳ 생성 중"}]
+
+
+def test_edits_during_rate_limit_wait_merge_into_next_request():
+    async def scenario():
+        updater = MessageUpdater(count=1, seconds=0.2)
+        message = FakeMessage(1)
+        await updater.edit(message, content="1")  # ✅ 토큰 사용
+        second = asyncio.create_task(updater.edit(message, content="2"))
+        await asyncio.sleep(0.05)  # ✅ 버킷 대기 중
+        updater.schedule(message, content="3", view="v")
+        await second
+        return message.edits
+
+    assert asyncio.run(scenario()) == [{"content": "1"}, {"content": "3", "view": "v"}]
+
+
+def test_buckets_are_per_channel():
+    async def scenario():
+        updater = MessageUpdater(count=1, seconds=60)
+        first, other_channel = FakeMessage(1, channel_id=1), FakeMessage(2, channel_id=2)
+        await asyncio.wait_for(updater.edit(first, content="a"), 1)
+        await asyncio.wait_for(updater.edit(other_channel, content="b"), 1)  # ✅ 다른 채널은 기다리지 않음
+        return first.edits, other_channel.edits
+
+    assert asyncio.run(scenario()) == ([{"content": "a"}], [{"content": "b"}])
+
+
+def test_edit_raises_failure_to_waiters_only():
+    async def scenario():
+        updater = MessageUpdater()
+        message = FakeMessage(1, fail=True)
+        with pytest.raises(RuntimeError):
+            await updater.edit(message, content="x")
+        updater.schedule(message, content="y")  # ✅ 기다리는 쪽이 없으면 로그만 남김
+        await asyncio.sleep(0.01)
+        return message.edits, updater.tasks, updater.pending
+
+    edits, tasks, pending = asyncio.run(scenario())
+    assert edits == [{"content": "x"}, {"content": "y"}]
+    assert tasks == {} and pending == {}
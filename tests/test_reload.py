@@ -0,0 +1,45 @@
+import asyncio
+import sys
+
+
+def confirm_state():
+    return {"author_id": 1, "payload": {"action": "register"}, "success_message": "✅", "error_message": "🚨",
+            "payload_type": "generic", "game_number": None, "round_mode": 4}
+
+
+def test_reload_all_swaps_code_and_keeps_state(core, make_context):
+    async def scenario():
+        bot = core.bot
+        await core.load_extensions()
+        assert sorted(bot.cogs) == ["Core", "Diagnostics", "Info", "Lobby", "Maintenance", "Results", "Teams", "Users"]
+        assert sorted(command.name for command in bot.tree.get_commands()) == ["결과등록", "결과조회", "조회", "팀생성"]
+
+        views = sys.modules["views"]
+        core.view_store.put(111, 222, "confirm", confirm_state(), 600)
+        views.restore_views()
+        old_view = core.live_views[111]
+        old_results = bot.get_cog("Results")
+
+        ctx = make_context(next(iter(core.ALLOWED_USER_IDS)))
+        await core.리로드.callback(ctx, "전체")
+        assert "🚨" not in ctx.sent[-1]
+
+        # ✅ 버튼은 새 views 모듈의 클래스로 교체, 이전 View는 등록 해제
+        new_view = core.live_views[111]
+        assert type(new_view) is sys.modules["views"].ConfirmView
+        assert type(new_view) is not type(old_view)
+        assert old_view.is_finished()
+        assert bot._connection._view_store._synced_message_views[111] is new_view
+
+        # ✅ 리스너 / 체크 / Cog 작업은 중복 없이 새 Cog 것만 남음
+        assert {event: len(listeners) for event, listeners in bot.extra_events.items()} == {
+            "on_message": 1, "on_command_error": 1, "on_ready": 1}
+        assert len(bot._checks) == 1
+        assert bot.get_cog("Results") is not old_results
+        await asyncio.sleep(0)
+        assert old_results.outbox_task.cancelled()
+        assert bot.get_command("조회").cog is bot.get_cog("Users")
+
+        await bot.close()
+
+    asyncio.run(scenario())
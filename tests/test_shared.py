@@ -0,0 +1,21 @@
+import importlib
+
+from name_index import build_game_index
+
+
+def test_results_rewrite_resets_analytics(core, monkeypatch):
+    shared = importlib.import_module("shared")
+    refits = []
+    monkeypatch.setattr(shared, "schedule_predictor_refit", lambda: refits.append(True))
+    core.synergy_matrix.loaded = core.lineup_index.loaded = True
+    core.gas_cache.store({"action": "getMatch", "game_number": "250101120000"}, {"game_number": "250101120000"})
+    build_game_index(core.game_index, ["250101120000", "250102120000"], 1.0)
+
+    shared.on_results_rewritten(["250101120000"])
+    assert not core.synergy_matrix.loaded and not core.lineup_index.loaded
+    assert core.gas_cache.lookup({"action": "getMatch", "game_number": "250101120000"}) is None
+    assert [number for _, number in core.game_index.entries] == ["250102120000"]
+    assert core.game_index.version is None and refits == [True]
+
+    shared.on_results_rewritten()  # ✅ 백업 복구 → 게임번호 인덱스 전체를 다시 구성
+    assert len(core.game_index) == 0 and len(refits) == 2
@@ -0,0 +1,144 @@
+import pytest
+
+from records import Player, class_mask
+from team_solver import ROLE_ORDER, ConstraintError, TeamSolver, parse_constraints, role_mmr
+
+ALL_CLASSES = "드,어,넥,슴"
+
+
+def make_player(name, classes=ALL_CLASSES, mmr=1000.0, class_mmr=None):
+    class_mmr = tuple(class_mmr) if class_mmr else (mmr,) * len(ROLE_ORDER)
+    return Player(name, class_mask(classes), mmr, class_mmr, mmr)
+
+
+def make_players(count=8, classes=ALL_CLASSES):
+    return [make_player(f"p{i}", classes, 1000.0 + 100 * i) for i in range(count)]
+
+
+def sides(solver, mask):
+    return {name for i, name in enumerate(solver.names) if mask >> i & 1}
+
+
+def test_parse_constraints_splits_groups_and_pairs():
+    text, together, apart = parse_constraints("a/b/c 같은팀:a+b 다른팀:c+d+e")
+    assert together == [["a", "b"]]
+    assert apart == [("c", "d"), ("c", "e"), ("d", "e")]
+    assert "같은팀" not in text and "다른팀" not in text
+
+
+def test_parse_constraints_needs_two_names():
+    with pytest.raises(ConstraintError):
+        parse_constraints("같은팀:a")
+
+
+def test_together_players_share_every_split():
+    solver = TeamSolver(make_players(), together=[["p0", "p1", "p2"]]).propagate()
+    assert solver.splits
+    for mask in solver.splits:
+        team = sides(solver, mask)
+        assert {"p0", "p1", "p2"} <= team or not {"p0", "p1", "p2"} & team
+
+
+def test_apart_players_never_share_a_split():
+    solver = TeamSolver(make_players(), apart=[("p0", "p7")]).propagate()
+    assert solver.splits
+    for mask in solver.splits:
+        assert ("p0" in sides(solver, mask)) != ("p7" in sides(solver, mask))
+
+
+def test_scarce_role_forces_players_apart():
+    players = make_players(6, "어,넥,슴") + [make_player("d1", "드"), make_player("d2", "드")]
+    solver = TeamSolver(players).propagate()
+    for mask in solver.splits:
+        assert ("d1" in sides(solver, mask)) != ("d2" in sides(solver, mask))
+
+
+def test_role_overrides_limit_assignments():
+    players = make_players()
+    solver = TeamSolver(players, roles={"p0": ["넥"]}).propagate()
+    team1, _ = solver.feasible_splits()[0]
+    roles = solver.assign_roles(team1) or solver.assign_roles([p for p in players if p not in team1])
+    assert {"username": "p0", "class": "넥"} in roles
+
+
+@pytest.mark.parametrize("players, kwargs, message", [
+    (make_players(7), {}, "8명"),
+    (make_players(7, "어,넥,슴") + [make_player("d1", "드")], {}, "`드` 클래스를 맡을 수 있는 인원이 1명"),
+    (make_players(), {"together": [["p0", "p1"]], "apart": [("p0", "p1")]}, "같은팀 조건으로 묶였지만"),
+    (make_players(), {"together": [["p0", "p1", "p2", "p3", "p4"]]}, "최대 4명"),
+    (make_players(), {"apart": [("p0", "p1"), ("p1", "p2"), ("p0", "p2")]}, "충돌"),
+    (make_players(), {"together": [["p0", "nobody"]]}, "참가자 목록에 없습니다"),
+])
+def test_impossible_constraints_explain_why(players, kwargs, message):
+    with pytest.raises(ConstraintError, match=message):
+        TeamSolver(players, **kwargs).propagate()
+
+
+def mixed_players():
+    mmrs = [(1500, 1400, 1300, 1200), (1100, 1600, 1000, 1250), (900, 950, 1700, 1000), (1300, 1300, 1300, 1300),
+            (1000, 1200, 1100, 1400), (1250, 900, 1150, 1050), (800, 1000, 1200, 1600), (1400, 1100, 900, 1000)]
+    return [make_player(f"p{i}", class_mmr=values, mmr=sum(values) / 4) for i, values in enumerate(mmrs)]
+
+
+def brute_force_gaps(solver):
+    full = (1 << len(solver.players)) - 1
+    gaps = []
+    for mask in solver.splits:
+        if mask > full ^ mask:
+            continue
+        gaps.append(min(
+            abs(sum(role_mmr(solver.players[a1[r]], role) - role_mmr(solver.players[a2[r]], role) for r, role in enumerate(ROLE_ORDER)))
+            for a1 in solver.assignments[mask] for a2 in solver.assignments[full ^ mask]
+        ))
+    return sorted(gaps)
+
+
+def test_top_lineups_match_brute_force_order():
+    solver = TeamSolver(mixed_players()).propagate()
+    lineups = solver.top_lineups(5)
+    assert len(lineups) == 5
+    assert [round(gap, 6) for gap, _, _ in lineups] == [round(gap, 6) for gap in brute_force_gaps(solver)[:5]]
+    for gap, team1, team2 in lineups:
+        assert solver.lineup_gap(team1, team2) == pytest.approx(gap)
+        assert [p["class"] for p in team1] == ROLE_ORDER == [p["class"] for p in team2]
+
+
+def test_top_lineups_are_distinct_splits():
+    solver = TeamSolver(mixed_players()).propagate()
+    lineups = solver.top_lineups(100)
+    seen = {frozenset(frozenset(p["username"] for p in team) for team in (team1, team2)) for _, team1, team2 in lineups}
+    assert len(seen) == len(lineups) == len(solver.feasible_splits())
+
+
+def test_top_lineups_respect_constraints():
+    solver = TeamSolver(mixed_players(), together=[["p0", "p1"]], apart=[("p2", "p3")]).propagate()
+    for _, team1, team2 in solver.top_lineups(10):
+        names1 = {p["username"] for p in team1}
+        assert ("p0" in names1) == ("p1" in names1)
+        assert ("p2" in names1) != ("p3" in names1)
+
+
+def test_top_lineups_tiebreak_orders_equal_scores():
+    solver = TeamSolver(make_players(8)).propagate()  # ✅ 모든 클래스 MMR이 같아서 같은 점수가 많음
+    preferred = {"p0", "p4"}
+
+    def tiebreak(names1, names2):
+        return 0 if preferred <= set(names1) or preferred <= set(names2) else 1
+
+    best_gap, team1, team2 = solver.top_lineups(1, tiebreak=tiebreak)[0]
+    assert any(preferred <= {p["username"] for p in team} for team in (team1, team2))
+    assert best_gap == min(gap for gap, _, _ in solver.top_lineups(100))
+
+
+def test_top_lineups_use_objective_when_given():
+    solver = TeamSolver(mixed_players()).propagate()
+    objective_calls = []
+
+    def objective(diffs):
+        objective_calls.append(diffs)
+        return abs(diffs[0])  # ✅ 드 클래스 차이만 보는 목적 함수
+
+    lineups = solver.top_lineups(3, objective=objective)
+    assert objective_calls
+    scores = [abs(solver.role_diffs(team1, team2)[0]) for _, team1, team2 in lineups]
+    assert scores == sorted(scores)
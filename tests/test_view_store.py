@@ -0,0 +1,71 @@
+import json
+
+from view_store import ViewStore
+
+
+def test_put_evicts_oldest_past_max_live():
+    store = ViewStore(max_live=2)
+    assert store.put(1, 10, "confirm", {"n": 1}, ttl=60) == []
+    assert store.put(2, 10, "confirm", {"n": 2}, ttl=60) == []
+    evicted = store.put(3, 10, "team", {"n": 3}, ttl=60)
+    assert [message_id for message_id, _ in evicted] == [1]
+    assert evicted[0][1]["state"] == {"n": 1}
+    assert list(store.entries) == [2, 3]
+
+
+def test_put_again_refreshes_position():
+    store = ViewStore(max_live=2)
+    store.put(1, 10, "confirm", {}, ttl=60)
+    store.put(2, 10, "confirm", {}, ttl=60)
+    store.put(1, 10, "confirm", {"again": True}, ttl=60)
+    evicted = store.put(3, 10, "confirm", {}, ttl=60)
+    assert [message_id for message_id, _ in evicted] == [2]
+
+
+def test_pop_expired_respects_limit(clock):
+    store = ViewStore()
+    for message_id in range(5):
+        store.put(message_id, 10, "confirm", {}, ttl=10)
+    store.put(99, 10, "team", {}, ttl=1000)
+
+    clock[0] += 11
+    first = store.pop_expired(limit=3)
+    assert [message_id for message_id, _ in first] == [0, 1, 2]
+    second = store.pop_expired(limit=3)
+    assert [message_id for message_id, _ in second] == [3, 4]
+    assert store.pop_expired() == []
+    assert list(store.entries) == [99]
+
+
+def test_update_and_pop_mark_dirty():
+    store = ViewStore()
+    store.put(1, 10, "confirm", {"round_mode": 4}, ttl=60)
+    store.dirty = False
+    store.update(1, {"round_mode": 5})
+    assert store.dirty and store.entries[1]["state"] == {"round_mode": 5}
+
+    store.dirty = False
+    store.update(404, {})
+    assert not store.dirty
+    assert store.pop(1)["kind"] == "confirm"
+    assert store.dirty and store.pop(1) is None
+
+
+def test_save_and_reload_round_trip(tmp_path):
+    path = tmp_path / "views.json"
+    store = ViewStore(str(path))
+    store.put(123, 10, "team", {"players": ["a", "b"]}, ttl=60)
+    store.save_if_dirty()
+    assert not store.dirty
+
+    reloaded = ViewStore(str(path))
+    assert list(reloaded.entries) == [123]  # ✅ JSON 키(문자열) → 메시지 ID(int)
+    assert reloaded.entries[123]["state"] == {"players": ["a", "b"]}
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "views.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert len(ViewStore(str(path))) == 0
+    path.write_text(json.dumps([]), encoding="utf-8")
+    assert len(ViewStore(str(path))) == 0
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from aiohttp.test_utils import make_mocked_request
+
+import webhook
+
+SECRET = "비밀키"
+BODY = json.dumps({"sheet": "Players", "keys": ["유저1"]}, ensure_ascii=False).encode()
+NOW = 1_700_000_000
+
+
+def test_verify_accepts_matching_signature():
+    signature = webhook.sign(SECRET, str(NOW), BODY)
+    assert signature.startswith("sha256=")
+    assert webhook.verify(SECRET, str(NOW), signature, BODY, now=NOW)
+
+
+def test_verify_rejects_wrong_secret_or_tampered_body():
+    signature = webhook.sign(SECRET, str(NOW), BODY)
+    assert not webhook.verify("다른 키", str(NOW), signature, BODY, now=NOW)
+    assert not webhook.verify(SECRET, str(NOW), signature, BODY + b" ", now=NOW)
+    assert not webhook.verify(SECRET, str(NOW), None, BODY, now=NOW)
+
+
+def test_verify_rejects_signature_for_other_timestamp():
+    signature = webhook.sign(SECRET, str(NOW - 1), BODY)
+    assert not webhook.verify(SECRET, str(NOW), signature, BODY, now=NOW)
+
+
+def test_verify_allows_skew_up_to_limit():
+    for timestamp in (NOW - webhook.MAX_SKEW_SECONDS, NOW + webhook.MAX_SKEW_SECONDS):
+        signature = webhook.sign(SECRET, str(timestamp), BODY)
+        assert webhook.verify(SECRET, str(timestamp), signature, BODY, now=NOW)
+
+
+def test_verify_rejects_stale_or_future_timestamps():
+    for timestamp in (NOW - webhook.MAX_SKEW_SECONDS - 1, NOW + webhook.MAX_SKEW_SECONDS + 1):
+        signature = webhook.sign(SECRET, str(timestamp), BODY)
+        assert not webhook.verify(SECRET, str(timestamp), signature, BODY, now=NOW)
+
+
+def test_verify_rejects_malformed_timestamp():
+    assert not webhook.verify(SECRET, None, webhook.sign(SECRET, "", BODY), BODY, now=NOW)
+    assert not webhook.verify(SECRET, "어제", webhook.sign(SECRET, "어제", BODY), BODY, now=NOW)
+
+
+def post(server, body, timestamp, signature):
+    headers = {"X-Webhook-Timestamp": timestamp, "X-Webhook-Signature": signature}
+    request = make_mocked_request("POST", "/invalidate", headers=headers)
+    request.read = lambda: asyncio.sleep(0, result=body)
+    return asyncio.run(server.handle(request))
+
+
+def test_server_calls_handler_only_for_signed_requests():
+    calls = []
+    server = webhook.InvalidationServer(SECRET)
+    server.on("Players", lambda keys, rows: calls.append((keys, rows)))
+    timestamp = str(int(webhook.time.time()))
+
+    assert post(server, BODY, timestamp, "sha256=00").status == 401
+    assert calls == []
+
+    response = post(server, BODY, timestamp, webhook.sign(SECRET, timestamp, BODY))
+    assert response.status == 200
+    assert calls == [(["유저1"], [])]
@@ -0,0 +1,246 @@
+"""
+✅ 경량 트레이싱 (OpenTelemetry 스팬 모델 호환, 로컬 JSONL 파일로 내보내기)
+
+- 명령어 / 버튼 클릭 / GAS 요청 / 디스코드 REST 요청을 각각 스팬으로 기록하고 같은 trace_id로 묶는다
+- 현재 스팬은 contextvars로 전달 → 같은 태스크, create_task / asyncio.to_thread로 넘긴 작업까지 자동으로 부모-자식 연결
+- 버튼 클릭처럼 다른 태스크에서 이어지는 작업은 View가 저장해 둔 SpanContext를 parent로 넘겨 같은 트레이스에 연결
+- 종료된 스팬은 한 줄에 하나씩 OTLP JSON span 형식으로 저장 (traceId / spanId / parentSpanId / ...)
+
+사용 예: python tracing.py traces.jsonl --last 5   → 최근 트레이스 5개의 스팬 트리 + 구간별 소요 시간
+"""
+import argparse
+import contextvars
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+_exporter = None
+
+
+@dataclass(slots=True, frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str = ""
+    kind: str = "INTERNAL"
+    start_time_unix_nano: int = 0
+    end_time_unix_nano: int = 0
+    attributes: dict = field(default_factory=dict)
+    error: str = None
+
+    @property
+    def context(self):
+        return SpanContext(self.trace_id, self.span_id)
+
+    @property
+    def duration_ms(self):
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1e6
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_error(self, message):
+        self.error = str(message)
+
+    def to_otlp(self):
+        """✅ OTLP JSON(`resourceSpans[].scopeSpans[].spans[]`)의 span 객체 형식"""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": f"SPAN_KIND_{self.kind}",
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": (
+                {"code": "STATUS_CODE_ERROR", "message": self.error}
+                if self.error is not None else {"code": "STATUS_CODE_OK"}
+            ),
+        }
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class JsonlExporter:
+    """✅ 종료된 스팬을 JSONL 파일에 추가 (max_bytes를 넘으면 `.1`로 옮기고 새 파일 시작)"""
+
+    def __init__(self, path, max_bytes=20 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()  # ✅ asyncio.to_thread 작업의 스팬도 같은 파일에 기록
+
+    def export(self, span):
+        line = json.dumps(span.to_otlp(), ensure_ascii=False) + "\n"
+        with self._lock:
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def configure(path, max_bytes=20 * 1024 * 1024):
+    """✅ 내보낼 JSONL 파일 지정 (빈 값이면 스팬을 만들되 저장하지 않음)"""
+    global _exporter
+    _exporter = JsonlExporter(path, max_bytes) if path else None
+    logging.info(f"🧵 [트레이싱] {'→ ' + path if path else '내보내기 사용 안 함'}")
+
+
+def current_context():
+    """✅ 현재 스팬의 SpanContext (없으면 None) → 다른 태스크에서 parent로 사용"""
+    span = _current_span.get()
+    return span.context if span else None
+
+
+def start_span(name, kind="INTERNAL", parent=None, attributes=None):
+    """✅ 스팬 시작 + 현재 스팬으로 지정 → (span, token). 반드시 같은 컨텍스트에서 end_span 호출"""
+    parent = parent or current_context()
+    span = Span(
+        name,
+        parent.trace_id if parent else secrets.token_hex(16),
+        secrets.token_hex(8),
+        parent.span_id if parent else "",
+        kind,
+        time.time_ns(),
+        attributes=dict(attributes or {}),
+    )
+    return span, _current_span.set(span)
+
+
+def end_span(span, token, error=None):
+    span.end_time_unix_nano = time.time_ns()
+    if error is not None:
+        span.set_error(error)
+    try:
+        _current_span.reset(token)
+    except ValueError:  # ✅ 다른 컨텍스트에서 종료된 경우 (현재 스팬 복원만 생략)
+        pass
+    if _exporter is not None:
+        try:
+            _exporter.export(span)
+        except OSError as e:
+            logging.warning(f"⚠️ [트레이싱] 스팬 저장 실패: {e}")
+
+
+@contextmanager
+def span(name, kind="INTERNAL", parent=None, attributes=None):
+    """✅ with tracing.span("GAS getPlayersInfo", kind="CLIENT"): ... (예외 발생 시 ERROR 상태로 기록)"""
+    current, token = start_span(name, kind, parent, attributes)
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        end_span(current, token, error)
+
+
+def instrument_discord(http_client):
+    """
+    ✅ 디스코드 REST 요청을 CLIENT 스팬으로 기록
+    - 봇 토큰 요청(메시지 전송 / 수정 등): bot.http.request
+    - 인터랙션 응답 / 팔로업: 웹훅 어댑터 request
+    """
+    from discord.webhook.async_ import AsyncWebhookAdapter
+
+    def rest_span(route):
+        return span(f"Discord {route.method} {route.path}", kind="CLIENT",
+                    attributes={"http.method": route.method, "http.route": route.path})
+
+    http_request = http_client.request
+
+    async def request(route, **kwargs):
+        with rest_span(route):
+            return await http_request(route, **kwargs)
+
+    http_client.request = request
+
+    webhook_request = AsyncWebhookAdapter.request
+    if getattr(webhook_request, "__traced__", False):
+        return
+
+    async def traced_webhook_request(self, route, session, **kwargs):
+        with rest_span(route):
+            return await webhook_request(self, route, session, **kwargs)
+
+    traced_webhook_request.__traced__ = True
+    AsyncWebhookAdapter.request = traced_webhook_request
+
+
+def load_traces(path):
+    """✅ JSONL 파일 → {traceId: [span, ...]} (파일에 기록된 순서)"""
+    traces = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                traces[record["traceId"]].append(record)
+    return traces
+
+
+def format_trace(spans):
+    """✅ 한 트레이스의 스팬 트리 (시작 시각 순, 들여쓰기 = 깊이, 루트 시작 기준 오프셋 / 소요 시간)"""
+    by_id = {s["spanId"]: s for s in spans}
+    children = defaultdict(list)
+    roots = []
+    for s in sorted(spans, key=lambda s: int(s["startTimeUnixNano"])):
+        if s["parentSpanId"] in by_id:
+            children[s["parentSpanId"]].append(s)
+        else:
+            roots.append(s)
+
+    origin = min(int(s["startTimeUnixNano"]) for s in spans)
+    lines = []
+
+    def walk(s, depth):
+        start = (int(s["startTimeUnixNano"]) - origin) / 1e6
+        duration = (int(s["endTimeUnixNano"]) - int(s["startTimeUnixNano"])) / 1e6
+        error = " ❌" if s["status"]["code"] == "STATUS_CODE_ERROR" else ""
+        lines.append(f"{start:>9.1f}ms {duration:>9.1f}ms  {'  ' * depth}{s['name']}{error}")
+        for child in children[s["spanId"]]:
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트레이스 JSONL 파일 요약")
+    parser.add_argument("path", nargs="?", default="traces.jsonl")
+    parser.add_argument("--last", type=int, default=5, help="출력할 최근 트레이스 수")
+    args = parser.parse_args()
+
+    traces = list(load_traces(args.path).items())[-args.last:]
+    for trace_id, spans in traces:
+        print(f"🧵 trace {trace_id} (스팬 {len(spans)}개)")
+        print(f"{'시작':>11} {'소요':>11}  이름")
+        print(format_trace(spans))
+        print()
+
+
+if __name__ == "__main__":
+    main()
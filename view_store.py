@@ -0,0 +1,83 @@
+"""
+✅ 버튼 / 선택 메뉴 상태 저장소 (재시작 후에도 확인 대기 중인 버튼이 동작하도록)
+
+- 메시지 ID → {종류, 채널 ID, 만료 시각, 상태} (OrderedDict, 등록 순서 = 오래된 순)
+- 봇은 시작할 때 저장된 상태로 View를 다시 만들어 같은 메시지 ID / custom_id로 등록
+- 살아 있는 View 수 상한(max_live): 넘치면 가장 오래된 항목부터 꺼내서 돌려줌 → 호출하는 쪽에서 버튼 제거
+- pop_expired(limit): 만료된 항목을 한 번에 최대 limit개만 꺼냄 (주기 정리 작업이 한 번에 오래 걸리지 않도록)
+- 항목이 바뀌면 dirty 표시 → save_if_dirty()로 저장 (임시 파일 → 교체)
+"""
+import collections
+import json
+import logging
+import os
+import time
+
+
+class ViewStore:
+    def __init__(self, path=None, max_live=200):
+        self.path = path
+        self.max_live = max_live
+        self.entries = collections.OrderedDict()  # 메시지 ID → {"kind", "channel_id", "expires_at", "state"}
+        self.dirty = False
+        self._load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def put(self, message_id, channel_id, kind, state, ttl):
+        """✅ 저장 → 상한을 넘어 밀려난 [(메시지 ID, 항목), ...]"""
+        self.entries[message_id] = {
+            "kind": kind, "channel_id": channel_id, "expires_at": time.time() + ttl, "state": state,
+        }
+        self.entries.move_to_end(message_id)
+        self.dirty = True
+
+        evicted = []
+        while len(self.entries) > self.max_live:
+            evicted.append(self.entries.popitem(last=False))
+        return evicted
+
+    def update(self, message_id, state):
+        entry = self.entries.get(message_id)
+        if entry is not None:
+            entry["state"] = state
+            self.dirty = True
+
+    def pop(self, message_id):
+        entry = self.entries.pop(message_id, None)
+        if entry is not None:
+            self.dirty = True
+        return entry
+
+    def pop_expired(self, limit=50):
+        """✅ 만료된 항목을 최대 limit개 꺼냄 → [(메시지 ID, 항목), ...]"""
+        now = time.time()
+        expired = [message_id for message_id, entry in self.entries.items() if entry["expires_at"] <= now][:limit]
+        return [(message_id, self.pop(message_id)) for message_id in expired]
+
+    def save_if_dirty(self):
+        if not self.dirty or not self.path:
+            return
+        data = [[message_id, entry] for message_id, entry in self.entries.items()]
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logging.warning(f"⚠️ [버튼 상태] 저장 실패: {e}")
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ [버튼 상태] `{self.path}` 읽기 실패, 빈 상태로 시작: {e}")
+            return
+        for message_id, entry in data:
+            self.entries[int(message_id)] = entry
+        logging.info(f"🧷 [버튼 상태] {len(self.entries)}개 불러옴")
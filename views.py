@@ -0,0 +1,756 @@
+"""
+✅ 확인 / 복구 / 팀 생성 버튼 View (재시작 후 복원, `!리로드 전체` 후 새 코드의 View로 교체)
+
+- send_view()로 보낸 메시지의 View 상태는 view_store에 저장 (메시지 ID → kind / 상태 / 만료 시각)
+- restore_views(): 저장된 상태로 View를 다시 만들어 같은 메시지에 등록 (시작할 때, 이 모듈을 리로드한 뒤)
+"""
+import asyncio
+import json
+import logging
+import re
+import time
+
+import discord
+import requests
+
+import gas
+import tracing
+from records import CLASS_ORDER, decode_players
+from team_solver import ADVANCED_PATTERNS, GENERAL_PATTERNS, ConstraintError, TeamSolver, pick_by_penalty, split_by_pattern
+from bot import (CONFIRM_VIEW_TTL, MAX_LIVE_VIEWS, REMATCH_PENALTY_WEIGHT, RESULT_WRITE_ACTIONS, SYNERGY_PENALTY_WEIGHT,
+                 TEAM_VIEW_TTL, TOP_K_LINEUPS, VIEW_SWEEP_BATCH, VIEW_SWEEP_INTERVAL, bot, lineup_index, live_views,
+                 message_updates, replica, result_outbox, synergy_matrix, view_store, win_predictor)
+from shared import (GAS_UNAVAILABLE_MESSAGE, ensure_lineup_index_loaded, ensure_synergy_loaded, format_win_probability,
+                    link_registered_user, on_result_registered, on_results_rewritten, post_result_write, stale_notice,
+                    traced_interaction)
+
+
+class DurableView(discord.ui.View):
+    """
+    ✅ 재시작 후에도 동작하는 View (모든 항목에 고정 custom_id, 상태는 view_store에 저장)
+    - send_view()로 보낸 메시지만 저장 / 복원, stop()하면 저장된 상태도 삭제
+    - 유효 시간(ttl)이 지나면 정리 작업(sweep_views)이 메시지의 버튼을 제거
+    """
+    kind = None
+    ttl = CONFIRM_VIEW_TTL
+
+    def __init__(self):
+        super().__init__(timeout=None)
+        self.message_id = None
+
+    def to_state(self):
+        raise NotImplementedError
+
+    def save_state(self):
+        """✅ 상태가 바뀐 뒤 저장 (선승 모드 변경, 상태 메시지 생성 등)"""
+        if self.message_id is not None:
+            view_store.update(self.message_id, self.to_state())
+            view_store.save_if_dirty()
+
+    def stop(self):
+        super().stop()
+        if self.message_id is not None:
+            live = live_views.pop(self.message_id, None)
+            if live is not None and live is not self:
+                discord.ui.View.stop(live)  # ✅ 처리 중에 리로드로 교체된 View도 함께 정리
+            if view_store.pop(self.message_id) is not None:
+                view_store.save_if_dirty()
+
+
+def track_view(view, message):
+    """✅ 보낸 메시지의 View 상태 저장 (상한을 넘으면 가장 오래된 View부터 만료)"""
+    view.message_id = message.id
+    live_views[message.id] = view
+    for message_id, entry in view_store.put(message.id, message.channel.id, view.kind, view.to_state(), view.ttl):
+        logging.info(f"🧷 [버튼 상태] 상한 {MAX_LIVE_VIEWS}개 초과 → 메시지 {message_id} 버튼 만료")
+        retire_view(message_id, entry)
+    view_store.save_if_dirty()
+
+
+async def send_view(destination, content, view, **kwargs):
+    """✅ DurableView가 달린 메시지 전송 + 상태 저장 (재시작 후 복원 대상)"""
+    message = await destination.send(content, view=view, **kwargs)
+    track_view(view, message)
+    return message
+
+
+def retire_view(message_id, entry):
+    """✅ 만료 / 상한 초과로 꺼낸 View 정리: 메모리에서 제거하고 메시지의 버튼 제거"""
+    view = live_views.pop(message_id, None)
+    if view is not None:
+        discord.ui.View.stop(view)
+    channel = bot.get_partial_messageable(entry["channel_id"])
+    message_updates.schedule(channel.get_partial_message(message_id), view=None)
+
+
+class ConfirmView(DurableView):
+    kind = "confirm"
+
+    def __init__(self, ctx, payload, success_message, error_message, payload_type="generic", game_number=None, round_mode=4,
+                 author_id=None, link_user_id=None):
+        super().__init__()
+        self.author_id = ctx.author.id if ctx is not None else author_id  # ✅ 버튼을 누를 수 있는 유저 (명령어 실행자)
+        self.link_user_id = link_user_id  # ✅ 새 유저 등록 성공 시 유저명과 연결할 디스코드 계정 (본인 등록일 때만)
+        self.payload = payload
+        self.success_message = success_message
+        self.error_message = error_message
+        self.payload_type = payload_type
+        self.game_number = game_number
+        self.round_mode = round_mode
+        self._has_been_clicked = False
+        self.trace_parent = tracing.current_context()
+
+        self.is_best_of_three = round_mode == 3
+        self.is_best_of_four = round_mode == 4
+        self.is_best_of_five = round_mode == 5
+
+        logging.basicConfig(level=logging.DEBUG)
+        logging.info(f"📌 ConfirmView 생성됨 (Payload: {self.payload}, PayloadType: {self.payload_type})")
+
+        # ✅ payload_type이 "game_result"일 때만 선승 모드 토글 버튼 추가
+        if self.payload_type == "game_result":
+            self.add_item(self.ToggleRoundModeButton(self))  # ✅ (self) 넘겨줌
+
+    def to_state(self):
+        success_message = self.success_message
+        if callable(success_message):
+            success_message = success_message(self.game_number)
+        return {
+            "author_id": self.author_id, "payload": self.payload, "success_message": success_message,
+            "error_message": self.error_message, "payload_type": self.payload_type,
+            "game_number": self.game_number, "round_mode": self.round_mode, "link_user_id": self.link_user_id,
+        }
+
+    @classmethod
+    def from_state(cls, state, channel_id, message_id):
+        return cls(None, state["payload"], state["success_message"], state["error_message"], state["payload_type"],
+                   state["game_number"], state["round_mode"], author_id=state["author_id"],
+                   link_user_id=state.get("link_user_id"))
+
+    class ToggleRoundModeButton(discord.ui.Button):
+        def __init__(self, view):
+            round_mode = view.round_mode  # ✅ view로부터 현재 round_mode 받아옴
+
+            super().__init__(
+                label=f"🔁 선승 모드 (현재: {round_mode}선승)",
+                style={
+                    3: discord.ButtonStyle.blurple,
+                    4: discord.ButtonStyle.grey,
+                    5: discord.ButtonStyle.green
+                }.get(round_mode, discord.ButtonStyle.grey),
+                row=0,
+                custom_id="confirm_round_mode"
+            )
+
+        async def callback(self, interaction: discord.Interaction):
+            view = self.view
+            if not hasattr(view, "round_mode"):
+                view.round_mode = 4
+            else:
+                view.round_mode = {3: 4, 4: 5, 5: 3}[view.round_mode]
+
+            view.is_best_of_three = view.round_mode == 3
+            view.is_best_of_four = view.round_mode == 4
+            view.is_best_of_five = view.round_mode == 5
+
+            self.label = f"🔁 선승 모드 (현재: {view.round_mode}선승)"
+            self.style = {
+                3: discord.ButtonStyle.blurple,
+                4: discord.ButtonStyle.grey,
+                5: discord.ButtonStyle.green
+            }[view.round_mode]
+
+            await interaction.response.edit_message(view=view)
+            view.save_state()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        logging.debug(f"👤 [확인] {interaction.user} 가 버튼 클릭 (입력한 유저 ID: {self.author_id})")
+        is_author = interaction.user.id == self.author_id
+        if not is_author:
+            await interaction.response.send_message("❌ 당신은 이 요청을 보낸 유저가 아닙니다.", ephemeral=True)
+            return False
+
+        # ✅ 확인 버튼이 눌릴 때만 _has_been_clicked 확인
+        if interaction.data["custom_id"] == self.confirm.custom_id:
+            if self._has_been_clicked:
+                await interaction.response.send_message("⚠️ 이미 처리 중입니다!", ephemeral=True)
+                return False
+
+        return True
+
+    async def send_followup(self, interaction: discord.Interaction, message: str):
+        """✅ 처리 중 메시지 전송"""
+        logging.debug(f"⏳ [처리 중] {message}")
+        return await interaction.followup.send(f"⌛ {message} 잠시만 기다려주세요!")
+
+    def extract_game_number(self, response_text: str) -> str:
+        """✅ GAS 응답에서 게임번호 추출 (JSON or 정규식)"""
+        logging.debug(f"📥 [응답 분석] 원본 응답: {response_text}")
+        try:
+            data = json.loads(response_text.strip().strip('"'))
+            return data.get("game_number", "알 수 없음")
+        except json.JSONDecodeError:
+            match = re.search(r"게임번호:\s*(\d+)", response_text)
+            return match.group(1) if match else "알 수 없음"
+
+    @discord.ui.button(label="✅ 확인", style=discord.ButtonStyle.green, custom_id="confirm_button")
+    @traced_interaction("버튼 확인")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # ✅ 인터랙션 응답 + 버튼 비활성화를 요청 한 번으로
+        for child in self.children:
+            if isinstance(child, discord.ui.Button):
+                child.disabled = True
+        await interaction.response.edit_message(view=self)
+
+        followup_message = await self.send_followup(interaction, "처리 중입니다.")
+
+        try:
+            # ✅ game_result 타입일 때만 선승모드 스코어 검사
+            if self.payload_type == "game_result":
+                win_score = self.payload.get("win_score", 0)
+                lose_score = self.payload.get("lose_score", 0)
+                total_score = win_score + lose_score
+                max_score = self.round_mode
+
+                # ✅ 콜드게임 예외 처리 (4선승 모드 + 3:0 or 0:3)
+                is_cold_game = (
+                        max_score == 4 and
+                        ((win_score == 3 and lose_score == 0) or (win_score == 0 and lose_score == 3))
+                )
+
+                if (win_score != max_score or lose_score >= max_score) and not is_cold_game:
+                    raise Exception(f"{max_score}선승 모드: 승리팀은 {max_score}점, 패배팀은 0~{max_score - 1}점이어야 합니다.")
+                if total_score > max_score + (max_score - 1) and not is_cold_game:
+                    raise Exception(
+                        f"{max_score}선승 모드: 양 팀 합계는 최대 {max_score}:{max_score - 1}로, 총 {max_score + (max_score - 1)}점을 초과할 수 없습니다.")
+
+            # ✅ 정상 요청 처리
+            logging.info(f"🚀 [요청 전송] Payload: {self.payload}")
+            async def notify_wait():
+                message_updates.schedule(followup_message, content="⏳ **MMR 갱신이 진행 중입니다. 끝나는 대로 처리합니다...**")
+
+            try:
+                if self.payload.get("action") in RESULT_WRITE_ACTIONS:
+                    response = await post_result_write(self.payload, notify_wait)
+                else:
+                    response = await asyncio.to_thread(gas.post, self.payload)
+                failure = None if response.status_code == 200 else f"응답 코드 {response.status_code}"
+            except requests.RequestException as e:  # ✅ 일일 예산 초과(gas.QuotaExceeded)는 장애가 아니므로 아래 오류 안내로
+                failure = str(e)
+
+            # ✅ GAS 장애 중 경기 결과는 보관해 두었다가 복구되면 자동 등록
+            if failure and self.payload_type == "game_result":
+                gas.mark_failed(failure)
+                result_outbox.add(self.payload)
+                await message_updates.edit(
+                    followup_message,
+                    content=f"📥 **GAS 서버가 응답하지 않아 경기 결과를 보관했습니다.** (대기 {len(result_outbox)}건)\n"
+                            f"GAS가 복구되면 자동으로 등록됩니다. (게임번호: `{self.payload.get('game_number')}`)",
+                    view=None
+                )
+                self.stop()
+                return
+            if failure:
+                raise requests.HTTPError(failure)
+
+            response_text = response.text.strip().strip('"')
+            try:
+                data = json.loads(response_text)
+                if "error" in data:
+                    raise Exception(data["error"])
+            except json.JSONDecodeError:
+                data = {}
+
+            if self.payload_type == "game_result":
+                game_number = self.extract_game_number(response_text)
+                message = self.success_message(game_number) if callable(self.success_message) else self.success_message
+                on_result_registered(self.payload)
+            else:
+                message = self.success_message
+                if self.payload.get("action") in RESULT_WRITE_ACTIONS:
+                    on_results_rewritten()  # ✅ restoreLastBackup 등
+                if self.link_user_id is not None and self.link_user_id == interaction.user.id:
+                    message += link_registered_user(interaction.user, interaction.guild, self.payload["username"])
+
+            await message_updates.edit(followup_message, content=message, view=None,
+                                       allowed_mentions=discord.AllowedMentions.none())
+
+        except (requests.RequestException, Exception) as e:
+            await message_updates.edit(followup_message, content=f"🚨 {self.error_message}\n오류: {str(e)}", view=None)
+
+        self.stop()
+
+    @discord.ui.button(label="❌ 취소", style=discord.ButtonStyle.red, custom_id="confirm_cancel")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """❌ 취소 버튼을 눌렀을 때 실행"""
+        logging.info(f"🚫 [취소] {interaction.user} 님이 요청을 취소함")
+
+        # 🔒 버튼 비활성화를 인터랙션 응답으로 (요청 한 번)
+        for child in self.children:
+            if isinstance(child, discord.ui.Button):
+                child.disabled = True
+        await interaction.response.edit_message(view=self)
+
+        await interaction.followup.send("🚫 작업이 취소되었습니다.", ephemeral=True)
+        self.stop()
+
+
+class RollbackSelectView(DurableView):
+    kind = "rollback_select"
+
+    def __init__(self, ctx, options, author_id=None):
+        super().__init__()
+        self.author_id = ctx.author.id if ctx is not None else author_id
+        self.add_item(RollbackSelectMenu(options, self))
+
+    def to_state(self):
+        menu = self.children[0]
+        return {"author_id": self.author_id,
+                "options": [[option.label, option.value, option.description] for option in menu.options]}
+
+    @classmethod
+    def from_state(cls, state, channel_id, message_id):
+        options = [discord.SelectOption(label=label, value=value, description=description)
+                   for label, value, description in state["options"]]
+        return cls(None, options, author_id=state["author_id"])
+
+
+class RollbackSelectMenu(discord.ui.Select):
+    def __init__(self, options, parent_view):
+        super().__init__(placeholder="🔽 복구할 백업 파일을 선택하세요!", min_values=1, max_values=1, options=options,
+                         custom_id="rollback_select")
+        self.parent_view = parent_view
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        if interaction.user.id != self.parent_view.author_id:
+            await interaction.followup.send("❌ 당신은 이 작업을 요청한 유저가 아닙니다.", ephemeral=True)
+            return
+
+        file_id = self.values[0]
+        file_name = next((opt.label for opt in self.options if opt.value == file_id), "알 수 없음")
+
+        # ✅ 복구 확인 메시지
+        confirm_msg = f"⚠️ `{file_name}` 파일로 복구하시겠습니까?"
+
+        view = ConfirmRollbackView(self.parent_view.author_id, file_id, file_name)
+        await send_view(interaction.followup, confirm_msg, view)
+        self.parent_view.stop()
+
+
+class ConfirmRollbackView(DurableView):
+    kind = "rollback_confirm"
+
+    def __init__(self, author_id, file_id, file_name):
+        super().__init__()
+        self.author_id = author_id
+        self.file_id = file_id
+        self.file_name = file_name
+        self.trace_parent = tracing.current_context()
+
+    def to_state(self):
+        return {"author_id": self.author_id, "file_id": self.file_id, "file_name": self.file_name}
+
+    @classmethod
+    def from_state(cls, state, channel_id, message_id):
+        return cls(state["author_id"], state["file_id"], state["file_name"])
+
+    @discord.ui.button(label="✅ 복구", style=discord.ButtonStyle.green, custom_id="rollback_confirm")
+    @traced_interaction("버튼 복구")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("❌ 당신은 이 작업을 요청한 유저가 아닙니다.", ephemeral=True)
+            return
+
+        # 🔄 로딩 메시지 출력 전 버튼 비활성화 (인터랙션 응답 + 버튼 비활성화를 요청 한 번으로)
+        for child in self.children:
+            if isinstance(child, discord.ui.Button):
+                child.disabled = True
+        await interaction.response.edit_message(view=self)
+
+        # 🔄 로딩 메시지
+        loading_msg = await interaction.followup.send("🔄 복구 중입니다... 잠시만 기다려주세요!")
+
+        # 🛰️ 복구 요청
+        logging.info(f"📂 복구 확정됨 → file_id: {self.file_id}")
+        try:
+            response = await post_result_write({
+                "action": "restoreFromFile",
+                "file_id": self.file_id
+            })
+
+            if response.status_code == 200 and "success" in response.text:
+                on_results_rewritten()
+                await loading_msg.edit(content=f"✅ **복구 완료!** `{self.file_name}` 로 되돌렸습니다.")
+            else:
+                await loading_msg.edit(content=f"🚨 복구 실패! 서버 응답: {response.text}")
+
+        except Exception as e:
+            await loading_msg.edit(content=f"🚨 복구 중 예외 발생: {e}")
+
+        self.stop()
+
+    @discord.ui.button(label="❌ 취소", style=discord.ButtonStyle.red, custom_id="rollback_cancel")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_message("🚫 복구 작업이 취소되었습니다.", ephemeral=True)
+        self.stop()
+
+
+class TeamGenerationView(DurableView):
+    kind = "team"
+    ttl = TEAM_VIEW_TTL
+
+    def __init__(self, ctx, players, parsed_classes, together=None, apart=None, players_data=None, stale_age=None):
+        super().__init__()
+        self.ctx = ctx
+        self.players = players
+        self.parsed_players = parsed_classes
+        self.together = together or []  # ✅ 같은팀 조건 [[유저명, ...], ...]
+        self.apart = apart or []  # ✅ 다른팀 조건 [(유저명, 유저명), ...]
+        self.team1 = []
+        self.team2 = []
+        self.used_fallback = False  # ✅ 제약 조건 때문에 기본 규칙 밖의 조합을 썼는지 여부
+        self.players_data = None  # ✅ 한 번만 가져온 GAS 유저 정보 (MIX 재클릭 시 재사용)
+        self.prefetched = players_data  # ✅ 명령어에서 Roster와 함께 받아 둔 유저 정보 (있으면 GAS 요청 생략)
+        self.solver = None
+        self.constraint_error = None
+        self.alternatives = []  # ✅ MMR 차이 순 상위 K개 라인업 [(MMR 차이, 팀1, 팀2)]
+        self.alternative_index = -1
+        self._prepare_task = None
+        self.trace_parent = tracing.current_context()
+        self.stale_age = stale_age  # ✅ GAS 장애로 캐시된 유저 정보를 쓰는 경우 저장 후 경과 초
+        self.message = None  # ✅ 기존 메시지를 저장할 변수 추가
+        self.status_message = None  # ✅ "팀 생성 중..." 메시지 저장 변수
+
+    def to_state(self):
+        """✅ 입력 조건만 저장 (유저 정보 / 추천 조합은 복원 후 첫 클릭에서 다시 계산)"""
+        return {
+            "players": self.players, "parsed_players": self.parsed_players,
+            "together": self.together, "apart": [list(pair) for pair in self.apart],
+            "status_message_id": self.status_message.id if self.status_message else None,
+        }
+
+    @classmethod
+    def from_state(cls, state, channel_id, message_id):
+        channel = bot.get_partial_messageable(channel_id)
+        view = cls(channel, state["players"], state["parsed_players"], state["together"],
+                   [tuple(pair) for pair in state["apart"]])
+        view.message = channel.get_partial_message(message_id)
+        if state["status_message_id"]:
+            view.status_message = channel.get_partial_message(state["status_message_id"])
+        return view
+
+    async def get_player_data(self):
+        """GAS에서 유저 정보 가져오기 (비동기 방식)"""
+        if self.prefetched is not None:
+            players, self.prefetched = self.prefetched, None
+            return players
+
+        logging.info(f"📡 [GAS 요청] 유저 정보 요청: {self.players}")
+
+        try:
+            if await replica.sync():
+                players, self.stale_age = replica.players_for(self.players), replica.stale_age
+            else:
+                payload = {"action": "getPlayersInfo", "players": self.players}
+                data, self.stale_age = await gas.fetch_async(payload, timeout=gas.READ_TIMEOUT)
+                if "error" in data:
+                    await self.ctx.send(f"🚨 {data['error']}")
+                    return None
+                players = decode_players(data)
+            logging.info(f"✅ [GAS 응답] 성공: {[(p.username, p.mmr) for p in players]}")
+            return players
+        except gas.GasUnavailable as e:
+            logging.warning(f"⚠ [GAS 응답] 실패 (캐시 없음): {e}")
+            await self.ctx.send(GAS_UNAVAILABLE_MESSAGE)
+            return None
+        except Exception as e:
+            logging.error(f"🚨 GAS 요청 실패: {e}")
+            await self.ctx.send(f"🚨 GAS 요청 중 오류 발생: {e}")
+            return None
+
+    def apply_effective_mmr(self, players_data):
+        """유저가 지정한 클래스(`유저(드,넥)`)가 있으면 해당 클래스 MMR 평균을 적용"""
+        for p in players_data:
+            preferred = self.parsed_players.get(p.username)  # 예: ["드", "넥"]
+            mmrs = [p.class_mmr[CLASS_ORDER.index(c)] for c in preferred or [] if c in CLASS_ORDER]
+            p.effective_mmr = sum(mmrs) / len(mmrs) if mmrs else p.mmr
+
+        players_data.sort(key=lambda x: x.effective_mmr, reverse=True)  # MMR 정렬
+
+    def pick_teams(self, candidates, solver):
+        """
+        ✅ 규칙별 후보 중 제약 조건을 만족하는 조합을 선택
+        - 만족하는 후보가 없으면 제약 조건을 만족하는 전체 조합 중 MMR 차이가 가장 작은 조합 사용
+        """
+        feasible = [(t1, t2) for t1, t2 in candidates if solver.is_feasible(t1)]
+        logging.info(f"🧩 [제약 조건 필터] 후보 {len(candidates)}개 → {len(feasible)}개")
+
+        self.used_fallback = not feasible
+        if not feasible:
+            def mmr_gap(split):
+                return abs(sum(p.effective_mmr for p in split[0]) - sum(p.effective_mmr for p in split[1]))
+
+            splits = solver.feasible_splits()
+            best_gap = min(mmr_gap(split) for split in splits)
+            feasible = [split for split in splits if mmr_gap(split) == best_gap]
+            logging.info(f"⚠️ [제약 조건 우선] 기본 규칙 후보 없음 → MMR 차이 {best_gap:.1f} 조합 사용")
+
+        # ✅ 시너지 불균형 + 최근 같은 팀 반복 페널티로 가중 랜덤 선택 (가중치 0이면 균등 랜덤)
+        synergy = synergy_matrix.synergy() if SYNERGY_PENALTY_WEIGHT > 0 and synergy_matrix.loaded else None
+        penalties = []
+        for t1, t2 in feasible:
+            names1, names2 = [p.username for p in t1], [p.username for p in t2]
+            penalty = 0.0
+            if synergy is not None:
+                penalty += SYNERGY_PENALTY_WEIGHT * synergy_matrix.balance_penalty(names1, names2, synergy)
+            if REMATCH_PENALTY_WEIGHT > 0:
+                penalty += REMATCH_PENALTY_WEIGHT * lineup_index.penalty(names1, names2)
+            penalties.append(penalty)
+
+        logging.info(f"🎯 [후보 페널티] {sorted(penalties)[:5]} ... (후보 {len(feasible)}개)")
+        self.team1, self.team2 = pick_by_penalty(feasible, penalties)
+
+    def generate_teams(self, players_data, solver):
+        """MMR 기반 팀 생성 (일반 방식)"""
+        self.apply_effective_mmr(players_data)
+        logging.info(f"📊 [MMR 정렬] 유저 데이터: {[(p.username, p.effective_mmr) for p in players_data]}")
+
+        # ✅ 상위 4명 중 2명 + 하위 4명 중 2명 조합
+        candidates = [split_by_pattern(players_data, pattern) for pattern in GENERAL_PATTERNS]
+
+        self.pick_teams(candidates, solver)
+
+        logging.info(f"🔴 [팀1] {self.team1}")
+        logging.info(f"🔵 [팀2] {self.team2}")
+
+    def generate_teams_advanced(self, players_data, solver):
+        """MMR 기반 팀 생성 (고급 방식)"""
+        self.apply_effective_mmr(players_data)
+        logging.info(f"📊 [고급 MMR 정렬] 유저 데이터: {[(p.username, p.mmr) for p in players_data]}")
+
+        # ✅ MMR 순위에 따른 고정 팀 배정 (2 to 1)
+        candidates = [split_by_pattern(players_data, pattern) for pattern in ADVANCED_PATTERNS]
+
+        self.pick_teams(candidates, solver)
+
+        logging.info(f"🎲 [고급 랜덤 배정] 팀1: {self.team1}, 팀2: {self.team2}")
+
+    def start_prefetch(self):
+        """✅ 버튼을 누르기 전에 유저 정보 조회 + 후보 계산을 미리 시작"""
+        if self._prepare_task is None:
+            self._prepare_task = asyncio.create_task(self._prepare())
+
+    async def prepare(self):
+        """✅ 유저 정보 / 제약 전파 / 상위 라인업을 한 번만 계산 (GAS 실패 시에만 다음 클릭에서 재시도)"""
+        if self.solver is not None:
+            return True
+        if self.constraint_error:
+            await self.update_status_message(f"🚨 **팀 생성 불가!** {self.constraint_error}")
+            return False
+
+        self.start_prefetch()
+        ready = await self._prepare_task
+        if not ready:
+            self._prepare_task = None
+        return ready
+
+    async def _prepare(self):
+        players_data = await self.get_player_data()
+        if players_data is None:
+            return False
+
+        if SYNERGY_PENALTY_WEIGHT > 0:
+            await ensure_synergy_loaded()  # ✅ 실패해도 시너지 페널티 없이 팀 생성 진행
+        if REMATCH_PENALTY_WEIGHT > 0:
+            await ensure_lineup_index_loaded()  # ✅ 실패해도 반복 페널티 없이 팀 생성 진행
+
+        try:
+            solver = TeamSolver(players_data, self.parsed_players, self.together, self.apart).propagate()
+        except ConstraintError as e:
+            logging.warning(f"❌ [제약 조건 불가] {e}")
+            self.constraint_error = str(e)
+            await self.update_status_message(f"🚨 **팀 생성 불가!** {e}")
+            return False
+
+        self.players_data = players_data
+        self.apply_effective_mmr(self.players_data)
+        self.alternatives = solver.top_lineups(
+            TOP_K_LINEUPS,
+            tiebreak=lineup_index.penalty if REMATCH_PENALTY_WEIGHT > 0 else None,
+            objective=win_predictor.balance_objective if win_predictor.fitted else None
+        )
+        self.solver = solver
+        logging.info(f"🏅 [상위 라인업] MMR 차이: {[gap for gap, _, _ in self.alternatives]}")
+        return True
+
+    async def build_lineup(self, advanced=False):
+        """
+        ✅ (캐시된) 유저 정보 → 규칙별 팀 분할 → 클래스 배정
+        - 조건을 만족할 수 없으면 이유를 상태 메시지로 안내하고 None 반환 (재시도 없음)
+        """
+        if not await self.prepare():
+            return None
+
+        if advanced:
+            self.generate_teams_advanced(self.players_data, self.solver)
+        else:
+            self.generate_teams(self.players_data, self.solver)
+
+        team1 = self.solver.assign_roles(self.team1)
+        team2 = self.solver.assign_roles(self.team2)
+        logging.info(f"🔄 팀1 최종 포지션: {team1}")
+        logging.info(f"🔄 팀2 최종 포지션: {team2}")
+        return team1, team2
+
+    def format_result(self, title, team1, team2, gap=None):
+        result_text = f"[아래]{'/'.join([p['username'] for p in team1])} vs [위]{'/'.join([p['username'] for p in team2])}"
+        fallback_note = "\n⚠️ 제약 조건 때문에 기본 규칙 대신 MMR 차이가 가장 작은 조합을 사용했습니다.\n" if self.used_fallback else ""
+        if gap is None:
+            gap = self.solver.lineup_gap(team1, team2)
+        probability = win_predictor.predict_diff(self.solver.role_diffs(team1, team2))
+
+        return f"""{stale_notice(self.stale_age)}🏆 **{title}** 🏆
+
+        🔴 **아랫팀:** {', '.join([f"{p['username']}({p['class']})" for p in team1])}
+        🔵 **윗팀:** {', '.join([f"{p['username']}({p['class']})" for p in team2])}
+        📏 **MMR 차이:** {gap:.1f}
+        🎲 **예상 승률:** {format_win_probability(probability)}
+{fallback_note}
+        🎮 경기 준비 완료!
+
+    {result_text}"""
+
+    @discord.ui.button(label="MIX!", style=discord.ButtonStyle.green, custom_id="team_mix")
+    @traced_interaction("버튼 MIX")
+    async def mix_teams(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """일반 MMR 기반 팀 생성"""
+        await self.acknowledge(interaction)  # ✅ 인터랙션 응답 + 버튼 비활성화
+        await self.update_status_message("⏳ **팀을 생성 중입니다...**")  # ✅ "팀 생성 중..." 메시지 표시
+
+        lineup = await self.build_lineup()
+        if lineup is None:
+            self.enable_buttons()  # ✅ 서버 응답 실패 / 조건 불가 시 버튼 다시 활성화
+            return
+
+        await self.update_status_message(self.format_result("MMR 기반 팀 생성 결과 (일반)", *lineup))  # ✅ 기존 메시지 업데이트
+
+        self.enable_buttons()  # ✅ 서버 응답 완료 후 버튼 다시 활성화
+
+    @discord.ui.button(label="MIX!(고급)", style=discord.ButtonStyle.blurple, custom_id="team_mix_advanced")
+    @traced_interaction("버튼 MIX(고급)")
+    async def mix_teams_advanced(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """고급 MMR 기반 팀 생성"""
+        await self.acknowledge(interaction)  # ✅ 인터랙션 응답 + 버튼 비활성화
+        await self.update_status_message("⏳ **팀(고급)을 생성 중입니다...**")  # ✅ "팀 생성 중..." 메시지 표시
+
+        lineup = await self.build_lineup(advanced=True)
+        if lineup is None:
+            self.enable_buttons()  # ✅ 서버 응답 실패 / 조건 불가 시 버튼 다시 활성화
+            return
+
+        await self.update_status_message(self.format_result("MMR 기반 팀 생성 결과 (고급)", *lineup))  # ✅ 기존 메시지 업데이트
+
+        self.enable_buttons()  # ✅ 서버 응답 완료 후 버튼 다시 활성화
+
+    @discord.ui.button(label="🔁 다음 후보", style=discord.ButtonStyle.grey, custom_id="team_next")
+    @traced_interaction("버튼 다음 후보")
+    async def next_alternative(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """MMR 차이가 작은 순으로 미리 계산한 라인업을 하나씩 보여줌 (GAS 재요청 없음)"""
+        await interaction.response.defer()
+
+        if self.solver is None:
+            self.disable_buttons()
+            await self.update_status_message("⏳ **추천 조합을 계산 중입니다...**")
+            ready = await self.prepare()
+            self.enable_buttons()
+            if not ready:
+                return
+
+        if not self.alternatives:
+            await self.update_status_message("🚨 추천할 수 있는 조합이 없습니다.")
+            return
+
+        self.alternative_index = (self.alternative_index + 1) % len(self.alternatives)
+        gap, team1, team2 = self.alternatives[self.alternative_index]
+        self.used_fallback = False
+        order = "예상 승률 균형 순" if win_predictor.fitted else "MMR 차이 순"
+        title = f"추천 조합 {self.alternative_index + 1}/{len(self.alternatives)} ({order})"
+        await self.update_status_message(self.format_result(title, team1, team2, gap))
+
+    async def acknowledge(self, interaction):
+        """버튼 비활성화를 인터랙션 응답으로 보냄 (defer + 메시지 수정 두 번 대신 요청 한 번)"""
+        for child in self.children:
+            child.disabled = True
+        await interaction.response.edit_message(view=self)
+
+    def disable_buttons(self):
+        """버튼을 비활성화 (서버 응답 대기 중)"""
+        for child in self.children:
+            child.disabled = True
+        if self.message:
+            message_updates.schedule(self.message, view=self)
+
+    def enable_buttons(self):
+        """버튼을 다시 활성화 (서버 응답 완료 후)"""
+        for child in self.children:
+            child.disabled = False
+        if self.message:
+            message_updates.schedule(self.message, view=self)
+
+    async def update_status_message(self, content):
+        """상태 메시지 업데이트 (팀 생성 중 → 결과 표시), 버튼 메시지와 같으면 버튼 상태와 한 요청으로 합쳐짐"""
+        if self.status_message:
+            await message_updates.edit(self.status_message, content=content)
+        else:
+            self.status_message = await self.ctx.send(content)
+            self.save_state()
+
+
+# ✅ 재시작 / 리로드 후 버튼 복원 + 만료된 버튼 정리
+VIEW_CLASSES = {cls.kind: cls for cls in (ConfirmView, RollbackSelectView, ConfirmRollbackView, TeamGenerationView)}
+
+
+def restore_views():
+    """
+    ✅ 저장된 View를 같은 메시지 ID / custom_id로 다시 등록 (cogs/core.py의 cog_load에서 호출)
+    - 시작할 때: 저장된 View 전체 복원
+    - `!리로드 전체` 후: 이전 코드의 클래스로 동작 중인 View만 새 클래스로 교체 (이미 현재 클래스면 그대로 유지)
+    """
+    now = time.time()
+    restored = 0
+    for message_id, entry in list(view_store.entries.items()):
+        cls = VIEW_CLASSES.get(entry["kind"])
+        if cls is None or entry["expires_at"] <= now:
+            continue  # ✅ 만료된 항목은 sweep_views가 버튼까지 정리
+        live = live_views.get(message_id)
+        if type(live) is cls:
+            continue
+        try:
+            view = cls.from_state(entry["state"], entry["channel_id"], message_id)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"⚠️ [버튼 상태] 메시지 {message_id} 복원 실패: {e}")
+            view_store.pop(message_id)
+            continue
+        if live is not None:
+            discord.ui.View.stop(live)  # ✅ 새 View 등록 전에 이전 View의 custom_id 등록 해제
+        view.message_id = message_id
+        live_views[message_id] = view
+        bot.add_view(view, message_id=message_id)
+        restored += 1
+
+    view_store.save_if_dirty()
+    logging.info(f"🧷 [버튼 상태] {restored}개 복원")
+
+
+async def sweep_views():
+    """✅ VIEW_SWEEP_INTERVAL초마다 만료된 View를 최대 VIEW_SWEEP_BATCH개씩 정리"""
+    while True:
+        await asyncio.sleep(VIEW_SWEEP_INTERVAL)
+        expired = view_store.pop_expired(VIEW_SWEEP_BATCH)
+        for message_id, entry in expired:
+            retire_view(message_id, entry)
+        if expired:
+            logging.info(f"🧹 [버튼 상태] 만료 {len(expired)}개 정리 (남은 {len(view_store)}개)")
+        view_store.save_if_dirty()
@@ -0,0 +1,118 @@
+"""
+✅ 스프레드시트 수정 알림 수신 엔드포인트 (캐시 무효화용 로컬 HTTP 서버)
+
+Apps Script `onEdit` 트리거가 수정된 시트 / 행 정보를 POST하면 해당 캐시 항목만 무효화하거나 갱신한다.
+- 경로: POST /invalidate
+- 본문: {"sheet": "Players", "keys": ["유저명", ...], "rows": [{"username": ..., "mmr": ...}, ...]}
+  - keys: 수정된 행의 키 (Players/Aliases → 유저명, Results → 게임번호), 비어 있으면 시트 전체 무효화
+  - rows: 수정된 행의 최신 값 (있으면 무효화 대신 그 값으로 갱신)
+- 인증: X-Webhook-Timestamp(유닉스 초) + X-Webhook-Signature(`sha256=` + HMAC-SHA256(비밀키, "타임스탬프.본문") 16진수)
+  타임스탬프가 MAX_SKEW_SECONDS 이상 차이 나면 거절 (재전송 공격 방지)
+
+로컬 테스트: python webhook.py --url http://127.0.0.1:8089/invalidate --secret 비밀키 --sheet Players --keys 유저1 유저2
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import logging
+import time
+
+from aiohttp import web
+
+MAX_SKEW_SECONDS = 300
+
+
+def sign(secret, timestamp, body):
+    """✅ 요청 서명 (Apps Script: Utilities.computeHmacSha256Signature(`${ts}.${body}`, secret)와 같은 값)"""
+    message = f"{timestamp}.".encode() + body
+    return "sha256=" + hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify(secret, timestamp, signature, body, now=None):
+    try:
+        skew = abs((now or time.time()) - int(timestamp))
+    except (TypeError, ValueError):
+        return False
+    if skew > MAX_SKEW_SECONDS:
+        return False
+    return hmac.compare_digest(sign(secret, timestamp, body), signature or "")
+
+
+class InvalidationServer:
+    """✅ 시트 이름별 핸들러 `handler(keys, rows)`를 등록해 두고 알림을 받으면 호출"""
+
+    def __init__(self, secret, host="127.0.0.1", port=8089):
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.handlers = {}
+        self._runner = None
+
+    def on(self, sheet, handler):
+        self.handlers[sheet] = handler
+
+    async def handle(self, request):
+        body = await request.read()
+        if not verify(self.secret, request.headers.get("X-Webhook-Timestamp"),
+                      request.headers.get("X-Webhook-Signature"), body):
+            logging.warning(f"🚫 [캐시 무효화] 서명 검증 실패 ({request.remote})")
+            return web.json_response({"error": "invalid signature"}, status=401)
+
+        try:
+            event = json.loads(body)
+            sheet = event["sheet"]
+        except (ValueError, KeyError, TypeError):
+            return web.json_response({"error": "invalid payload"}, status=400)
+
+        handler = self.handlers.get(sheet)
+        if handler is None:
+            logging.info(f"ℹ️ [캐시 무효화] 처리하지 않는 시트: {sheet}")
+            return web.json_response({"ok": True, "ignored": sheet})
+
+        keys, rows = event.get("keys") or [], event.get("rows") or []
+        handler(keys, rows)
+        logging.info(f"🧹 [캐시 무효화] {sheet} 키 {len(keys) or '전체'} / 갱신 행 {len(rows)}")
+        return web.json_response({"ok": True, "sheet": sheet})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/invalidate", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logging.info(f"🛰️ [캐시 무효화] http://{self.host}:{self.port}/invalidate 수신 대기")
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main():
+    """✅ Apps Script onEdit 트리거와 같은 형식의 알림을 보내는 로컬 테스트 도구"""
+    import requests
+
+    parser = argparse.ArgumentParser(description="캐시 무효화 알림 테스트 전송")
+    parser.add_argument("--url", default="http://127.0.0.1:8089/invalidate")
+    parser.add_argument("--secret", required=True)
+    parser.add_argument("--sheet", required=True, help="Players / Aliases / Results / Seasons")
+    parser.add_argument("--keys", nargs="*", default=[])
+    parser.add_argument("--rows", default=None, help="수정된 행 JSON 배열")
+    args = parser.parse_args()
+
+    event = {"sheet": args.sheet, "keys": args.keys}
+    if args.rows:
+        event["rows"] = json.loads(args.rows)
+    body = json.dumps(event, ensure_ascii=False).encode()
+    timestamp = str(int(time.time()))
+    response = requests.post(args.url, data=body, headers={
+        "Content-Type": "application/json",
+        "X-Webhook-Timestamp": timestamp,
+        "X-Webhook-Signature": sign(args.secret, timestamp, body),
+    })
+    print(response.status_code, response.text)
+
+
+if __name__ == "__main__":
+    main()